@@ -0,0 +1,23 @@
+"""
+Cover created_at in the embeddings (user_id, kind) index.
+
+The per-worker vector index checks COUNT(*) and MAX(created_at) for a user and
+kind before every semantic query to detect writes from other processes. With
+created_at in the index both aggregates are answered from the index alone,
+without reading the vector blobs.
+"""
+
+from yoyo import step
+
+__depends__ = {"0051_pin_conversations"}
+
+steps = [
+    step(
+        "CREATE INDEX idx_embeddings_user_kind_created ON embeddings(user_id, kind, created_at)",
+        "DROP INDEX IF EXISTS idx_embeddings_user_kind_created",
+    ),
+    step(
+        "DROP INDEX IF EXISTS idx_embeddings_user_kind",
+        "CREATE INDEX idx_embeddings_user_kind ON embeddings(user_id, kind)",
+    ),
+]
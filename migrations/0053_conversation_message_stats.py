@@ -0,0 +1,87 @@
+"""
+Denormalized message stats on conversations.
+
+Sidebar listings and the 60-second sync poll used LEFT JOIN messages +
+COUNT(m.id) plus a correlated last-message subquery, scanning every message
+of every listed conversation. The stats now live on the conversation row:
+
+message_count         = number of messages in the conversation
+last_message_preview  = first 1000 chars of the newest message's content
+                        (created_at, then id); build_message_preview() still
+                        turns it into the one-line sidebar snippet at read time
+
+Triggers on messages keep both current inside the writing statement's
+transaction, so every writer (add/update/delete, tail truncation, planner and
+program resets, agent compaction) stays consistent without having to know.
+Existing rows are backfilled here.
+"""
+
+from yoyo import step
+
+__depends__ = {"0052_embeddings_signature_index"}
+
+steps = [
+    step(
+        "ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE conversations DROP COLUMN message_count",
+    ),
+    step(
+        "ALTER TABLE conversations ADD COLUMN last_message_preview TEXT",
+        "ALTER TABLE conversations DROP COLUMN last_message_preview",
+    ),
+    # Backfill
+    step(
+        """
+        UPDATE conversations SET
+            message_count = (SELECT COUNT(*) FROM messages m
+                             WHERE m.conversation_id = conversations.id),
+            last_message_preview = (SELECT substr(m.content, 1, 1000) FROM messages m
+                                    WHERE m.conversation_id = conversations.id
+                                    ORDER BY m.created_at DESC, m.id DESC LIMIT 1)
+        """
+    ),
+    step(
+        """
+        CREATE TRIGGER IF NOT EXISTS conversation_stats_insert_message
+        AFTER INSERT ON messages
+        BEGIN
+            UPDATE conversations SET
+                message_count = message_count + 1,
+                last_message_preview = (SELECT substr(m.content, 1, 1000) FROM messages m
+                                        WHERE m.conversation_id = NEW.conversation_id
+                                        ORDER BY m.created_at DESC, m.id DESC LIMIT 1)
+            WHERE id = NEW.conversation_id;
+        END
+        """,
+        "DROP TRIGGER IF EXISTS conversation_stats_insert_message",
+    ),
+    step(
+        """
+        CREATE TRIGGER IF NOT EXISTS conversation_stats_delete_message
+        AFTER DELETE ON messages
+        BEGIN
+            UPDATE conversations SET
+                message_count = MAX(message_count - 1, 0),
+                last_message_preview = (SELECT substr(m.content, 1, 1000) FROM messages m
+                                        WHERE m.conversation_id = OLD.conversation_id
+                                        ORDER BY m.created_at DESC, m.id DESC LIMIT 1)
+            WHERE id = OLD.conversation_id;
+        END
+        """,
+        "DROP TRIGGER IF EXISTS conversation_stats_delete_message",
+    ),
+    step(
+        """
+        CREATE TRIGGER IF NOT EXISTS conversation_stats_update_message
+        AFTER UPDATE OF content, created_at ON messages
+        BEGIN
+            UPDATE conversations SET
+                last_message_preview = (SELECT substr(m.content, 1, 1000) FROM messages m
+                                        WHERE m.conversation_id = NEW.conversation_id
+                                        ORDER BY m.created_at DESC, m.id DESC LIMIT 1)
+            WHERE id = NEW.conversation_id;
+        END
+        """,
+        "DROP TRIGGER IF EXISTS conversation_stats_update_message",
+    ),
+]
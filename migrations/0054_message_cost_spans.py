@@ -0,0 +1,23 @@
+"""
+Per-turn latency spans on message_costs.
+
+spans = JSON object {name: {"ms": total, "n": count}} recorded by
+        src/utils/spans.py for streamed chat turns: history load
+        (get_messages, enrich_history), agent_setup/context_cache, prompt,
+        first_token (ms since the turn started), llm (per round, summed),
+        tool:<name> per tool, save_message, generate_title, and turn (total)
+
+NULL for turns recorded before this migration, batch turns, and turns with
+TURN_SPANS_ENABLED off. analyze_costs.py gains a Latency Breakdown section.
+"""
+
+from yoyo import step
+
+__depends__ = {"0053_conversation_message_stats"}
+
+steps = [
+    step(
+        "ALTER TABLE message_costs ADD COLUMN spans TEXT",
+        "ALTER TABLE message_costs DROP COLUMN spans",
+    ),
+]
@@ -0,0 +1,39 @@
+"""
+Local mirror of each user's Todoist tasks, projects and sections.
+
+todoist_objects holds the Sync API objects as JSON (kind: 'item' | 'project'
+| 'section'); only active objects are kept - deleted, completed and archived
+ones are removed as their deltas arrive. todoist_sync_state holds the Sync
+API sync_token each user's mirror is current to, and when it last synced.
+See src/utils/todoist_sync.py.
+"""
+
+from yoyo import step
+
+__depends__ = {"0054_message_cost_spans"}
+
+steps = [
+    step(
+        """
+        CREATE TABLE todoist_objects (
+            user_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            id TEXT NOT NULL,
+            project_id TEXT,
+            data TEXT NOT NULL,
+            PRIMARY KEY (user_id, kind, id)
+        )
+        """,
+        "DROP TABLE todoist_objects",
+    ),
+    step(
+        """
+        CREATE TABLE todoist_sync_state (
+            user_id TEXT PRIMARY KEY,
+            sync_token TEXT NOT NULL,
+            synced_at TEXT NOT NULL
+        )
+        """,
+        "DROP TABLE todoist_sync_state",
+    ),
+]
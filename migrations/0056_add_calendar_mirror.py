@@ -0,0 +1,48 @@
+"""
+Local mirror of Google Calendar events per (user, calendar).
+
+calendar_events holds the expanded event instances (singleEvents) as JSON,
+with their bounds normalized to naive UTC ISO strings for range queries.
+Cancelled events are removed as their deltas arrive. calendar_sync_state
+holds each calendar's nextSyncToken and the [window_start, window_end) the
+last full sync covered. See src/utils/calendar_sync.py.
+"""
+
+from yoyo import step
+
+__depends__ = {"0055_add_todoist_mirror"}
+
+steps = [
+    step(
+        """
+        CREATE TABLE calendar_events (
+            user_id TEXT NOT NULL,
+            calendar_id TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            start_at TEXT NOT NULL,
+            end_at TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (user_id, calendar_id, event_id)
+        )
+        """,
+        "DROP TABLE calendar_events",
+    ),
+    step(
+        "CREATE INDEX idx_calendar_events_start ON calendar_events(user_id, calendar_id, start_at)",
+        "DROP INDEX IF EXISTS idx_calendar_events_start",
+    ),
+    step(
+        """
+        CREATE TABLE calendar_sync_state (
+            user_id TEXT NOT NULL,
+            calendar_id TEXT NOT NULL,
+            sync_token TEXT NOT NULL,
+            window_start TEXT NOT NULL,
+            window_end TEXT NOT NULL,
+            synced_at TEXT NOT NULL,
+            PRIMARY KEY (user_id, calendar_id)
+        )
+        """,
+        "DROP TABLE calendar_sync_state",
+    ),
+]
@@ -0,0 +1,82 @@
+"""
+Content-addressed blob store (files.db).
+
+blobs held one copy of the data per key, so an image pasted into three
+conversations, or re-attached on edit & resend, was stored (and backed up)
+three times. Data now lives once per sha256 in blob_contents, with a
+refcount kept by triggers on blobs, and blobs rows point at it. See
+src/db/blob_store.py.
+
+Existing rows are hashed and deduplicated in one transaction. The freed
+pages are returned by the next VACUUM (scripts/vacuum_databases.py).
+"""
+
+import sqlite3
+
+from yoyo import step
+
+from src.config import Config
+
+__depends__ = {"0056_add_calendar_mirror"}
+
+
+def dedupe_blob_store(conn):
+    """Convert files.db to content-addressed storage."""
+    from src.db.blob_store import ensure_schema
+
+    blob_path = Config.BLOB_STORAGE_PATH
+    if not blob_path.exists():
+        print(f"Blob store not found at {blob_path}, skipping")
+        return
+
+    blob_conn = sqlite3.connect(blob_path)
+    try:
+        converted = ensure_schema(blob_conn)
+    finally:
+        blob_conn.close()
+    if converted:
+        keys, contents = converted
+        print(f"Deduplicated {keys} blobs into {contents} stored contents in {blob_path}")
+
+
+def restore_blob_copies(conn):
+    """Give every key its own copy of the data again (the old single-table layout)."""
+    blob_path = Config.BLOB_STORAGE_PATH
+    if not blob_path.exists():
+        print(f"Blob store not found at {blob_path}, skipping")
+        return
+
+    blob_conn = sqlite3.connect(blob_path)
+    try:
+        columns = {row[1] for row in blob_conn.execute("PRAGMA table_info(blobs)")}
+        if "data" in columns:
+            return
+        blob_conn.execute("BEGIN IMMEDIATE")
+        blob_conn.execute("""
+            CREATE TABLE blobs_legacy (
+                key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                mime_type TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        blob_conn.execute("""
+            INSERT INTO blobs_legacy (key, data, mime_type, size, created_at)
+            SELECT b.key, c.data, b.mime_type, b.size, b.created_at
+            FROM blobs b JOIN blob_contents c ON c.sha256 = b.sha256
+        """)
+        for trigger in ("blobs_refcount_insert", "blobs_refcount_delete", "blobs_refcount_update"):
+            blob_conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        blob_conn.execute("DROP TABLE blobs")
+        blob_conn.execute("DROP TABLE blob_contents")
+        blob_conn.execute("ALTER TABLE blobs_legacy RENAME TO blobs")
+        blob_conn.commit()
+        print(f"Restored per-key blob copies in {blob_path}")
+    finally:
+        blob_conn.close()
+
+
+steps = [
+    step(dedupe_blob_store, restore_blob_copies),
+]
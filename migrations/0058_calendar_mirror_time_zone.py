@@ -0,0 +1,20 @@
+"""
+Store each mirrored calendar's time zone.
+
+All-day events carry bare dates; their bounds are midnight in the calendar's
+time zone (events.list timeZone), not UTC midnight. Existing mirrors stored
+UTC midnight, so they are cleared and resynced in full on the next read.
+"""
+
+from yoyo import step
+
+__depends__ = {"0057_content_addressed_blob_store"}
+
+steps = [
+    step(
+        "ALTER TABLE calendar_sync_state ADD COLUMN time_zone TEXT",
+        "ALTER TABLE calendar_sync_state DROP COLUMN time_zone",
+    ),
+    step("DELETE FROM calendar_events"),
+    step("DELETE FROM calendar_sync_state"),
+]
@@ -5,9 +5,10 @@ Reads the SQLite DB directly (stdlib only, safe to run on prod):
 
     python scripts/analyze_costs.py [days] [db_path]
 
-Sections: totals, by conversation type, by model, web-search correlation
-(messages with cited sources vs without), input-token distribution,
-top messages/conversations, daily trend.
+Sections: totals, by conversation type, by model, turn metrics, latency
+breakdown (per-turn spans), web-search correlation (messages with cited
+sources vs without), input-token distribution, top messages/conversations,
+daily trend.
 """
 
 from __future__ import annotations
@@ -45,6 +46,37 @@ def _percentile(sorted_values: list[int], pct: float) -> int:
     return sorted_values[index]
 
 
+def _print_latency_breakdown(conn: sqlite3.Connection, since: str) -> None:
+    """Where streamed turns spend their time, from the spans JSON column.
+
+    Spans nest and overlap (history contains get_messages; parallel tools run
+    concurrently), so shares are of total turn time and need not sum to 100%.
+    first_token is time since the turn started, not a duration.
+    """
+    print("LATENCY BREAKDOWN (streamed turns with spans, ms per turn that has the span):")
+    by_span: dict[str, list[int]] = {}
+    for r in conn.execute(
+        """SELECT je.key name, json_extract(je.value, '$.ms') ms
+           FROM message_costs mc, json_each(mc.spans) je
+           WHERE mc.created_at >= ? AND mc.spans IS NOT NULL""",
+        (since,),
+    ):
+        by_span.setdefault(r["name"], []).append(r["ms"])
+    turn_total = sum(by_span.get("turn", []))
+    if not turn_total:
+        print("  (no turns with spans in window)\n")
+        return
+    for name, values in sorted(by_span.items(), key=lambda kv: -sum(kv[1])):
+        values.sort()
+        share = "      " if name in ("turn", "first_token") else _pct(sum(values), turn_total)
+        print(
+            f"  {name[:24]:<24} {len(values):>5} turns | avg {sum(values) / len(values):>8,.0f} "
+            f"| p50 {_percentile(values, 0.5):>8,} | p90 {_percentile(values, 0.9):>8,} "
+            f"| {share}"
+        )
+    print()
+
+
 def main() -> None:
     days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
     db_path = sys.argv[2] if len(sys.argv) > 2 else "chatbot.db"
@@ -59,6 +91,7 @@ def main() -> None:
     cost_columns = {r["name"] for r in conn.execute("PRAGMA table_info(message_costs)")}
     has_cache_column = "cached_input_tokens" in cost_columns
     has_tool_columns = "tool_rounds" in cost_columns
+    has_spans_column = "spans" in cost_columns
 
     print(f"=== Cost analysis: last {days} days (since {since[:10]}) ===\n")
 
@@ -145,6 +178,10 @@ def main() -> None:
         print(f"    {r['tool']:<24} {r['n']:>5}")
     print()
 
+    # ---- Latency breakdown (per-turn spans, column exists since 0054)
+    if has_spans_column:
+        _print_latency_breakdown(conn, since)
+
     # ---- Web search correlation (cited sources as the marker)
     print("WEB SEARCH CORRELATION (messages with cited sources vs without):")
     for r in conn.execute(
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark allocations of the chat write path for a base64 attachment.
+
+Runs one video attachment through the steps a chat request takes - validate,
+thumbnail marking, blob save + metadata, thumbnail queueing, Gemini Files API
+upload (faked: the upload only reads the file object in chunks) - and reports
+traced peak allocation, base64 decodes and wall time for:
+
+- decode-once: validate_files() decodes the file into an Attachment that the
+  later steps share.
+- per-step: the Attachment is dropped after validation, so every step falls
+  back to decoding "data" itself (the behavior before Attachment existed).
+
+The peak excludes the request's base64 string, which both modes hold.
+
+Usage:
+    python scripts/benchmark_attachments.py
+    python scripts/benchmark_attachments.py --size-mb 90
+"""
+
+import argparse
+import base64
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agent import gemini_files  # noqa: E402
+from src.db import blob_store as blob_store_module  # noqa: E402
+from src.db.blob_store import BlobStore  # noqa: E402
+from src.db.models.helpers import extract_file_metadata, save_file_to_blob_store  # noqa: E402
+from src.utils.background_thumbnails import (  # noqa: E402
+    mark_files_for_thumbnail_generation,
+    queue_pending_thumbnails,
+)
+from src.utils.files import validate_files  # noqa: E402
+
+_UPLOAD_CHUNK = 8 * 1024 * 1024
+# Decodes below this size (thumbnails, small fields) aren't counted
+_LARGE_DECODE_BYTES = 1024 * 1024
+
+
+def _video_payload(size: int) -> str:
+    """Base64 of an MP4-signed blob of `size` bytes."""
+    header = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom"
+    return base64.b64encode(header + os.urandom(size - len(header))).decode("ascii")
+
+
+def _fake_upload(message_id: str, file_index: int, data: Any, mime_type: str) -> str:
+    fileobj = io.BytesIO(data) if isinstance(data, bytes) else data
+    while fileobj.read(_UPLOAD_CHUNK):
+        pass
+    return f"https://example.invalid/files/{message_id}-{file_index}"
+
+
+def _write_path(encoded: str, decode_once: bool) -> int:
+    """Run the write path for one attachment; returns the number of large decodes."""
+    decodes = 0
+    b64decode: Callable[..., bytes] = base64.b64decode
+
+    def counting_b64decode(s: Any, *args: Any, **kwargs: Any) -> bytes:
+        nonlocal decodes
+        result = b64decode(s, *args, **kwargs)
+        if len(result) >= _LARGE_DECODE_BYTES:
+            decodes += 1
+        return result
+
+    files: list[dict[str, Any]] = [{"name": "clip.mp4", "type": "video/mp4", "data": encoded}]
+    with (
+        patch("base64.b64decode", counting_b64decode),
+        patch.object(gemini_files, "ensure_gemini_file_uri", _fake_upload),
+    ):
+        is_valid, error = validate_files(files)
+        if not is_valid:
+            raise SystemExit(f"validation failed: {error}")
+        if not decode_once:
+            files[0].pop("attachment")
+        mark_files_for_thumbnail_generation(files)
+        for idx, file in enumerate(files):
+            save_file_to_blob_store("bench-msg", idx, file)
+            extract_file_metadata(file)
+        queue_pending_thumbnails("bench-msg", files)
+        gemini_files.attach_gemini_file_uris("bench-msg", files)
+    return decodes
+
+
+def _measure(encoded: str, decode_once: bool) -> tuple[int, int, float]:
+    """(peak traced bytes above baseline, large decodes, wall seconds)."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    decodes = _write_path(encoded, decode_once)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peak, decodes, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=50, help="decoded attachment size")
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    encoded = _video_payload(size)
+    print(f"attachment={args.size_mb} MB video/mp4 (base64 {len(encoded) / 1024 / 1024:.0f} MB)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BlobStore(Path(tmp) / "files.db")
+        with patch.object(blob_store_module, "_blob_store", store):
+            for label, decode_once in (("per-step", False), ("decode-once", True)):
+                peak, decodes, elapsed = _measure(encoded, decode_once)
+                print(
+                    f"{label:<12} peak {peak / 1024 / 1024:7.1f} MB   "
+                    f"decodes {decodes}   wall {elapsed * 1000:7.0f} ms"
+                )
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
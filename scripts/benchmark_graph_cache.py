@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark per-request ChatAgent setup with and without the graph cache.
+
+Constructs ChatAgent the way a chat request does (full tool set, no context
+cache) and reports the mean setup time when every request builds its graph
+from scratch - the cache is cleared before each construction - against the
+steady state where the compiled graph is reused. No API calls are made:
+model construction and tool binding are local.
+
+Usage:
+    python scripts/benchmark_graph_cache.py
+    python scripts/benchmark_graph_cache.py --requests 200 --model gemini-3-flash-preview
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-placeholder")
+
+from src.agent.agent import ChatAgent  # noqa: E402
+from src.agent.graph import clear_graph_cache  # noqa: E402
+from src.config import Config  # noqa: E402
+
+
+def _time_per_call(fn: Callable[[], object], repeats: int) -> float:
+    """Mean wall time of fn() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50, help="constructions per measurement")
+    parser.add_argument("--model", default=Config.DEFAULT_MODEL)
+    args = parser.parse_args()
+
+    def new_agent() -> ChatAgent:
+        return ChatAgent(args.model, enable_context_cache=False)
+
+    def uncached() -> ChatAgent:
+        clear_graph_cache()
+        return new_agent()
+
+    new_agent()  # warm imports and the model/tool-binding caches outside the timings
+    cold_ms = _time_per_call(uncached, args.requests)
+    new_agent()
+    warm_ms = _time_per_call(new_agent, args.requests)
+
+    print(f"model={args.model} requests={args.requests}")
+    print(f"{'graph built per request':<26} {cold_ms:8.2f} ms")
+    print(f"{'graph cache hit':<26} {warm_ms:8.2f} ms")
+    print(f"{'speedup':<26} {cold_ms / warm_ms:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
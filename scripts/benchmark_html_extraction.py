@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark HTML->text extraction in-thread vs in the process pool.
+
+Extracts a corpus of saved pages the way research does - RESEARCH_FETCH_WORKERS
+threads at once - while a "streamer" thread wakes every 5 ms, standing in for
+token streaming on another request in the same web worker. Reports wall time
+for the corpus and the streamer's worst and p99 wake-up delay: with in-thread
+extraction the parsers hold the GIL and the streamer stalls.
+
+Save pages with e.g. `curl -L -o corpus/wiki.html https://en.wikipedia.org/wiki/Python`.
+Without --corpus a synthetic corpus of article-like pages is generated.
+
+Usage:
+    python scripts/benchmark_html_extraction.py --corpus ~/pages
+    python scripts/benchmark_html_extraction.py --pages 24 --workers 4
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config  # noqa: E402
+from src.utils import html_extraction  # noqa: E402
+
+_TICK_SECONDS = 0.005
+
+
+def _synthetic_corpus(pages: int) -> list[str]:
+    paragraph = (
+        "<p>The committee reviewed the proposal in detail, weighing the cost of "
+        "the new rail link against the projected ridership and the <a href='/x'>"
+        "regional plan</a>. Several members asked for a revised estimate.</p>"
+    )
+    chrome = "<nav>" + "<a href='/n'>Section</a>" * 200 + "</nav>"
+    return [
+        f"<html><body>{chrome}<article><h1>Report {i}</h1>{paragraph * (150 + 25 * i)}"
+        f"</article><footer>{chrome}</footer></body></html>"
+        for i in range(pages)
+    ]
+
+
+def _load_corpus(directory: Path) -> list[str]:
+    files = sorted([*directory.glob("*.html"), *directory.glob("*.htm")])
+    return [f.read_text(encoding="utf-8", errors="replace") for f in files]
+
+
+def _run(corpus: list[str], threads: int) -> tuple[float, list[float]]:
+    """Extract the corpus on `threads` threads; returns (wall seconds, streamer delays in ms)."""
+    delays: list[float] = []
+    done = threading.Event()
+
+    def streamer() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + _TICK_SECONDS
+            time.sleep(_TICK_SECONDS)
+            delays.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    ticker = threading.Thread(target=streamer)
+    ticker.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(html_extraction.extract_text, corpus))
+    elapsed = time.perf_counter() - start
+    done.set()
+    ticker.join()
+    return elapsed, delays
+
+
+def _report(label: str, elapsed: float, delays: list[float]) -> None:
+    p99 = statistics.quantiles(delays, n=100)[98] if len(delays) >= 100 else max(delays)
+    print(
+        f"{label:<12} wall {elapsed * 1000:8.0f} ms   "
+        f"streamer stall max {max(delays):7.1f} ms  p99 {p99:6.1f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="directory of saved .html pages")
+    parser.add_argument("--pages", type=int, default=12, help="synthetic pages (no --corpus)")
+    parser.add_argument("--threads", type=int, default=Config.RESEARCH_FETCH_WORKERS)
+    parser.add_argument("--workers", type=int, default=max(1, Config.HTML_EXTRACT_WORKERS))
+    args = parser.parse_args()
+
+    corpus = _load_corpus(args.corpus) if args.corpus else _synthetic_corpus(args.pages)
+    if not corpus:
+        print(f"No .html pages in {args.corpus}")
+        return 1
+    total_kb = sum(len(page) for page in corpus) // 1024
+    print(f"pages={len(corpus)} ({total_kb} KB) threads={args.threads} workers={args.workers}")
+
+    with patch.object(Config, "HTML_EXTRACT_WORKERS", 0):
+        _report("in-thread", *_run(corpus, args.threads))
+
+    with patch.object(Config, "HTML_EXTRACT_WORKERS", args.workers):
+        html_extraction.extract_text(corpus[0])  # start the pool outside the timing
+        _report("pool", *_run(corpus, args.threads))
+    html_extraction.shutdown_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
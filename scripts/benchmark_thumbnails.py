@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark thumbnail generation throughput and GIL stalls.
+
+Stores a corpus of images in a temporary files.db and renders thumbnails for
+all of them with THUMBNAIL_WORKER_THREADS background threads, in three modes:
+
+- base64-thread: the previous background path - base64-encode the image,
+  generate_thumbnail() one size in the thread, decode and save the result.
+- engine-thread: render_stored_thumbnails() in the thread (all sizes, one
+  decode, binary blobs; THUMBNAIL_WORKER_PROCESSES=0).
+- engine-pool: the same in the process pool (--processes workers).
+
+For each mode it reports images/s, images/s per core used, and the longest
+stall of a thread that wakes every millisecond - a stand-in for a request
+streaming tokens in the same web process.
+
+Usage:
+    python scripts/benchmark_thumbnails.py
+    python scripts/benchmark_thumbnails.py --corpus ~/Pictures --processes 4
+"""
+
+import argparse
+import base64
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config  # noqa: E402
+from src.db import blob_store as blob_store_module  # noqa: E402
+from src.db.blob_store import BlobStore  # noqa: E402
+from src.utils import thumbnail_engine  # noqa: E402
+from src.utils.images import generate_thumbnail  # noqa: E402
+from src.utils.thumbnail_engine import THUMBNAIL_SIZES, render_stored_thumbnails  # noqa: E402
+
+_MIME_BY_SUFFIX = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
+def _synthetic_photo(seed: int, size: tuple[int, int]) -> bytes:
+    """A phone-sized JPEG with gradients and noise (so it doesn't compress to nothing)."""
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 40 + seed % 20)
+    img = Image.merge("RGB", (gradient, noise, gradient.rotate(90 * (seed % 4)).resize(size)))
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=90)
+    return output.getvalue()
+
+
+def _load_corpus(corpus: Path | None, count: int) -> list[tuple[bytes, str]]:
+    if corpus is None:
+        return [(_synthetic_photo(i, (4032, 3024)), "image/jpeg") for i in range(count)]
+    images = [
+        (path.read_bytes(), _MIME_BY_SUFFIX[path.suffix.lower()])
+        for path in sorted(corpus.iterdir())
+        if path.suffix.lower() in _MIME_BY_SUFFIX
+    ]
+    if not images:
+        raise SystemExit(f"no images in {corpus}")
+    return images
+
+
+def _base64_thread(store: BlobStore, key: str, mime_type: str) -> None:
+    stored = store.get(key)
+    assert stored is not None
+    thumbnail = generate_thumbnail(base64.b64encode(stored[0]).decode("utf-8"), mime_type)
+    if thumbnail:
+        store.save(f"{key}.thumb", base64.b64decode(thumbnail), "image/jpeg")
+
+
+def _engine(store: BlobStore, key: str, mime_type: str) -> None:
+    render_stored_thumbnails(key, mime_type, {size: f"{key}.{size}" for size in THUMBNAIL_SIZES})
+
+
+def _run(
+    render: Callable[[BlobStore, str, str], None],
+    store: BlobStore,
+    corpus: list[tuple[bytes, str]],
+) -> tuple[float, float]:
+    """(wall seconds, longest ticker stall in seconds) for rendering the corpus."""
+    stop = threading.Event()
+    longest = 0.0
+
+    def ticker() -> None:
+        nonlocal longest
+        last = time.perf_counter()
+        while not stop.is_set():
+            time.sleep(0.001)
+            now = time.perf_counter()
+            longest = max(longest, now - last - 0.001)
+            last = now
+
+    ticker_thread = threading.Thread(target=ticker)
+    ticker_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=Config.THUMBNAIL_WORKER_THREADS) as executor:
+        for future in [
+            executor.submit(render, store, f"bench/{i}", mime_type)
+            for i, (_, mime_type) in enumerate(corpus)
+        ]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    ticker_thread.join()
+    return elapsed, longest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="directory of images (default: synthetic)")
+    parser.add_argument("--count", type=int, default=24, help="synthetic images (12 MP JPEG)")
+    parser.add_argument("--processes", type=int, default=Config.THUMBNAIL_WORKER_PROCESSES or 2)
+    args = parser.parse_args()
+
+    corpus = _load_corpus(args.corpus, args.count)
+    total_mb = sum(len(data) for data, _ in corpus) / 1024 / 1024
+    print(
+        f"corpus={len(corpus)} images ({total_mb:.0f} MB)  "
+        f"threads={Config.THUMBNAIL_WORKER_THREADS}  processes={args.processes}  "
+        f"cpus={os.cpu_count()}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BlobStore(Path(tmp) / "files.db")
+        for i, (data, mime_type) in enumerate(corpus):
+            store.save(f"bench/{i}", data, mime_type)
+
+        modes: list[tuple[str, Callable[[BlobStore, str, str], None], int]] = [
+            ("base64-thread", _base64_thread, 0),
+            ("engine-thread", _engine, 0),
+            ("engine-pool", _engine, args.processes),
+        ]
+        with patch.object(blob_store_module, "_blob_store", store):
+            for label, render, processes in modes:
+                cores = min(processes, os.cpu_count() or 1) or 1
+                with patch.object(Config, "THUMBNAIL_WORKER_PROCESSES", processes):
+                    if processes:
+                        _run(render, store, corpus[: args.processes])  # start the workers
+                    elapsed, stall = _run(render, store, corpus)
+                    thumbnail_engine.shutdown_pool()
+                rate = len(corpus) / elapsed
+                print(
+                    f"{label:<14} {rate:6.1f} img/s   {rate / cores:6.1f} img/s/core   "
+                    f"max stall {stall * 1000:6.0f} ms"
+                )
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark the NumPy vector index against pure-Python top_k_similar.
+
+Synthetic random vectors, no database or API calls. For each size it reports
+the one-off index build (what a worker pays on first query or reload), the
+per-query latency of VectorIndex.top_k, and the per-query latency of the
+previous path: unpack every blob and score it with cosine in Python. The
+Python baseline is skipped above --baseline-max (1M vectors takes minutes).
+
+Usage:
+    python scripts/benchmark_vector_index.py
+    python scripts/benchmark_vector_index.py --sizes 10000 100000 --dim 768 --queries 20
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np  # noqa: E402
+
+from src.utils.embeddings import top_k_similar  # noqa: E402
+from src.utils.vector_index import VectorIndex  # noqa: E402
+
+
+def _time_per_call(fn: Callable[[], object], repeats: int) -> float:
+    """Mean wall time of fn() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def _bench_size(
+    rng: np.random.Generator, query: list[float], size: int, args: argparse.Namespace
+) -> tuple[float, float, float | None]:
+    """(build ms, index query ms, Python query ms or None) for one corpus size."""
+    matrix = rng.standard_normal((size, args.dim), dtype=np.float32)
+    rows = [(f"ref-{i}", args.dim, matrix[i].astype("<f4").tobytes()) for i in range(size)]
+
+    index = VectorIndex(args.dim)
+    build_ms = _time_per_call(lambda: index.load(rows, (size, None)), 1)
+    index_ms = _time_per_call(lambda: index.top_k(query, args.k), args.queries)
+    if size > args.baseline_max:
+        return build_ms, index_ms, None
+
+    candidates = [(ref_id, blob) for ref_id, _dim, blob in rows]
+    python_ms = _time_per_call(lambda: top_k_similar(query, candidates, args.k), 1)
+    # Same winners as the reference, up to float32 rounding
+    expected = {ref_id for ref_id, _ in top_k_similar(query, candidates, args.k)}
+    if {ref_id for ref_id, _ in index.top_k(query, args.k)} != expected:
+        print(f"  WARNING: top-{args.k} differs from the reference at {size} vectors")
+    return build_ms, index_ms, python_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--k", type=int, default=30)
+    parser.add_argument("--queries", type=int, default=10, help="queries per measurement")
+    parser.add_argument("--baseline-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(args.dim, dtype=np.float32).tolist()
+
+    print(f"dim={args.dim} k={args.k} queries={args.queries}")
+    print(f"{'vectors':>10} {'build ms':>10} {'index ms':>10} {'python ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        build_ms, index_ms, python_ms = _bench_size(rng, query, size, args)
+        if python_ms is None:
+            python_col, speedup = f"{'skipped':>10}", f"{'-':>8}"
+        else:
+            python_col, speedup = f"{python_ms:10.1f}", f"{python_ms / index_ms:7.0f}x"
+        print(f"{size:>10} {build_ms:10.1f} {index_ms:10.2f} {python_col} {speedup}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
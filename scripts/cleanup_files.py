@@ -39,6 +39,7 @@ def main() -> int:
             "videos_deleted": counts["videos_deleted"],
             "images_deleted": counts["images_deleted"],
             "files_deleted": counts["files_deleted"],
+            "uploads_deleted": counts["uploads_deleted"],
         },
     )
     return 0
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Agent scheduler for production deployment.
 
-This script runs via systemd timer every minute to check for and execute
-scheduled autonomous agents.
+By default this script runs once via systemd timer every minute to check for
+and execute scheduled autonomous agents. With --daemon it stays resident
+(systemd/ai-chatbot-agent-scheduler-daemon.service), sleeping until the next
+agent is due instead of polling every minute (see src/agent/scheduler_daemon.py).
 
 Usage:
-    ./scripts/run_agent_scheduler.py
+    ./scripts/run_agent_scheduler.py            # one pass (timer)
+    ./scripts/run_agent_scheduler.py --daemon   # resident scheduler
 
 The scheduler:
 1. Gets all agents due for execution (where next_run_at <= now)
@@ -14,8 +17,12 @@ The scheduler:
 4. Updates next_run_at based on the cron schedule
 """
 
+import argparse
+import signal
 import sys
+import threading
 from pathlib import Path
+from types import FrameType
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,9 +36,29 @@ app = create_app()
 def main() -> None:
     """Run the agent scheduler."""
     from src.agent.scheduler import run_scheduled_agents
+    from src.agent.scheduler_daemon import AgentScheduleDaemon
+
+    parser = argparse.ArgumentParser(description="Run scheduled autonomous agents")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and run agents when due instead of a single pass",
+    )
+    args = parser.parse_args()
 
     with app.app_context():
-        run_scheduled_agents()
+        if not args.daemon:
+            run_scheduled_agents()
+            return
+
+        stop_event = threading.Event()
+
+        def _stop(signum: int, frame: FrameType | None) -> None:
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, _stop)
+        signal.signal(signal.SIGINT, _stop)
+        AgentScheduleDaemon().run(stop_event)
 
 
 if __name__ == "__main__":
@@ -31,6 +31,7 @@ from src.agent.tool_display import TOOL_METADATA, extract_tool_detail
 from src.agent.tools import get_tools_for_request
 from src.config import Config
 from src.utils.logging import get_logger
+from src.utils.spans import mark_span, span
 
 logger = get_logger(__name__)
 
@@ -157,9 +158,10 @@ class ChatAgent:
         if enable_context_cache and system_prompt_override is None:
             cache_profile = self._get_cache_profile()
             if cache_profile and with_tools and active_tools:
-                self._cached_content_name = get_cached_content_name(
-                    cache_profile, model_name, active_tools
-                )
+                with span("context_cache"):
+                    self._cached_content_name = get_cached_content_name(
+                        cache_profile, model_name, active_tools
+                    )
 
         logger.debug(
             "Creating ChatAgent",
@@ -174,17 +176,29 @@ class ChatAgent:
                 "cached": self._cached_content_name is not None,
             },
         )
-        from src.agent.graph import compile_graph
+        from src.agent.graph import compile_graph, get_compiled_graph, graph_cache_key
 
-        self.graph = compile_graph(
-            create_chat_graph(
+        # Reused across requests: building binds tool schemas and compiles the
+        # LangGraph topology, identical for every request with the same key
+        self.graph = get_compiled_graph(
+            graph_cache_key(
                 model_name,
-                with_tools=with_tools,
-                include_thoughts=include_thoughts,
-                tools=active_tools,
-                is_autonomous=is_autonomous,
-                cached_content=self._cached_content_name,
-            )
+                with_tools,
+                include_thoughts,
+                active_tools,
+                is_autonomous,
+                self._cached_content_name,
+            ),
+            lambda: compile_graph(
+                create_chat_graph(
+                    model_name,
+                    with_tools=with_tools,
+                    include_thoughts=include_thoughts,
+                    tools=active_tools,
+                    is_autonomous=is_autonomous,
+                    cached_content=self._cached_content_name,
+                )
+            ),
         )
 
     def _get_cache_profile(self) -> CacheProfile | None:
@@ -234,7 +248,13 @@ class ChatAgent:
             mime_type = file.get("type", "application/octet-stream")
             data = file.get("data", "")
 
-            if mime_type.startswith("image/"):
+            uri = file.get("gemini_file_uri")
+            if uri:
+                # Videos and large images/PDFs go via the Gemini Files API: the
+                # URI is attached by attach_gemini_file_uris() before the agent
+                # runs, so tool rounds don't re-send megabytes of base64
+                blocks.append({"type": "media", "file_uri": uri, "mime_type": mime_type})
+            elif mime_type.startswith("image/"):
                 # Image block for Gemini
                 blocks.append(
                     {
@@ -244,22 +264,17 @@ class ChatAgent:
                     }
                 )
             elif mime_type.startswith("video/"):
-                # Videos go via the Gemini Files API (inline limit is ~20MB).
-                # The URI is attached by attach_gemini_file_uris() before the
-                # agent runs; absence means the upload failed.
-                uri = file.get("gemini_file_uri")
-                if uri:
-                    blocks.append({"type": "media", "file_uri": uri, "mime_type": mime_type})
-                else:
-                    error = file.get("gemini_upload_error", "processing failed")
-                    name = file.get("name", "video")
-                    blocks.append(
-                        {
-                            "type": "text",
-                            "text": f"[Video '{name}' could not be attached: {error}. "
-                            "Tell the user the video could not be processed.]",
-                        }
-                    )
+                # Videos can't be inlined (limit is ~20MB): no URI means the
+                # upload failed
+                error = file.get("gemini_upload_error", "processing failed")
+                name = file.get("name", "video")
+                blocks.append(
+                    {
+                        "type": "text",
+                        "text": f"[Video '{name}' could not be attached: {error}. "
+                        "Tell the user the video could not be processed.]",
+                    }
+                )
             elif mime_type == "application/pdf":
                 # PDF - Gemini supports inline PDFs
                 blocks.append(
@@ -275,7 +290,11 @@ class ChatAgent:
                     import base64
                     import binascii
 
-                    decoded = base64.b64decode(data).decode("utf-8")
+                    attachment = file.get("attachment")
+                    if attachment is not None:
+                        decoded = str(attachment.data, "utf-8")
+                    else:
+                        decoded = base64.b64decode(data).decode("utf-8")
                     file_name = file.get("name", "file")
                     blocks.append(
                         {
@@ -791,28 +810,32 @@ class ChatAgent:
 
         Yields:
             Events as dicts with 'type' field:
-            - {"type": "thinking", "text": "..."} - Model's reasoning/thinking text
+            - {"type": "thinking", "text": "...", "offset": n} - New reasoning text to
+              splice into the trace at offset n (deltas, not the accumulated text)
+            - {"type": "thinking", "text": "...", "offset": 0, "checkpoint": True} -
+              Full accumulated trace, sent whenever the trace doubles in length
             - {"type": "tool_start", "tool": "tool_name"} - Tool execution starting
             - {"type": "tool_end", "tool": "tool_name"} - Tool execution finished
             - {"type": "token", "text": "..."} - Text token for streaming display
             - {"type": "final", "content": "...", "tool_results": [...], "usage_info": {...}, "result_messages": [...]}
         """
-        messages = self._build_messages(
-            text,
-            files,
-            history,
-            force_tools=force_tools,
-            user_name=user_name,
-            user_id=user_id,
-            custom_instructions=custom_instructions,
-            is_planning=is_planning,
-            dashboard_data=dashboard_data,
-            is_sports=is_sports,
-            sports_context=sports_context,
-            is_language=is_language,
-            language_context=language_context,
-            conversation_title=conversation_title,
-        )
+        with span("prompt"):
+            messages = self._build_messages(
+                text,
+                files,
+                history,
+                force_tools=force_tools,
+                user_name=user_name,
+                user_id=user_id,
+                custom_instructions=custom_instructions,
+                is_planning=is_planning,
+                dashboard_data=dashboard_data,
+                is_sports=is_sports,
+                sports_context=sports_context,
+                is_language=is_language,
+                language_context=language_context,
+                conversation_title=conversation_title,
+            )
 
         # Accumulate full response text
         full_response = ""
@@ -825,11 +848,15 @@ class ChatAgent:
         total_output_tokens = 0
         total_cached_tokens = 0
         chunk_count = 0
+        # Time to first token (thinking or text) is recorded as a latency span
+        first_token_marked = False
         # Track active tool calls by tool_call_id (NOT name: two parallel calls
         # to the same tool must emit separate tool_start/tool_end events)
         pending_tool_calls: set[str] = set()
-        # Accumulate thinking text across chunks
+        # Accumulate thinking text across chunks (events carry only the delta;
+        # a full-text checkpoint goes out each time the trace doubles)
         accumulated_thinking = ""
+        next_thinking_checkpoint = Config.THINKING_CHECKPOINT_MIN_CHARS
         # Track token yields for debugging
         token_yield_count = 0
         # Track if we're inside an echoed MSG_CONTEXT block (spans multiple chunks)
@@ -946,6 +973,9 @@ class ChatAgent:
 
                     # Process content
                     if message_chunk.content:
+                        if not first_token_marked:
+                            mark_span("first_token")
+                            first_token_marked = True
                         # Debug: Log raw content structure occasionally
                         if chunk_count <= 5:
                             content_type = type(message_chunk.content).__name__
@@ -977,10 +1007,24 @@ class ChatAgent:
                                 },
                             )
 
-                        # Accumulate thinking content and yield updates
+                        # Accumulate thinking content and yield deltas
                         if thinking:
+                            thinking_offset = len(accumulated_thinking)
                             accumulated_thinking += thinking
-                            yield {"type": "thinking", "text": accumulated_thinking}
+                            if len(accumulated_thinking) >= next_thinking_checkpoint:
+                                next_thinking_checkpoint = 2 * len(accumulated_thinking)
+                                yield {
+                                    "type": "thinking",
+                                    "text": accumulated_thinking,
+                                    "offset": 0,
+                                    "checkpoint": True,
+                                }
+                            else:
+                                yield {
+                                    "type": "thinking",
+                                    "text": thinking,
+                                    "offset": thinking_offset,
+                                }
 
                         # Process regular text content
                         if text_content:
@@ -20,9 +20,11 @@ from collections.abc import Callable
 from typing import Any
 
 from src.agent.compaction import summarize_messages
+from src.agent.history import enrich_history
 from src.config import Config
 from src.db.models import db
 from src.utils.logging import get_logger
+from src.utils.spans import span
 
 logger = get_logger(__name__)
 
@@ -152,6 +154,78 @@ def _schedule_summary_refresh(
     _spawn_refresh(_work)
 
 
+def _keep_recent(
+    history_len: int,
+    history_tokens: int,
+    tail_tokens: Callable[[int], int],
+) -> int | None:
+    """How many trailing messages stay verbatim, or None to send history as is.
+
+    Args:
+        history_len: Number of history messages
+        history_tokens: Estimated tokens of the whole history
+        tail_tokens: Estimated tokens of the last k messages, for k up to
+            CONVERSATION_COMPACTION_KEEP_RECENT
+    """
+    over_count = history_len > Config.CONVERSATION_COMPACTION_THRESHOLD
+    token_threshold = Config.CONVERSATION_COMPACTION_TOKEN_THRESHOLD
+    over_tokens = token_threshold > 0 and history_tokens > token_threshold
+    if not (over_count or over_tokens):
+        return None
+
+    keep_recent = Config.CONVERSATION_COMPACTION_KEEP_RECENT
+    # A few huge recent messages can exceed the token threshold all by
+    # themselves - shrink the verbatim tail (down to a floor) so compaction
+    # actually bounds what is sent, not just how many messages frame it.
+    if token_threshold > 0:
+        while keep_recent > _MIN_KEEP_RECENT and tail_tokens(keep_recent) > token_threshold:
+            keep_recent -= 1
+    if history_len <= keep_recent:
+        return None
+    return keep_recent
+
+
+def _compact(
+    user_id: str,
+    conversation_id: str,
+    window: list[dict[str, Any]],
+    window_start: int,
+    history_len: int,
+    keep_recent: int,
+    prior_summary: str | None,
+    covered_count: int,
+) -> list[dict[str, Any]] | None:
+    """Summary + un-summarized middle + recent tail, or None to send everything.
+
+    ``window`` is ``history[window_start:]``; it must start at or before the
+    first message the summary does not cover.
+    """
+    older_len = history_len - keep_recent
+    # Clamp coverage in case history shrank (e.g. messages deleted from the UI)
+    covered_count = max(0, min(covered_count, older_len))
+    uncovered = window[covered_count - window_start : older_len - window_start]
+    recent = window[older_len - window_start :]
+
+    needs_resummarize = prior_summary is None or (
+        len(uncovered) >= Config.CONVERSATION_COMPACTION_RESUMMARIZE_BATCH
+    )
+
+    if needs_resummarize:
+        # OFF the request path: the LLM summarizer used to run synchronously
+        # here, adding seconds to the user's turn every time the middle
+        # crossed the batch size. The refreshed summary serves LATER turns;
+        # this turn uses whatever state already exists. Deferring also keeps
+        # this turn's history prefix byte-identical to the previous one,
+        # which Gemini's implicit caching rewards.
+        _schedule_summary_refresh(user_id, conversation_id, uncovered, prior_summary, older_len)
+
+    if prior_summary is None:
+        # No usable summary yet — safest to send the full history unchanged.
+        return None
+
+    return [_summary_message(prior_summary)] + uncovered + recent
+
+
 def build_compacted_history(
     user_id: str | None,
     conversation_id: str | None,
@@ -177,48 +251,117 @@ def build_compacted_history(
         return history
     if not user_id or not conversation_id:
         return history
-    over_count = len(history) > Config.CONVERSATION_COMPACTION_THRESHOLD
-    token_threshold = Config.CONVERSATION_COMPACTION_TOKEN_THRESHOLD
-    over_tokens = token_threshold > 0 and _estimate_tokens(history) > token_threshold
-    if not (over_count or over_tokens):
+    keep_recent = _keep_recent(
+        len(history), _estimate_tokens(history), lambda k: _estimate_tokens(history[-k:])
+    )
+    if keep_recent is None:
         return history
 
-    keep_recent = Config.CONVERSATION_COMPACTION_KEEP_RECENT
-    # A few huge recent messages can exceed the token threshold all by
-    # themselves - shrink the verbatim tail (down to a floor) so compaction
-    # actually bounds what is sent, not just how many messages frame it.
-    if token_threshold > 0:
-        while (
-            keep_recent > _MIN_KEEP_RECENT
-            and _estimate_tokens(history[-keep_recent:]) > token_threshold
-        ):
-            keep_recent -= 1
-    if len(history) <= keep_recent:
-        return history
+    prior_summary, covered_count = _load_state(user_id, conversation_id)
+    compacted = _compact(
+        user_id,
+        conversation_id,
+        history,
+        0,
+        len(history),
+        keep_recent,
+        prior_summary,
+        covered_count,
+    )
+    return history if compacted is None else compacted
+
+
+def _load_full_history(conversation_id: str) -> list[dict[str, Any]]:
+    """Enriched history of every message except the newest (the current turn's)."""
+    with span("get_messages"):
+        messages = db.get_messages(conversation_id)[:-1]
+    with span("enrich_history"):
+        return enrich_history(messages)
 
-    older = history[:-keep_recent]
-    recent = history[-keep_recent:]
+
+def load_compacted_history(user_id: str, conversation_id: str) -> list[dict[str, Any]]:
+    """Load the history to send for a new turn, reading only what is sent.
+
+    Same result as ``build_compacted_history(user_id, conversation_id,
+    enrich_history(db.get_messages(conversation_id)[:-1]))`` - the newest
+    message is the turn's own user message - but once a running summary
+    exists only the un-summarized tail is read from the DB and enriched.
+    Thresholds are decided from message count/length aggregates.
+    """
+    if not Config.CONVERSATION_COMPACTION_ENABLED:
+        return _load_full_history(conversation_id)
+
+    count, chars, newest_chars = db.get_message_stats(conversation_id)
+    history_len = count - 1
+    history_tokens = (chars - newest_chars) // _CHARS_PER_TOKEN_ESTIMATE
+    over_count = history_len > Config.CONVERSATION_COMPACTION_THRESHOLD
+    token_threshold = Config.CONVERSATION_COMPACTION_TOKEN_THRESHOLD
+    over_tokens = token_threshold > 0 and history_tokens > token_threshold
+    if not (over_count or over_tokens):
+        return _load_full_history(conversation_id)
 
     prior_summary, covered_count = _load_state(user_id, conversation_id)
-    # Clamp coverage in case history shrank (e.g. messages deleted from the UI)
-    covered_count = max(0, min(covered_count, len(older)))
-    uncovered = older[covered_count:]
+    if prior_summary is None:
+        # First compaction (the whole older part gets summarized) - load it all
+        return build_compacted_history(
+            user_id, conversation_id, _load_full_history(conversation_id)
+        )
 
-    needs_resummarize = prior_summary is None or (
-        len(uncovered) >= Config.CONVERSATION_COMPACTION_RESUMMARIZE_BATCH
+    # Everything the summary covers is skipped. The tail never shrinks
+    # below KEEP_RECENT when clamping coverage, so starting there is safe
+    window_start = max(
+        0, min(covered_count, history_len - Config.CONVERSATION_COMPACTION_KEEP_RECENT)
+    )
+    # One extra leading message: enrichment derives session gaps from it
+    fetch_start = max(0, window_start - 1)
+    with span("get_messages"):
+        messages = db.get_messages_from(conversation_id, fetch_start)[:-1]
+    if len(messages) != history_len - fetch_start:
+        # Conversation changed between the queries - take the plain path
+        return build_compacted_history(
+            user_id, conversation_id, _load_full_history(conversation_id)
+        )
+    with span("enrich_history"):
+        window = enrich_history(messages)[window_start - fetch_start :]
+
+    keep_recent = _keep_recent(history_len, history_tokens, lambda k: _estimate_tokens(window[-k:]))
+    if keep_recent is None:
+        # Only reachable when the whole history fits the tail (window_start 0)
+        return window
+    compacted = _compact(
+        user_id,
+        conversation_id,
+        window,
+        window_start,
+        history_len,
+        keep_recent,
+        prior_summary,
+        covered_count,
     )
+    return window if compacted is None else compacted
 
-    if needs_resummarize:
-        # OFF the request path: the LLM summarizer used to run synchronously
-        # here, adding seconds to the user's turn every time the middle
-        # crossed the batch size. The refreshed summary serves LATER turns;
-        # this turn uses whatever state already exists. Deferring also keeps
-        # this turn's history prefix byte-identical to the previous one,
-        # which Gemini's implicit caching rewards.
-        _schedule_summary_refresh(user_id, conversation_id, uncovered, prior_summary, len(older))
 
-    if prior_summary is None:
-        # No usable summary yet — safest to send the full history unchanged.
-        return history
+def resolve_turn_history(
+    user_id: str,
+    conversation_id: str,
+    history: list[dict[str, Any]] | None,
+    *,
+    compact: bool,
+) -> list[dict[str, Any]]:
+    """The enriched history to send for a chat turn.
 
-    return [_summary_message(prior_summary)] + uncovered + recent
+    Args:
+        user_id: Owner of the conversation
+        conversation_id: Conversation identifier
+        history: Pre-built enriched history (re-run turns), or None to load
+            everything before the newest message
+        compact: False for agent conversations, which use their own
+            destructive compaction
+    """
+    if history is None:
+        if compact:
+            return load_compacted_history(user_id, conversation_id)
+        return _load_full_history(conversation_id)
+    if compact:
+        return build_compacted_history(user_id, conversation_id, history)
+    return history
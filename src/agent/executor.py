@@ -129,12 +129,14 @@ class AgentExecutor:
         # Get current trigger chain to pass to child
         parent_chain = get_trigger_chain()
 
-        # Create execution record
-        execution = db.create_execution(
+        # Claim the agent: it may already be running on a scheduler worker
+        execution = db.create_execution_if_idle(
             agent_id=self.agent.id,
             trigger_type=self.trigger_type,
             triggered_by_agent_id=self.triggered_by_agent_id,
         )
+        if execution is None:
+            raise AgentBlockedError("Agent is already running")
 
         # Execute the agent with the parent's trigger chain
         result, error_message = execute_agent(
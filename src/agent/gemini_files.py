@@ -1,14 +1,18 @@
-"""Bridge to the Gemini Files API for large media (videos).
+"""Bridge to the Gemini Files API for large media.
 
 Gemini's inline generateContent limit is ~20MB, so videos are uploaded to
-the Files API and referenced by file_uri. Uploaded files live 48h on
-Google's side; we cache the URI in kv_store for 47h and re-upload on demand.
+the Files API and referenced by file_uri. Images and PDFs above
+GEMINI_FILES_UPLOAD_THRESHOLD take the same path: inline base64 is re-sent
+with every tool round and every retrieve_file, a URI is a few bytes.
+Uploaded files live 48h on Google's side; we cache the URI in kv_store for
+47h and re-upload on demand.
 """
 
 import base64
 import binascii
 import io
 import json
+import logging
 import time
 from datetime import timedelta
 from typing import Any
@@ -17,7 +21,8 @@ from google import genai
 from google.genai import types as genai_types
 
 from src.config import Config
-from src.db.models import db
+from src.db.blob_store import get_blob_store
+from src.db.models import db, make_blob_key
 from src.utils.datetime_utils import utcnow_naive
 from src.utils.logging import get_logger
 
@@ -55,9 +60,28 @@ def _get_cached_uri(message_id: str, file_index: int) -> str | None:
     return None
 
 
-def ensure_gemini_file_uri(message_id: str, file_index: int, data: bytes, mime_type: str) -> str:
+def uses_files_api(mime_type: str, size: int) -> bool:
+    """Whether an attachment is sent by Files API reference instead of inline.
+
+    Videos always are (inline limit). Images and PDFs are once they exceed
+    GEMINI_FILES_UPLOAD_THRESHOLD; a threshold of 0 keeps them inline.
+    """
+    if mime_type.startswith("video/"):
+        return True
+    if not (mime_type.startswith("image/") or mime_type == "application/pdf"):
+        return False
+    threshold = Config.GEMINI_FILES_UPLOAD_THRESHOLD
+    return threshold > 0 and size > threshold
+
+
+def ensure_gemini_file_uri(
+    message_id: str, file_index: int, data: bytes | io.IOBase, mime_type: str
+) -> str:
     """Return an ACTIVE Gemini Files API URI for this file, uploading if needed.
 
+    data is the file's bytes or a seekable binary file object (streamed from
+    the blob store for uploads, so the file is never held whole in memory).
+
     Raises:
         GeminiFileError: if upload or server-side processing fails.
     """
@@ -76,7 +100,7 @@ def ensure_gemini_file_uri(message_id: str, file_index: int, data: bytes, mime_t
             "message_id": message_id,
             "file_index": file_index,
             "mime_type": mime_type,
-            "size": len(data),
+            "size": len(data) if isinstance(data, bytes) else None,
         },
     )
 
@@ -85,7 +109,7 @@ def ensure_gemini_file_uri(message_id: str, file_index: int, data: bytes, mime_t
 
     try:
         gfile = client.files.upload(
-            file=io.BytesIO(data),
+            file=io.BytesIO(data) if isinstance(data, bytes) else data,
             config=genai_types.UploadFileConfig(mime_type=mime_type),
         )
         deadline = time.monotonic() + PROCESSING_TIMEOUT_SECONDS
@@ -117,29 +141,71 @@ def ensure_gemini_file_uri(message_id: str, file_index: int, data: bytes, mime_t
     return str(gfile.uri)
 
 
-def attach_gemini_file_uris(message_id: str, files: list[dict[str, Any]]) -> None:
-    """Upload video attachments to the Files API, annotating file dicts in place.
+def _ensure_stored_file_uri(message_id: str, file_index: int, mime_type: str) -> str:
+    """ensure_gemini_file_uri for a saved file read from the blob store."""
+    reader = get_blob_store().open_reader(make_blob_key(message_id, file_index))
+    if reader is None:
+        raise GeminiFileError("Uploaded file is missing from storage")
+    with reader.fileobj() as fileobj:
+        return ensure_gemini_file_uri(message_id, file_index, fileobj, mime_type)
 
-    Adds "gemini_file_uri" on success or "gemini_upload_error" on failure.
-    Never raises — a failed video upload must not fail the whole chat request.
+
+def attach_gemini_file_uris(message_id: str, files: list[dict[str, Any]]) -> None:
+    """Upload large attachments to the Files API, annotating file dicts in place.
+
+    Covers videos and images/PDFs above the upload threshold (uses_files_api).
+    Adds "gemini_file_uri" on success. A failed video gets "gemini_upload_error"
+    (it can't be inlined); a failed image/PDF is left as is and goes inline.
+    Files validated by validate_files() are uploaded from their decoded
+    "attachment". Files without "data" (streamed uploads, see
+    src/utils/uploads.py) are read from the blob store, and inlined from there
+    if their upload fails.
+    Never raises — a failed upload must not fail the whole chat request.
     """
     for idx, file in enumerate(files):
         mime_type = file.get("type", "")
-        if not mime_type.startswith("video/"):
+        encoded = file.get("data")
+        attachment = file.get("attachment")
+        if attachment is not None:
+            size = attachment.size
+        else:
+            # Decoded size from the base64 length, without decoding small files
+            size = len(encoded) * 3 // 4 if encoded is not None else file.get("size", 0)
+        if not uses_files_api(mime_type, size):
             continue
+        is_video = mime_type.startswith("video/")
         try:
-            data = base64.b64decode(file.get("data", ""))
-            file["gemini_file_uri"] = ensure_gemini_file_uri(message_id, idx, data, mime_type)
+            if attachment is not None:
+                with attachment.open() as fileobj:
+                    file["gemini_file_uri"] = ensure_gemini_file_uri(
+                        message_id, idx, fileobj, mime_type
+                    )
+            elif encoded is None:
+                file["gemini_file_uri"] = _ensure_stored_file_uri(message_id, idx, mime_type)
+            else:
+                data = base64.b64decode(encoded)
+                file["gemini_file_uri"] = ensure_gemini_file_uri(message_id, idx, data, mime_type)
         except Exception as e:
             # Broad catch is deliberate: any failure here (upload, DB cache,
-            # client construction) must degrade to a text notice for the LLM,
-            # never fail the whole chat request.
-            logger.error(
-                "Failed to prepare video for Gemini",
-                extra={"message_id": message_id, "file_index": idx, "error": str(e)},
+            # client construction) must degrade to a text notice for the LLM
+            # (or inline data), never fail the whole chat request.
+            logger.log(
+                logging.ERROR if is_video else logging.WARNING,
+                "Failed to prepare file for Gemini",
+                extra={
+                    "message_id": message_id,
+                    "file_index": idx,
+                    "mime_type": mime_type,
+                    "error": str(e),
+                },
                 exc_info=not isinstance(e, (GeminiFileError, binascii.Error)),
             )
-            file["gemini_upload_error"] = str(e)
+            if is_video:
+                file["gemini_upload_error"] = str(e)
+            elif encoded is None:
+                stored = get_blob_store().get(make_blob_key(message_id, idx))
+                if stored is not None:
+                    file["data"] = base64.b64encode(stored[0]).decode("utf-8")
 
 
 def delete_cached_file_uri(message_id: str, file_index: int) -> None:
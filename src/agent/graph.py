@@ -16,6 +16,9 @@ was removed in Aug 2026 (git history has it).
 """
 
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from typing import Annotated, Any, Literal, TypedDict
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
@@ -23,14 +26,18 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode as BaseToolNode
+from langgraph.prebuilt.tool_node import ToolCallRequest
 
 from src.agent.content import extract_text_content, strip_full_result_from_tool_content
 from src.agent.retry import with_retry
+from src.agent.tool_cache import FRESH_ARG, cache_key, get_tool_cache, label_cached_result
 from src.agent.tool_results import get_current_request_id, store_tool_result
-from src.agent.tools import get_available_tools
+from src.agent.tools import TOOL_CACHE_POLICIES, get_available_tools
+from src.agent.tools.context import get_conversation_context
 from src.agent.tools.metadata import EXTRACT_ONLY_TOOL_NAMES
 from src.config import Config
 from src.utils.logging import get_logger
+from src.utils.spans import span
 
 logger = get_logger(__name__)
 
@@ -235,7 +242,8 @@ def chat_node(
             "model": model.model_name if hasattr(model, "model_name") else "unknown",
         },
     )
-    response = with_retry(model.invoke)(messages)
+    with span("llm"):
+        response = with_retry(model.invoke)(messages)
 
     # Log tool calls if present
     if isinstance(response, AIMessage) and response.tool_calls:
@@ -452,6 +460,16 @@ def _handle_tool_errors(e: Exception) -> str:
     return f"Error: {e!r}\n Please fix your mistakes."
 
 
+def _timed_tool_call(request: ToolCallRequest, execute: Callable[[ToolCallRequest], Any]) -> Any:
+    """Record each tool execution as a tool:<name> latency span of the turn.
+
+    Runs inside the ToolNode executor thread of the call, which carries a copy
+    of the turn's context, so parallel calls are timed individually.
+    """
+    with span(f"tool:{request.tool_call['name']}"):
+        return execute(request)
+
+
 def _split_blocked_tool_calls(
     state: AgentState,
     modules: dict[str, Any],
@@ -528,6 +546,86 @@ def _split_approval_tool_calls(
     return approval_state, siblings_state
 
 
+def _serve_cached_tool_calls(
+    state: AgentState, user_id: str | None
+) -> tuple[list[ToolMessage], AgentState | None, dict[str, tuple[tuple[Any, ...], float]]]:
+    """Answer repeated idempotent tool calls from the tool result cache.
+
+    Returns (cached_tool_messages, state_with_calls_to_run, pending) where
+    pending maps the tool_call_id of each cacheable call that will run to
+    (cache key, ttl) for _remember_tool_results. The state is None when every
+    call was served, and the original state when none was.
+
+    Calls that are writes under their tool's policy, or that a policy lists in
+    invalidated_by, drop the user's cached entries before they run.
+    """
+    last_message = state["messages"][-1]
+    if not (isinstance(last_message, AIMessage) and last_message.tool_calls):
+        return [], state, {}
+
+    cache = get_tool_cache()
+    served: list[ToolMessage] = []
+    to_run: list[Any] = []
+    pending: dict[str, tuple[tuple[Any, ...], float]] = {}
+    for tool_call in last_message.tool_calls:
+        tool_name = tool_call.get("name") or ""
+        args = tool_call.get("args") or {}
+        policy = TOOL_CACHE_POLICIES.get(tool_name)
+        key = cache_key(policy, tool_name, args, user_id) if policy else None
+
+        if policy and key is None and not policy.is_read(args):
+            cache.invalidate(tool_name, user_id)
+        for cached_name, cached_policy in TOOL_CACHE_POLICIES.items():
+            if tool_name in cached_policy.invalidated_by:
+                cache.invalidate(cached_name, user_id)
+
+        hit = cache.get(key) if key is not None and not args.get(FRESH_ARG) else None
+        if hit is None:
+            to_run.append(tool_call)
+            if key is not None and policy is not None:
+                pending[tool_call.get("id") or ""] = (key, policy.ttl_seconds)
+            continue
+
+        content, age_seconds = hit
+        logger.info(
+            "Tool result served from cache",
+            extra={"tool_name": tool_name, "age_seconds": round(age_seconds)},
+        )
+        served.append(
+            ToolMessage(
+                content=label_cached_result(content, tool_name, age_seconds),
+                tool_call_id=tool_call.get("id", ""),
+                name=tool_name,
+            )
+        )
+
+    if not served:
+        return [], state, pending
+    logger.debug("Tool result cache stats", extra=cache.stats())
+    if not to_run:
+        return served, None, pending
+
+    pruned = AIMessage(content=last_message.content, tool_calls=to_run)
+    exec_state: AgentState = {**state, "messages": list(state["messages"][:-1]) + [pruned]}
+    return served, exec_state, pending
+
+
+def _remember_tool_results(
+    messages: list[Any], pending: dict[str, tuple[tuple[Any, ...], float]]
+) -> None:
+    """Cache successful text results of the cacheable calls that just ran."""
+    cache = get_tool_cache()
+    for msg in messages:
+        if (
+            isinstance(msg, ToolMessage)
+            and msg.tool_call_id in pending
+            and isinstance(msg.content, str)
+            and _tool_message_error(msg) is None
+        ):
+            key, ttl_seconds = pending[msg.tool_call_id]
+            cache.put(key, msg.content, ttl_seconds)
+
+
 def _capture_and_strip_tool_messages(messages: list[Any], request_id: str | None) -> None:
     """Store original tool results for server-side extraction, then strip
     _full_result payloads (e.g. generated images) before they reach the LLM."""
@@ -581,7 +679,9 @@ def create_tool_node(tools: list[Any], is_autonomous: bool = False) -> Any:
         tools: List of tools to use
         is_autonomous: If True, check permissions and require approval for dangerous operations
     """
-    base_tool_node = BaseToolNode(tools, handle_tool_errors=_handle_tool_errors)
+    base_tool_node = BaseToolNode(
+        tools, handle_tool_errors=_handle_tool_errors, wrap_tool_call=_timed_tool_call
+    )
 
     def tool_node_with_stripping(state: AgentState) -> dict[str, Any]:
         """Execute tools and strip _full_result from results."""
@@ -610,13 +710,24 @@ def create_tool_node(tools: list[Any], is_autonomous: bool = False) -> Any:
         if is_autonomous and exec_state is not None:
             approval_state, exec_state = _split_approval_tool_calls(exec_state)
 
+        # Repeated idempotent reads are answered from the tool result cache
+        cached_messages: list[ToolMessage] = []
+        pending_cache: dict[str, tuple[tuple[Any, ...], float]] = {}
+        if exec_state is not None:
+            _, user_id = get_conversation_context()
+            cached_messages, exec_state, pending_cache = _serve_cached_tool_calls(
+                exec_state, user_id
+            )
+        answered = blocked_messages + cached_messages
+
         if exec_state is None:
-            # Every call was blocked (or was an approval request)
-            result: dict[str, Any] = {"messages": blocked_messages}
+            # Every call was blocked, served from cache, or an approval request
+            result: dict[str, Any] = {"messages": answered}
         else:
             result = base_tool_node.invoke(exec_state)
-            if blocked_messages:
-                result["messages"] = blocked_messages + list(result.get("messages", []))
+            _remember_tool_results(result.get("messages", []), pending_cache)
+            if answered:
+                result["messages"] = answered + list(result.get("messages", []))
 
         _capture_and_strip_tool_messages(result.get("messages", []), request_id)
 
@@ -732,6 +843,69 @@ def compile_graph(graph: StateGraph[AgentState]) -> Any:
     return graph.compile()
 
 
+# ============ Compiled Graph Cache ============
+
+# Compiled graphs keyed by everything create_chat_graph() builds from
+# (see graph_cache_key). Per-request state never lives in the graph: the
+# request id, agent context and conversation context are contextvars read at
+# run time, so one compiled graph serves any number of concurrent requests.
+_compiled_graphs: OrderedDict[Hashable, Any] = OrderedDict()
+_compiled_graphs_lock = threading.Lock()
+
+
+def graph_cache_key(
+    model_name: str,
+    with_tools: bool,
+    include_thoughts: bool,
+    tools: list[Any],
+    is_autonomous: bool,
+    cached_content: str | None,
+) -> Hashable:
+    """Cache key for a compiled chat graph.
+
+    Tools are identified by name AND object identity: the tool registry holds
+    module-level singletons, and a cached graph keeps its tools alive, so an
+    id can't be reused by a different tool while its entry exists.
+    """
+    tool_signature = tuple((getattr(t, "name", ""), id(t)) for t in tools)
+    return (
+        model_name,
+        with_tools,
+        include_thoughts,
+        tool_signature,
+        is_autonomous,
+        cached_content,
+    )
+
+
+def get_compiled_graph(key: Hashable, build: Callable[[], Any]) -> Any:
+    """Return the compiled graph for `key`, building it on a miss.
+
+    Bounded LRU (Config.AGENT_GRAPH_CACHE_SIZE). Building happens outside the
+    lock: two concurrent misses may both build, and the later one wins -
+    cheaper than serializing every first request behind a slow compile.
+    """
+    with _compiled_graphs_lock:
+        graph = _compiled_graphs.get(key)
+        if graph is not None:
+            _compiled_graphs.move_to_end(key)
+            return graph
+
+    graph = build()
+    with _compiled_graphs_lock:
+        _compiled_graphs[key] = graph
+        _compiled_graphs.move_to_end(key)
+        while len(_compiled_graphs) > Config.AGENT_GRAPH_CACHE_SIZE:
+            _compiled_graphs.popitem(last=False)
+    return graph
+
+
+def clear_graph_cache() -> None:
+    """Drop every compiled graph (tests patch the model class per test)."""
+    with _compiled_graphs_lock:
+        _compiled_graphs.clear()
+
+
 def get_graph_config() -> dict[str, Any]:
     """Build the config dict for graph invoke/stream calls."""
     return {"recursion_limit": Config.AGENT_RECURSION_LIMIT}
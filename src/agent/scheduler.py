@@ -1,21 +1,29 @@
 """Shared scheduler logic for autonomous agents.
 
 This module provides the core scheduling logic used by both:
-- Production: systemd timer script (scripts/run_agent_scheduler.py)
+- Production: systemd timer script (scripts/run_agent_scheduler.py), or the
+  resident scheduler (src/agent/scheduler_daemon.py) via its --daemon mode
 - Development: background thread (src/agent/dev_scheduler.py)
 
 The only difference between environments is how the scheduler is triggered:
 - Production: External systemd timer invokes the script every minute
 - Development: Internal background thread calls run_scheduled_agents() every minute
+
+Due agents run concurrently (AGENT_SCHEDULER_WORKERS), so agents due at the
+same minute that each wait on the model don't queue behind one another.
 """
 
 from __future__ import annotations
 
+import contextvars
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
-from src.db.models import db
+from src.config import Config
+from src.db.models import close_thread_db_connections, db
 from src.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -24,6 +32,10 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Which SchedulerResult counter a single agent run lands in
+Outcome = Literal["executed", "skipped", "failed", "waiting_approval"]
+
+
 @dataclass
 class SchedulerResult:
     """Result of a scheduler run."""
@@ -33,19 +45,20 @@ class SchedulerResult:
     failed: int = 0
     waiting_approval: int = 0
 
+    def add(self, outcome: Outcome) -> None:
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
 
 def run_scheduled_agents() -> SchedulerResult:
     """Execute all agents that are due to run.
 
     This is the shared core logic used by both production (systemd timer)
-    and development (background thread) schedulers.
+    and development (background thread) schedulers. Due agents run
+    concurrently on a bounded pool (see _run_due_agents).
 
     Returns:
         SchedulerResult with counts of executed, skipped, and failed agents.
     """
-    from src.agent.executor import AgentBlockedError, execute_agent
-    from src.agent.tools.request_approval import ApprovalRequestedException
-
     now = datetime.now(UTC).replace(tzinfo=None)  # Naive UTC for DB comparison
     logger.info("Scheduler: evaluating agent schedules", extra={"now": now.isoformat()})
 
@@ -65,98 +78,8 @@ def run_scheduled_agents() -> SchedulerResult:
     )
 
     result = SchedulerResult()
-
-    for agent in due_agents:
-        # Skip agents with pending approval
-        if db.has_pending_approval(agent.id):
-            logger.debug(
-                "Scheduler: skipping agent with pending approval",
-                extra={"agent_id": agent.id, "agent_name": agent.name},
-            )
-            result.skipped += 1
-            continue
-
-        # Skip agents that are already running (prevent overlapping executions)
-        if db.has_running_execution(agent.id):
-            logger.debug(
-                "Scheduler: skipping agent with running execution",
-                extra={"agent_id": agent.id, "agent_name": agent.name},
-            )
-            result.skipped += 1
-            continue
-
-        # Get the user
-        user = db.get_user_by_id(agent.user_id)
-        if not user:
-            logger.warning(
-                "Scheduler: user not found for agent",
-                extra={"agent_id": agent.id, "user_id": agent.user_id},
-            )
-            result.failed += 1
-            continue
-
-        # Create execution record
-        execution = db.create_execution(
-            agent_id=agent.id,
-            trigger_type="scheduled",
-        )
-
-        try:
-            logger.info(
-                "Scheduler: executing agent",
-                extra={"agent_id": agent.id, "agent_name": agent.name},
-            )
-
-            # Execute the agent
-            exec_result, error_msg = execute_agent(agent, user, "scheduled", execution.id)
-
-            if exec_result is True:
-                db.update_execution(execution.id, status="completed")
-                result.executed += 1
-                logger.info(
-                    "Scheduler: agent execution completed",
-                    extra={"agent_id": agent.id, "agent_name": agent.name},
-                )
-            elif exec_result == "waiting_approval":
-                # Executor already set status to waiting_approval
-                result.waiting_approval += 1
-                logger.info(
-                    "Scheduler: agent waiting for approval",
-                    extra={"agent_id": agent.id, "agent_name": agent.name},
-                )
-            else:
-                db.update_execution(execution.id, status="failed", error_message=error_msg)
-                result.failed += 1
-                logger.warning(
-                    "Scheduler: agent execution failed",
-                    extra={"agent_id": agent.id, "error": error_msg},
-                )
-                _update_next_run_on_failure(agent)
-
-        except ApprovalRequestedException:
-            # Agent used request_approval tool - already handled by executor
-            result.waiting_approval += 1
-            logger.info(
-                "Scheduler: agent requested approval",
-                extra={"agent_id": agent.id, "agent_name": agent.name},
-            )
-
-        except AgentBlockedError as e:
-            result.skipped += 1
-            logger.warning(
-                "Scheduler: agent blocked",
-                extra={"agent_id": agent.id, "error": str(e)},
-            )
-
-        except Exception as e:
-            db.update_execution(execution.id, status="failed", error_message=str(e))
-            result.failed += 1
-            logger.error(
-                "Scheduler: agent execution error",
-                extra={"agent_id": agent.id, "error": str(e)},
-                exc_info=True,
-            )
-            _update_next_run_on_failure(agent)
+    if due_agents:
+        _run_due_agents(due_agents, result)
 
     logger.info(
         "Scheduler: completed",
@@ -171,6 +94,161 @@ def run_scheduled_agents() -> SchedulerResult:
     return result
 
 
+def _run_due_agents(agents: list[Agent], result: SchedulerResult) -> None:
+    """Run agents on a bounded thread pool, fairly across users.
+
+    Each user's agents queue in due order. Free workers are handed out
+    round-robin across users, and no user has more than
+    AGENT_SCHEDULER_MAX_PER_USER agents running at once, so one user's batch
+    of 07:00 briefings can't hold every worker while another user waits.
+
+    Every run gets its own copy of the scheduler's context: the request id,
+    conversation and agent contextvars execute_agent sets stay with that run
+    instead of leaking into the next run on the same worker thread.
+    """
+    workers = max(1, Config.AGENT_SCHEDULER_WORKERS)
+    per_user = max(1, Config.AGENT_SCHEDULER_MAX_PER_USER)
+    queues: OrderedDict[str, deque[Agent]] = OrderedDict()
+    for agent in agents:
+        queues.setdefault(agent.user_id, deque()).append(agent)
+    running: dict[Future[Outcome], Agent] = {}
+    running_per_user: Counter[str] = Counter()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent-scheduler") as pool:
+        while queues or running:
+            # Fill free workers, one agent per eligible user per pass
+            dispatched = True
+            while dispatched and len(running) < workers:
+                dispatched = False
+                for user_id in list(queues):
+                    if len(running) >= workers:
+                        break
+                    if running_per_user[user_id] >= per_user:
+                        continue
+                    agent = queues[user_id].popleft()
+                    if queues[user_id]:
+                        queues.move_to_end(user_id)
+                    else:
+                        del queues[user_id]
+                    context = contextvars.copy_context()
+                    running[pool.submit(context.run, _run_agent, agent)] = agent
+                    running_per_user[user_id] += 1
+                    dispatched = True
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                agent = running.pop(future)
+                running_per_user[agent.user_id] -= 1
+                try:
+                    result.add(future.result())
+                except Exception as e:
+                    # _run_agent handles execution errors; this is a scheduler
+                    # bug or a DB failure before the execution record existed
+                    result.failed += 1
+                    logger.error(
+                        "Scheduler: agent run crashed",
+                        extra={"agent_id": agent.id, "error": str(e)},
+                        exc_info=True,
+                    )
+
+
+def _run_agent(agent: Agent) -> Outcome:
+    """Run one due agent on a scheduler worker, then release its DB connections."""
+    try:
+        return _execute_due_agent(agent)
+    finally:
+        close_thread_db_connections()
+
+
+def _execute_due_agent(agent: Agent) -> Outcome:
+    """Guard, claim and execute one due agent; returns its outcome."""
+    from src.agent.executor import AgentBlockedError, execute_agent
+    from src.agent.tools.request_approval import ApprovalRequestedException
+
+    # Skip agents with pending approval
+    if db.has_pending_approval(agent.id):
+        logger.debug(
+            "Scheduler: skipping agent with pending approval",
+            extra={"agent_id": agent.id, "agent_name": agent.name},
+        )
+        return "skipped"
+
+    # Get the user
+    user = db.get_user_by_id(agent.user_id)
+    if not user:
+        logger.warning(
+            "Scheduler: user not found for agent",
+            extra={"agent_id": agent.id, "user_id": agent.user_id},
+        )
+        return "failed"
+
+    # Claim the agent: creates the execution record unless one is already
+    # running (a manual run or trigger_agent may have started it meanwhile)
+    execution = db.create_execution_if_idle(agent_id=agent.id, trigger_type="scheduled")
+    if execution is None:
+        logger.debug(
+            "Scheduler: skipping agent with running execution",
+            extra={"agent_id": agent.id, "agent_name": agent.name},
+        )
+        return "skipped"
+
+    try:
+        logger.info(
+            "Scheduler: executing agent",
+            extra={"agent_id": agent.id, "agent_name": agent.name},
+        )
+
+        # Execute the agent
+        exec_result, error_msg = execute_agent(agent, user, "scheduled", execution.id)
+
+        if exec_result is True:
+            db.update_execution(execution.id, status="completed")
+            logger.info(
+                "Scheduler: agent execution completed",
+                extra={"agent_id": agent.id, "agent_name": agent.name},
+            )
+            return "executed"
+        if exec_result == "waiting_approval":
+            # Executor already set status to waiting_approval
+            logger.info(
+                "Scheduler: agent waiting for approval",
+                extra={"agent_id": agent.id, "agent_name": agent.name},
+            )
+            return "waiting_approval"
+        db.update_execution(execution.id, status="failed", error_message=error_msg)
+        logger.warning(
+            "Scheduler: agent execution failed",
+            extra={"agent_id": agent.id, "error": error_msg},
+        )
+        _update_next_run_on_failure(agent)
+        return "failed"
+
+    except ApprovalRequestedException:
+        # Agent used request_approval tool - already handled by executor
+        logger.info(
+            "Scheduler: agent requested approval",
+            extra={"agent_id": agent.id, "agent_name": agent.name},
+        )
+        return "waiting_approval"
+
+    except AgentBlockedError as e:
+        logger.warning(
+            "Scheduler: agent blocked",
+            extra={"agent_id": agent.id, "error": str(e)},
+        )
+        return "skipped"
+
+    except Exception as e:
+        db.update_execution(execution.id, status="failed", error_message=str(e))
+        logger.error(
+            "Scheduler: agent execution error",
+            extra={"agent_id": agent.id, "error": str(e)},
+            exc_info=True,
+        )
+        _update_next_run_on_failure(agent)
+        return "failed"
+
+
 def _update_next_run_on_failure(agent: Agent) -> None:
     """Update next_run_at after a failed execution.
 
@@ -0,0 +1,94 @@
+"""Resident agent scheduler.
+
+The systemd timer starts a fresh Python process every minute, so an agent due
+at 09:00:00 runs somewhere within that minute, and every tick pays for
+interpreter start-up and create_app() even when nothing is due. The resident
+mode (``scripts/run_agent_scheduler.py --daemon``) stays up instead: it keeps
+a min-heap of the scheduled agents' next_run_at, sleeps until the earliest,
+then runs the shared run_scheduled_agents() in-process.
+
+The web app runs in other processes, so agent create/update/delete bump a
+counter in kv_store (db.get_schedule_version) and the daemon polls it every
+AGENT_SCHEDULER_POLL_SECONDS while sleeping - one indexed read - and rebuilds
+the heap when it changes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from datetime import datetime, timedelta
+
+from src.agent.scheduler import run_scheduled_agents
+from src.config import Config
+from src.db.models import db
+from src.utils.datetime_utils import utcnow_naive
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Agents still due after a run (pending approval, already running, failed
+# claim) keep their past next_run_at; retry them at the timer's old cadence
+# instead of spinning on them.
+OVERDUE_RETRY_SECONDS = 60
+
+
+class AgentScheduleDaemon:
+    """Sleeps until the next scheduled agent is due, then runs due agents."""
+
+    def __init__(self, poll_seconds: float | None = None) -> None:
+        self.poll_seconds = poll_seconds or Config.AGENT_SCHEDULER_POLL_SECONDS
+        self._heap: list[tuple[datetime, str]] = []
+        self._version: int | None = None
+        self._last_run_at: datetime | None = None
+
+    def reload(self) -> None:
+        """Rebuild the heap from the database."""
+        # Read the version first: a change landing mid-reload triggers another
+        self._version = db.get_schedule_version()
+        heap: list[tuple[datetime, str]] = []
+        for agent in db.list_all_scheduled_agents():
+            if agent.next_run_at is None:
+                continue
+            due_at = agent.next_run_at
+            if self._last_run_at is not None and due_at <= self._last_run_at:
+                due_at = self._last_run_at + timedelta(seconds=OVERDUE_RETRY_SECONDS)
+            heap.append((due_at, agent.id))
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def next_due_at(self) -> datetime | None:
+        return self._heap[0][0] if self._heap else None
+
+    def tick(self, now: datetime | None = None) -> float:
+        """Run due agents if any; returns how long to sleep before the next tick."""
+        if db.get_schedule_version() != self._version:
+            self.reload()
+
+        now = now or utcnow_naive()
+        next_due = self.next_due_at()
+        if next_due is not None and next_due <= now:
+            result = run_scheduled_agents()
+            logger.debug("Scheduler daemon: run finished", extra={"result": str(result)})
+            self._last_run_at = now
+            self.reload()
+            now = utcnow_naive()
+            next_due = self.next_due_at()
+
+        if next_due is None:
+            return self.poll_seconds
+        return max(0.0, min(self.poll_seconds, (next_due - now).total_seconds()))
+
+    def run(self, stop_event: threading.Event) -> None:
+        """Loop until stop_event is set (in-flight agent runs finish first)."""
+        logger.info("Scheduler daemon: started", extra={"poll_seconds": self.poll_seconds})
+        while not stop_event.is_set():
+            try:
+                timeout = self.tick()
+            except Exception as e:
+                logger.error(
+                    "Scheduler daemon: tick failed", extra={"error": str(e)}, exc_info=True
+                )
+                timeout = self.poll_seconds
+            stop_event.wait(timeout)
+        logger.info("Scheduler daemon: stopped")
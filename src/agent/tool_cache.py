@@ -0,0 +1,204 @@
+"""Per-worker TTL cache for idempotent tool results.
+
+The model regularly repeats the same read within one conversation or agent
+run - the same web_search, a fetch_url it already read, a Garmin or calendar
+lookup from three turns ago. The tool node (src/agent/graph.py) answers such
+calls from this cache instead of re-running the tool.
+
+Tools opt in with a ToolCachePolicy (see TOOL_CACHE_POLICIES in
+src/agent/tools/__init__.py). A policy decides which calls are reads, how long
+their results stay fresh, how arguments are canonicalized into the key, and
+whether the key is scoped to the user. Only successful string results are
+stored; errors and multimodal payloads always re-run.
+
+Served results are labelled with their age so the model can re-run
+freshness-sensitive calls with ``fresh=true``, which skips the lookup (the
+fresh result then replaces the cached one).
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.config import Config
+
+# Tool argument that bypasses the cache; never part of the key
+FRESH_ARG = "fresh"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def canonical_args(args: dict[str, Any]) -> dict[str, Any]:
+    """Default key normalization: drop unset args and `fresh`, tidy whitespace.
+
+    None means "use the default" for every cached tool, so `limit=None` and an
+    omitted `limit` are the same call.
+    """
+    canonical: dict[str, Any] = {}
+    for name, value in args.items():
+        if name == FRESH_ARG or value is None:
+            continue
+        if isinstance(value, str):
+            value = _WHITESPACE_RE.sub(" ", value).strip()
+        elif isinstance(value, list):
+            value = [_WHITESPACE_RE.sub(" ", v).strip() if isinstance(v, str) else v for v in value]
+        canonical[name] = value
+    return canonical
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """How one tool's results are cached.
+
+    Attributes:
+        ttl_seconds: How long a result is served before the tool re-runs
+        is_read: Which calls are cacheable reads; any other call of the tool
+            is a write and drops the user's cached entries of this tool
+        normalize: Canonicalizes arguments into the key (default: canonical_args)
+        user_scoped: Key results per user; False shares them across users
+            (public data such as search results and web pages)
+        context_key: Extra key material from request context that the result
+            depends on beyond the arguments (e.g. device location for "current")
+        invalidated_by: Other tools whose calls drop the user's cached entries
+            of this tool (e.g. save_place changes what "home" resolves to)
+    """
+
+    ttl_seconds: float
+    is_read: Callable[[dict[str, Any]], bool] = lambda args: True
+    normalize: Callable[[dict[str, Any]], dict[str, Any]] = canonical_args
+    user_scoped: bool = True
+    context_key: Callable[[dict[str, Any]], Hashable] | None = None
+    invalidated_by: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass
+class _Entry:
+    content: str
+    stored_at: float
+    expires_at: float
+    size: int
+
+
+class ToolResultCache:
+    """Byte-bounded LRU of tool results with per-entry expiry.
+
+    Thread-safe: batched tool calls and concurrent requests share one instance.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Any, ...], _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple[Any, ...]) -> tuple[str, float] | None:
+        """Return (content, age in seconds) for a live entry, counting the lookup."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.content, now - entry.stored_at
+
+    def put(self, key: tuple[Any, ...], content: str, ttl_seconds: float) -> None:
+        """Store a result, evicting least recently used entries past max_bytes."""
+        size = len(content.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(content, now, now + ttl_seconds, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tool_name: str, user_id: str | None) -> int:
+        """Drop every entry of tool_name for user_id; returns how many."""
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == tool_name and k[1] == user_id]
+            for key in stale:
+                self._drop(key)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters for logging and monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _drop(self, key: tuple[Any, ...]) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+
+_cache = ToolResultCache(Config.TOOL_CACHE_MAX_BYTES)
+
+
+def get_tool_cache() -> ToolResultCache:
+    """The per-worker tool result cache."""
+    return _cache
+
+
+def cache_key(
+    policy: ToolCachePolicy, tool_name: str, args: dict[str, Any], user_id: str | None
+) -> tuple[Any, ...] | None:
+    """Key for a cacheable call, or None when the call is never cached.
+
+    Writes and user-scoped calls without a user get no key. `fresh=true` calls
+    do get one: they skip the lookup but their result refreshes the entry.
+    The key always starts with (tool_name, user_id) so invalidation can find
+    a tool's entries.
+    """
+    if not Config.TOOL_CACHE_ENABLED or not policy.is_read(args):
+        return None
+    if policy.user_scoped and not user_id:
+        return None
+    normalized = json.dumps(policy.normalize(args), sort_keys=True, default=str)
+    context = policy.context_key(args) if policy.context_key else None
+    return (tool_name, user_id if policy.user_scoped else None, normalized, context)
+
+
+def label_cached_result(content: str, tool_name: str, age_seconds: float) -> str:
+    """Mark a served result as cached so the model can ask for a fresh one.
+
+    JSON objects get a "_cached" field (keeps them parseable for result
+    extraction and error detection); anything else gets a leading note.
+    """
+    note = (
+        f"Cached result from {round(age_seconds)}s ago. If up-to-the-minute data "
+        f"matters, call {tool_name} again with fresh=true."
+    )
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        data = None
+    if isinstance(data, dict):
+        return json.dumps({**data, "_cached": note})
+    return f"[{note}]\n{content}"
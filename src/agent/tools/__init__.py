@@ -3,8 +3,11 @@
 This package contains all tools available to the LLM agent.
 """
 
+from collections.abc import Hashable
 from typing import Any
 
+from src.agent.tool_cache import ToolCachePolicy, canonical_args
+
 # Import tools from submodules
 from src.agent.tools.agent_kv import kv_store
 from src.agent.tools.browser import browser, is_browser_available
@@ -29,6 +32,7 @@ from src.agent.tools.file_retrieval import retrieve_file
 from src.agent.tools.garmin import garmin_connect, is_garmin_available
 from src.agent.tools.garmin_workout import garmin_workout
 from src.agent.tools.google_calendar import google_calendar, is_google_calendar_available
+from src.agent.tools.http_cache import normalize_url
 from src.agent.tools.image_generation import generate_image
 from src.agent.tools.memory import manage_memory, search_memory
 from src.agent.tools.metadata import (
@@ -379,6 +383,67 @@ def get_tools_for_agent(agent: Agent) -> list[Any]:
     return tools
 
 
+# ============ Tool Result Caching ============
+
+
+def _web_search_cache_args(args: dict[str, Any]) -> dict[str, Any]:
+    """Key web_search by its effective query list, as the tool merges it."""
+    merged = [args.get("query") or ""] + list(args.get("queries") or [])
+    queries = canonical_args({"queries": merged})["queries"]
+    num_results = args.get("num_results") or Config.WEB_SEARCH_DEFAULT_RESULTS
+    return {
+        "queries": list(dict.fromkeys(q.casefold() for q in queries if q)),
+        "num_results": min(max(1, num_results), Config.WEB_SEARCH_MAX_RESULTS),
+    }
+
+
+def _fetch_url_cache_args(args: dict[str, Any]) -> dict[str, Any]:
+    """Key fetch_url by URL without the fragment; scheme and host are case-insensitive."""
+    return {"url": normalize_url(str(args.get("url", "")))}
+
+
+def _current_location_key(args: dict[str, Any]) -> Hashable:
+    """Device location (~100 m) for calls that resolve a "current" point."""
+    if not any(isinstance(v, str) and v.strip().lower() == "current" for v in args.values()):
+        return None
+    loc = get_location_context()
+    if not loc:
+        return None
+    return round(loc["lat"], 3), round(loc["lon"], 3)
+
+
+_CALENDAR_READ_ACTIONS = {"list_calendars", "list_events", "get_event"}
+
+# Tools whose results are reused across repeated identical calls (see
+# src/agent/tool_cache.py). Only idempotent reads belong here; TTLs bound how
+# stale a result the model can be handed without asking for fresh=true.
+TOOL_CACHE_POLICIES: dict[str, ToolCachePolicy] = {
+    "web_search": ToolCachePolicy(
+        ttl_seconds=600, normalize=_web_search_cache_args, user_scoped=False
+    ),
+    "fetch_url": ToolCachePolicy(
+        ttl_seconds=600, normalize=_fetch_url_cache_args, user_scoped=False
+    ),
+    # Read-only; "today" data moves during the day, hence the short TTL
+    "garmin_connect": ToolCachePolicy(ttl_seconds=300),
+    # Writes (create/update/delete/respond) drop the user's cached reads
+    "google_calendar": ToolCachePolicy(
+        ttl_seconds=120, is_read=lambda args: args.get("action") in _CALENDAR_READ_ACTIONS
+    ),
+    "search_places": ToolCachePolicy(
+        ttl_seconds=900,
+        context_key=_current_location_key,
+        invalidated_by=frozenset({"save_place", "delete_place"}),
+    ),
+    # Car routes are traffic-aware
+    "get_route": ToolCachePolicy(
+        ttl_seconds=300,
+        context_key=_current_location_key,
+        invalidated_by=frozenset({"save_place", "delete_place"}),
+    ),
+}
+
+
 # Export all public symbols
 __all__ = [
     # Tools
@@ -442,4 +507,5 @@ __all__ = [
     "get_tools_for_agent",
     # Constants
     "FETCHABLE_BINARY_TYPES",
+    "TOOL_CACHE_POLICIES",
 ]
@@ -1,9 +1,14 @@
 """Browser automation tool using Playwright for JavaScript-capable web browsing.
 
-All Playwright operations run on a dedicated daemon thread (the "browser worker")
+All Playwright operations run on dedicated daemon threads ("browser workers")
 because Playwright's sync API is greenlet-based and cannot be used from arbitrary
-threads. The tool function dispatches commands to the worker via a queue and blocks
+threads. The tool function dispatches commands to a worker via a queue and blocks
 until the result is ready.
+
+A pool of BROWSER_WORKERS workers, each with its own Chromium, lets conversations
+browse in parallel: a conversation sticks to the worker holding its session,
+new conversations go to the least-loaded worker, and a worker whose queue is
+BROWSER_WORKER_MAX_QUEUE deep fails fast instead of queueing behind slow pages.
 """
 
 import atexit
@@ -71,20 +76,30 @@ class _WorkerCommand:
     error: BaseException | None = None
 
 
+class BrowserBusyError(Exception):
+    """Raised when a browser worker's queue is full (fast-fail instead of waiting)."""
+
+
 class _BrowserWorker:
     """Dedicated thread that owns the Playwright browser instance.
 
     Playwright's sync API uses greenlets internally and cannot be shared across
     threads. This worker runs all Playwright operations on a single long-lived
-    daemon thread and accepts commands via a queue.
+    daemon thread and accepts commands via a queue. Its sessions (one browser
+    context per conversation) are capped and expired per worker.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, index: int = 0) -> None:
         # Set when a command times out (worker stuck in Playwright) - the
         # worker is then replaced on next use instead of dispatched to forever
         self.unhealthy = False
         self._cmd_queue: queue.Queue[_WorkerCommand | None] = queue.Queue()
-        self._thread = threading.Thread(target=self._run, daemon=True, name="browser-worker")
+        # Commands queued or running, for the fast-fail limit and routing
+        self._depth = 0
+        self._depth_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"browser-worker-{index}"
+        )
         self._pw: Any = None
         self._browser: Any = None
         self._sessions: dict[str, BrowserSession] = {}
@@ -124,15 +139,36 @@ class _BrowserWorker:
         # Cleanup
         self._cleanup_all()
 
+    @property
+    def load(self) -> int:
+        """Sessions held plus commands pending (routing weight for new conversations)."""
+        return len(self._sessions) + self._depth
+
     def execute(self, fn_name: str, **kwargs: Any) -> Any:
-        """Send a command to the worker and block until done."""
+        """Send a command to the worker and block until done.
+
+        Raises:
+            BrowserBusyError: BROWSER_WORKER_MAX_QUEUE commands are already
+                pending on this worker
+        """
+        with self._depth_lock:
+            if self._depth >= Config.BROWSER_WORKER_MAX_QUEUE:
+                raise BrowserBusyError("Browser worker queue is full")
+            self._depth += 1
+        try:
+            return self._execute(fn_name, kwargs)
+        finally:
+            with self._depth_lock:
+                self._depth -= 1
+
+    def _execute(self, fn_name: str, kwargs: dict[str, Any]) -> Any:
         cmd = _WorkerCommand(fn_name=fn_name, kwargs=kwargs)
         self._cmd_queue.put(cmd)
         cmd.result_event.wait(timeout=Config.TOOL_TIMEOUT)
         if not cmd.result_event.is_set():
             # The worker thread is stuck inside a Playwright call and will
             # process queued commands only if/when it ever returns. Mark the
-            # worker unhealthy so _get_worker() replaces it (R1); the stuck
+            # worker unhealthy so the pool replaces it (R1); the stuck
             # daemon thread is abandoned and dies with the process.
             self.unhealthy = True
             raise TimeoutError("Browser worker timed out")
@@ -309,39 +345,117 @@ class _BrowserWorker:
         ]
         for cid in stale:
             self._close_session(cid)
-        return {"cleaned": len(stale)}
-
+        return {"cleaned": len(stale), "sessions": list(self._sessions)}
 
-# ============ Worker Lifecycle ============
 
-_worker: _BrowserWorker | None = None
-_worker_lock = threading.Lock()
+# ============ Worker Pool ============
 
 
-def _get_worker() -> _BrowserWorker:
-    """Get or create the browser worker (lazy init, replaces unhealthy ones)."""
-    global _worker
-    if _worker is not None and not _worker.unhealthy:
-        return _worker
-
-    with _worker_lock:
-        if _worker is not None and not _worker.unhealthy:
-            return _worker
-        if _worker is not None:
-            logger.warning("Replacing unhealthy browser worker")
-            _worker.stop()  # best effort; the stuck thread may never see it
-        _worker = _BrowserWorker()
-    return _worker
-
-
-def _shutdown_worker() -> None:
-    global _worker
-    if _worker is not None:
-        _worker.stop()
-        _worker = None
+class _BrowserPool:
+    """BROWSER_WORKERS browser workers with conversation-affinity routing.
 
+    Workers start lazily, so an idle deployment runs no Chromium at all. A
+    conversation is routed to the worker that holds its session; a new one
+    goes to the least-loaded worker (an unstarted slot counts as empty).
+    Unhealthy workers are replaced in place, keeping their slot's affinity.
+    Each routing stamps the conversation with the current generation, so a
+    cleanup pass only prunes conversations that weren't routed after it
+    listed the worker's sessions.
+    """
 
-atexit.register(_shutdown_worker)
+    def __init__(self, size: int) -> None:
+        self._workers: list[_BrowserWorker | None] = [None] * max(1, size)
+        self._affinity: dict[str, int] = {}
+        self._routed_at: dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def worker_for(self, conversation_id: str) -> _BrowserWorker:
+        with self._lock:
+            self._generation += 1
+            self._routed_at[conversation_id] = self._generation
+            index = self._affinity.get(conversation_id)
+            if index is None:
+                index = min(range(len(self._workers)), key=self._slot_load)
+                self._affinity[conversation_id] = index
+            worker = self._workers[index]
+            if worker is not None and not worker.unhealthy:
+                return worker
+            if worker is not None:
+                logger.warning("Replacing unhealthy browser worker", extra={"worker": index})
+                worker.stop()  # best effort; the stuck thread may never see it
+            worker = self._workers[index] = _BrowserWorker(index)
+            return worker
+
+    def _slot_load(self, index: int) -> tuple[int, bool]:
+        worker = self._workers[index]
+        if worker is None:
+            return (0, True)  # empty, but prefer an idle running worker
+        return (worker.load, False)
+
+    def live_workers(self) -> list[tuple[int, _BrowserWorker]]:
+        with self._lock:
+            return [
+                (i, w) for i, w in enumerate(self._workers) if w is not None and not w.unhealthy
+            ]
+
+    def generation(self) -> int:
+        """Current routing generation (take it before listing a worker's sessions)."""
+        with self._lock:
+            return self._generation
+
+    def prune(self, index: int, live_sessions: list[str], generation: int) -> None:
+        """Drop affinity for conversations whose session on worker `index` is gone.
+
+        Conversations routed after `generation` are kept: their session may
+        not be open yet when the worker listed its sessions.
+        """
+        live = set(live_sessions)
+        with self._lock:
+            for cid in [
+                c
+                for c, i in self._affinity.items()
+                if i == index and c not in live and self._routed_at.get(c, 0) <= generation
+            ]:
+                del self._affinity[cid]
+                self._routed_at.pop(cid, None)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for worker in self._workers:
+                if worker is not None:
+                    worker.stop()
+            self._workers = [None] * len(self._workers)
+            self._affinity.clear()
+            self._routed_at.clear()
+
+
+_pool: _BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> _BrowserPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _BrowserPool(Config.BROWSER_WORKERS)
+    return _pool
+
+
+def _get_worker(conversation_id: str) -> _BrowserWorker:
+    """Get the browser worker for a conversation (lazy init, replaces unhealthy ones)."""
+    return _get_pool().worker_for(conversation_id)
+
+
+def _shutdown_workers() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+atexit.register(_shutdown_workers)
 
 # Background cleanup timer
 _cleanup_thread: threading.Thread | None = None
@@ -352,13 +466,18 @@ def _cleanup_loop() -> None:
     while not _cleanup_stop.is_set():
         if _cleanup_stop.wait(timeout=60):
             break
-        if _worker is not None:
+        pool = _pool
+        if pool is None:
+            continue
+        for index, worker in pool.live_workers():
             try:
-                result = _worker.execute("cleanup_stale")
+                generation = pool.generation()
+                result = worker.execute("cleanup_stale")
+                pool.prune(index, result["sessions"], generation)
                 if result.get("cleaned", 0) > 0:
                     logger.debug(
                         "Cleaned up stale browser sessions",
-                        extra={"count": result["cleaned"]},
+                        extra={"count": result["cleaned"], "worker": index},
                     )
             except Exception:
                 logger.debug("Browser session cleanup pass failed", exc_info=True)
@@ -603,7 +722,7 @@ def browser(
     _start_cleanup_thread()
 
     try:
-        worker = _get_worker()
+        worker = _get_worker(conversation_id)
 
         # Build kwargs for worker command
         kwargs: dict[str, Any] = {"conversation_id": conversation_id}
@@ -640,6 +759,14 @@ def browser(
 
         return json.dumps(result)
 
+    except BrowserBusyError:
+        return json.dumps(
+            {
+                "error": "The browser is busy with other requests.",
+                "retriable": True,
+                "hint": "Try again shortly, or use fetch_url if the page doesn't need JavaScript.",
+            }
+        )
     except TimeoutError:
         return json.dumps(
             {
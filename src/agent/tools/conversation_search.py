@@ -19,7 +19,7 @@ from langchain_core.tools import tool
 from src.agent.tools.context import get_conversation_context
 from src.config import Config
 from src.db.models import db
-from src.utils.embeddings import embed_text, top_k_similar
+from src.utils.embeddings import embed_text
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -101,12 +101,9 @@ def _semantic_matches(
     if query_vec is None:
         return []
 
-    candidates = [
-        (ref_id, vector) for ref_id, _dim, vector in db.get_embeddings(user_id, "message")
-    ]
     ranked = [
         ref_id
-        for ref_id, score in top_k_similar(query_vec, candidates, limit * 3)
+        for ref_id, score in db.search_embeddings(user_id, "message", query_vec, limit * 3)
         if score >= _SEMANTIC_MIN_SIMILARITY
     ]
     if not ranked:
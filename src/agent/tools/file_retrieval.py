@@ -163,27 +163,36 @@ def retrieve_file(
 
     file_size = len(binary_data)
 
-    # Videos go via the Gemini Files API (inline limit is ~20MB); skip the
-    # base64 encoding below — a 100MB video would be needlessly inflated
-    if mime_type.startswith("video/"):
-        from src.agent.gemini_files import GeminiFileError, ensure_gemini_file_uri
+    # Videos and large images/PDFs go via the Gemini Files API (inline limit
+    # is ~20MB, and an inline result is re-sent on every later tool round);
+    # the URI is cached per file, so repeat retrievals don't re-upload
+    from src.agent.gemini_files import GeminiFileError, ensure_gemini_file_uri, uses_files_api
 
+    if uses_files_api(mime_type, file_size):
         try:
             uri = ensure_gemini_file_uri(message_id, file_index, binary_data, mime_type)
         except GeminiFileError as e:
-            return json.dumps({"error": f"Failed to prepare video for viewing: {e}"})
-        logger.info(
-            "retrieve_file: video prepared via Files API",
-            extra={"message_id": message_id, "file_index": file_index},
-        )
-        return [
-            {
-                "type": "text",
-                "text": f"Here is {file_name} ({mime_type}, {file_size} bytes) "
-                f"from message {message_id}:",
-            },
-            {"type": "media", "file_uri": uri, "mime_type": mime_type},
-        ]
+            if mime_type.startswith("video/"):
+                return json.dumps({"error": f"Failed to prepare video for viewing: {e}"})
+            # Images and PDFs still fit inline
+            logger.warning(
+                "retrieve_file: Files API upload failed, returning inline",
+                extra={"message_id": message_id, "file_index": file_index, "error": str(e)},
+            )
+            uri = None
+        if uri:
+            logger.info(
+                "retrieve_file: file prepared via Files API",
+                extra={"message_id": message_id, "file_index": file_index},
+            )
+            return [
+                {
+                    "type": "text",
+                    "text": f"Here is {file_name} ({mime_type}, {file_size} bytes) "
+                    f"from message {message_id}:",
+                },
+                {"type": "media", "file_uri": uri, "mime_type": mime_type},
+            ]
 
     # Encode as base64 for return
     file_base64 = base64.b64encode(binary_data).decode("utf-8")
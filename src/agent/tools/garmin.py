@@ -424,6 +424,7 @@ def garmin_connect(
     limit: int | None = None,
     activity_type: str | None = None,
     course_id: str | None = None,
+    fresh: bool = False,
 ) -> str:
     """Access health, fitness, and training data from the user's Garmin Connect account.
 
@@ -482,6 +483,8 @@ def garmin_connect(
         limit: Number of activities to return for get_activities (default 10)
         activity_type: Filter by activity type for get_activities / get_courses
         course_id: Course ID for get_course_details
+        fresh: Query Garmin again instead of reusing a recent identical
+            call (today's stats change during the day)
 
     Returns:
         JSON string with the result
@@ -14,6 +14,7 @@ from src.auth.google_calendar import (
     GoogleCalendarAuthError,
 )
 from src.config import Config
+from src.utils.calendar_sync import CalendarMirror, CalendarSyncError, sync_calendar_mirror
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -55,6 +56,55 @@ def _get_google_calendar_access_token() -> tuple[str, str | None] | None:
     return access_token, user.google_calendar_email
 
 
+def _get_calendar_mirror(
+    token: str, calendar_id: str, sync: bool, force: bool = False
+) -> CalendarMirror | None:
+    """Get the current user's local mirror of a calendar (src/utils/calendar_sync.py).
+
+    With sync, the mirror is brought up to date first (at most once per
+    GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS unless force is set); without,
+    an existing mirror is returned for writes to patch. Returns None - handlers
+    then use the REST API - without a user context, with
+    GOOGLE_CALENDAR_MIRROR_ENABLED off, when the calendar was never synced
+    (writes) or when the sync fails (the REST call then surfaces the error).
+    """
+    if not Config.GOOGLE_CALENDAR_MIRROR_ENABLED:
+        return None
+    _, user_id = get_conversation_context()
+    if not user_id:
+        return None
+
+    from src.db.models import db
+
+    if not sync:
+        state = db.get_calendar_sync_state(user_id, calendar_id)
+        if not state:
+            return None
+        return CalendarMirror(db, user_id, calendar_id, state["window_start"], state["window_end"])
+    try:
+        return sync_calendar_mirror(db, user_id, token, calendar_id, force=force)
+    except CalendarSyncError as e:
+        logger.warning(
+            "Calendar mirror sync failed, using the REST API",
+            extra={"user_id": user_id, "calendar_id": calendar_id, "error": str(e)},
+        )
+        return None
+
+
+def _patch_calendar_mirror(mirror: CalendarMirror | None, event: dict[str, Any]) -> None:
+    """Patch the mirror with an event returned by a write.
+
+    Writes to a recurring series change instances the response doesn't
+    include, so those mark the mirror stale instead.
+    """
+    if not mirror:
+        return
+    if event.get("recurrence"):
+        mirror.mark_stale()
+    else:
+        mirror.save(event)
+
+
 def _calendar_time_range(
     time_min: str | None, time_max: str | None, default_days: int = 7
 ) -> tuple[str, str]:
@@ -240,25 +290,37 @@ def _google_calendar_list_events(
     time_max: str | None,
     max_results: int | None,
     query: str | None,
+    mirror: CalendarMirror | None = None,
 ) -> dict[str, Any]:
+    """List events in a range.
+
+    Served from the mirror when it covers the range; text searches (query)
+    and ranges outside the synced window go to the API.
+    """
     time_min_val, time_max_val = _calendar_time_range(time_min, time_max)
-    params: dict[str, Any] = {
-        "timeMin": time_min_val,
-        "timeMax": time_max_val,
-        "singleEvents": True,
-        "orderBy": "startTime",
-    }
-    if query:
-        params["q"] = query
-    if max_results:
-        params["maxResults"] = max(1, min(max_results, 100))
+    limit = max(1, min(max_results, 100)) if max_results else None
 
-    events = _google_calendar_api_request(
-        "GET", f"/calendars/{calendar_id}/events", token, params=params
-    )
-    if not isinstance(events, dict):
-        raise Exception("Unexpected response from Google Calendar")
-    formatted_events = [_format_calendar_event(e) for e in events.get("items", [])]
+    if mirror and not query and mirror.covers(time_min_val, time_max_val):
+        items = mirror.events(time_min_val, time_max_val)[:limit]
+    else:
+        params: dict[str, Any] = {
+            "timeMin": time_min_val,
+            "timeMax": time_max_val,
+            "singleEvents": True,
+            "orderBy": "startTime",
+        }
+        if query:
+            params["q"] = query
+        if limit:
+            params["maxResults"] = limit
+
+        events = _google_calendar_api_request(
+            "GET", f"/calendars/{calendar_id}/events", token, params=params
+        )
+        if not isinstance(events, dict):
+            raise Exception("Unexpected response from Google Calendar")
+        items = events.get("items", [])
+    formatted_events = [_format_calendar_event(e) for e in items]
     return {
         "action": "list_events",
         "calendar_id": calendar_id,
@@ -269,10 +331,15 @@ def _google_calendar_list_events(
     }
 
 
-def _google_calendar_get_event(token: str, calendar_id: str, event_id: str) -> dict[str, Any]:
-    event = _google_calendar_api_request(
-        "GET", f"/calendars/{calendar_id}/events/{event_id}", token
-    )
+def _google_calendar_get_event(
+    token: str, calendar_id: str, event_id: str, mirror: CalendarMirror | None = None
+) -> dict[str, Any]:
+    """Fetch one event (events outside the mirrored window come from the API)."""
+    event: Any = mirror.get(event_id) if mirror else None
+    if event is None:
+        event = _google_calendar_api_request(
+            "GET", f"/calendars/{calendar_id}/events/{event_id}", token
+        )
     if not isinstance(event, dict):
         raise Exception("Unexpected response when fetching event")
     return {"action": "get_event", "event": _format_calendar_event(event)}
@@ -351,6 +418,7 @@ def _google_calendar_create_event(
     recurrence: list[str] | None,
     conference: bool | None,
     send_updates: str | None,
+    mirror: CalendarMirror | None = None,
 ) -> dict[str, Any]:
     if not summary:
         raise Exception("summary is required to create an event")
@@ -381,6 +449,7 @@ def _google_calendar_create_event(
     )
     if not isinstance(event, dict):
         raise Exception("Unexpected response when creating event")
+    _patch_calendar_mirror(mirror, event)
     return {"action": "create_event", "event": _format_calendar_event(event)}
 
 
@@ -400,6 +469,7 @@ def _google_calendar_update_event(
     recurrence: list[str] | None,
     conference: bool | None,
     send_updates: str | None,
+    mirror: CalendarMirror | None = None,
 ) -> dict[str, Any]:
     payload = _build_event_payload(
         summary,
@@ -432,16 +502,25 @@ def _google_calendar_update_event(
     )
     if not isinstance(event, dict):
         raise Exception("Unexpected response when updating event")
+    _patch_calendar_mirror(mirror, event)
     return {"action": "update_event", "event": _format_calendar_event(event)}
 
 
 def _google_calendar_delete_event(
-    token: str, calendar_id: str, event_id: str, send_updates: str | None
+    token: str,
+    calendar_id: str,
+    event_id: str,
+    send_updates: str | None,
+    mirror: CalendarMirror | None = None,
 ) -> dict[str, Any]:
     params = {"sendUpdates": send_updates} if send_updates else None
     _google_calendar_api_request(
         "DELETE", f"/calendars/{calendar_id}/events/{event_id}", token, params=params
     )
+    if mirror:
+        # Deleting a series cancels its instances - let the next read pull them
+        mirror.remove(event_id)
+        mirror.mark_stale()
     return {
         "action": "delete_event",
         "success": True,
@@ -458,6 +537,7 @@ def _google_calendar_respond_event(
     response_status: str,
     user_email: str | None,
     send_updates: str | None,
+    mirror: CalendarMirror | None = None,
 ) -> dict[str, Any]:
     if not user_email:
         raise Exception(
@@ -486,6 +566,7 @@ def _google_calendar_respond_event(
     )
     if not isinstance(event, dict):
         raise Exception("Unexpected response when updating RSVP")
+    _patch_calendar_mirror(mirror, event)
     return {
         "action": "respond_event",
         "event": _format_calendar_event(event),
@@ -504,6 +585,9 @@ _CALENDAR_ACTIONS = {
     "respond_event",
 }
 
+# Actions answered from the local mirror (synced before the read)
+_MIRROR_READ_ACTIONS = {"list_events", "get_event"}
+
 
 @tool
 def google_calendar(
@@ -527,6 +611,7 @@ def google_calendar(
     conference: bool | None = None,
     response_status: str | None = None,
     send_updates: str | None = None,
+    fresh: bool = False,
 ) -> str:
     """Manage Google Calendar events and calendars.
 
@@ -541,6 +626,8 @@ def google_calendar(
 
     Dates must be ISO 8601 strings. Use calendar_id="primary" when unsure.
     Use Todoist for flexible tasks and Google Calendar for time-bound commitments.
+    Reads may be served from a short-lived cache or a local copy synced every
+    few seconds; pass fresh=true to bypass the cache and sync first.
     """
 
     if not _is_google_calendar_configured():
@@ -576,16 +663,28 @@ def google_calendar(
     calendar_id = calendar_id or "primary"
 
     try:
+        # Text searches go to the API (the mirror has no full-text index), so
+        # they neither sync nor read the mirror
+        mirror = (
+            _get_calendar_mirror(
+                token, calendar_id, sync=action in _MIRROR_READ_ACTIONS, force=fresh
+            )
+            if action in _CALENDAR_ACTIONS
+            and action != "list_calendars"
+            and not (action == "list_events" and query)
+            else None
+        )
+
         if action == "list_calendars":
             result = _google_calendar_list_calendars(token)
         elif action == "list_events":
             result = _google_calendar_list_events(
-                token, calendar_id, time_min, time_max, max_results, query
+                token, calendar_id, time_min, time_max, max_results, query, mirror
             )
         elif action == "get_event":
             if not event_id:
                 return json.dumps({"error": "event_id is required for get_event"})
-            result = _google_calendar_get_event(token, calendar_id, event_id)
+            result = _google_calendar_get_event(token, calendar_id, event_id, mirror)
         elif action == "create_event":
             result = _google_calendar_create_event(
                 token,
@@ -602,6 +701,7 @@ def google_calendar(
                 recurrence,
                 conference,
                 send_updates,
+                mirror,
             )
         elif action == "update_event":
             if not event_id:
@@ -622,11 +722,14 @@ def google_calendar(
                 recurrence,
                 conference,
                 send_updates,
+                mirror,
             )
         elif action == "delete_event":
             if not event_id:
                 return json.dumps({"error": "event_id is required for delete_event"})
-            result = _google_calendar_delete_event(token, calendar_id, event_id, send_updates)
+            result = _google_calendar_delete_event(
+                token, calendar_id, event_id, send_updates, mirror
+            )
         elif action == "respond_event":
             if not event_id or not response_status:
                 return json.dumps(
@@ -641,6 +744,7 @@ def google_calendar(
                 response_status,
                 calendar_email,
                 send_updates,
+                mirror,
             )
         else:
             return json.dumps(
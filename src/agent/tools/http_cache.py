@@ -0,0 +1,332 @@
+"""Persistent HTTP cache for fetch_url and research.
+
+The in-memory tool cache (src/agent/tool_cache.py) only answers identical
+calls within one worker for ten minutes. This cache sits under it, at the
+HTTP layer: responses are stored in a separate SQLite file keyed by
+normalized URL, shared by every worker, agent and the scheduler process, and
+survive restarts.
+
+- Freshness follows Cache-Control (s-maxage / max-age, minus Age), then
+  Expires, then the usual 10%-of-Last-Modified heuristic. As a shared cache
+  it never stores no-store or private responses.
+- Stale entries are revalidated with a conditional GET (If-None-Match /
+  If-Modified-Since); a 304 refreshes the entry without downloading the body.
+- The markdown extracted from an HTML body is cached alongside it (keyed by
+  the body's hash), so trafilatura runs once per page version.
+- The file is bounded by HTTP_CACHE_MAX_BYTES with least-recently-used eviction.
+
+The cache only ever skips network requests: every request that does go out
+(including revalidations) passes the same SSRF validation as before.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from src.config import Config
+from src.utils.connection_pool import ConnectionPool
+from src.utils.db_helpers import execute_with_timing, init_query_logging
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Heuristic freshness for responses with only Last-Modified (RFC 9111 4.2.2)
+_HEURISTIC_FRACTION = 0.1
+_HEURISTIC_MAX_SECONDS = 24 * 3600
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL: no fragment; scheme and host are case-insensitive."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+def _directives(headers: httpx.Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers, now: float) -> float | None:
+    """Seconds a response stays fresh, or None if it must not be stored."""
+    directives = _directives(headers)
+    if "no-store" in directives or "private" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        age = float(headers.get("age", "0"))
+    except ValueError:
+        age = 0.0
+    for name in ("s-maxage", "max-age"):
+        value = directives.get(name)
+        if value is not None:
+            try:
+                return max(0.0, float(value) - age)
+            except ValueError:
+                return 0.0
+
+    date = _http_date(headers.get("date")) or now
+    expires = _http_date(headers.get("expires"))
+    if "expires" in headers:
+        return max(0.0, expires - date) if expires is not None else 0.0
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None and last_modified < date:
+        return min((date - last_modified) * _HEURISTIC_FRACTION, _HEURISTIC_MAX_SECONDS)
+    return 0.0
+
+
+def _body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A stored 200 response."""
+
+    url: str
+    final_url: str
+    content_type: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-type": self.content_type},
+            content=self.body,
+            request=httpx.Request("GET", self.final_url),
+        )
+
+
+class HTTPCache:
+    """SQLite-backed HTTP response cache (see module docstring)."""
+
+    def __init__(self, db_path: Path | None = None, max_bytes: int | None = None) -> None:
+        self.db_path = db_path or Config.HTTP_CACHE_PATH
+        self.max_bytes = max_bytes if max_bytes is not None else Config.HTTP_CACHE_MAX_BYTES
+        self._should_log_queries, self._slow_query_threshold_ms = init_query_logging()
+        self._pool = ConnectionPool(self.db_path)
+        self._init_db()
+
+    def close(self) -> None:
+        self._pool.close_all()
+
+    def _execute_with_timing(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: tuple[object, ...] = (),
+    ) -> sqlite3.Cursor:
+        return execute_with_timing(
+            conn,
+            query,
+            params,
+            should_log=self._should_log_queries,
+            slow_query_threshold_ms=self._slow_query_threshold_ms,
+            log_prefix="HTTP cache ",
+        )
+
+    def _init_db(self) -> None:
+        with self._pool.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT NOT NULL,
+                    content_type TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    body_sha256 TEXT NOT NULL,
+                    markdown TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_http_cache_last_used ON http_cache(last_used)"
+            )
+            conn.commit()
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Look up a URL (fresh or stale) and mark it recently used."""
+        key = normalize_url(url)
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                """SELECT final_url, content_type, body, etag, last_modified, expires_at
+                   FROM http_cache WHERE url = ?""",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._execute_with_timing(
+                conn, "UPDATE http_cache SET last_used = ? WHERE url = ?", (time.time(), key)
+            )
+            conn.commit()
+        return CachedResponse(
+            url=key,
+            final_url=row["final_url"],
+            content_type=row["content_type"],
+            body=bytes(row["body"]),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            expires_at=row["expires_at"],
+        )
+
+    def store(self, url: str, response: httpx.Response) -> bool:
+        """Store a 200 response if its headers allow it; returns whether it was stored."""
+        if response.status_code != 200:
+            return False
+        now = time.time()
+        lifetime = freshness_lifetime(response.headers, now)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        # Neither fresh nor revalidatable: every use would refetch anyway
+        if lifetime is None or (lifetime <= 0 and not etag and not last_modified):
+            return False
+        body = response.content
+        if len(body) > self.max_bytes // 4:
+            return False
+
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                """INSERT OR REPLACE INTO http_cache
+                   (url, final_url, content_type, body, body_sha256, markdown, etag,
+                    last_modified, expires_at, last_used, size)
+                   VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?)""",
+                (
+                    normalize_url(url),
+                    str(response.url),
+                    response.headers.get("content-type", ""),
+                    body,
+                    _body_hash(body),
+                    etag,
+                    last_modified,
+                    now + lifetime,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict(conn)
+            conn.commit()
+        return True
+
+    def refresh(self, entry: CachedResponse, response: httpx.Response) -> None:
+        """Apply a 304 Not Modified: new freshness (and validators) for the stored body."""
+        now = time.time()
+        lifetime = freshness_lifetime(response.headers, now)
+        with self._pool.get_connection() as conn:
+            if lifetime is None:
+                self._execute_with_timing(
+                    conn, "DELETE FROM http_cache WHERE url = ?", (entry.url,)
+                )
+            else:
+                self._execute_with_timing(
+                    conn,
+                    """UPDATE http_cache
+                       SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified),
+                           expires_at = ?, last_used = ?
+                       WHERE url = ?""",
+                    (
+                        response.headers.get("etag"),
+                        response.headers.get("last-modified"),
+                        now + lifetime,
+                        now,
+                        entry.url,
+                    ),
+                )
+            conn.commit()
+
+    def get_markdown(self, url: str, body: bytes) -> str | None:
+        """Extracted text cached for this exact body of url, if any."""
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT markdown FROM http_cache WHERE url = ? AND body_sha256 = ?",
+                (normalize_url(url), _body_hash(body)),
+            ).fetchone()
+        return row["markdown"] if row else None
+
+    def set_markdown(self, url: str, body: bytes, markdown: str) -> None:
+        """Attach extracted text to the stored body (no-op if url isn't cached)."""
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                """UPDATE http_cache SET markdown = ?, size = length(body) + ?
+                   WHERE url = ? AND body_sha256 = ?""",
+                (markdown, len(markdown.encode()), normalize_url(url), _body_hash(body)),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the cache fits max_bytes."""
+        total = self._execute_with_timing(
+            conn, "SELECT COALESCE(SUM(size), 0) AS total FROM http_cache"
+        ).fetchone()["total"]
+        if total <= self.max_bytes:
+            return
+        victims: list[str] = []
+        for row in self._execute_with_timing(
+            conn, "SELECT url, size FROM http_cache ORDER BY last_used ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append(row["url"])
+            total -= row["size"]
+        conn.executemany("DELETE FROM http_cache WHERE url = ?", [(v,) for v in victims])
+        logger.debug("HTTP cache evicted entries", extra={"count": len(victims)})
+
+
+# Global instance (lazy initialization, like the blob store)
+_http_cache: HTTPCache | None = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Get the shared HTTP cache, or None when HTTP_CACHE_ENABLED is off."""
+    global _http_cache
+    if not Config.HTTP_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HTTPCache()
+    return _http_cache
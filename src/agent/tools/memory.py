@@ -25,7 +25,7 @@ from src.agent.tools.context import get_conversation_context
 from src.agent.tools.permission_check import check_autonomous_permission
 from src.config import Config
 from src.db.models import db
-from src.utils.embeddings import embed_and_store_async, embed_text, top_k_similar
+from src.utils.embeddings import embed_and_store_async, embed_text
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -271,12 +271,10 @@ def search_memory(query: str) -> str:
     if Config.EMBEDDINGS_ENABLED and len(matched_ids) < _SEARCH_MEMORY_MAX_RESULTS:
         query_vec = embed_text(query)
         if query_vec is not None:
-            candidates = [
-                (ref_id, vector)
-                for ref_id, _dim, vector in db.get_embeddings(user_id, "memory")
-                if ref_id in by_id
-            ]
-            for ref_id, score in top_k_similar(query_vec, candidates, _SEARCH_MEMORY_MAX_RESULTS):
+            ranked = db.search_embeddings(
+                user_id, "memory", query_vec, _SEARCH_MEMORY_MAX_RESULTS, ref_ids=by_id
+            )
+            for ref_id, score in ranked:
                 if score >= Config.MEMORY_SEARCH_MIN_SIMILARITY and ref_id not in matched_ids:
                     matched_ids.append(ref_id)
 
@@ -95,7 +95,7 @@ def _fmt_duration(seconds: int) -> str:
 
 
 @tool
-def search_places(query: str, near: str = "current", limit: int = 5) -> str:
+def search_places(query: str, near: str = "current", limit: int = 5, fresh: bool = False) -> str:
     """Search for places (restaurants, shops, POIs, addresses) near a location.
 
     Args:
@@ -103,6 +103,8 @@ def search_places(query: str, near: str = "current", limit: int = 5) -> str:
         near: Where to search: "current" (user's device location), a saved place
             name (e.g. "home"), or a free-text address/city (e.g. "Brno")
         limit: Max results (default 5)
+        fresh: Search again instead of reusing results from a recent
+            identical search (e.g. for current opening hours)
 
     Returns:
         Numbered list of matches with locality, distance, and a map link.
@@ -233,13 +235,15 @@ def delete_place(name: str) -> str:
 
 
 @tool
-def get_route(origin: str, destination: str, mode: str = "car") -> str:
+def get_route(origin: str, destination: str, mode: str = "car", fresh: bool = False) -> str:
     """Plan a route and get distance + ETA between two locations.
 
     Args:
         origin: Start: "current" (device location), a saved place name, or an address
         destination: End: same formats as origin
         mode: "car" (traffic-aware), "bike", "foot", or "hiking"
+        fresh: Replan instead of reusing a recent identical route (for
+            current traffic)
 
     Returns:
         Distance, duration, and a map link for the route.
@@ -9,6 +9,7 @@ concurrently, and hand everything back at once.
 Deterministic - no nested LLM call (delegate_task is the agentic variant).
 """
 
+import contextvars
 import json
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
@@ -33,19 +34,28 @@ _UNFETCHED_CANDIDATES = 5
 _MAX_SOURCES_HARD_CAP = 8
 
 
+def _search_or_empty(query: str, per_query: int) -> list[dict[str, str]]:
+    try:
+        return search_web(query, per_query)
+    except SearchProviderError as e:
+        logger.warning("research: search failed", extra={"query": query, "error": str(e)})
+        return []
+
+
 def _ranked_unique_urls(queries: list[str], per_query: int) -> list[dict[str, str]]:
     """Interleave results by rank across queries, dedup by URL.
 
     Rank-0 hits of every query come before any rank-1 hit: with multiple query
-    angles, each angle's best result matters more than one angle's tail.
+    angles, each angle's best result matters more than one angle's tail. The
+    queries are searched concurrently; ranking keeps the query order.
     """
-    per_query_results: list[list[dict[str, str]]] = []
-    for query in queries:
-        try:
-            per_query_results.append(search_web(query, per_query))
-        except SearchProviderError as e:
-            logger.warning("research: search failed", extra={"query": query, "error": str(e)})
-            per_query_results.append([])
+    workers = max(1, min(len(queries), Config.WEB_SEARCH_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _search_or_empty, query, per_query)
+            for query in queries
+        ]
+        per_query_results = [future.result() for future in futures]
 
     seen: set[str] = set()
     ordered: list[dict[str, str]] = []
@@ -9,6 +9,7 @@ from src.agent.tools.context import get_conversation_context
 from src.agent.tools.permission_check import check_autonomous_permission
 from src.config import Config
 from src.utils.logging import get_logger
+from src.utils.todoist_sync import TodoistMirror, TodoistSyncError, sync_todoist_mirror
 
 logger = get_logger(__name__)
 
@@ -31,6 +32,35 @@ def _get_todoist_token() -> str | None:
     return user.todoist_access_token
 
 
+def _get_todoist_mirror(token: str, sync: bool) -> TodoistMirror | None:
+    """Get the current user's local Todoist mirror (src/utils/todoist_sync.py).
+
+    With sync, the mirror is brought up to date first (at most once per
+    TODOIST_SYNC_MIN_INTERVAL_SECONDS); without, it is only patched by writes.
+    Returns None - handlers then use the REST API - without a user context,
+    with TODOIST_MIRROR_ENABLED off, or when the sync fails (the REST call
+    then surfaces the error).
+    """
+    if not Config.TODOIST_MIRROR_ENABLED:
+        return None
+    _, user_id = get_conversation_context()
+    if not user_id:
+        return None
+
+    from src.db.models import db
+
+    if not sync:
+        return TodoistMirror(db, user_id)
+    try:
+        return sync_todoist_mirror(db, user_id, token)
+    except TodoistSyncError as e:
+        logger.warning(
+            "Todoist mirror sync failed, using the REST API",
+            extra={"user_id": user_id, "error": str(e)},
+        )
+        return None
+
+
 def _todoist_api_request(
     method: str,
     endpoint: str,
@@ -229,10 +259,13 @@ def _todoist_list_tasks(
     token: str,
     filter_string: str | None = None,
     project_id: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """List tasks with optional filter.
 
     Enriches tasks with section_name and project_name for better context.
+    With a mirror, unfiltered listings and the enrichment are served locally;
+    filter queries are still evaluated by Todoist.
     """
     # Todoist API v1 evaluates the filter query language ("overdue", "today",
     # "7 days", ...) ONLY on the dedicated /tasks/filter endpoint. Passing
@@ -246,6 +279,8 @@ def _todoist_list_tasks(
         if project_id:
             params["project_id"] = project_id
         tasks = _todoist_api_request("GET", "/tasks/filter", token, params=params)
+    elif mirror:
+        tasks = mirror.tasks(project_id)
     else:
         params = {}
         if project_id:
@@ -266,27 +301,38 @@ def _todoist_list_tasks(
     section_ids = {t.get("section_id") for t in tasks if t.get("section_id")}
     project_ids = {t.get("project_id") for t in tasks if t.get("project_id")}
 
-    # Fetch all sections (more efficient than per-section requests)
-    if section_ids:
-        try:
-            sections = _todoist_api_request("GET", "/sections", token)
-            if isinstance(sections, list):
-                section_map = {
-                    s["id"]: s["name"] for s in sections if s.get("id") and s.get("name")
-                }
-        except Exception as e:
-            logger.warning("Failed to fetch sections for task enrichment", extra={"error": str(e)})
-
-    # Fetch all projects for names
-    if project_ids:
-        try:
-            projects = _todoist_api_request("GET", "/projects", token)
-            if isinstance(projects, list):
-                project_map = {
-                    p["id"]: p["name"] for p in projects if p.get("id") and p.get("name")
-                }
-        except Exception as e:
-            logger.warning("Failed to fetch projects for task enrichment", extra={"error": str(e)})
+    if mirror:
+        # Names come from the local mirror - no extra requests
+        if section_ids:
+            section_map = mirror.section_names()
+        if project_ids:
+            project_map = mirror.project_names()
+    else:
+        # Fetch all sections (more efficient than per-section requests)
+        if section_ids:
+            try:
+                sections = _todoist_api_request("GET", "/sections", token)
+                if isinstance(sections, list):
+                    section_map = {
+                        s["id"]: s["name"] for s in sections if s.get("id") and s.get("name")
+                    }
+            except Exception as e:
+                logger.warning(
+                    "Failed to fetch sections for task enrichment", extra={"error": str(e)}
+                )
+
+        # Fetch all projects for names
+        if project_ids:
+            try:
+                projects = _todoist_api_request("GET", "/projects", token)
+                if isinstance(projects, list):
+                    project_map = {
+                        p["id"]: p["name"] for p in projects if p.get("id") and p.get("name")
+                    }
+            except Exception as e:
+                logger.warning(
+                    "Failed to fetch projects for task enrichment", extra={"error": str(e)}
+                )
 
     formatted_tasks = [_format_task(task, section_map, project_map) for task in tasks]
 
@@ -301,9 +347,9 @@ def _todoist_list_tasks(
     return result
 
 
-def _todoist_list_projects(token: str) -> dict[str, Any]:
+def _todoist_list_projects(token: str, mirror: TodoistMirror | None = None) -> dict[str, Any]:
     """List all projects with their full metadata."""
-    projects = _todoist_api_request("GET", "/projects", token)
+    projects = mirror.projects() if mirror else _todoist_api_request("GET", "/projects", token)
     if not isinstance(projects, list):
         projects = []
 
@@ -336,9 +382,15 @@ def _todoist_list_projects(token: str) -> dict[str, Any]:
     }
 
 
-def _todoist_get_project(token: str, project_id: str) -> dict[str, Any]:
-    """Fetch a single project by ID."""
-    project = _todoist_api_request("GET", f"/projects/{project_id}", token)
+def _todoist_get_project(
+    token: str, project_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
+    """Fetch a single project by ID (archived projects are not mirrored)."""
+    project: dict[str, Any] | list[dict[str, Any]] | None = (
+        mirror.get("project", project_id) if mirror else None
+    )
+    if project is None:
+        project = _todoist_api_request("GET", f"/projects/{project_id}", token)
     if not isinstance(project, dict):
         raise Exception("Failed to fetch project")
     return {"action": "get_project", "project": project}
@@ -351,6 +403,7 @@ def _todoist_add_project(
     parent_project_id: str | None = None,
     is_favorite: bool | None = None,
     view_style: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """Create a new Todoist project."""
     data: dict[str, Any] = {"name": project_name}
@@ -366,6 +419,8 @@ def _todoist_add_project(
     project = _todoist_api_request("POST", "/projects", token, data=data)
     if not isinstance(project, dict):
         raise Exception("Failed to create project")
+    if mirror:
+        mirror.save("project", project)
     return {"action": "add_project", "success": True, "project": project}
 
 
@@ -377,6 +432,7 @@ def _todoist_update_project(
     parent_project_id: str | None = None,
     is_favorite: bool | None = None,
     view_style: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """Update project metadata (name, color, favorite state, etc.)."""
     data: dict[str, Any] = {}
@@ -397,12 +453,20 @@ def _todoist_update_project(
     project = _todoist_api_request("POST", f"/projects/{project_id}", token, data=data)
     if not isinstance(project, dict):
         raise Exception("Failed to update project")
+    if mirror:
+        mirror.save("project", project)
     return {"action": "update_project", "success": True, "project": project}
 
 
-def _todoist_delete_project(token: str, project_id: str) -> dict[str, Any]:
+def _todoist_delete_project(
+    token: str, project_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Delete a project permanently."""
     _todoist_api_request("DELETE", f"/projects/{project_id}", token)
+    if mirror:
+        # Its sections and tasks go with it: the next read pulls those deltas
+        mirror.remove("project", project_id)
+        mirror.mark_stale()
     return {
         "action": "delete_project",
         "success": True,
@@ -411,9 +475,14 @@ def _todoist_delete_project(token: str, project_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_archive_project(token: str, project_id: str) -> dict[str, Any]:
+def _todoist_archive_project(
+    token: str, project_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Archive a project to hide it from active view."""
     _todoist_api_request("POST", f"/projects/{project_id}/archive", token)
+    if mirror:
+        mirror.remove("project", project_id)
+        mirror.mark_stale()
     return {
         "action": "archive_project",
         "success": True,
@@ -422,9 +491,13 @@ def _todoist_archive_project(token: str, project_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_unarchive_project(token: str, project_id: str) -> dict[str, Any]:
+def _todoist_unarchive_project(
+    token: str, project_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Bring an archived project back."""
     _todoist_api_request("POST", f"/projects/{project_id}/unarchive", token)
+    if mirror:
+        mirror.mark_stale()
     return {
         "action": "unarchive_project",
         "success": True,
@@ -433,12 +506,19 @@ def _todoist_unarchive_project(token: str, project_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_list_sections(token: str, project_id: str) -> dict[str, Any]:
+def _todoist_list_sections(
+    token: str, project_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """List all sections for a specific project.
 
     Sections help organize tasks within a project (e.g., "To Do", "In Progress", "Done").
     """
-    sections = _todoist_api_request("GET", "/sections", token, params={"project_id": project_id})
+    if mirror:
+        sections: Any = mirror.sections(project_id)
+    else:
+        sections = _todoist_api_request(
+            "GET", "/sections", token, params={"project_id": project_id}
+        )
     if not isinstance(sections, list):
         sections = []
 
@@ -462,35 +542,55 @@ def _todoist_list_sections(token: str, project_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_get_section(token: str, section_id: str) -> dict[str, Any]:
+def _todoist_get_section(
+    token: str, section_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Fetch a section by ID."""
-    section = _todoist_api_request("GET", f"/sections/{section_id}", token)
+    section: dict[str, Any] | list[dict[str, Any]] | None = (
+        mirror.get("section", section_id) if mirror else None
+    )
+    if section is None:
+        section = _todoist_api_request("GET", f"/sections/{section_id}", token)
     if not isinstance(section, dict):
         raise Exception("Failed to fetch section")
     return {"action": "get_section", "section": section}
 
 
-def _todoist_add_section(token: str, project_id: str, section_name: str) -> dict[str, Any]:
+def _todoist_add_section(
+    token: str, project_id: str, section_name: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Create a new section inside a project."""
     data = {"project_id": project_id, "name": section_name}
     section = _todoist_api_request("POST", "/sections", token, data=data)
     if not isinstance(section, dict):
         raise Exception("Failed to create section")
+    if mirror:
+        mirror.save("section", section)
     return {"action": "add_section", "success": True, "section": section}
 
 
-def _todoist_update_section(token: str, section_id: str, section_name: str) -> dict[str, Any]:
+def _todoist_update_section(
+    token: str, section_id: str, section_name: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Rename an existing section."""
     data = {"name": section_name}
     section = _todoist_api_request("POST", f"/sections/{section_id}", token, data=data)
     if not isinstance(section, dict):
         raise Exception("Failed to update section")
+    if mirror:
+        mirror.save("section", section)
     return {"action": "update_section", "success": True, "section": section}
 
 
-def _todoist_delete_section(token: str, section_id: str) -> dict[str, Any]:
+def _todoist_delete_section(
+    token: str, section_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Delete a section from a project."""
     _todoist_api_request("DELETE", f"/sections/{section_id}", token)
+    if mirror:
+        # Its tasks go with it: the next read pulls those deltas
+        mirror.remove("section", section_id)
+        mirror.mark_stale()
     return {
         "action": "delete_section",
         "success": True,
@@ -525,9 +625,15 @@ def _todoist_list_collaborators(token: str, project_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_get_task(token: str, task_id: str) -> dict[str, Any]:
-    """Get a specific task by ID."""
-    task_result = _todoist_api_request("GET", f"/tasks/{task_id}", token)
+def _todoist_get_task(
+    token: str, task_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
+    """Get a specific task by ID (completed tasks are not mirrored)."""
+    task_result: dict[str, Any] | list[dict[str, Any]] | None = (
+        mirror.get("item", task_id) if mirror else None
+    )
+    if task_result is None:
+        task_result = _todoist_api_request("GET", f"/tasks/{task_id}", token)
     return {"action": "get_task", "task": task_result}
 
 
@@ -542,6 +648,7 @@ def _todoist_add_task(
     priority: int | None = None,
     labels: list[str] | None = None,
     assignee_id: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """Create a new task."""
     task_data: dict[str, Any] = {"content": content}
@@ -563,6 +670,8 @@ def _todoist_add_task(
         task_data["assignee_id"] = assignee_id
 
     new_task = _todoist_api_request("POST", "/tasks", token, data=task_data)
+    if mirror:
+        mirror.save("item", new_task)
     return {"action": "add_task", "success": True, "task": new_task}
 
 
@@ -576,6 +685,7 @@ def _todoist_update_task(
     priority: int | None = None,
     labels: list[str] | None = None,
     assignee_id: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """Update an existing task."""
     update_data: dict[str, Any] = {}
@@ -598,6 +708,8 @@ def _todoist_update_task(
         return {"error": "No fields to update provided"}
 
     updated_task = _todoist_api_request("POST", f"/tasks/{task_id}", token, data=update_data)
+    if mirror:
+        mirror.save("item", updated_task)
     return {"action": "update_task", "success": True, "task": updated_task}
 
 
@@ -607,6 +719,7 @@ def _todoist_move_task(
     section_id: str | None = None,
     project_id: str | None = None,
     parent_id: str | None = None,
+    mirror: TodoistMirror | None = None,
 ) -> dict[str, Any]:
     """Move a task to a different section, project, or make it a subtask.
 
@@ -618,6 +731,7 @@ def _todoist_move_task(
         section_id: Target section (for moving within project)
         project_id: Target project (for moving between projects)
         parent_id: Parent task ID (for making subtask)
+        mirror: Local mirror to mark stale (subtasks move along)
 
     Returns:
         Success status
@@ -650,6 +764,8 @@ def _todoist_move_task(
     command_uuid = commands[0]["uuid"]
 
     if command_uuid in sync_status and sync_status[command_uuid] == "ok":
+        if mirror:
+            mirror.mark_stale()
         return {
             "action": "move_task",
             "success": True,
@@ -661,9 +777,16 @@ def _todoist_move_task(
         return {"action": "move_task", "success": False, "error": error_info}
 
 
-def _todoist_complete_task(token: str, task_id: str) -> dict[str, Any]:
+def _todoist_complete_task(
+    token: str, task_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Mark a task as completed."""
     _todoist_api_request("POST", f"/tasks/{task_id}/close", token)
+    if mirror:
+        # A recurring task comes back with its next due date, subtasks close
+        # with their parent: the next read pulls those deltas
+        mirror.remove("item", task_id)
+        mirror.mark_stale()
     return {
         "action": "complete_task",
         "success": True,
@@ -672,9 +795,13 @@ def _todoist_complete_task(token: str, task_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_reopen_task(token: str, task_id: str) -> dict[str, Any]:
+def _todoist_reopen_task(
+    token: str, task_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Reopen a completed task."""
     _todoist_api_request("POST", f"/tasks/{task_id}/reopen", token)
+    if mirror:
+        mirror.mark_stale()
     return {
         "action": "reopen_task",
         "success": True,
@@ -683,9 +810,14 @@ def _todoist_reopen_task(token: str, task_id: str) -> dict[str, Any]:
     }
 
 
-def _todoist_delete_task(token: str, task_id: str) -> dict[str, Any]:
+def _todoist_delete_task(
+    token: str, task_id: str, mirror: TodoistMirror | None = None
+) -> dict[str, Any]:
     """Delete a task permanently."""
     _todoist_api_request("DELETE", f"/tasks/{task_id}", token)
+    if mirror:
+        mirror.remove("item", task_id)
+        mirror.mark_stale()
     return {
         "action": "delete_task",
         "success": True,
@@ -719,6 +851,16 @@ _TODOIST_ACTIONS = {
     "delete_task",
 }
 
+# Actions served from the local mirror (synced first); writes only patch it
+_MIRROR_READ_ACTIONS = {
+    "list_tasks",
+    "list_projects",
+    "get_project",
+    "list_sections",
+    "get_section",
+    "get_task",
+}
+
 
 @tool
 def todoist(
@@ -853,17 +995,23 @@ def todoist(
     )
 
     try:
+        mirror = (
+            _get_todoist_mirror(token, sync=action in _MIRROR_READ_ACTIONS)
+            if action in _TODOIST_ACTIONS
+            else None
+        )
+
         # Dispatch to the appropriate action handler
         if action == "list_tasks":
-            result = _todoist_list_tasks(token, filter_string, project_id)
+            result = _todoist_list_tasks(token, filter_string, project_id, mirror)
 
         elif action == "list_projects":
-            result = _todoist_list_projects(token)
+            result = _todoist_list_projects(token, mirror)
 
         elif action == "get_project":
             if not project_id:
                 return json.dumps({"error": "project_id is required for get_project action"})
-            result = _todoist_get_project(token, project_id)
+            result = _todoist_get_project(token, project_id, mirror)
 
         elif action == "add_project":
             if not project_name:
@@ -875,6 +1023,7 @@ def todoist(
                 parent_project_id,
                 is_favorite,
                 view_style,
+                mirror,
             )
 
         elif action == "update_project":
@@ -888,32 +1037,33 @@ def todoist(
                 parent_project_id,
                 is_favorite,
                 view_style,
+                mirror,
             )
 
         elif action == "delete_project":
             if not project_id:
                 return json.dumps({"error": "project_id is required for delete_project action"})
-            result = _todoist_delete_project(token, project_id)
+            result = _todoist_delete_project(token, project_id, mirror)
 
         elif action == "archive_project":
             if not project_id:
                 return json.dumps({"error": "project_id is required for archive_project action"})
-            result = _todoist_archive_project(token, project_id)
+            result = _todoist_archive_project(token, project_id, mirror)
 
         elif action == "unarchive_project":
             if not project_id:
                 return json.dumps({"error": "project_id is required for unarchive_project action"})
-            result = _todoist_unarchive_project(token, project_id)
+            result = _todoist_unarchive_project(token, project_id, mirror)
 
         elif action == "list_sections":
             if not project_id:
                 return json.dumps({"error": "project_id is required for list_sections action"})
-            result = _todoist_list_sections(token, project_id)
+            result = _todoist_list_sections(token, project_id, mirror)
 
         elif action == "get_section":
             if not section_id:
                 return json.dumps({"error": "section_id is required for get_section action"})
-            result = _todoist_get_section(token, section_id)
+            result = _todoist_get_section(token, section_id, mirror)
 
         elif action == "add_section":
             if not project_id or not section_name:
@@ -922,7 +1072,7 @@ def todoist(
                         "error": "project_id and section_name are required for add_section action",
                     }
                 )
-            result = _todoist_add_section(token, project_id, section_name)
+            result = _todoist_add_section(token, project_id, section_name, mirror)
 
         elif action == "update_section":
             if not section_id or not section_name:
@@ -931,12 +1081,12 @@ def todoist(
                         "error": "section_id and section_name are required for update_section action",
                     }
                 )
-            result = _todoist_update_section(token, section_id, section_name)
+            result = _todoist_update_section(token, section_id, section_name, mirror)
 
         elif action == "delete_section":
             if not section_id:
                 return json.dumps({"error": "section_id is required for delete_section action"})
-            result = _todoist_delete_section(token, section_id)
+            result = _todoist_delete_section(token, section_id, mirror)
 
         elif action == "list_collaborators":
             if not project_id:
@@ -946,7 +1096,7 @@ def todoist(
         elif action == "get_task":
             if not task_id:
                 return json.dumps({"error": "task_id is required for get_task action"})
-            result = _todoist_get_task(token, task_id)
+            result = _todoist_get_task(token, task_id, mirror)
 
         elif action == "add_task":
             if not content:
@@ -962,6 +1112,7 @@ def todoist(
                 priority,
                 labels,
                 assignee_id,
+                mirror,
             )
 
         elif action == "update_task":
@@ -977,27 +1128,28 @@ def todoist(
                 priority,
                 labels,
                 assignee_id,
+                mirror,
             )
 
         elif action == "move_task":
             if not task_id:
                 return json.dumps({"error": "task_id is required for move_task action"})
-            result = _todoist_move_task(token, task_id, section_id, project_id, parent_id)
+            result = _todoist_move_task(token, task_id, section_id, project_id, parent_id, mirror)
 
         elif action == "complete_task":
             if not task_id:
                 return json.dumps({"error": "task_id is required for complete_task action"})
-            result = _todoist_complete_task(token, task_id)
+            result = _todoist_complete_task(token, task_id, mirror)
 
         elif action == "reopen_task":
             if not task_id:
                 return json.dumps({"error": "task_id is required for reopen_task action"})
-            result = _todoist_reopen_task(token, task_id)
+            result = _todoist_reopen_task(token, task_id, mirror)
 
         elif action == "delete_task":
             if not task_id:
                 return json.dumps({"error": "task_id is required for delete_task action"})
-            result = _todoist_delete_task(token, task_id)
+            result = _todoist_delete_task(token, task_id, mirror)
 
         else:
             return json.dumps(
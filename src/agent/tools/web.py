@@ -1,18 +1,19 @@
 """Web tools for fetching URLs and searching the web."""
 
 import base64
+import contextvars
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import urljoin
 
-import html2text
 import httpx
-import trafilatura
-from bs4 import BeautifulSoup
 from langchain_core.tools import tool
 
+from src.agent.tools.http_cache import CachedResponse, get_http_cache
 from src.agent.tools.url_safety import check_host, validate_public_url
 from src.config import Config
+from src.utils.html_extraction import HTMLExtractionError, extract_text, truncate_text
 from src.utils.logging import get_logger
 from src.utils.search_provider import SearchProviderError, active_provider, search_web
 
@@ -55,68 +56,30 @@ def wrap_untrusted_content(text: str, source: str | None = None) -> str:
     )
 
 
-# Below this many chars, trafilatura almost certainly found no article body
-# (link hubs, SPAs, very short pages) - fall back to the broad html2text pass,
-# which at least returns the page's headlines/links. Validated against real
-# pages: a Wikipedia article yields ~52k chars; the BBC News homepage ~192.
-_MIN_MAIN_CONTENT_CHARS = 200
+def _extract_full_text(html: str) -> str:
+    """Readable text of an HTML page (untruncated); large pages parse off-thread.
 
-
-def _extract_main_content(html: str) -> str:
-    """Isolate the main article body via trafilatura.
-
-    Drops menus, related-article lists, cookie banners and comment sections
-    that a tag-based strip leaves behind, so the model gets denser signal
-    within the length cap. Returns "" when no article body is recognized (so
-    the caller falls back) or on any extraction error.
+    Raises:
+        HTMLExtractionError: If an off-thread parse timed out or crashed
     """
-    try:
-        extracted = trafilatura.extract(
-            html,
-            output_format="markdown",
-            include_links=False,
-            favor_precision=True,
-        )
-        return extracted or ""
-    except Exception:
-        logger.debug("trafilatura extraction failed, falling back", exc_info=True)
-        return ""
-
-
-def _html_to_markdown(html: str) -> str:
-    """Broad fallback: strip boilerplate tags and convert the rest to markdown."""
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove script, style, nav, footer, header elements
-    for element in soup(["script", "style", "nav", "footer", "header", "aside", "noscript"]):
-        element.decompose()
-
-    converter = html2text.HTML2Text()
-    converter.ignore_links = False
-    converter.ignore_images = True
-    converter.ignore_emphasis = False
-    converter.body_width = 0  # No wrapping
-
-    return converter.handle(str(soup))
+    return extract_text(html)
 
 
 def _extract_text_from_html(html: str, max_length: int | None = None) -> str:
-    """Extract readable text from HTML, preferring main-content extraction.
+    """Extract readable text from HTML, truncated to max_length (default HTML_TEXT_MAX_LENGTH)."""
+    return truncate_text(_extract_full_text(html), max_length)
 
-    trafilatura isolates the article body for denser signal; link hubs and
-    SPAs have no recognizable article, so we fall back to the broad html2text
-    pass when it returns too little.
-    """
-    text = _extract_main_content(html)
-    if len(text) < _MIN_MAIN_CONTENT_CHARS:
-        text = _html_to_markdown(html)
-
-    # Truncate if too long
-    limit = max_length if max_length is not None else Config.HTML_TEXT_MAX_LENGTH
-    if len(text) > limit:
-        text = text[:limit] + "\n\n[Content truncated...]"
 
-    return text.strip()
+def _page_text(url: str, response: httpx.Response, max_length: int | None = None) -> str:
+    """Readable text of a fetched HTML page, reusing the HTTP cache's extraction."""
+    cache = get_http_cache()
+    if cache is None:
+        return _extract_text_from_html(response.text, max_length)
+    text = cache.get_markdown(url, response.content)
+    if text is None:
+        text = _extract_full_text(response.text)
+        cache.set_markdown(url, response.content, text)
+    return truncate_text(text, max_length)
 
 
 # Supported binary MIME types for fetch_url
@@ -151,12 +114,21 @@ def _get_content_type_category(content_type: str) -> str:
     return "unsupported"
 
 
-def _fetch_response(url: str) -> tuple[httpx.Response | None, str | None]:
+def _fetch_response(url: str, revalidate: bool = False) -> tuple[httpx.Response | None, str | None]:
     """Fetch a URL with SSRF validation and manual, re-validated redirects.
 
+    A fresh HTTP cache entry is served without a request (unless revalidate);
+    a stale one is revalidated with a conditional GET.
+
     Returns (response, None) on success or (None, error_message) on failure.
     The response body is fully loaded before the client closes.
     """
+    cache = get_http_cache()
+    cached = cache.get(url) if cache is not None else None
+    if cached is not None and not revalidate and cached.is_fresh():
+        logger.debug("HTTP cache hit", extra={"url": url})
+        return cached.to_response(), None
+
     # SSRF protection: validate scheme + that the host doesn't resolve to a
     # private/reserved/metadata address. Redirects are followed manually below
     # so each hop is validated too (a public URL could 30x into a blocked range).
@@ -176,7 +148,7 @@ def _fetch_response(url: str) -> tuple[httpx.Response | None, str | None]:
         ) as client:
             current_url = url
             for _ in range(_MAX_REDIRECTS + 1):
-                response = client.get(current_url)
+                response = client.get(current_url, **_conditional_kwargs(cached, current_url))
                 if not response.is_redirect:
                     break
                 location = response.headers.get("location")
@@ -193,7 +165,13 @@ def _fetch_response(url: str) -> tuple[httpx.Response | None, str | None]:
                 current_url = next_url
             else:
                 return None, f"Too many redirects fetching {url}"
+            if cached is not None and cache is not None and response.status_code == 304:
+                logger.debug("HTTP cache revalidated", extra={"url": url})
+                cache.refresh(cached, response)
+                return cached.to_response(), None
             response.raise_for_status()
+            if cache is not None:
+                cache.store(url, response)
             return response, None
     except httpx.TimeoutException:
         logger.warning("URL fetch timeout", extra={"url": url})
@@ -208,6 +186,14 @@ def _fetch_response(url: str) -> tuple[httpx.Response | None, str | None]:
         return None, f"Failed to fetch {url}: {e}"
 
 
+def _conditional_kwargs(cached: CachedResponse | None, current_url: str) -> dict[str, Any]:
+    """Validators for the request that reaches the cached response's final URL."""
+    if cached is None or current_url != cached.final_url:
+        return {}
+    headers = cached.conditional_headers()
+    return {"headers": headers} if headers else {}
+
+
 def fetch_page_text(url: str, max_chars: int | None = None) -> tuple[str | None, str | None]:
     """Fetch a URL and return readable page text (for programmatic reuse).
 
@@ -225,7 +211,10 @@ def fetch_page_text(url: str, max_chars: int | None = None) -> tuple[str | None,
     mime_type = content_type.split(";")[0].strip().lower()
 
     if category == "html":
-        return _extract_text_from_html(response.text, max_chars), None
+        try:
+            return _page_text(url, response, max_chars), None
+        except HTMLExtractionError as e:
+            return None, f"{e} for {url}"
     if category == "text":
         text = response.text
         limit = max_chars if max_chars is not None else Config.HTML_TEXT_MAX_LENGTH
@@ -238,7 +227,7 @@ def fetch_page_text(url: str, max_chars: int | None = None) -> tuple[str | None,
 
 
 @tool
-def fetch_url(url: str) -> str | list[dict[str, Any]]:
+def fetch_url(url: str, fresh: bool = False) -> str | list[dict[str, Any]]:
     """Fetch content from a URL - supports web pages, PDFs, and images.
 
     Use this tool to:
@@ -251,6 +240,8 @@ def fetch_url(url: str) -> str | list[dict[str, Any]]:
 
     Args:
         url: The URL to fetch (must start with http:// or https://)
+        fresh: Refetch instead of reusing a recent result for this URL, and
+            revalidate with the server even if the HTTP cache copy is still fresh
 
     Returns:
         For web pages: The text content in markdown format
@@ -258,7 +249,7 @@ def fetch_url(url: str) -> str | list[dict[str, Any]]:
         For errors: JSON with error field
     """
     logger.info("fetch_url called", extra={"url": url})
-    response, fetch_error = _fetch_response(url)
+    response, fetch_error = _fetch_response(url, revalidate=fresh)
     if fetch_error or response is None:
         return json.dumps({"error": fetch_error or f"Failed to fetch {url}"})
 
@@ -279,7 +270,10 @@ def fetch_url(url: str) -> str | list[dict[str, Any]]:
 
     # Handle HTML content - extract text
     if content_category == "html":
-        extracted_text = _extract_text_from_html(response.text)
+        try:
+            extracted_text = _page_text(url, response)
+        except HTMLExtractionError as e:
+            return json.dumps({"error": f"{e} for {url}"})
         logger.info(
             "HTML content extracted", extra={"url": url, "text_length": len(extracted_text)}
         )
@@ -397,6 +391,7 @@ def web_search(
     query: str = "",
     queries: list[str] | None = None,
     num_results: int | None = None,
+    fresh: bool = False,
 ) -> str:
     """Search the web using DuckDuckGo. Supports multiple queries in ONE call.
 
@@ -414,6 +409,8 @@ def web_search(
         queries: Multiple search queries to run together (preferred for
             independent searches; capped at a configured maximum)
         num_results: Number of results per query (default from config, max from config)
+        fresh: Search again instead of reusing results from a recent
+            identical search (for breaking news)
 
     Returns:
         JSON string with results. Single query: {query, results}. Multiple
@@ -435,10 +432,17 @@ def web_search(
     if len(all_queries) == 1:
         return json.dumps({**_search_one(all_queries[0], num_results), "_warning": _SEARCH_WARNING})
 
-    response: dict[str, Any] = {
-        "searches": [_search_one(q, num_results) for q in all_queries],
-        "_warning": _SEARCH_WARNING,
-    }
+    # Concurrent fan-out; each task runs in its own copy of the caller's
+    # context so log lines keep the request id
+    workers = min(len(all_queries), Config.WEB_SEARCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _search_one, q, num_results)
+            for q in all_queries
+        ]
+        searches = [future.result() for future in futures]
+
+    response: dict[str, Any] = {"searches": searches, "_warning": _SEARCH_WARNING}
     if dropped > 0:
         response["note"] = (
             f"{dropped} queries were dropped (max {Config.WEB_SEARCH_MAX_BATCH_QUERIES} "
@@ -1,8 +1,14 @@
 """Persistence pipeline for a completed chat turn.
 
-Orchestrates metadata extraction, generated-file collection, message
-persistence, cost accounting and title generation. Called from both the stream
-generator and the cleanup thread.
+Orchestrates metadata extraction, generated-file collection and message
+persistence. Called from both the stream generator and the cleanup thread.
+
+Everything the done event doesn't need - cost rows, response language
+detection and title generation (an LLM round-trip on the first exchange) -
+runs afterwards on a small shared pool (the post-commit pipeline). The stream
+sends done as soon as the message is persisted; the pipeline's title and
+language follow in a title_updated event, or reach the client on its next
+sync.
 
 Memory operations are not handled here: manage_memory writes during the turn so
 the model can read the outcome, rather than having its arguments replayed after
@@ -11,6 +17,9 @@ the fact.
 
 from __future__ import annotations
 
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from src.agent.agent import generate_title
@@ -27,6 +36,7 @@ from src.agent.tools import (
     set_current_message_files,
     set_location_context,
 )
+from src.api.helpers.stream_notify import notify_stream_update
 from src.api.schemas import MessageRole
 from src.api.utils import calculate_and_save_message_cost
 from src.config import Config
@@ -36,9 +46,23 @@ from src.utils.images import (
     extract_generated_images_from_tool_results,
 )
 from src.utils.logging import get_logger
+from src.utils.spans import SpanRecorder, span
 
 logger = get_logger(__name__)
 
+# Post-commit pipeline executor (created on first use; the lock guards
+# concurrent first access under threaded workers)
+_post_commit_executor: ThreadPoolExecutor | None = None
+_post_commit_executor_lock = threading.Lock()
+
+
+class PostCommitResult:
+    """Result of the post-commit pipeline, for the title_updated event."""
+
+    def __init__(self, title: str | None, language: str | None) -> None:
+        self.title = title
+        self.language = language
+
 
 class SaveResult:
     """Result from save_message_to_db with extracted data for done event."""
@@ -49,15 +73,26 @@ class SaveResult:
         sources: list[dict[str, str]],
         generated_images_meta: list[dict[str, str]],
         all_generated_files: list[dict[str, Any]],
-        generated_title: str | None,
-        language: str | None,
+        post_commit: Future[PostCommitResult],
     ) -> None:
         self.message_id = message_id
         self.sources = sources
         self.generated_images_meta = generated_images_meta
         self.all_generated_files = all_generated_files
-        self.generated_title = generated_title
-        self.language = language
+        self.post_commit = post_commit
+
+
+def _get_post_commit_executor() -> ThreadPoolExecutor:
+    """Get or create the post-commit pipeline executor (thread-safe lazy init)."""
+    global _post_commit_executor
+    if _post_commit_executor is None:
+        with _post_commit_executor_lock:
+            if _post_commit_executor is None:
+                _post_commit_executor = ThreadPoolExecutor(
+                    max_workers=Config.POST_COMMIT_WORKER_THREADS,
+                    thread_name_prefix="post-commit-",
+                )
+    return _post_commit_executor
 
 
 def _extract_stream_metadata(
@@ -66,11 +101,10 @@ def _extract_stream_metadata(
     tools: list[dict[str, Any]],
     user_id: str,
     conv_id: str,
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], str | None]:
-    """Extract sources, image prompts and language from the turn."""
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Extract sources and image prompts from the turn."""
     sources: list[dict[str, Any]] = list(extract_cited_sources(result_messages))
     generated_images_meta = extract_image_prompts_from_messages(result_messages)
-    language = detect_response_language(content)
 
     # Fallback: if web_search was used but no cite_sources, extract from tool results
     if not sources and tools:
@@ -83,10 +117,9 @@ def _extract_stream_metadata(
             "conversation_id": conv_id,
             "sources_count": len(sources) if sources else 0,
             "generated_images_count": len(generated_images_meta) if generated_images_meta else 0,
-            "language": language,
         },
     )
-    return sources, generated_images_meta, language
+    return sources, generated_images_meta
 
 
 def _collect_generated_files(
@@ -129,7 +162,6 @@ def _persist_assistant_message(
     all_generated_files: list[dict[str, Any]],
     sources: list[dict[str, Any]],
     generated_images_meta: list[dict[str, Any]],
-    language: str | None,
 ) -> Any:
     """UPDATE the stream-start placeholder, or INSERT when it is gone/absent."""
     logger.debug(
@@ -140,7 +172,6 @@ def _persist_assistant_message(
         "files": all_generated_files if all_generated_files else None,
         "sources": sources if sources else None,
         "generated_images": generated_images_meta if generated_images_meta else None,
-        "language": language,
     }
     if assistant_message_id:
         assistant_msg = db.update_message_content(assistant_message_id, content, **kwargs)
@@ -209,6 +240,65 @@ def _resolve_title_update(
         return None
 
 
+def _run_post_commit(
+    message_id: str,
+    conv_id: str,
+    user_id: str,
+    model: str,
+    message_text: str,
+    content: str,
+    result_messages: list[Any],
+    usage: dict[str, Any],
+    full_tool_results: list[dict[str, Any]],
+    span_recorder: SpanRecorder | None,
+) -> PostCommitResult:
+    """Save the cost row, detect the language and resolve the title of a saved message.
+
+    Runs on the post-commit executor. Each step fails on its own: an error is
+    logged and only skips that step.
+    """
+    try:
+        # Cost first: it's a quick write and what the client refreshes when
+        # the stream closes
+        try:
+            if span_recorder is not None:
+                usage = {**usage, "spans": span_recorder.summary()}
+            calculate_and_save_message_cost(
+                message_id,
+                conv_id,
+                user_id,
+                model,
+                usage,
+                full_tool_results,
+                len(content),
+                mode="stream",
+            )
+        except Exception:
+            logger.exception(
+                "Saving message cost failed",
+                extra={"user_id": user_id, "conversation_id": conv_id, "message_id": message_id},
+            )
+
+        language = detect_response_language(content)
+        if language:
+            try:
+                db.update_message_language(message_id, language)
+            except Exception:
+                logger.exception(
+                    "Saving message language failed",
+                    extra={"user_id": user_id, "message_id": message_id},
+                )
+
+        title = _resolve_title_update(conv_id, user_id, message_text, content, result_messages)
+        return PostCommitResult(title, language)
+    finally:
+        # Pool threads are long-lived - don't pin a connection to each
+        try:
+            db._pool.close_thread_connection()
+        except Exception:
+            logger.debug("Closing thread-local db connection failed", exc_info=True)
+
+
 def save_message_to_db(
     content: str,
     result_messages: list[Any],
@@ -221,11 +311,13 @@ def save_message_to_db(
     stream_request_id: str,
     client_connected: bool,
     assistant_message_id: str | None = None,
+    span_recorder: SpanRecorder | None = None,
 ) -> SaveResult | None:
     """Save message to database. Called from both generator and cleanup thread.
 
-    Orchestrates the sub-steps: metadata extraction, generated-file collection,
-    message persistence, cost accounting and title generation.
+    Orchestrates the sub-steps: metadata extraction, generated-file collection
+    and message persistence, then submits the post-commit pipeline (cost,
+    language, title) without waiting for it.
 
     Args:
         content: Message content to save
@@ -239,42 +331,48 @@ def save_message_to_db(
         stream_request_id: Streaming request ID (for full tool results)
         client_connected: Whether client is still connected (for logging)
         assistant_message_id: Pre-generated message ID for streaming recovery
+        span_recorder: The turn's latency span recorder; its summary is saved
+            with the message cost (passed explicitly: the cleanup thread saves
+            without the turn's context)
 
     Returns:
         SaveResult with extracted data for building done event, or None on error.
     """
     try:
-        sources, generated_images_meta, language = _extract_stream_metadata(
+        sources, generated_images_meta = _extract_stream_metadata(
             content, result_messages, tools, user_id, conv_id
         )
         all_generated_files, full_tool_results = _collect_generated_files(
             stream_request_id, user_id, conv_id
         )
-        assistant_msg = _persist_assistant_message(
-            conv_id,
-            user_id,
-            content,
-            assistant_message_id,
-            all_generated_files,
-            sources,
-            generated_images_meta,
-            language,
-        )
-
-        # Calculate and save cost for streaming (use full_tool_results for image cost)
-        calculate_and_save_message_cost(
+        with span("save_message", span_recorder):
+            assistant_msg = _persist_assistant_message(
+                conv_id,
+                user_id,
+                content,
+                assistant_message_id,
+                all_generated_files,
+                sources,
+                generated_images_meta,
+            )
+        # Resume tails waiting for the saved message can finish now
+        notify_stream_update(assistant_msg.id)
+
+        # Use the full tool results for image cost. The request's context is
+        # copied so the pipeline's logs keep its request id.
+        post_commit = _get_post_commit_executor().submit(
+            contextvars.copy_context().run,
+            _run_post_commit,
             assistant_msg.id,
             conv_id,
             user_id,
             model,
+            message_text,
+            content,
+            result_messages,
             usage,
             full_tool_results,
-            len(content),
-            mode="stream",
-        )
-
-        generated_title = _resolve_title_update(
-            conv_id, user_id, message_text, content, result_messages
+            span_recorder,
         )
 
         logger.info(
@@ -294,8 +392,7 @@ def save_message_to_db(
             sources=sources,
             generated_images_meta=generated_images_meta,
             all_generated_files=all_generated_files,
-            generated_title=generated_title,
-            language=language,
+            post_commit=post_commit,
         )
     except Exception as e:
         logger.error(
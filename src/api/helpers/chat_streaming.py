@@ -12,7 +12,9 @@ import threading
 import time
 import uuid
 from collections.abc import Callable, Generator
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Protocol
 
 from src.agent.agent import ChatAgent
 
@@ -28,7 +30,7 @@ from src.agent.tools.request_approval import (
     ApprovalRequestedException,
     build_approval_message,
 )
-from src.api.helpers.chat_save import SaveResult, save_message_to_db
+from src.api.helpers.chat_save import PostCommitResult, SaveResult, save_message_to_db
 from src.api.helpers.program_context import load_language_context, load_sports_context
 from src.api.helpers.stream_resume import _JOURNALED_EVENT_TYPES, _StreamJournal
 from src.api.schemas import MessageRole
@@ -36,9 +38,10 @@ from src.api.utils import (
     build_stream_done_event,
 )
 from src.config import Config
-from src.db.models import db
+from src.db.models import close_thread_db_connections, db
 from src.utils.logging import get_logger
 from src.utils.push import send_push_to_user
+from src.utils.spans import SpanRecorder, set_span_recorder, span
 
 if TYPE_CHECKING:
     from src.db.models import Conversation, Message, User
@@ -46,6 +49,12 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+class EventSink(Protocol):
+    """Where the producer thread puts events (queue.Queue or the ASGI loop queue)."""
+
+    def put(self, item: dict[str, Any] | None | Exception) -> None: ...
+
+
 def _notify_response_ready(user_id: str, conv_id: str, content: str) -> None:
     """Web-push "answer ready" for a finished turn no connected client saw.
 
@@ -83,27 +92,9 @@ STREAM_TIMEOUT_MARKER = "\n\n_…(response timed out)_"
 STREAM_ERROR_MARKER = "\n\n_…(response interrupted by an error)_"
 
 
-def _close_thread_db_connections() -> None:
-    """Close DB pool connections for the current thread.
-
-    Called when a short-lived background thread is about to exit so the
-    ConnectionPool doesn't keep a reference to the connection forever.
-    """
-    try:
-        db._pool.close_thread_connection()
-    except Exception:
-        logger.debug("Closing thread-local db connection failed", exc_info=True)
-    try:
-        from src.db.blob_store import get_blob_store
-
-        get_blob_store()._pool.close_thread_connection()
-    except Exception:
-        logger.debug("Closing thread-local blob connection failed", exc_info=True)
-
-
 def stream_events(
     agent: ChatAgent,
-    event_queue: queue.Queue[dict[str, Any] | None | Exception],
+    event_queue: EventSink,
     final_results: dict[str, Any],
     message_text: str,
     files: list[dict[str, Any]] | None,
@@ -125,6 +116,7 @@ def stream_events(
     agent_execution_context: AgentContext | None = None,
     client_location: dict[str, Any] | None = None,
     conversation_title: str | None = None,
+    span_recorder: SpanRecorder | None = None,
 ) -> None:
     """Background thread that streams events into the queue.
 
@@ -148,6 +140,8 @@ def stream_events(
         agent_execution_context: AgentContext for interactive agent
             conversations - contextvars don't cross threads, so it must be
             re-set here for kv_store and permission checks to see it
+        span_recorder: The turn's latency span recorder (re-set here for the
+            same reason)
     """
     journal: _StreamJournal | None = None
     if journal_message_id and Config.STREAM_JOURNAL_ENABLED:
@@ -157,6 +151,7 @@ def stream_events(
     set_current_message_files(files if files else None)
     set_conversation_context(conv_id, user_id)
     set_location_context(client_location)
+    set_span_recorder(span_recorder)
     if agent_execution_context is not None:
         set_agent_context(agent_execution_context)
     if is_sports and sports_context:
@@ -299,7 +294,7 @@ def stream_events(
         if journal:
             journal.finish()
         # Close thread-local DB connections so the pool doesn't leak them
-        _close_thread_db_connections()
+        close_thread_db_connections()
 
 
 def cleanup_and_save(
@@ -344,45 +339,7 @@ def cleanup_and_save(
         # Timeout ensures we still save if generator gets stuck or client disconnects early
         generator_finished = generator_done_event.wait(timeout=Config.STREAM_CLEANUP_WAIT_DELAY)
 
-        # Use lock to prevent race condition with generator's save
-        # NOTE: We must check saved status even if generator_finished is True, because
-        # GeneratorExit (raised when client disconnects) can kill the generator before
-        # it reaches _finalize_stream. The finally block sets generator_done_event, but
-        # the save never happened. This commonly occurs on mobile when the screen locks.
-        with save_lock:
-            # Only save if:
-            # 1. Final results are ready (stream completed successfully)
-            # 2. Message hasn't been saved yet (generator didn't save)
-            if final_results["ready"] and not final_results["saved"]:
-                if generator_finished:
-                    logger.info(
-                        "Generator exited without saving (likely GeneratorExit from client disconnect), "
-                        "saving message in cleanup thread",
-                        extra={"user_id": user_id, "conversation_id": conv_id},
-                    )
-                else:
-                    logger.info(
-                        "Generator stopped early (client disconnected), saving message in cleanup thread",
-                        extra={"user_id": user_id, "conversation_id": conv_id},
-                    )
-                # Save the message and mark as saved
-                save_func()
-                final_results["saved"] = True
-                # The turn finished but no client was connected to see it
-                # (typically mobile screen lock) - nudge the user's devices
-                _notify_response_ready(
-                    user_id, conv_id, str(final_results.get("clean_content") or "")
-                )
-            elif generator_finished:
-                logger.debug(
-                    "Generator completed, cleanup thread not needed",
-                    extra={
-                        "user_id": user_id,
-                        "conversation_id": conv_id,
-                        "ready": final_results["ready"],
-                        "saved": final_results["saved"],
-                    },
-                )
+        save_if_unsaved(final_results, save_lock, generator_finished, conv_id, user_id, save_func)
     except Exception as e:
         logger.error(
             "Error in cleanup thread",
@@ -395,7 +352,58 @@ def cleanup_and_save(
         )
     finally:
         # Close thread-local DB connections so the pool doesn't leak them
-        _close_thread_db_connections()
+        close_thread_db_connections()
+
+
+def save_if_unsaved(
+    final_results: dict[str, Any],
+    save_lock: threading.Lock,
+    generator_finished: bool,
+    conv_id: str,
+    user_id: str,
+    save_func: Callable[[], SaveResult | None],
+) -> None:
+    """Fallback save once the producer finished (see cleanup_and_save).
+
+    Shared by the cleanup thread and the ASGI front's cleanup task.
+    """
+    # Use lock to prevent race condition with generator's save
+    # NOTE: We must check saved status even if generator_finished is True, because
+    # GeneratorExit (raised when client disconnects) can kill the generator before
+    # it reaches _finalize_stream. The finally block sets generator_done_event, but
+    # the save never happened. This commonly occurs on mobile when the screen locks.
+    with save_lock:
+        # Only save if:
+        # 1. Final results are ready (stream completed successfully)
+        # 2. Message hasn't been saved yet (generator didn't save)
+        if final_results["ready"] and not final_results["saved"]:
+            if generator_finished:
+                logger.info(
+                    "Generator exited without saving (likely GeneratorExit from client disconnect), "
+                    "saving message in cleanup thread",
+                    extra={"user_id": user_id, "conversation_id": conv_id},
+                )
+            else:
+                logger.info(
+                    "Generator stopped early (client disconnected), saving message in cleanup thread",
+                    extra={"user_id": user_id, "conversation_id": conv_id},
+                )
+            # Save the message and mark as saved
+            save_func()
+            final_results["saved"] = True
+            # The turn finished but no client was connected to see it
+            # (typically mobile screen lock) - nudge the user's devices
+            _notify_response_ready(user_id, conv_id, str(final_results.get("clean_content") or ""))
+        elif generator_finished:
+            logger.debug(
+                "Generator completed, cleanup thread not needed",
+                extra={
+                    "user_id": user_id,
+                    "conversation_id": conv_id,
+                    "ready": final_results["ready"],
+                    "saved": final_results["saved"],
+                },
+            )
 
 
 # ============================================================================
@@ -409,11 +417,12 @@ def create_stream_generator(
     user_msg: Message,
     message_text: str,
     files: list[dict[str, Any]],
-    history: list[dict[str, Any]],
+    history: list[dict[str, Any]] | None,
     force_tools: list[str] | None,
     anonymous_mode: bool,
     stream_request_id: str,
     client_location: dict[str, Any] | None = None,
+    span_recorder: SpanRecorder | None = None,
 ) -> Generator[str]:
     """Create the SSE stream generator for chat streaming.
 
@@ -429,10 +438,13 @@ def create_stream_generator(
         user_msg: The saved user message
         message_text: The user's message text
         files: List of file attachments
-        history: Conversation history
+        history: Enriched conversation history, or None to load it (windowed)
+            when the stream starts
         force_tools: Optional list of tools to force
         anonymous_mode: Whether anonymous mode is enabled
         stream_request_id: Unique request ID for tool result capture
+        span_recorder: Latency span recorder started by the route (None when
+            span tracing is disabled)
 
     Returns:
         Generator that yields SSE-formatted strings
@@ -452,6 +464,7 @@ def create_stream_generator(
             anonymous_mode=anonymous_mode,
             stream_request_id=stream_request_id,
             client_location=client_location,
+            span_recorder=span_recorder,
         )
 
         # Set up threading context
@@ -469,37 +482,13 @@ def create_stream_generator(
 
             # Save message and send done event
             yield from _finalize_stream(context)
+            yield from _yield_post_commit_update(context)
 
         except Exception as e:
             yield from _handle_generator_error(context, e)
 
         finally:
-            # Clean up agent context if this was an agent conversation
-            context.cleanup_agent_context()
-            # Delete placeholder ONLY if the turn truly died: producer thread
-            # finished without results. While the producer is still generating
-            # (client disconnect mid-stream), the placeholder must survive so
-            # the cleanup thread saves into the SAME id - that id is what the
-            # resume endpoint and poll recovery look up. Deleting it here made
-            # the cleanup save fall back to an INSERT under a NEW id, which
-            # stranded every recovery keyed to the original one (X1).
-            # The approval path never sets "ready" - its save happens in
-            # _finalize_approval_stream / the producer, so it is excluded too.
-            if (
-                context.placeholder_saved
-                and not context.final_results["ready"]
-                and not context.final_results["saved"]
-                and context.approval_info is None
-                and (context.stream_thread is None or not context.stream_thread.is_alive())
-            ):
-                try:
-                    db.delete_message_by_id(context.expected_assistant_msg_id)
-                except Exception:
-                    logger.warning(
-                        "Failed to delete unused placeholder message",
-                        extra={"message_id": context.expected_assistant_msg_id},
-                        exc_info=True,
-                    )
+            _release_stream(context)
             # Signal that generator is done with its save attempt
             # This allows cleanup thread to proceed (or skip if we already saved)
             context.generator_done_event.set()
@@ -507,6 +496,37 @@ def create_stream_generator(
     return generate()
 
 
+def _release_stream(context: _StreamContext) -> None:
+    """Generator-exit cleanup: reset context vars, drop an unused placeholder."""
+    # Clean up agent context if this was an agent conversation
+    context.cleanup_agent_context()
+    set_span_recorder(None)
+    # Delete placeholder ONLY if the turn truly died: producer thread
+    # finished without results. While the producer is still generating
+    # (client disconnect mid-stream), the placeholder must survive so
+    # the cleanup thread saves into the SAME id - that id is what the
+    # resume endpoint and poll recovery look up. Deleting it here made
+    # the cleanup save fall back to an INSERT under a NEW id, which
+    # stranded every recovery keyed to the original one (X1).
+    # The approval path never sets "ready" - its save happens in
+    # _finalize_approval_stream / the producer, so it is excluded too.
+    if (
+        context.placeholder_saved
+        and not context.final_results["ready"]
+        and not context.final_results["saved"]
+        and context.approval_info is None
+        and (context.stream_thread is None or not context.stream_thread.is_alive())
+    ):
+        try:
+            db.delete_message_by_id(context.expected_assistant_msg_id)
+        except Exception:
+            logger.warning(
+                "Failed to delete unused placeholder message",
+                extra={"message_id": context.expected_assistant_msg_id},
+                exc_info=True,
+            )
+
+
 class _StreamContext:
     """Encapsulates all state for a streaming request."""
 
@@ -517,23 +537,28 @@ class _StreamContext:
         user_msg: Message,
         message_text: str,
         files: list[dict[str, Any]],
-        history: list[dict[str, Any]],
+        history: list[dict[str, Any]] | None,
         force_tools: list[str] | None,
         anonymous_mode: bool,
         stream_request_id: str,
         client_location: dict[str, Any] | None = None,
+        span_recorder: SpanRecorder | None = None,
     ) -> None:
         self.user = user
         self.conv = conv
         self.user_msg = user_msg
         self.message_text = message_text
         self.files = files
-        self.history = history
+        # Pre-built history (re-run turns); None = load it in setup_context
+        self.prebuilt_history = history
+        self.history: list[dict[str, Any]] = []
         self.force_tools = force_tools
         self.anonymous_mode = anonymous_mode
         self.stream_request_id = stream_request_id
         # Device GPS fix (ClientLocation.model_dump()); in-flight only, never persisted
         self.client_location = client_location
+        # Per-turn latency spans, saved with the message cost (None = disabled)
+        self.span_recorder = span_recorder
 
         # Derived values
         self.conv_id = conv.id
@@ -555,6 +580,9 @@ class _StreamContext:
 
         # Whether a placeholder message was saved to DB at stream start
         self.placeholder_saved: bool = False
+        # Post-commit pipeline of the saved message (title, language), set
+        # once the done event went out; _yield_post_commit_update waits on it
+        self.post_commit: Future[PostCommitResult] | None = None
 
         # Threading
         self.event_queue: queue.Queue[dict[str, Any] | None | Exception] = queue.Queue()
@@ -593,6 +621,7 @@ class _StreamContext:
         set_current_message_files(self.files if self.files else None)
         set_conversation_context(self.conv_id, self.user_id)
         set_location_context(self.client_location)
+        set_span_recorder(self.span_recorder)
 
         # Fetch planner dashboard if needed
         if self.conv.is_planning:
@@ -612,11 +641,14 @@ class _StreamContext:
 
         # Compact long histories for regular (non-agent) conversations to bound
         # per-turn input cost. Agent conversations use their own destructive
-        # compaction, so they are left untouched.
-        if not self.is_autonomous:
-            from src.agent.conversation_compaction import build_compacted_history
+        # compaction, so they are left untouched. Without a pre-built history
+        # only the window that is actually sent gets loaded.
+        from src.agent.conversation_compaction import resolve_turn_history
 
-            self.history = build_compacted_history(self.user_id, self.conv_id, self.history)
+        with span("history"):
+            self.history = resolve_turn_history(
+                self.user_id, self.conv_id, self.prebuilt_history, compact=not self.is_autonomous
+            )
 
     def _setup_planner_context(self) -> None:
         """Set up planner dashboard context if this is a planning conversation."""
@@ -707,52 +739,8 @@ class _StreamContext:
 
     def start_threads(self) -> None:
         """Start the streaming and cleanup background threads."""
-        agent = ChatAgent(
-            model_name=self.conv.model,
-            include_thoughts=True,
-            anonymous_mode=self.anonymous_mode,
-            is_planning=self.conv.is_planning,
-            is_autonomous=self.is_autonomous,
-            agent_context=self.agent_context,
-            is_sports=self.conv.is_sports,
-            sports_context=self.sports_context,
-            is_language=self.conv.is_language,
-            language_context=self.language_context,
-        )
-
-        self.stream_thread = threading.Thread(
-            target=stream_events,
-            args=(
-                agent,
-                self.event_queue,
-                self.final_results,
-                self.message_text,
-                self.files,
-                self.history,
-                self.force_tools,
-                self.user.name,
-                self.user_id,
-                self.user.custom_instructions,
-                self.conv.is_planning,
-                self.dashboard_data,
-                self.conv_id,
-                self.stream_request_id,
-                self.conv_id,  # conversation_id for checkpointing
-                self.conv.is_sports,
-                self.sports_context,
-                self.conv.is_language,
-                self.language_context,
-            ),
-            kwargs={
-                "journal_message_id": self.expected_assistant_msg_id,
-                "agent_execution_context": self.agent_execution_context,
-                "client_location": self.client_location,
-                "conversation_title": self.conv.title,
-            },
-            daemon=False,
-        )
-        self.stream_thread.start()
-
+        self.start_producer()
+        assert self.stream_thread is not None  # noqa: S101 - set by start_producer
         self.cleanup_thread = threading.Thread(
             target=cleanup_and_save,
             args=(
@@ -762,24 +750,91 @@ class _StreamContext:
                 self.generator_done_event,
                 self.conv_id,
                 self.user_id,
-                lambda: save_message_to_db(
-                    self.final_results["clean_content"],
-                    self.final_results["result_messages"],
-                    self.final_results["tool_results"],
-                    self.final_results["usage_info"],
-                    self.conv_id,
-                    self.user_id,
-                    self.conv.model,
-                    self.message_text,
-                    self.stream_request_id,
-                    self.client_connected,
-                    self.expected_assistant_msg_id,
-                ),
+                self.save_final_results,
             ),
             daemon=True,
         )
         self.cleanup_thread.start()
 
+    def start_producer(
+        self,
+        event_sink: EventSink | None = None,
+        on_exit: Callable[[], None] | None = None,
+    ) -> None:
+        """Start the producer thread running the agent.
+
+        Args:
+            event_sink: Where to put events (defaults to self.event_queue)
+            on_exit: Called from the producer thread once it has finished
+                (the ASGI front uses it to wake its event loop)
+        """
+        with span("agent_setup"):
+            agent = ChatAgent(
+                model_name=self.conv.model,
+                include_thoughts=True,
+                anonymous_mode=self.anonymous_mode,
+                is_planning=self.conv.is_planning,
+                is_autonomous=self.is_autonomous,
+                agent_context=self.agent_context,
+                is_sports=self.conv.is_sports,
+                sports_context=self.sports_context,
+                is_language=self.conv.is_language,
+                language_context=self.language_context,
+            )
+        sink = event_sink if event_sink is not None else self.event_queue
+
+        def run() -> None:
+            try:
+                stream_events(
+                    agent,
+                    sink,
+                    self.final_results,
+                    self.message_text,
+                    self.files,
+                    self.history,
+                    self.force_tools,
+                    self.user.name,
+                    self.user_id,
+                    self.user.custom_instructions,
+                    self.conv.is_planning,
+                    self.dashboard_data,
+                    self.conv_id,
+                    self.stream_request_id,
+                    self.conv_id,  # conversation_id for checkpointing
+                    self.conv.is_sports,
+                    self.sports_context,
+                    self.conv.is_language,
+                    self.language_context,
+                    journal_message_id=self.expected_assistant_msg_id,
+                    agent_execution_context=self.agent_execution_context,
+                    client_location=self.client_location,
+                    conversation_title=self.conv.title,
+                    span_recorder=self.span_recorder,
+                )
+            finally:
+                if on_exit is not None:
+                    on_exit()
+
+        self.stream_thread = threading.Thread(target=run, daemon=False)
+        self.stream_thread.start()
+
+    def save_final_results(self) -> SaveResult | None:
+        """Save the producer's final results (the cleanup path's save)."""
+        return save_message_to_db(
+            self.final_results["clean_content"],
+            self.final_results["result_messages"],
+            self.final_results["tool_results"],
+            self.final_results["usage_info"],
+            self.conv_id,
+            self.user_id,
+            self.conv.model,
+            self.message_text,
+            self.stream_request_id,
+            self.client_connected,
+            self.expected_assistant_msg_id,
+            span_recorder=self.span_recorder,
+        )
+
     def mark_disconnected(self, error: Exception, context: str) -> None:
         """Mark the client as disconnected and log the event."""
         if self.client_connected:
@@ -1034,6 +1089,7 @@ def _finalize_stream(context: _StreamContext) -> Generator[str]:
             context.stream_request_id,
             context.client_connected,
             context.expected_assistant_msg_id,
+            span_recorder=context.span_recorder,
         )
 
         # Mark as saved so cleanup thread knows not to save again
@@ -1053,9 +1109,7 @@ def _finalize_stream(context: _StreamContext) -> Generator[str]:
         save_result.all_generated_files,
         save_result.sources,
         save_result.generated_images_meta,
-        conversation_title=save_result.generated_title,
         user_message_id=context.user_msg.id,
-        language=save_result.language,
     )
 
     # Try to send done event even if client may have disconnected.
@@ -1063,6 +1117,7 @@ def _finalize_stream(context: _StreamContext) -> Generator[str]:
     # If truly disconnected, the write will fail and be caught below.
     try:
         yield f"data: {json.dumps(done_data)}\n\n"
+        context.post_commit = save_result.post_commit
     except (BrokenPipeError, ConnectionError, OSError) as e:
         logger.info(
             "Client disconnected before done event, but message saved",
@@ -1076,6 +1131,63 @@ def _finalize_stream(context: _StreamContext) -> Generator[str]:
         _notify_response_ready(context.user_id, context.conv_id, assistant_msg.content or "")
 
 
+def _yield_post_commit_update(
+    context: _StreamContext, timeout: float | None = None
+) -> Generator[str]:
+    """Yield title_updated once the saved message's post-commit pipeline finishes.
+
+    Keeps the stream open (after done) for at most timeout seconds
+    (POST_COMMIT_WAIT_TIMEOUT by default), sending keepalives meanwhile so a
+    client that went away releases the request thread at the next one. The
+    event carries the new conversation title and the detected response
+    language, when there are any; a client that misses it picks both up on
+    its next sync.
+    """
+    if context.post_commit is None or not context.client_connected:
+        return
+    if timeout is None:
+        timeout = Config.POST_COMMIT_WAIT_TIMEOUT
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = max(0.0, deadline - time.monotonic())
+        try:
+            result = context.post_commit.result(
+                timeout=min(remaining, Config.SSE_KEEPALIVE_INTERVAL)
+            )
+            break
+        except FutureTimeoutError:
+            if remaining <= Config.SSE_KEEPALIVE_INTERVAL:
+                logger.info(
+                    "Post-commit pipeline still running, closing stream without title_updated",
+                    extra={"user_id": context.user_id, "conversation_id": context.conv_id},
+                )
+                return
+            yield from _send_keepalive(context)
+            if not context.client_connected:
+                return
+        except Exception:
+            logger.exception(
+                "Post-commit pipeline failed",
+                extra={"user_id": context.user_id, "conversation_id": context.conv_id},
+            )
+            return
+    if not result.title and not result.language:
+        return
+
+    event: dict[str, Any] = {
+        "type": "title_updated",
+        "message_id": context.expected_assistant_msg_id,
+    }
+    if result.title:
+        event["title"] = result.title
+    if result.language:
+        event["language"] = result.language
+    try:
+        yield f"data: {json.dumps(event)}\n\n"
+    except (BrokenPipeError, ConnectionError, OSError) as e:
+        context.mark_disconnected(e, "title_updated")
+
+
 def _finalize_approval_stream(context: _StreamContext) -> Generator[str]:
     """Handle finalization when an approval request was raised.
 
@@ -0,0 +1,237 @@
+"""Event-loop driver for chat streams served by the ASGI front.
+
+Same turn lifecycle as create_stream_generator (placeholder, producer thread,
+journal, save, done event, title_updated, fallback save on disconnect), but only the agent
+producer gets a thread. The consumer waits on an asyncio queue, and the
+cleanup thread becomes a task on the loop, so an idle or slow stream costs a
+suspended coroutine instead of two parked threads.
+
+Blocking steps (context setup, DB writes, the final save) run on the loop's
+default executor inside a copy of the request's contextvars, so request id,
+conversation and agent context behave exactly as in the threaded path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from src.api.helpers.chat_streaming import (
+    _finalize_stream,
+    _handle_generator_error,
+    _handle_queue_error,
+    _handle_queue_event,
+    _handle_stream_timeout,
+    _release_stream,
+    _send_keepalive,
+    _StreamContext,
+    _yield_post_commit_update,
+    _yield_user_message_saved,
+    save_if_unsaved,
+)
+from src.config import Config
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.db.models import Conversation, Message, User
+    from src.utils.spans import SpanRecorder
+
+logger = get_logger(__name__)
+
+_T = TypeVar("_T")
+
+# Cleanup tasks outlive the response; keep strong references until they finish
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+class _LoopEventQueue:
+    """Event sink the producer thread fills and an event-loop task drains."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._queue: asyncio.Queue[dict[str, Any] | None | Exception] = asyncio.Queue()
+
+    def put(self, item: dict[str, Any] | None | Exception) -> None:
+        _call_soon_threadsafe(self._loop, self._queue.put_nowait, item)
+
+    async def get(self, timeout: float) -> dict[str, Any] | None | Exception:
+        """Next event; raises TimeoutError after `timeout` seconds."""
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+
+def _call_soon_threadsafe(
+    loop: asyncio.AbstractEventLoop, callback: Callable[..., object], *args: Any
+) -> None:
+    # The loop may be gone when a producer outlives a server shutdown
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(callback, *args)
+
+
+class _Runner:
+    """Runs blocking steps on the default executor in the stream's context."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self.context = contextvars.copy_context()
+
+    async def setup(self, fn: Callable[[], None]) -> None:
+        """Run fn in the stream's context itself, keeping the vars it sets."""
+        await self._loop.run_in_executor(None, self.context.run, fn)
+
+    async def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        # A fresh copy per call: a Context can't be entered by two threads at
+        # once, and the cleanup task may overlap a still-running save
+        return await self._loop.run_in_executor(None, self.context.copy().run, fn, *args)
+
+    async def drain(self, chunks: Iterator[str]) -> list[str]:
+        """Run one of the sync SSE helpers to completion off the loop."""
+        return await self.run(list, chunks)
+
+
+async def stream_chat_async(
+    user: User,
+    conv: Conversation,
+    user_msg: Message,
+    message_text: str,
+    files: list[dict[str, Any]],
+    history: list[dict[str, Any]] | None,
+    force_tools: list[str] | None,
+    anonymous_mode: bool,
+    stream_request_id: str,
+    client_location: dict[str, Any] | None = None,
+    span_recorder: SpanRecorder | None = None,
+) -> AsyncGenerator[str]:
+    """Async counterpart of create_stream_generator (same arguments and events)."""
+    loop = asyncio.get_running_loop()
+    runner = _Runner(loop)
+    context = _StreamContext(
+        user=user,
+        conv=conv,
+        user_msg=user_msg,
+        message_text=message_text,
+        files=files,
+        history=history,
+        force_tools=force_tools,
+        anonymous_mode=anonymous_mode,
+        stream_request_id=stream_request_id,
+        client_location=client_location,
+        span_recorder=span_recorder,
+    )
+    events = _LoopEventQueue(loop)
+    producer_done = asyncio.Event()
+    generator_done = asyncio.Event()
+
+    await runner.setup(context.setup_context)
+    await runner.run(
+        context.start_producer,
+        events,
+        lambda: _call_soon_threadsafe(loop, producer_done.set),
+    )
+    task = loop.create_task(_cleanup_and_save(context, runner, producer_done, generator_done))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    try:
+        for chunk in await runner.drain(_yield_user_message_saved(context)):
+            yield chunk
+        try:
+            async for chunk in _process_event_queue(context, events):
+                yield chunk
+            for chunk in await runner.drain(_finalize_stream(context)):
+                yield chunk
+            if context.post_commit is not None:
+                # Wait on the loop, not on an executor thread; shielded so a
+                # timeout doesn't cancel the pipeline. Timeouts and failures
+                # are logged by _yield_post_commit_update.
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(
+                        asyncio.shield(asyncio.wrap_future(context.post_commit)),
+                        timeout=Config.POST_COMMIT_WAIT_TIMEOUT,
+                    )
+            for chunk in await runner.drain(_yield_post_commit_update(context, timeout=0)):
+                yield chunk
+        except Exception as e:
+            for chunk in await runner.drain(_handle_generator_error(context, e)):
+                yield chunk
+    finally:
+        try:
+            # Shielded: a disconnect cancels this task, but the placeholder
+            # decision must still run to completion
+            await asyncio.shield(runner.run(_release_stream, context))
+        finally:
+            context.generator_done_event.set()
+            generator_done.set()
+
+
+async def _process_event_queue(
+    context: _StreamContext, events: _LoopEventQueue
+) -> AsyncGenerator[str]:
+    """Async _process_event_queue: same backstop deadline and event handling."""
+    deadline = time.monotonic() + Config.CHAT_TIMEOUT + Config.SSE_KEEPALIVE_INTERVAL
+    while True:
+        if time.monotonic() > deadline:
+            for chunk in _handle_stream_timeout(context):
+                yield chunk
+            break
+        try:
+            item = await events.get(timeout=Config.SSE_KEEPALIVE_INTERVAL)
+        except TimeoutError:
+            for chunk in _send_keepalive(context):
+                yield chunk
+            continue
+
+        if item is None:
+            break
+        if isinstance(item, Exception):
+            for chunk in _handle_queue_error(context, item):
+                yield chunk
+            return
+        if item.get("type") == "timeout":
+            for chunk in _handle_stream_timeout(context):
+                yield chunk
+            break
+        for chunk in _handle_queue_event(context, item):
+            yield chunk
+
+
+async def _cleanup_and_save(
+    context: _StreamContext,
+    runner: _Runner,
+    producer_done: asyncio.Event,
+    generator_done: asyncio.Event,
+) -> None:
+    """Task form of cleanup_and_save: fallback save after a client disconnect."""
+    extra = {"user_id": context.user_id, "conversation_id": context.conv_id}
+    try:
+        await asyncio.wait_for(producer_done.wait(), timeout=Config.STREAM_CLEANUP_THREAD_TIMEOUT)
+    except TimeoutError:
+        logger.error("Stream thread did not complete within timeout", extra=extra)
+        return
+
+    # Give the generator priority - it can still send the done event
+    try:
+        await asyncio.wait_for(generator_done.wait(), timeout=Config.STREAM_CLEANUP_WAIT_DELAY)
+        generator_finished = True
+    except TimeoutError:
+        generator_finished = False
+
+    try:
+        await runner.run(
+            save_if_unsaved,
+            context.final_results,
+            context.save_lock,
+            generator_finished,
+            context.conv_id,
+            context.user_id,
+            context.save_final_results,
+        )
+    except Exception as e:
+        logger.error(
+            "Error in stream cleanup task",
+            extra={**extra, "error": str(e)},
+            exc_info=True,
+        )
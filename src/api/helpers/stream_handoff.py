@@ -0,0 +1,50 @@
+"""SSE responses that the ASGI stream front can take over.
+
+The chat stream routes run through Flask in both deployments so auth, rate
+limiting and validation stay in one place. Under gunicorn the view returns a
+normal streaming Response. Under the ASGI front (src/asgi.py) the WSGI
+environ carries a hand-off slot: the view drops an async stream factory into
+it and returns an empty response, and the front streams the factory's output
+on its event loop once the view has returned.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+
+from flask import Response, request
+
+# WSGI environ key set by the ASGI front; holds a list the view appends to
+ASYNC_STREAM_ENVIRON_KEY = "ai_chatbot.async_stream"
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+
+
+@dataclass(frozen=True)
+class AsyncStreamHandoff:
+    """An async SSE stream handed from a Flask view to the ASGI front."""
+
+    factory: Callable[[], AsyncIterator[str]]
+    # Context of the request thread (request id etc.) to run the stream in
+    context: contextvars.Context
+
+
+def sse_response(
+    sync_stream: Callable[[], Iterator[str]],
+    async_stream: Callable[[], AsyncIterator[str]],
+) -> Response:
+    """Build the SSE response, handing the stream to the ASGI front if present.
+
+    Only one of the factories is ever called, so creating either stream may
+    have side effects (threads, placeholder rows).
+    """
+    slot: list[AsyncStreamHandoff] | None = request.environ.get(ASYNC_STREAM_ENVIRON_KEY)
+    if slot is None:
+        return Response(sync_stream(), mimetype="text/event-stream", headers=SSE_HEADERS)
+    slot.append(AsyncStreamHandoff(async_stream, contextvars.copy_context()))
+    return Response(iter(()), mimetype="text/event-stream", headers=SSE_HEADERS)
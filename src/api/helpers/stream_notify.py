@@ -0,0 +1,270 @@
+"""Wakeups for resume tails when a stream journal gets new rows.
+
+stream_resume_events used to poll the journal every 0.4s for the whole life
+of a resumed stream. Instead, tails subscribe to a message id and sleep until
+the producer signals that something changed (journal flush, message saved):
+
+- In-process: a Condition plus a per-message version counter. A producer and
+  a tail on the same worker wake each other directly; tails running on an
+  event loop (the ASGI front) wait on a future resolved thread-safely.
+- Cross-worker: each worker that has ever tailed a stream binds one Unix
+  datagram socket in STREAM_NOTIFY_DIR and runs one listener thread that
+  turns received message ids into in-process notifications. Producers send
+  the message id to every other worker's socket (non-blocking, best-effort).
+
+Wakeups are hints - a tail always re-reads the DB after waking and falls back
+to a slow poll (STREAM_RESUME_FALLBACK_POLL_SECONDS), so a lost datagram
+only costs latency, never correctness.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import os
+import socket
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from src.config import Config
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SOCKET_SUFFIX = ".sock"
+# Message ids are UUIDs; anything longer is not ours
+_MAX_DATAGRAM = 256
+
+_cond = threading.Condition()
+
+
+class _Entry:
+    """Change counter and subscribers of one message's stream (guarded by _cond)."""
+
+    __slots__ = ("async_waiters", "subscribers", "version")
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.subscribers = 0
+        self.async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+
+# Only ids with live subscribers are tracked, so notifying a stream nobody
+# tails is a dict miss.
+_subscriptions: dict[str, _Entry] = {}
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class StreamSubscription:
+    """A tail's handle for waiting on changes to one message's stream."""
+
+    def __init__(self, message_id: str) -> None:
+        self.message_id = message_id
+        with _cond:
+            self._entry = _subscriptions.setdefault(message_id, _Entry())
+            self._entry.subscribers += 1
+            self._seen = self._entry.version
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the stream changed since the last wait, or timeout.
+
+        Changes that happen between two waits (e.g. while the caller was
+        reading the journal) are not lost - the next wait returns at once.
+
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        entry = self._entry
+        with _cond:
+            changed = _cond.wait_for(lambda: entry.version != self._seen, timeout=max(timeout, 0))
+            self._seen = entry.version
+            return changed
+
+    async def wait_async(self, timeout: float) -> bool:
+        """Event-loop variant of wait() - suspends the task, not a thread."""
+        entry = self._entry
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        with _cond:
+            if entry.version != self._seen:
+                self._seen = entry.version
+                return True
+            waiter = (loop, future)
+            entry.async_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout=max(timeout, 0))
+            changed = True
+        except TimeoutError:
+            changed = False
+        finally:
+            with _cond:
+                if waiter in entry.async_waiters:
+                    entry.async_waiters.remove(waiter)
+                self._seen = entry.version
+        return changed
+
+    def close(self) -> None:
+        with _cond:
+            self._entry.subscribers -= 1
+            if self._entry.subscribers <= 0:
+                _subscriptions.pop(self.message_id, None)
+
+
+@contextlib.contextmanager
+def subscribe(message_id: str) -> Iterator[StreamSubscription]:
+    """Subscribe to change notifications for a message's stream.
+
+    Also starts this worker's cross-worker listener so producers running in
+    other workers can reach the subscription.
+    """
+    _get_channel().start()
+    subscription = StreamSubscription(message_id)
+    try:
+        yield subscription
+    finally:
+        subscription.close()
+
+
+def _notify_local(message_id: str) -> None:
+    with _cond:
+        entry = _subscriptions.get(message_id)
+        if entry is None:
+            return
+        entry.version += 1
+        waiters, entry.async_waiters = entry.async_waiters, []
+        _cond.notify_all()
+    for loop, future in waiters:
+        with contextlib.suppress(RuntimeError):  # Loop already closed
+            loop.call_soon_threadsafe(_resolve, future)
+
+
+def notify_stream_update(message_id: str) -> None:
+    """Wake every tail of message_id, in this worker and in the others.
+
+    Never raises - notification failures must not break the producer.
+    """
+    try:
+        _notify_local(message_id)
+        _get_channel().broadcast(message_id)
+    except Exception:
+        logger.debug("Stream notification failed", exc_info=True)
+
+
+class _CrossWorkerChannel:
+    """Unix datagram sockets connecting the workers of one deployment.
+
+    Each listening worker owns ``<directory>/<name>.sock``; broadcasting sends
+    the message id to every socket in the directory except our own and
+    unlinks sockets whose owner is gone (connection refused).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        on_message: Callable[[str], None] = _notify_local,
+    ) -> None:
+        self.directory = directory
+        self.path = directory / f"{name}{_SOCKET_SUFFIX}"
+        self._on_message = on_message
+        self._lock = threading.Lock()
+        self._listener: socket.socket | None = None
+        self._sender: socket.socket | None = None
+
+    @property
+    def supported(self) -> bool:
+        return Config.STREAM_NOTIFY_CROSS_WORKER and hasattr(socket, "AF_UNIX")
+
+    def start(self) -> None:
+        """Bind this worker's socket and start the listener thread (idempotent)."""
+        if not self.supported or self._listener is not None:
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            try:
+                self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+                with contextlib.suppress(FileNotFoundError):
+                    self.path.unlink()
+                listener = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                listener.bind(str(self.path))
+            except OSError:
+                logger.warning(
+                    "Cross-worker stream notifications unavailable, resume tails will poll",
+                    extra={"path": str(self.path)},
+                    exc_info=True,
+                )
+                return
+            self._listener = listener
+            atexit.register(self.close)
+            threading.Thread(
+                target=self._listen, name="stream-notify-listener", daemon=True
+            ).start()
+
+    def _listen(self) -> None:
+        listener = self._listener
+        while listener is not None:
+            try:
+                data = listener.recv(_MAX_DATAGRAM)
+            except OSError:
+                return  # Socket closed
+            try:
+                self._on_message(data.decode())
+            except Exception:
+                logger.debug("Stream notification handler failed", exc_info=True)
+
+    def broadcast(self, message_id: str) -> None:
+        """Send message_id to every other listening worker (best-effort)."""
+        if not self.supported or not self.directory.is_dir():
+            return
+        if self._sender is None:
+            sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            # A full receive buffer must never stall the producer - the tail's
+            # fallback poll picks up the dropped wakeup
+            sender.setblocking(False)
+            self._sender = sender
+        payload = message_id.encode()
+        for path in self.directory.glob(f"*{_SOCKET_SUFFIX}"):
+            if path == self.path:
+                continue
+            try:
+                self._sender.sendto(payload, str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Owner process is gone - sweep its socket
+                with contextlib.suppress(OSError):
+                    path.unlink()
+            except OSError:
+                logger.debug("Stream notification send failed", extra={"path": str(path)})
+
+    def close(self) -> None:
+        with self._lock:
+            listener, self._listener = self._listener, None
+            if listener is not None:
+                listener.close()
+                with contextlib.suppress(OSError):
+                    self.path.unlink()
+            if self._sender is not None:
+                self._sender.close()
+                self._sender = None
+
+
+_channel: _CrossWorkerChannel | None = None
+_channel_lock = threading.Lock()
+
+
+def _get_channel() -> _CrossWorkerChannel:
+    """Get this process's channel (re-created after fork, keyed by pid)."""
+    global _channel
+    pid_name = str(os.getpid())
+    if _channel is not None and _channel.path.stem == pid_name:
+        return _channel
+    with _channel_lock:
+        if _channel is None or _channel.path.stem != pid_name:
+            _channel = _CrossWorkerChannel(Path(Config.STREAM_NOTIFY_DIR), pid_name)
+        return _channel
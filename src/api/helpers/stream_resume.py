@@ -2,17 +2,22 @@
 
 The producer journals every client-facing SSE event with a monotonic seq
 (_StreamJournal); the resume endpoint replays rows after the client's last
-seen seq and continues live (stream_resume_events). Persistence is
-best-effort - journal failures never break the live stream.
+seen seq and continues live (stream_resume_events), woken by the producer's
+flushes (stream_notify) instead of polling. Persistence is best-effort -
+journal failures never break the live stream.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any
 
+from src.api.helpers.stream_notify import notify_stream_update, subscribe
 from src.config import Config
 from src.db.models import db
 from src.utils.logging import get_logger
@@ -20,6 +25,10 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Poll interval while waiting for the save after stream_end (bounded by
+# STREAM_RESUME_SAVE_GRACE_SECONDS)
+_POST_STREAM_POLL_SECONDS = 0.4
+
 _JOURNALED_EVENT_TYPES = {
     "token",
     "thinking",
@@ -70,9 +79,17 @@ class _StreamJournal:
         if not buffer:
             return
         try:
-            db.journal_append_events(self.message_id, buffer)
+            committed = db.journal_append_events(self.message_id, buffer)
         except Exception:
             logger.warning("Stream journal flush failed", exc_info=True)
+            return
+        # Wake tails once the rows are readable (at once unless the
+        # group-commit writer queued them)
+        committed.add_done_callback(self._notify_if_committed)
+
+    def _notify_if_committed(self, committed: Future[None]) -> None:
+        if committed.exception() is None:
+            notify_stream_update(self.message_id)
 
     def finish(self) -> None:
         """Mark the stream as over (resume endpoint stops tailing on this)."""
@@ -90,7 +107,73 @@ def stream_resume_events(message_id: str, after_seq: int) -> Generator[str]:
     after the producer finishes) and emits a done event built from it.
 
     Works cross-worker: the journal is DB-backed, so the resume request may
-    land on a different gunicorn worker than the one still generating.
+    land on a different gunicorn worker than the one still generating. The
+    tail sleeps between reads until the producer signals a flush or save
+    (stream_notify), with a slow fallback poll in case a wakeup is lost.
+
+    Thinking events are replayed as journaled - offset-tagged deltas plus
+    occasional full-text checkpoints - so the client rebuilds the trace the
+    same way it does live.
+    """
+    with subscribe(message_id) as subscription:
+        for item in _tail_journal(message_id, after_seq):
+            if isinstance(item, _Wait):
+                subscription.wait(item.seconds)
+            else:
+                yield item
+
+
+async def stream_resume_events_async(message_id: str, after_seq: int) -> AsyncGenerator[str]:
+    """Event-loop variant of stream_resume_events for the ASGI front.
+
+    Journal reads run on the default executor; waiting for the producer
+    suspends the task instead of holding a thread.
+    """
+    loop = asyncio.get_running_loop()
+    tail = _tail_journal(message_id, after_seq)
+    try:
+        with subscribe(message_id) as subscription:
+            while (item := await loop.run_in_executor(None, next, tail, None)) is not None:
+                if isinstance(item, _Wait):
+                    await subscription.wait_async(item.seconds)
+                else:
+                    yield item
+    finally:
+        tail.close()
+
+
+@dataclass(frozen=True)
+class _Wait:
+    """Yielded by _tail_journal when it has nothing to send for up to `seconds`."""
+
+    seconds: float
+
+
+def _done_event_from_message(msg: Any) -> dict[str, Any]:
+    """Build the resume stream's done event from the saved assistant message."""
+    done: dict[str, Any] = {
+        "type": "done",
+        "id": msg.id,
+        "created_at": msg.created_at.isoformat(),
+        "content": msg.content or "",
+    }
+    if msg.files:
+        done["files"] = msg.files
+    if msg.sources:
+        done["sources"] = msg.sources
+    if msg.generated_images:
+        done["generated_images"] = msg.generated_images
+    if msg.language:
+        done["language"] = msg.language
+    return done
+
+
+def _tail_journal(message_id: str, after_seq: int) -> Generator[str | _Wait]:
+    """Replay + live-tail loop of stream_resume_events (see there).
+
+    Yields SSE chunks, or a _Wait when the driver should sleep until the
+    producer signals a change - keeps the loop shared between the thread
+    and event-loop drivers.
     """
     deadline = time.monotonic() + Config.CHAT_TIMEOUT
     last_keepalive = time.monotonic()
@@ -102,23 +185,6 @@ def stream_resume_events(message_id: str, after_seq: int) -> Generator[str]:
     # keepalives until CHAT_TIMEOUT.
     stall_deadline = time.monotonic() + Config.STREAM_RESUME_STALL_SECONDS
 
-    def _done_event_from_message(msg: Any) -> dict[str, Any]:
-        done: dict[str, Any] = {
-            "type": "done",
-            "id": msg.id,
-            "created_at": msg.created_at.isoformat(),
-            "content": msg.content or "",
-        }
-        if msg.files:
-            done["files"] = msg.files
-        if msg.sources:
-            done["sources"] = msg.sources
-        if msg.generated_images:
-            done["generated_images"] = msg.generated_images
-        if msg.language:
-            done["language"] = msg.language
-        return done
-
     while time.monotonic() < deadline:
         events = db.journal_get_events(message_id, after_seq)
         if events:
@@ -166,7 +232,18 @@ def stream_resume_events(message_id: str, after_seq: int) -> Generator[str]:
             return
 
         if not events:
-            time.sleep(0.4)
+            now = time.monotonic()
+            wait_until = min(
+                deadline,
+                last_keepalive + Config.SSE_KEEPALIVE_INTERVAL,
+                now + Config.STREAM_RESUME_FALLBACK_POLL_SECONDS,
+                save_grace_deadline if save_grace_deadline is not None else stall_deadline,
+            )
+            if stream_ended:
+                # Placeholder deletion (failed turn) sends no wakeup - the
+                # bounded grace window keeps a short poll
+                wait_until = min(wait_until, now + _POST_STREAM_POLL_SECONDS)
+            yield _Wait(wait_until - now)
             if time.monotonic() - last_keepalive >= Config.SSE_KEEPALIVE_INTERVAL:
                 yield ": keepalive\n\n"
                 last_keepalive = time.monotonic()
@@ -454,19 +454,18 @@ def trigger_agent(user: User, agent_id: str) -> dict[str, Any]:
     if db.has_pending_approval(agent.id):
         raise_validation_error("Agent is waiting for approval")
 
-    # Check if agent is already running (prevent overlapping executions)
-    if db.has_running_execution(agent.id):
-        raise_validation_error("Agent is already running")
-
     # Check if agent is in cooldown period (prevent spamming)
     if db.is_in_cooldown(agent.id):
         raise_validation_error("Agent was recently executed. Please wait a few seconds.")
 
-    # Create execution record
-    execution = db.create_execution(
+    # Create execution record unless the agent is already running (one atomic
+    # step: the scheduler may be claiming the same agent concurrently)
+    execution = db.create_execution_if_idle(
         agent_id=agent.id,
         trigger_type="manual",
     )
+    if execution is None:
+        raise_validation_error("Agent is already running")
 
     # Execute the agent
     result, error_message = execute_agent(agent, user, "manual", execution.id)
@@ -5,6 +5,7 @@ batch (complete response) and streaming (SSE) modes.
 """
 
 import uuid
+from typing import Any
 
 from apiflask import APIBlueprint
 from flask import Response, request
@@ -36,6 +37,7 @@ from src.api.errors import (
 from src.api.helpers.chat_save import _resolve_title_update
 from src.api.helpers.program_context import load_language_context as _load_language_context
 from src.api.helpers.program_context import load_sports_context as _load_sports_context
+from src.api.helpers.stream_handoff import sse_response
 from src.api.rate_limiting import rate_limit_chat
 from src.api.routes.calendar import _get_valid_calendar_access_token
 from src.api.schemas import ChatBatchResponse, ChatRequest, MessageRole
@@ -57,6 +59,8 @@ from src.utils.images import (
     extract_generated_images_from_tool_results,
 )
 from src.utils.logging import get_logger, log_payload_snippet
+from src.utils.spans import new_span_recorder, span
+from src.utils.uploads import load_uploaded_files, resolve_uploads
 
 logger = get_logger(__name__)
 
@@ -127,7 +131,8 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
 
     Accepts JSON body with:
     - message: str (optional if files present) - the text message
-    - files: list[dict] (optional if message present) - array of {name, type, data} file objects
+    - files: list[dict] (optional if message present) - array of {name, type, data} file
+      objects ({name, type, upload_id} for files sent to POST /api/uploads first)
     - force_tools: list[str] (optional) - list of tool names to force (e.g. ["web_search"])
     """
     logger.info("Batch chat request", extra={"user_id": user.id, "conversation_id": conv_id})
@@ -152,7 +157,8 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
             )
 
     message_text = data.message.strip()
-    files = [f.model_dump() for f in data.files]  # Convert Pydantic models to dicts
+    # Convert Pydantic models to dicts (each file carries either data or upload_id)
+    files = [f.model_dump(exclude_none=True) for f in data.files]
     force_tools = data.force_tools
     # OR the persisted flag with the request flag: a conversation marked
     # anonymous stays anonymous even if a stale client omits the flag, and a
@@ -170,13 +176,20 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
         },
     )
 
+    # Before file validation: a retry whose original POST landed has already
+    # consumed its uploads, and should get the 409 rather than "not found"
+    if not data.rerun_mode:
+        _dedupe_client_message_id(conv_id, data.client_message_id)
+
     # Content validation for files (base64 decoding, size) - structure already validated by Pydantic
     if files:
         logger.debug(
             "Validating files",
             extra={"user_id": user.id, "conversation_id": conv_id, "file_count": len(files)},
         )
-        is_valid, error = validate_files(files)
+        is_valid, error = resolve_uploads(user.id, files)
+        if is_valid:
+            is_valid, error = validate_files(files)
         if not is_valid:
             logger.warning(
                 "File validation failed",
@@ -209,7 +222,6 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
         # Re-run on existing history: no new user message is inserted
         message_text, history_messages, user_msg = _resolve_rerun(conv_id, data.rerun_mode)
     else:
-        _dedupe_client_message_id(conv_id, data.client_message_id)
         user_msg = db.add_message(
             conv_id,
             MessageRole.USER,
@@ -220,28 +232,20 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
 
         # Queue background thumbnail generation for pending files
         if files:
+            load_uploaded_files(user_msg.id, files)
             queue_pending_thumbnails(user_msg.id, files)
-            # Upload videos to the Gemini Files API and annotate files with URIs
+            # Upload videos, and images/PDFs above GEMINI_FILES_UPLOAD_THRESHOLD, to
+            # the Gemini Files API and annotate files with URIs
             # (annotations are transient: the message was already saved without them)
             attach_gemini_file_uris(user_msg.id, files)
 
-        history_messages = db.get_messages(conv_id)[:-1]  # Exclude the just-added message
+        history_messages = None  # Loaded below, once the compaction mode is known
 
     # Get conversation history with enrichment (timestamps, file refs, tool summaries)
     # Files are excluded from previous messages to save tokens (only metadata is included)
     from src.agent.history import enrich_history
 
-    history = enrich_history(history_messages)
-    logger.debug(
-        "Starting chat agent",
-        extra={
-            "user_id": user.id,
-            "conversation_id": conv_id,
-            "model": conv.model,
-            "history_length": len(history),
-            "force_tools": force_tools,
-        },
-    )
+    history = enrich_history(history_messages) if history_messages is not None else None
 
     # Create agent and get response
     try:
@@ -332,10 +336,19 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
         # Compact long histories for regular (non-agent) conversations to bound
         # per-turn input cost. Agent conversations use their own destructive
         # compaction, so they are left untouched.
-        if not is_autonomous:
-            from src.agent.conversation_compaction import build_compacted_history
+        from src.agent.conversation_compaction import resolve_turn_history
 
-            history = build_compacted_history(user.id, conv_id, history)
+        history = resolve_turn_history(user.id, conv_id, history, compact=not is_autonomous)
+        logger.debug(
+            "Starting chat agent",
+            extra={
+                "user_id": user.id,
+                "conversation_id": conv_id,
+                "model": conv.model,
+                "history_length": len(history),
+                "force_tools": force_tools,
+            },
+        )
 
         agent = ChatAgent(
             model_name=conv.model,
@@ -546,7 +559,7 @@ def chat_batch(user: User, data: ChatRequest, conv_id: str) -> tuple[dict[str, s
     description="""Send a message and stream the response via Server-Sent Events.
 
 Returns text/event-stream with the following event types:
-- `thinking`: LLM thinking text (if enabled) - `{"type": "thinking", "text": "..."}`
+- `thinking`: LLM thinking delta (if enabled) - `{"type": "thinking", "text": "...", "offset": 0}` (`text` is spliced in at `offset`; `"checkpoint": true` events carry the full trace)
 - `tool_start`: Tool starting - `{"type": "tool_start", "tool": "web_search", "detail": "..."}`
 - `tool_end`: Tool completed - `{"type": "tool_end", "tool": "web_search"}`
 - `token`: Content token - `{"type": "token", "text": "..."}`
@@ -567,15 +580,19 @@ def chat_stream(
 
     Accepts JSON body with:
     - message: str (optional if files present) - the text message
-    - files: list[dict] (optional if message present) - array of {name, type, data} file objects
+    - files: list[dict] (optional if message present) - array of {name, type, data} file
+      objects ({name, type, upload_id} for files sent to POST /api/uploads first)
     - force_tools: list[str] (optional) - list of tool names to force (e.g. ["web_search"])
 
     Uses SSE keepalive heartbeats to prevent proxy timeouts during long LLM thinking phases.
     Keepalives are sent as SSE comments (: keepalive) which clients ignore but proxies see as activity.
     """
     from src.api.helpers.chat_streaming import create_stream_generator
+    from src.api.helpers.chat_streaming_async import stream_chat_async
 
     logger.info("Stream chat request", extra={"user_id": user.id, "conversation_id": conv_id})
+    # Latency spans of the turn start here; the stream context takes them over
+    span_recorder = new_span_recorder()
     conv = db.get_conversation(conv_id, user.id)
     if not conv:
         logger.warning(
@@ -597,7 +614,8 @@ def chat_stream(
             )
 
     message_text = data.message.strip()
-    files = [f.model_dump() for f in data.files]  # Convert Pydantic models to dicts
+    # Convert Pydantic models to dicts (each file carries either data or upload_id)
+    files = [f.model_dump(exclude_none=True) for f in data.files]
     force_tools = data.force_tools
     # OR the persisted flag with the request flag: a conversation marked
     # anonymous stays anonymous even if a stale client omits the flag, and a
@@ -615,13 +633,20 @@ def chat_stream(
         },
     )
 
+    # Before file validation: a retry whose original POST landed has already
+    # consumed its uploads, and should get the 409 rather than "not found"
+    if not data.rerun_mode:
+        _dedupe_client_message_id(conv_id, data.client_message_id)
+
     # Content validation for files (base64 decoding, size) - structure already validated by Pydantic
     if files:
         logger.debug(
             "Validating files for stream",
             extra={"user_id": user.id, "conversation_id": conv_id, "file_count": len(files)},
         )
-        is_valid, error = validate_files(files)
+        is_valid, error = resolve_uploads(user.id, files)
+        if is_valid:
+            is_valid, error = validate_files(files)
         if not is_valid:
             logger.warning(
                 "File validation failed in stream",
@@ -655,40 +680,43 @@ def chat_stream(
         message_text, rerun_history_messages, user_msg = _resolve_rerun(conv_id, data.rerun_mode)
     else:
         rerun_history_messages = None
-        _dedupe_client_message_id(conv_id, data.client_message_id)
-        user_msg = db.add_message(
-            conv_id,
-            MessageRole.USER,
-            message_text,
-            files=files if files else None,
-            message_id=data.client_message_id,
-        )
+        with span("save_user_message", span_recorder):
+            user_msg = db.add_message(
+                conv_id,
+                MessageRole.USER,
+                message_text,
+                files=files if files else None,
+                message_id=data.client_message_id,
+            )
 
         # Queue background thumbnail generation for pending files
         if files:
+            load_uploaded_files(user_msg.id, files)
             queue_pending_thumbnails(user_msg.id, files)
-            # Upload videos to the Gemini Files API and annotate files with URIs
+            # Upload videos, and images/PDFs above GEMINI_FILES_UPLOAD_THRESHOLD, to
+            # the Gemini Files API and annotate files with URIs
             # (annotations are transient: the message was already saved without them)
-            attach_gemini_file_uris(user_msg.id, files)
+            with span("gemini_upload", span_recorder):
+                attach_gemini_file_uris(user_msg.id, files)
 
-    # Get conversation history with enrichment (timestamps, file refs, tool summaries)
+    # Conversation history with enrichment (timestamps, file refs, tool summaries)
     # NOTE: We exclude file DATA from history to avoid re-sending large base64 data.
     # Only file metadata (name, type, message_id, file_index) is included so the LLM
     # can reference historical files using retrieve_file or generate_image tools.
+    # Regular turns pass None: the stream loads (and compacts) the history once
+    # it knows whether this is an agent conversation, reading only what is sent.
     from src.agent.history import enrich_history
 
+    history = None
     if rerun_history_messages is not None:
-        history = enrich_history(rerun_history_messages)
-    else:
-        messages = db.get_messages(conv_id)
-        history = enrich_history(messages[:-1])  # Exclude the just-added message
+        with span("enrich_history", span_recorder):
+            history = enrich_history(rerun_history_messages)
     logger.debug(
         "Starting stream chat agent",
         extra={
             "user_id": user.id,
             "conversation_id": conv_id,
             "model": conv.model,
-            "history_length": len(history),
             "force_tools": force_tools,
         },
     )
@@ -696,27 +724,22 @@ def chat_stream(
     # Generate a unique request ID for capturing full tool results
     stream_request_id = str(uuid.uuid4())
 
-    # Create the stream generator with all necessary context
-    generator = create_stream_generator(
-        user=user,
-        conv=conv,
-        user_msg=user_msg,
-        message_text=message_text,
-        files=files,
-        history=history,
-        force_tools=force_tools,
-        anonymous_mode=anonymous_mode,
-        stream_request_id=stream_request_id,
-        client_location=data.client_location.model_dump() if data.client_location else None,
-    )
-
-    return Response(
-        generator,
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        },
+    stream_params: dict[str, Any] = {
+        "user": user,
+        "conv": conv,
+        "user_msg": user_msg,
+        "message_text": message_text,
+        "files": files,
+        "history": history,
+        "force_tools": force_tools,
+        "anonymous_mode": anonymous_mode,
+        "stream_request_id": stream_request_id,
+        "client_location": data.client_location.model_dump() if data.client_location else None,
+        "span_recorder": span_recorder,
+    }
+    return sse_response(
+        lambda: create_stream_generator(**stream_params),
+        lambda: stream_chat_async(**stream_params),
     )
 
 
@@ -737,7 +760,10 @@ when the turn failed and nothing was saved.
 @require_auth
 def chat_stream_resume(user: User, conv_id: str, message_id: str) -> Response:
     """Resume streaming for an in-flight or recently finished assistant message."""
-    from src.api.helpers.stream_resume import stream_resume_events
+    from src.api.helpers.stream_resume import (
+        stream_resume_events,
+        stream_resume_events_async,
+    )
 
     conv = db.get_conversation(conv_id, user.id)
     if not conv:
@@ -758,11 +784,7 @@ def chat_stream_resume(user: User, conv_id: str, message_id: str) -> Response:
         },
     )
 
-    return Response(
-        stream_resume_events(message_id, after_seq),
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        },
+    return sse_response(
+        lambda: stream_resume_events(message_id, after_seq),
+        lambda: stream_resume_events_async(message_id, after_seq),
     )
@@ -1,6 +1,7 @@
-"""File serving routes: thumbnails and full files.
+"""File routes: attachment uploads, thumbnails and full files.
 
-This module handles serving image files (thumbnails and full-size) from messages.
+This module handles streamed attachment uploads and serving image files
+(thumbnails and full-size) from messages.
 """
 
 import base64
@@ -9,29 +10,136 @@ from datetime import datetime
 from typing import Any
 
 from apiflask import APIBlueprint
-from flask import Response
+from flask import Response, request
 
 from src.api.errors import (
     raise_auth_forbidden_error,
     raise_gone_error,
+    raise_missing_field_error,
     raise_not_found_error,
+    raise_payload_too_large_error,
     raise_validation_error,
 )
 from src.api.rate_limiting import rate_limit_files
-from src.api.schemas import ThumbnailStatus
+from src.api.schemas import ThumbnailStatus, UploadResponse
 from src.auth.jwt_auth import require_auth
 from src.config import Config
-from src.db.blob_store import get_blob_store
+from src.db.blob_store import BlobReader, get_blob_store
 from src.db.models import User, db, make_blob_key, make_thumbnail_key
 from src.utils.background_thumbnails import generate_and_save_thumbnail
 from src.utils.file_retention import is_file_expired, retention_note
 from src.utils.logging import get_logger
+from src.utils.thumbnail_engine import THUMBNAIL_MESSAGE, THUMBNAIL_PREVIEW, THUMBNAIL_SIZES
+from src.utils.uploads import UploadError, store_upload
 
 logger = get_logger(__name__)
 
 api = APIBlueprint("files", __name__, url_prefix="/api", tag="Files")
 
 
+_FILE_CACHE_CONTROL = "private, max-age=31536000"
+# Allowance for multipart boundaries and part headers on top of the file size
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def _blob_file_response(reader: BlobReader) -> Response:
+    """Stream a stored file with ETag revalidation and single-range support.
+
+    The body is read from the blob in fixed-size chunks while the response is
+    sent, so memory per request stays constant and `<video>`/`<audio>` can
+    seek (206 Partial Content). Multi-range requests get the whole file (a
+    valid answer per RFC 9110); an If-Range that doesn't match the current
+    ETag does too.
+    """
+    size = reader.size
+    etag = f"{reader.key}:{size}"
+    headers = {"Cache-Control": _FILE_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+
+    if request.if_none_match.contains(etag):
+        reader.close()
+        response = Response(status=304, headers=headers)
+        response.set_etag(etag)
+        return response
+
+    byte_range = request.range
+    if_range = request.if_range
+    if byte_range is not None and (if_range.etag or if_range.date):
+        if if_range.etag != etag:
+            byte_range = None
+
+    if byte_range is None:
+        response = Response(reader.iter_range(), mimetype=reader.mime_type, headers=headers)
+        response.content_length = size
+    else:
+        bounds = byte_range.range_for_length(size)
+        if bounds is None and len(byte_range.ranges) == 1:
+            reader.close()
+            response = Response(status=416, headers=headers)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        start, stop = bounds if bounds is not None else (0, size)
+        response = Response(
+            reader.iter_range(start, stop),
+            status=206 if bounds is not None else 200,
+            mimetype=reader.mime_type,
+            headers=headers,
+        )
+        response.content_length = stop - start
+        if bounds is not None:
+            response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+
+    response.set_etag(etag)
+    response.call_on_close(reader.close)
+    return response
+
+
+# ============================================================================
+# Upload Routes
+# ============================================================================
+
+
+@api.route("/uploads", methods=["POST"])
+@api.output(UploadResponse, status_code=201)
+@api.doc(
+    summary="Upload an attachment",
+    description="Stores one multipart/form-data `file` part and returns an upload_id "
+    "to reference from a chat request's files[] instead of base64 data.",
+    responses=[400, 413, 429],
+)
+@rate_limit_files
+@require_auth
+def upload_file(user: User) -> tuple[dict[str, Any], int]:
+    """Store an attachment for a following chat request.
+
+    Werkzeug spools the part to a temporary file while parsing (in memory
+    only up to 500 KB), and store_upload() copies it into the blob store in
+    chunks, so memory per upload stays bounded whatever the file size.
+    """
+    max_size = max(Config.MAX_FILE_SIZE, Config.MAX_VIDEO_FILE_SIZE)
+    if (request.content_length or 0) > max_size + _MULTIPART_OVERHEAD_BYTES:
+        logger.warning(
+            "Upload too large",
+            extra={"user_id": user.id, "content_length": request.content_length},
+        )
+        raise_payload_too_large_error(max_size)
+
+    upload = request.files.get("file")
+    if upload is None or not upload.filename:
+        raise_missing_field_error("file")
+
+    try:
+        result = store_upload(user.id, upload.stream, upload.filename, upload.mimetype)
+    except UploadError as e:
+        logger.warning(
+            "Upload rejected",
+            extra={"user_id": user.id, "file_name": upload.filename, "error": str(e)},
+        )
+        raise_validation_error(str(e), field="file")
+    finally:
+        upload.close()
+    return result, 201
+
+
 # ============================================================================
 # Image Routes
 # ============================================================================
@@ -40,7 +148,10 @@ api = APIBlueprint("files", __name__, url_prefix="/api", tag="Files")
 @api.route("/messages/<message_id>/files/<int:file_index>/thumbnail", methods=["GET"])
 @api.doc(
     summary="Get thumbnail for an image file",
-    description="Returns thumbnail binary data (200) or pending status (202).",
+    description=(
+        "Returns thumbnail binary data (200) or pending status (202). "
+        "?size=sidebar|message|preview selects the size (default: message)."
+    ),
     responses=[202, 403, 404, 429],
 )
 @rate_limit_files
@@ -50,16 +161,27 @@ def get_message_thumbnail(
 ) -> Response | tuple[dict[str, Any], int]:
     """Get a thumbnail for an image file from a message.
 
-    Thumbnails are stored in the blob store (files.db).
+    Thumbnails are stored in the blob store (files.db). Sizes other than
+    "message" fall back to the message thumbnail (sidebar) or the full image
+    (preview) for images that don't have them.
 
     Returns:
         - 200 with thumbnail binary data when ready
         - 202 with {"status": "pending"} when thumbnail is still being generated
         - Falls back to full image if thumbnail generation failed
     """
+    size = request.args.get("size", THUMBNAIL_MESSAGE)
+    if size not in THUMBNAIL_SIZES:
+        raise_validation_error(f"Unknown thumbnail size '{size}'", field="size")
+
     logger.debug(
         "Getting thumbnail",
-        extra={"user_id": user.id, "message_id": message_id, "file_index": file_index},
+        extra={
+            "user_id": user.id,
+            "message_id": message_id,
+            "file_index": file_index,
+            "size": size,
+        },
     )
 
     # Get the message
@@ -121,27 +243,10 @@ def get_message_thumbnail(
                     "threshold_seconds": Config.THUMBNAIL_STALE_THRESHOLD_SECONDS,
                 },
             )
-            # Get full image from blob store for regeneration
-            blob_key = make_blob_key(message_id, file_index)
-            blob_result = blob_store.get(blob_key)
-            if blob_result:
-                file_bytes, _ = blob_result
-                file_data_b64 = base64.b64encode(file_bytes).decode("utf-8")
-                # Regenerate synchronously (one-time recovery) using shared helper
-                thumbnail = generate_and_save_thumbnail(
-                    message_id, file_index, file_data_b64, file_type
-                )
-                if thumbnail:
-                    try:
-                        binary_data = base64.b64decode(thumbnail)
-                        return Response(
-                            binary_data,
-                            mimetype="image/jpeg",
-                            headers={"Cache-Control": "private, max-age=31536000"},
-                        )
-                    except binascii.Error:
-                        pass  # Fall through to full image
-            # Fall through to full image fallback below
+            # Regenerate synchronously (one-time recovery) using shared helper
+            if generate_and_save_thumbnail(message_id, file_index, file_type):
+                file["has_thumbnail"] = True
+            # Fall through to the stored thumbnail (or full image fallback) below
         else:
             # Not stale yet - return 202 to signal frontend to poll
             logger.debug(
@@ -160,7 +265,17 @@ def get_message_thumbnail(
     # Also check legacy "thumbnail" field for migration compatibility
     has_legacy_thumbnail = "thumbnail" in file and file["thumbnail"]
 
-    if has_thumbnail or has_legacy_thumbnail:
+    if has_thumbnail and size != THUMBNAIL_MESSAGE:
+        thumb_result = blob_store.get(make_thumbnail_key(message_id, file_index, size))
+        if thumb_result:
+            binary_data, mime_type = thumb_result
+            return Response(
+                binary_data,
+                mimetype=mime_type,
+                headers={"Cache-Control": "private, max-age=31536000"},
+            )
+
+    if (has_thumbnail or has_legacy_thumbnail) and size != THUMBNAIL_PREVIEW:
         # Try blob store first (new format)
         thumb_key = make_thumbnail_key(message_id, file_index)
         thumb_result = blob_store.get(thumb_key)
@@ -336,28 +451,22 @@ def get_message_file(
         )
         raise_gone_error(f"This file has been cleaned up. {retention_note(file_type)}.")
 
-    # Try blob store first (new format)
-    blob_store = get_blob_store()
-    blob_key = make_blob_key(message_id, file_index)
-    blob_result = blob_store.get(blob_key)
-    if blob_result:
-        binary_data, mime_type = blob_result
+    # Try blob store first (new format), streamed rather than loaded
+    reader = get_blob_store().open_reader(make_blob_key(message_id, file_index))
+    if reader is not None:
         logger.debug(
-            "Returning file from blob store",
+            "Streaming file from blob store",
             extra={
                 "user_id": user.id,
                 "message_id": message_id,
                 "conversation_id": message.conversation_id,
                 "file_index": file_index,
-                "file_type": mime_type,
-                "size": len(binary_data),
+                "file_type": reader.mime_type,
+                "size": reader.size,
+                "range": request.headers.get("Range"),
             },
         )
-        return Response(
-            binary_data,
-            mimetype=mime_type,
-            headers={"Cache-Control": "private, max-age=31536000"},
-        )
+        return _blob_file_response(reader)
 
     # Fall back to legacy base64 data (for unmigrated messages)
     file_data = file.get("data", "")
@@ -19,6 +19,8 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 
 from src.config import Config
 
+_UUID_RE = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
 # -----------------------------------------------------------------------------
 # Enums
 # -----------------------------------------------------------------------------
@@ -57,13 +59,17 @@ class PaginationDirection(StrEnum):
 class FileAttachment(BaseModel):
     """Schema for file attachments in chat requests.
 
-    Validates structure only. Content validation (base64 decoding, size checking)
-    is handled by validate_files() in src/utils/files.py.
+    Carries either inline base64 `data` or the `upload_id` of a file already
+    streamed in via POST /api/uploads. Validates structure only. Content
+    validation (base64 decoding, size checking) is handled by validate_files()
+    in src/utils/files.py, upload lookup by resolve_uploads() in
+    src/utils/uploads.py.
     """
 
     name: str = Field(..., min_length=1, max_length=255)
     type: str = Field(..., min_length=1)  # MIME type
-    data: str = Field(..., min_length=1)  # Base64-encoded data
+    data: str | None = Field(default=None, min_length=1)  # Base64-encoded data
+    upload_id: str | None = Field(default=None)
 
     @field_validator("type")
     @classmethod
@@ -74,6 +80,21 @@ class FileAttachment(BaseModel):
             raise ValueError(f"File type '{v}' not allowed. Allowed: {allowed}")
         return v
 
+    @field_validator("upload_id")
+    @classmethod
+    def validate_upload_id(cls, v: str | None) -> str | None:
+        """Upload IDs are interpolated into a blob key — UUIDs only."""
+        if v is not None and not re.fullmatch(_UUID_RE, v):
+            raise ValueError("upload_id must be a UUID")
+        return v
+
+    @model_validator(mode="after")
+    def validate_data_or_upload(self) -> FileAttachment:
+        """Exactly one of data and upload_id must be given."""
+        if (self.data is None) == (self.upload_id is None):
+            raise ValueError("Provide exactly one of data or upload_id")
+        return self
+
 
 # -----------------------------------------------------------------------------
 # Auth Schemas
@@ -208,9 +229,7 @@ class ChatRequest(BaseModel):
     @classmethod
     def validate_client_message_id(cls, v: str | None) -> str | None:
         """Client-generated message IDs become the row's primary key — UUIDs only."""
-        if v is not None and not re.fullmatch(
-            r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}", v
-        ):
+        if v is not None and not re.fullmatch(_UUID_RE, v):
             raise ValueError("client_message_id must be a UUID")
         return v
 
@@ -496,6 +515,15 @@ class FileMetadataResponse(BaseModel):
     fileIndex: int | None = None
 
 
+class UploadResponse(BaseModel):
+    """Response for POST /api/uploads - reference it from files[].upload_id."""
+
+    upload_id: str
+    name: str
+    type: str
+    size: int
+
+
 class SourceResponse(BaseModel):
     """Web search source citation."""
 
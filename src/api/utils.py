@@ -260,6 +260,7 @@ def calculate_and_save_message_cost(
         duration_ms=usage_info.get("duration_ms"),
         tool_errors=usage_info.get("tool_errors", 0),
         tools_used=usage_info.get("tools_used"),
+        spans=usage_info.get("spans"),
     )
 
     logger.info(
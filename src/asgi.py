@@ -0,0 +1,234 @@
+"""ASGI front for the chat stream routes.
+
+Serves /chat/stream and its resume endpoint from one asyncio event loop so an
+open stream costs a suspended coroutine instead of gunicorn threads (the
+agent's producer thread is the only thread a live turn still needs).
+
+Every request still goes through the Flask app on the loop's executor, so
+auth, rate limiting, validation and response headers are unchanged. The
+stream routes recognize the hand-off slot in the environ (see
+src/api/helpers/stream_handoff.py) and leave the streaming to this front.
+Other routes work but are buffered, so only route the stream endpoints here.
+
+Run with: uvicorn --factory src.asgi:create_asgi_app --port $STREAM_PORT
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import sys
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import unquote
+
+from src.api.helpers.stream_handoff import ASYNC_STREAM_ENVIRON_KEY, AsyncStreamHandoff
+from src.config import Config
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+WSGIApp = Callable[[dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+
+class _WSGIResult:
+    """Status, headers and body of one buffered WSGI call."""
+
+    def __init__(self) -> None:
+        self.status = 500
+        self.headers: list[tuple[str, str]] = []
+        self.body = b""
+
+
+class StreamFront:
+    """ASGI app running a WSGI app and streaming its handed-off SSE responses."""
+
+    def __init__(self, wsgi_app: WSGIApp) -> None:
+        self.wsgi_app = wsgi_app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        # Websockets are not served here; returning closes the connection
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Sized for the blocking steps of concurrent streams (DB
+                # reads, saves) plus the Flask calls that start them
+                asyncio.get_running_loop().set_default_executor(
+                    ThreadPoolExecutor(
+                        max_workers=Config.STREAM_EXECUTOR_THREADS,
+                        thread_name_prefix="stream-front",
+                    )
+                )
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive, Config.MAX_REQUEST_SIZE)
+        if body is None:
+            await _send_plain(send, 413, b"Request too large")
+            return
+
+        handoffs: list[AsyncStreamHandoff] = []
+        environ = _build_environ(scope, body)
+        environ[ASYNC_STREAM_ENVIRON_KEY] = handoffs
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self._call_wsgi, environ)
+
+        headers = result.headers
+        if handoffs:
+            # The view's placeholder body has no length; the stream follows
+            headers = [(k, v) for k, v in headers if k.lower() != "content-length"]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": result.status,
+                "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+            }
+        )
+        if not handoffs:
+            await send({"type": "http.response.body", "body": result.body})
+            return
+
+        handoff = handoffs[0]
+        pump = asyncio.create_task(_pump(handoff, send), context=handoff.context)
+        disconnect = asyncio.create_task(_wait_for_disconnect(receive))
+        try:
+            await asyncio.wait({pump, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not pump.done():
+                # Client went away: unwind the stream (its finally blocks
+                # hand over to the fallback save, as on gunicorn)
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+            disconnect.cancel()
+        if pump.done() and not pump.cancelled() and pump.exception() is not None:
+            logger.error(
+                "Async stream failed",
+                extra={"path": scope.get("path", "")},
+                exc_info=pump.exception(),
+            )
+
+    def _call_wsgi(self, environ: dict[str, Any]) -> _WSGIResult:
+        result = _WSGIResult()
+
+        def start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: Any = None
+        ) -> Callable[[bytes], None]:
+            result.status = int(status.split(" ", 1)[0])
+            result.headers = headers
+            return chunks.append
+
+        chunks: list[bytes] = []
+        app_iter = self.wsgi_app(environ, start_response)
+        try:
+            chunks.extend(app_iter)
+        finally:
+            close = getattr(app_iter, "close", None)
+            if close is not None:
+                close()
+        result.body = b"".join(chunks)
+        return result
+
+
+async def _pump(handoff: AsyncStreamHandoff, send: Send) -> None:
+    stream = handoff.factory()
+    try:
+        async for chunk in stream:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _read_body(receive: Receive, limit: int) -> bytes | None:
+    """Read the whole request body; None if it exceeds `limit` bytes."""
+    parts: list[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        parts.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(parts)
+
+
+async def _send_plain(send: Send, status: int, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", b"%d" % len(body))],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _build_environ(scope: Scope, body: bytes) -> dict[str, Any]:
+    """PEP 3333 environ for an ASGI HTTP scope with a fully read body."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": unquote(scope["path"], errors="surrogateescape")
+        .encode("utf-8", "surrogateescape")
+        .decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        if name == "CONTENT_LENGTH":
+            continue
+        key = f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def create_asgi_app() -> StreamFront:
+    """Create the ASGI stream front around a fresh Flask app."""
+    from src.app import create_app
+
+    return StreamFront(create_app())
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -87,6 +88,11 @@ class Config:
     STREAM_JOURNAL_FLUSH_INTERVAL_SECONDS: float = float(
         os.getenv("STREAM_JOURNAL_FLUSH_INTERVAL_SECONDS", "0.3")
     )
+    # Thinking events are deltas ({"text": new_text, "offset": n}); a full-text
+    # checkpoint (offset 0) is sent once the trace reaches this many chars and
+    # again each time it doubles, so a client that missed deltas can rebuild
+    # the trace while total bytes stay linear in the trace length
+    THINKING_CHECKPOINT_MIN_CHARS: int = int(os.getenv("THINKING_CHECKPOINT_MIN_CHARS", "4096"))
     # How long the resume endpoint waits for the saved message after the
     # producer finishes (save happens in the consumer/cleanup thread)
     STREAM_RESUME_SAVE_GRACE_SECONDS: int = int(os.getenv("STREAM_RESUME_SAVE_GRACE_SECONDS", "30"))
@@ -96,6 +102,24 @@ class Config:
     # thinking still emits thinking events, and tools are bounded by
     # TOOL_TIMEOUT (90s), so minutes of total silence means the turn is dead.
     STREAM_RESUME_STALL_SECONDS: int = int(os.getenv("STREAM_RESUME_STALL_SECONDS", "180"))
+    # Resume tails sleep until the producer signals a journal flush or save
+    # (src/api/helpers/stream_notify.py); this slow poll only covers lost
+    # wakeups (e.g. cross-worker sockets unavailable)
+    STREAM_RESUME_FALLBACK_POLL_SECONDS: float = float(
+        os.getenv("STREAM_RESUME_FALLBACK_POLL_SECONDS", "5")
+    )
+    # Cross-worker wakeups: one Unix datagram socket per listening worker in
+    # this directory. Disable to fall back to in-process wakeups + slow poll.
+    STREAM_NOTIFY_CROSS_WORKER: bool = (
+        os.getenv("STREAM_NOTIFY_CROSS_WORKER", "true").lower() == "true"
+    )
+    STREAM_NOTIFY_DIR: str = os.getenv(
+        "STREAM_NOTIFY_DIR", os.path.join(tempfile.gettempdir(), "ai-chatbot-stream-notify")
+    )
+    # ASGI stream front (src/asgi.py): executor threads for the blocking
+    # steps of streams it serves (Flask call, DB reads, saves). Producer
+    # threads are separate and not counted here.
+    STREAM_EXECUTOR_THREADS: int = int(os.getenv("STREAM_EXECUTOR_THREADS", "16"))
 
     # Streaming cleanup thread timeouts
     STREAM_CLEANUP_THREAD_TIMEOUT: int = int(
@@ -105,6 +129,14 @@ class Config:
         os.getenv("STREAM_CLEANUP_WAIT_DELAY", "1.0")
     )  # 1 second delay before checking if message was saved
 
+    # Post-commit pipeline (src/api/helpers/chat_save.py): cost rows, language
+    # detection and title generation run after the done event, on this many
+    # shared threads. A still-connected stream waits up to
+    # POST_COMMIT_WAIT_TIMEOUT seconds to send their title_updated event (a
+    # gthread request thread is held meanwhile, so keep it short).
+    POST_COMMIT_WORKER_THREADS: int = int(os.getenv("POST_COMMIT_WORKER_THREADS", "4"))
+    POST_COMMIT_WAIT_TIMEOUT: float = float(os.getenv("POST_COMMIT_WAIT_TIMEOUT", "5"))
+
     # Tool results cleanup (prevents memory leaks from orphaned tool results)
     TOOL_RESULTS_TTL_SECONDS: int = int(
         os.getenv("TOOL_RESULTS_TTL_SECONDS", "600")
@@ -119,6 +151,10 @@ class Config:
     # Slow query logging (only active in development/debug mode)
     SLOW_QUERY_THRESHOLD_MS: int = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100"))
 
+    # Per-turn latency spans (history load, prompt, first token, each tool,
+    # save, title) stored with the turn's message_costs row
+    TURN_SPANS_ENABLED: bool = os.getenv("TURN_SPANS_ENABLED", "true").lower() == "true"
+
     # User location (for contextual responses - units, locale, recommendations)
     # Format: "City, Country" (e.g., "Prague, Czech Republic" or "New York, USA")
     USER_LOCATION: str = os.getenv("USER_LOCATION", "")
@@ -221,6 +257,11 @@ class Config:
     # Database
     DATABASE_PATH: Path = BASE_DIR / os.getenv("DATABASE_PATH", "chatbot.db")
     BLOB_STORAGE_PATH: Path = BASE_DIR / os.getenv("BLOB_STORAGE_PATH", "files.db")
+    # Group-commit writer: background writes (stream journal, embeddings, costs)
+    # are queued to one writer thread per worker and committed in batches
+    DB_WRITE_BEHIND_ENABLED: bool = os.getenv("DB_WRITE_BEHIND_ENABLED", "false").lower() == "true"
+    DB_WRITE_BEHIND_MAX_BATCH: int = int(os.getenv("DB_WRITE_BEHIND_MAX_BATCH", "64"))
+    DB_WRITE_BEHIND_MAX_QUEUE: int = int(os.getenv("DB_WRITE_BEHIND_MAX_QUEUE", "10000"))
 
     # Request size limits (DoS protection)
     # Must be larger than MAX_FILE_SIZE * MAX_FILES_PER_MESSAGE to allow multi-file uploads
@@ -231,10 +272,18 @@ class Config:
     MAX_VIDEO_FILE_SIZE: int = int(
         os.getenv("MAX_VIDEO_FILE_SIZE", str(100 * BYTES_PER_MB))
     )  # 100 MB
+    # Images and PDFs larger than this are sent to Gemini as Files API
+    # references instead of inline base64 (0 = always inline); videos always are
+    GEMINI_FILES_UPLOAD_THRESHOLD: int = int(
+        os.getenv("GEMINI_FILES_UPLOAD_THRESHOLD", str(BYTES_PER_MB))
+    )  # 1 MB
     # File retention: attachments are not permanent storage
     VIDEO_RETENTION_DAYS: int = int(os.getenv("VIDEO_RETENTION_DAYS", "7"))
     IMAGE_RETENTION_DAYS: int = int(os.getenv("IMAGE_RETENTION_DAYS", "30"))
     FILE_RETENTION_DAYS: int = int(os.getenv("FILE_RETENTION_DAYS", "30"))  # PDFs, text, etc.
+    # Multipart uploads (POST /api/uploads) that no chat message referenced
+    # within this window are deleted by the retention sweep
+    UPLOAD_RETENTION_HOURS: int = int(os.getenv("UPLOAD_RETENTION_HOURS", "24"))
     MAX_FILES_PER_MESSAGE: int = int(os.getenv("MAX_FILES_PER_MESSAGE", "10"))
     ALLOWED_FILE_TYPES: set[str] = set(
         os.getenv(
@@ -252,7 +301,16 @@ class Config:
     THUMBNAIL_SKIP_THRESHOLD_BYTES: int = int(
         os.getenv("THUMBNAIL_SKIP_THRESHOLD", str(100 * BYTES_PER_KB))
     )  # 100KB - skip thumbnail for small images
+    # Sidebar and lightbox preview sizes rendered alongside THUMBNAIL_MAX_SIZE
+    # (the message size) from the same decode; square bounding boxes
+    THUMBNAIL_SIDEBAR_MAX_SIZE: int = int(os.getenv("THUMBNAIL_SIDEBAR_MAX_SIZE", "128"))
+    THUMBNAIL_PREVIEW_MAX_SIZE: int = int(os.getenv("THUMBNAIL_PREVIEW_MAX_SIZE", "1600"))
     THUMBNAIL_WORKER_THREADS: int = int(os.getenv("THUMBNAIL_WORKER_THREADS", "2"))
+    # Thumbnails render in a per-process pool of this many worker processes
+    # (src/utils/thumbnail_engine.py) so Pillow doesn't hold the web worker's
+    # GIL (0 = render in the background thread itself); slower renders fail
+    THUMBNAIL_WORKER_PROCESSES: int = int(os.getenv("THUMBNAIL_WORKER_PROCESSES", "2"))
+    THUMBNAIL_TIMEOUT_SECONDS: float = float(os.getenv("THUMBNAIL_TIMEOUT_SECONDS", "30"))
     THUMBNAIL_RESAMPLING: str = os.getenv(
         "THUMBNAIL_RESAMPLING", "BILINEAR"
     )  # BILINEAR (fast) or LANCZOS (quality)
@@ -329,6 +387,9 @@ class Config:
     # to bundle independent searches into one round instead of sequential
     # rounds that each re-send the whole conversation)
     WEB_SEARCH_MAX_BATCH_QUERIES = 5
+    # Queries of one batch searched concurrently (a batch takes as long as
+    # its slowest query instead of the sum)
+    WEB_SEARCH_WORKERS = 5
 
     # Research tool (search + fetch top sources in one tool round)
     RESEARCH_MAX_SOURCES = 5
@@ -347,13 +408,21 @@ class Config:
     EVAL_JUDGE_MODEL: str = os.getenv("EVAL_JUDGE_MODEL") or "gemini-3.1-pro-preview"
 
     # Embeddings for semantic recall (memories + past conversations).
-    # Vectors stored in the embeddings table; brute-force cosine search.
+    # Vectors stored in the embeddings table; searched through a per-worker
+    # in-memory NumPy index (src/utils/vector_index.py).
     EMBEDDINGS_ENABLED: bool = os.getenv("EMBEDDINGS_ENABLED", "true").lower() == "true"
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL") or "gemini-embedding-001"
     EMBEDDING_DIM: int = int(os.getenv("EMBEDDING_DIM", "768"))
 
     # HTML processing
     HTML_TEXT_MAX_LENGTH = 15000
+    # HTML->text extraction (src/utils/html_extraction.py): pages of at least
+    # HTML_EXTRACT_MIN_BYTES parse in a per-process pool of this many worker
+    # processes so trafilatura/BeautifulSoup don't hold the web worker's GIL
+    # (0 = always in-thread); slower parses fail instead of re-parsing in-thread
+    HTML_EXTRACT_WORKERS: int = int(os.getenv("HTML_EXTRACT_WORKERS", "2"))
+    HTML_EXTRACT_MIN_BYTES: int = int(os.getenv("HTML_EXTRACT_MIN_BYTES", str(16 * BYTES_PER_KB)))
+    HTML_EXTRACT_TIMEOUT_SECONDS: float = float(os.getenv("HTML_EXTRACT_TIMEOUT_SECONDS", "20"))
     # Tool result size caps (chars) - results land in LLM context
     CODE_EXECUTION_MAX_STDOUT_CHARS: int = int(
         os.getenv("CODE_EXECUTION_MAX_STDOUT_CHARS", "10000")
@@ -408,7 +477,12 @@ class Config:
     # container without user namespaces).
     BROWSER_NO_SANDBOX: bool = os.getenv("BROWSER_NO_SANDBOX", "false").lower() == "true"
     BROWSER_SESSION_TTL_SECONDS: int = int(os.getenv("BROWSER_SESSION_TTL_SECONDS", "300"))
+    # Worker pool: each worker is one Chromium on its own thread holding up to
+    # BROWSER_MAX_CONCURRENT_SESSIONS sessions (LRU-evicted); a worker with
+    # BROWSER_WORKER_MAX_QUEUE commands pending fails fast instead of queueing
+    BROWSER_WORKERS: int = int(os.getenv("BROWSER_WORKERS", "2"))
     BROWSER_MAX_CONCURRENT_SESSIONS: int = int(os.getenv("BROWSER_MAX_CONCURRENT_SESSIONS", "3"))
+    BROWSER_WORKER_MAX_QUEUE: int = int(os.getenv("BROWSER_WORKER_MAX_QUEUE", "4"))
     BROWSER_PAGE_TIMEOUT_MS: int = int(os.getenv("BROWSER_PAGE_TIMEOUT_MS", "30000"))
 
     # Code execution sandbox settings
@@ -442,6 +516,15 @@ class Config:
     # blocked; this bounds DISTINCT-agent chains (A->B->C->...) so a
     # misconfigured fleet cannot fan out unbounded LLM runs.
     AGENT_MAX_TRIGGER_DEPTH: int = int(os.getenv("AGENT_MAX_TRIGGER_DEPTH", "3"))
+    # Scheduler concurrency: due agents run on a bounded thread pool, at most
+    # AGENT_SCHEDULER_MAX_PER_USER at a time per user, dispatched round-robin
+    # across users (1 worker = the old one-after-another behavior)
+    AGENT_SCHEDULER_WORKERS: int = int(os.getenv("AGENT_SCHEDULER_WORKERS", "4"))
+    AGENT_SCHEDULER_MAX_PER_USER: int = int(os.getenv("AGENT_SCHEDULER_MAX_PER_USER", "2"))
+    # Resident scheduler (run_agent_scheduler.py --daemon): how often it checks
+    # for agents created/edited/deleted by the web app while sleeping until
+    # the next due agent
+    AGENT_SCHEDULER_POLL_SECONDS: float = float(os.getenv("AGENT_SCHEDULER_POLL_SECONDS", "5"))
 
     # Conversation compaction settings
     # Maximum messages before compaction is triggered (keeps conversation within context limits)
@@ -481,6 +564,11 @@ class Config:
     # Browser automation needs more headroom than simple tool calls
     AGENT_RECURSION_LIMIT: int = int(os.getenv("AGENT_RECURSION_LIMIT", "50"))
 
+    # Compiled chat graphs kept per worker, keyed by model, tool set and mode
+    # (create_chat_graph + compile is ~tens of ms of schema/topology building
+    # that would otherwise run on every request)
+    AGENT_GRAPH_CACHE_SIZE: int = int(os.getenv("AGENT_GRAPH_CACHE_SIZE", "32"))
+
     # Graph self-correction: max consecutive tool error retries before giving up
     AGENT_MAX_TOOL_RETRIES: int = int(os.getenv("AGENT_MAX_TOOL_RETRIES", "2"))
 
@@ -505,6 +593,20 @@ class Config:
         os.getenv("AGENT_AGED_TOOL_RESULT_MAX_CHARS", "2000")
     )
 
+    # Tool result cache (src/agent/tool_cache.py): repeated idempotent reads
+    # (web_search, fetch_url, Garmin/calendar lookups, places) are answered
+    # from a per-worker TTL cache. Per-tool TTLs live in TOOL_CACHE_POLICIES;
+    # the cache evicts least recently used results past this many bytes.
+    TOOL_CACHE_ENABLED: bool = os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+    TOOL_CACHE_MAX_BYTES: int = int(os.getenv("TOOL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    # HTTP cache (src/agent/tools/http_cache.py): fetch_url/research responses
+    # in a separate SQLite file shared by all processes, honoring Cache-Control
+    # and revalidated with conditional GETs; LRU-evicted past HTTP_CACHE_MAX_BYTES
+    HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+    HTTP_CACHE_PATH: Path = BASE_DIR / os.getenv("HTTP_CACHE_PATH", "http_cache.db")
+    HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(256 * BYTES_PER_MB)))
+
     # Gunicorn worker recycling: restart workers after N requests to prevent memory leaks
     GUNICORN_MAX_REQUESTS: int = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
     GUNICORN_MAX_REQUESTS_JITTER: int = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "50"))
@@ -579,6 +681,13 @@ class Config:
     )
     TODOIST_API_TIMEOUT: int = int(os.getenv("TODOIST_API_TIMEOUT", "10"))  # seconds
     TODOIST_API_BASE_URL: str = "https://api.todoist.com/api/v1"
+    # Local Todoist mirror (src/utils/todoist_sync.py): dashboard builds and
+    # read-only tool calls query it, pulling Sync API deltas at most once per
+    # TODOIST_SYNC_MIN_INTERVAL_SECONDS (writes patch it directly)
+    TODOIST_MIRROR_ENABLED: bool = os.getenv("TODOIST_MIRROR_ENABLED", "true").lower() == "true"
+    TODOIST_SYNC_MIN_INTERVAL_SECONDS: float = float(
+        os.getenv("TODOIST_SYNC_MIN_INTERVAL_SECONDS", "30")
+    )
 
     # Google Calendar Integration
     GOOGLE_CALENDAR_CLIENT_ID: str = os.getenv("GOOGLE_CALENDAR_CLIENT_ID", "")
@@ -588,6 +697,17 @@ class Config:
     )
     GOOGLE_CALENDAR_API_TIMEOUT: int = int(os.getenv("GOOGLE_CALENDAR_API_TIMEOUT", "10"))
     GOOGLE_CALENDAR_API_BASE_URL: str = "https://www.googleapis.com/calendar/v3"
+    # Local events mirror (src/utils/calendar_sync.py): dashboard builds and
+    # tool reads query it, pulling syncToken deltas at most once per
+    # GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS; a full sync covers the last
+    # week and the next GOOGLE_CALENDAR_MIRROR_DAYS (must exceed 7)
+    GOOGLE_CALENDAR_MIRROR_ENABLED: bool = (
+        os.getenv("GOOGLE_CALENDAR_MIRROR_ENABLED", "true").lower() == "true"
+    )
+    GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS: float = float(
+        os.getenv("GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS", "30")
+    )
+    GOOGLE_CALENDAR_MIRROR_DAYS: int = int(os.getenv("GOOGLE_CALENDAR_MIRROR_DAYS", "30"))
     GOOGLE_OAUTH_TOKEN_URL: str = "https://oauth2.googleapis.com/token"  # noqa: S105 - URL, not a secret
     GOOGLE_USERINFO_URL: str = "https://www.googleapis.com/oauth2/v2/userinfo"
 
@@ -7,12 +7,26 @@ base64-encoded JSON reduces storage size by ~33% and improves query performance.
 Key format:
 - Files: "{message_id}/{index}" (e.g., "abc123/0")
 - Thumbnails: "{message_id}/{index}.thumb" (e.g., "abc123/0.thumb")
+- Pending uploads: "uploads/{user_id}/{upload_id}" (moved to a file key when
+  a message references them, see src/utils/uploads.py)
+
+Storage is content-addressed: blob_contents holds each distinct content once,
+keyed by its sha256, and a blobs row maps a key to a content hash. The same
+screenshot pasted into three conversations (or re-attached on edit & resend)
+is stored once. Triggers on blobs keep blob_contents.refcount current for
+every writer and delete a content row when its last key goes, so callers
+(and routes/files.py) only ever see keys.
 """
 
+import hashlib
+import io
 import sqlite3
 import threading
+import uuid
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import IO
 
 from src.config import Config
 from src.utils.connection_pool import ConnectionPool
@@ -21,6 +35,198 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bytes read per step when streaming a blob (memory per request is one chunk)
+STREAM_CHUNK_SIZE = 256 * 1024
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS blob_contents (
+        sha256 TEXT PRIMARY KEY,
+        data BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        refcount INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL
+    )
+    """,
+    # No index on blobs beyond the PRIMARY KEY: its B-tree serves both exact
+    # matches and left-anchored LIKE prefix queries
+    """
+    CREATE TABLE IF NOT EXISTS blobs (
+        key TEXT PRIMARY KEY,
+        sha256 TEXT NOT NULL,
+        mime_type TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blobs_refcount_insert
+    AFTER INSERT ON blobs
+    BEGIN
+        UPDATE blob_contents SET refcount = refcount + 1 WHERE sha256 = NEW.sha256;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blobs_refcount_delete
+    AFTER DELETE ON blobs
+    BEGIN
+        UPDATE blob_contents SET refcount = refcount - 1 WHERE sha256 = OLD.sha256;
+        DELETE FROM blob_contents WHERE sha256 = OLD.sha256 AND refcount <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blobs_refcount_update
+    AFTER UPDATE OF sha256 ON blobs
+    WHEN OLD.sha256 != NEW.sha256
+    BEGIN
+        UPDATE blob_contents SET refcount = refcount + 1 WHERE sha256 = NEW.sha256;
+        UPDATE blob_contents SET refcount = refcount - 1 WHERE sha256 = OLD.sha256;
+        DELETE FROM blob_contents WHERE sha256 = OLD.sha256 AND refcount <= 0;
+    END
+    """,
+)
+
+
+def ensure_schema(conn: sqlite3.Connection) -> tuple[int, int] | None:
+    """Create the blob store schema, converting a pre-dedup files.db in place.
+
+    The old layout kept the data on the blobs row. Its rows are hashed one at
+    a time (read in STREAM_CHUNK_SIZE chunks), each distinct content is copied
+    into blob_contents inside SQLite, and blobs is rebuilt as pointer rows -
+    all in one transaction. Run VACUUM afterwards to return the freed pages.
+
+    Returns:
+        (keys, distinct contents) if a legacy table was converted, else None
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(blobs)")}
+    legacy = "data" in columns
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if legacy:
+            conn.execute("ALTER TABLE blobs RENAME TO blobs_legacy")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        converted = _convert_legacy_rows(conn) if legacy else None
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return converted
+
+
+def _convert_legacy_rows(conn: sqlite3.Connection) -> tuple[int, int]:
+    rows = conn.execute(
+        "SELECT rowid, key, mime_type, size, created_at FROM blobs_legacy ORDER BY rowid"
+    ).fetchall()
+    contents = 0
+    for rowid, key, mime_type, size, created_at in rows:
+        hasher = hashlib.sha256()
+        with conn.blobopen("blobs_legacy", "data", rowid, readonly=True) as blob:
+            while chunk := blob.read(STREAM_CHUNK_SIZE):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        cursor = conn.execute(
+            """INSERT INTO blob_contents (sha256, data, size, created_at)
+               SELECT ?, data, length(data), created_at FROM blobs_legacy WHERE rowid = ?
+               ON CONFLICT(sha256) DO NOTHING""",
+            (digest, rowid),
+        )
+        contents += cursor.rowcount
+        conn.execute(
+            "INSERT INTO blobs (key, sha256, mime_type, size, created_at) VALUES (?, ?, ?, ?, ?)",
+            (key, digest, mime_type, size, created_at),
+        )
+    conn.execute("DROP TABLE blobs_legacy")
+    return len(rows), contents
+
+
+class BlobReader:
+    """Incremental read handle on one stored blob.
+
+    Wraps sqlite3.Connection.blobopen on a dedicated read-only connection, so
+    a response can stream a 100 MB video in fixed-size chunks (and seek for
+    Range requests) without materializing it. The handle pins a read snapshot:
+    a concurrent replace or delete of the key doesn't tear the stream.
+
+    Always close() it - iter_range() does so when exhausted or closed early,
+    and routes also register close() with the response.
+    """
+
+    def __init__(
+        self, conn: sqlite3.Connection, blob: sqlite3.Blob, key: str, mime_type: str
+    ) -> None:
+        self._conn = conn
+        self._blob = blob
+        self.key = key
+        self.mime_type = mime_type
+        self.size = len(blob)
+        self._closed = False
+
+    def iter_range(
+        self, start: int = 0, end: int | None = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield bytes [start, end) in chunks, then close the reader."""
+        end = self.size if end is None else min(end, self.size)
+        try:
+            self._blob.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = self._blob.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+    def fileobj(self) -> io.BufferedReader:
+        """A seekable binary file object over the blob (closing it closes the reader).
+
+        For consumers that take a file rather than an iterator, such as the
+        Gemini Files API upload.
+        """
+        return io.BufferedReader(_BlobRawIO(self), buffer_size=STREAM_CHUNK_SIZE)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._blob.close()
+        finally:
+            self._conn.close()
+
+
+class _BlobRawIO(io.RawIOBase):
+    """Raw binary I/O adapter over a BlobReader's incremental blob handle."""
+
+    def __init__(self, reader: BlobReader) -> None:
+        super().__init__()
+        self._reader = reader
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data = self._reader._blob.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._reader._blob.seek(offset, whence)
+        return self._reader._blob.tell()
+
+    def tell(self) -> int:
+        return self._reader._blob.tell()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._reader.close()
+        super().close()
+
 
 class BlobStore:
     """SQLite-based blob storage for files and thumbnails."""
@@ -67,39 +273,148 @@ class BlobStore:
         """Initialize the blob database schema."""
         logger.debug("Initializing blob store", extra={"db_path": str(self.db_path)})
         with self._pool.get_connection() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS blobs (
-                    key TEXT PRIMARY KEY,
-                    data BLOB NOT NULL,
-                    mime_type TEXT NOT NULL,
-                    size INTEGER NOT NULL,
-                    created_at TEXT NOT NULL
-                )
-            """)
-            # Note: No additional index needed - PRIMARY KEY on 'key' already provides
-            # a B-tree index that SQLite uses for both exact matches and LIKE prefix queries
-            conn.commit()
+            converted = ensure_schema(conn)
+        if converted:
+            logger.info(
+                "Converted blob store to content-addressed storage",
+                extra={"keys": converted[0], "contents": converted[1]},
+            )
+
+    def _link(
+        self, conn: sqlite3.Connection, key: str, sha256: str, mime_type: str, size: int
+    ) -> None:
+        """Point key at a stored content (an upsert, so the refcount triggers fire)."""
+        self._execute_with_timing(
+            conn,
+            """INSERT INTO blobs (key, sha256, mime_type, size, created_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(key) DO UPDATE SET
+                   sha256 = excluded.sha256,
+                   mime_type = excluded.mime_type,
+                   size = excluded.size,
+                   created_at = excluded.created_at""",
+            (key, sha256, mime_type, size, datetime.now().isoformat()),
+        )
 
-    def save(self, key: str, data: bytes, mime_type: str) -> None:
+    def save(
+        self, key: str, data: bytes | memoryview, mime_type: str, sha256: str | None = None
+    ) -> None:
         """Save a blob to the store.
 
+        Content already stored under another key is not written again.
+
         Args:
             key: Unique key for the blob (e.g., "{message_id}/{index}")
             data: Binary data to store
             mime_type: MIME type of the data
+            sha256: Hex digest of data, if the caller already has it
+                (Attachment.sha256); computed otherwise
         """
         logger.debug(
             "Saving blob",
             extra={"key": key, "size": len(data), "mime_type": mime_type},
         )
+        digest = sha256 or hashlib.sha256(data).hexdigest()
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                """INSERT INTO blob_contents (sha256, data, size, created_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(sha256) DO NOTHING""",
+                (digest, data, len(data), datetime.now().isoformat()),
+            )
+            self._link(conn, key, digest, mime_type, len(data))
+            conn.commit()
+
+    def save_stream(self, key: str, stream: IO[bytes], size: int, mime_type: str) -> None:
+        """Save a blob by copying it from a file object in fixed-size chunks.
+
+        The content row is reserved with zeroblob(size) under a placeholder
+        hash and filled through an incremental blob handle, hashing as it
+        goes, so a 100 MB upload never exists as a single bytes object. If
+        the content turns out to be stored already, the copy is dropped.
+        Nothing is visible to readers until the commit.
+
+        Args:
+            key: Unique key for the blob
+            stream: Binary file object positioned at the start of the data
+            size: Number of bytes to copy from stream
+            mime_type: MIME type of the data
+
+        Raises:
+            ValueError: If the stream ends before size bytes were read
+        """
+        logger.debug(
+            "Saving blob from stream",
+            extra={"key": key, "size": size, "mime_type": mime_type},
+        )
+        hasher = hashlib.sha256()
+        with self._pool.get_connection() as conn:
+            cursor = self._execute_with_timing(
+                conn,
+                """INSERT INTO blob_contents (sha256, data, size, created_at)
+                   VALUES (?, zeroblob(?), ?, ?)""",
+                (f"pending:{uuid.uuid4()}", size, size, datetime.now().isoformat()),
+            )
+            rowid = cursor.lastrowid
+            if rowid is None:
+                raise sqlite3.DatabaseError("Blob insert returned no rowid")
+            with conn.blobopen("blob_contents", "data", rowid) as blob:
+                remaining = size
+                while remaining > 0:
+                    chunk = stream.read(min(STREAM_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ValueError(f"Stream ended {remaining} bytes short of {size}")
+                    blob.write(chunk)
+                    hasher.update(chunk)
+                    remaining -= len(chunk)
+
+            digest = hasher.hexdigest()
+            stored = self._execute_with_timing(
+                conn, "SELECT 1 FROM blob_contents WHERE sha256 = ?", (digest,)
+            ).fetchone()
+            if stored:
+                self._execute_with_timing(
+                    conn, "DELETE FROM blob_contents WHERE rowid = ?", (rowid,)
+                )
+            else:
+                self._execute_with_timing(
+                    conn, "UPDATE blob_contents SET sha256 = ? WHERE rowid = ?", (digest, rowid)
+                )
+            self._link(conn, key, digest, mime_type, size)
+            conn.commit()
+
+    def rename(self, key: str, new_key: str) -> bool:
+        """Move a blob to a new key without copying its data.
+
+        An existing blob at new_key is replaced.
+
+        Args:
+            key: The current blob key
+            new_key: The key to move it to
+
+        Returns:
+            True if moved, False if key was not found
+        """
+        logger.debug("Renaming blob", extra={"key": key, "new_key": new_key})
+        if key == new_key:
+            return self.exists(key)
         with self._pool.get_connection() as conn:
+            # Delete the replaced row explicitly: OR REPLACE deletions skip the
+            # refcount trigger
             self._execute_with_timing(
                 conn,
-                """INSERT OR REPLACE INTO blobs (key, data, mime_type, size, created_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (key, data, mime_type, len(data), datetime.now().isoformat()),
+                """DELETE FROM blobs
+                   WHERE key = ? AND EXISTS (SELECT 1 FROM blobs WHERE key = ?)""",
+                (new_key, key),
+            )
+            cursor = self._execute_with_timing(
+                conn,
+                "UPDATE blobs SET key = ? WHERE key = ?",
+                (new_key, key),
             )
             conn.commit()
+            return cursor.rowcount > 0
 
     def get(self, key: str) -> tuple[bytes, str] | None:
         """Retrieve a blob from the store.
@@ -113,7 +428,9 @@ class BlobStore:
         with self._pool.get_connection() as conn:
             row = self._execute_with_timing(
                 conn,
-                "SELECT data, mime_type FROM blobs WHERE key = ?",
+                """SELECT c.data, b.mime_type FROM blobs b
+                   JOIN blob_contents c ON c.sha256 = b.sha256
+                   WHERE b.key = ?""",
                 (key,),
             ).fetchone()
 
@@ -122,6 +439,41 @@ class BlobStore:
 
             return bytes(row["data"]), row["mime_type"]
 
+    def open_reader(self, key: str) -> BlobReader | None:
+        """Open a streaming read handle on a blob, or None if it doesn't exist.
+
+        Uses its own read-only connection (not the thread-local pool): the
+        handle outlives the route function and is consumed while the WSGI
+        server iterates the response.
+
+        Args:
+            key: The blob key
+
+        Returns:
+            A BlobReader (caller must close it), or None if not found
+        """
+        conn = sqlite3.connect(
+            f"file:{Path(self.db_path).resolve()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=30.0,
+        )
+        try:
+            row = conn.execute(
+                """SELECT c.rowid, b.mime_type FROM blobs b
+                   JOIN blob_contents c ON c.sha256 = b.sha256
+                   WHERE b.key = ?""",
+                (key,),
+            ).fetchone()
+            if row is None:
+                conn.close()
+                return None
+            blob = conn.blobopen("blob_contents", "data", row[0], readonly=True)
+        except Exception:
+            conn.close()
+            raise
+        return BlobReader(conn, blob, key, row[1])
+
     def delete(self, key: str) -> bool:
         """Delete a blob from the store.
 
@@ -210,6 +562,31 @@ class BlobStore:
         )
         return count
 
+    def delete_by_prefix_before(self, prefix: str, cutoff: datetime) -> int:
+        """Delete blobs under a key prefix that were saved before cutoff.
+
+        Args:
+            prefix: Key prefix to match (e.g., "uploads/")
+            cutoff: Naive local datetime (created_at is stored that way)
+
+        Returns:
+            Number of blobs deleted
+        """
+        with self._pool.get_connection() as conn:
+            cursor = self._execute_with_timing(
+                conn,
+                "DELETE FROM blobs WHERE key LIKE ? AND created_at < ?",
+                (prefix + "%", cutoff.isoformat()),
+            )
+            conn.commit()
+            count = cursor.rowcount
+
+        logger.debug(
+            "Stale blobs deleted by prefix",
+            extra={"prefix": prefix, "cutoff": cutoff.isoformat(), "count": count},
+        )
+        return count
+
     def exists(self, key: str) -> bool:
         """Check if a blob exists.
 
@@ -244,6 +621,23 @@ class BlobStore:
             ).fetchone()
             return row["size"] if row else None
 
+    def get_info(self, key: str) -> tuple[int, str] | None:
+        """Get the size and MIME type of a blob without loading the data.
+
+        Args:
+            key: The blob key
+
+        Returns:
+            Tuple of (size, mime_type) if found, None otherwise
+        """
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT size, mime_type FROM blobs WHERE key = ?",
+                (key,),
+            ).fetchone()
+            return (row["size"], row["mime_type"]) if row else None
+
 
 # Global blob store instance (lazy initialization).
 # Lock guards against concurrent first-access under threaded (gthread) workers,
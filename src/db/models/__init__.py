@@ -15,9 +15,11 @@ Usage:
 
 from pathlib import Path
 
+from src.db.blob_store import get_blob_store
 from src.db.models.agent import AgentMixin
 from src.db.models.base import DatabaseBase
 from src.db.models.cache import CacheMixin
+from src.db.models.calendar import CalendarMirrorMixin
 from src.db.models.conversation import ConversationMixin
 from src.db.models.cost import CostMixin
 from src.db.models.dataclasses import (
@@ -54,7 +56,11 @@ from src.db.models.push import PushSubscriptionMixin
 from src.db.models.search import SearchMixin
 from src.db.models.settings import SettingsMixin
 from src.db.models.stream_journal import StreamJournalMixin
+from src.db.models.todoist import TodoistMirrorMixin
 from src.db.models.user import UserMixin
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class Database(
@@ -74,6 +80,8 @@ class Database(
     ProgramConversationMixin,
     PushSubscriptionMixin,
     StreamJournalMixin,
+    TodoistMirrorMixin,
+    CalendarMirrorMixin,
 ):
     """Main database class combining all mixins.
 
@@ -94,6 +102,23 @@ class Database(
 # Global database instance
 db = Database()
 
+
+def close_thread_db_connections() -> None:
+    """Close DB pool connections for the current thread.
+
+    Called when a short-lived background thread is about to exit so the
+    ConnectionPool doesn't keep a reference to the connection forever.
+    """
+    try:
+        db._pool.close_thread_connection()
+    except Exception:
+        logger.debug("Closing thread-local db connection failed", exc_info=True)
+    try:
+        get_blob_store()._pool.close_thread_connection()
+    except Exception:
+        logger.debug("Closing thread-local blob connection failed", exc_info=True)
+
+
 # Re-export all public symbols
 __all__ = [
     # Database class and instance
@@ -121,4 +146,5 @@ __all__ = [
     "parse_cursor",
     "should_reset_planner",
     "check_database_connectivity",
+    "close_thread_db_connections",
 ]
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# kv_store row counting agent schedule changes (see get_schedule_version)
+_SCHEDULE_VERSION_KEY = ("_system", "agent_scheduler", "schedule_version")
+
 
 class AgentMixin:
     """Mixin providing Agent-related database operations."""
@@ -216,6 +219,7 @@ class AgentMixin:
                     system_type,
                 ),
             )
+            self._bump_schedule_version(conn)
             conn.commit()
 
         logger.info("Agent created", extra={"agent_id": agent_id, "user_id": user_id})
@@ -486,6 +490,7 @@ class AgentMixin:
                     (model, agent_id, user_id),
                 )
 
+            self._bump_schedule_version(conn)
             conn.commit()
 
             # Fetch and return the updated agent
@@ -558,6 +563,7 @@ class AgentMixin:
                     (conv_id, user_id),
                 )
 
+            self._bump_schedule_version(conn)
             conn.commit()
 
         if message_ids:
@@ -679,8 +685,37 @@ class AgentMixin:
                     agent_id,
                 ),
             )
+            self._bump_schedule_version(conn)
             conn.commit()
 
+    def get_schedule_version(self) -> int:
+        """Get the agent schedule change counter (0 if never bumped).
+
+        The resident scheduler (src/agent/scheduler_daemon.py) polls this
+        to notice agents created, edited or deleted by the web app.
+        """
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT value FROM kv_store WHERE user_id = ? AND namespace = ? AND key = ?",
+                _SCHEDULE_VERSION_KEY,
+            ).fetchone()
+            return int(row["value"]) if row else 0
+
+    def _bump_schedule_version(self, conn: sqlite3.Connection) -> None:
+        """Increment the schedule change counter inside the caller's transaction."""
+        now = utcnow_naive().isoformat()
+        self._execute_with_timing(
+            conn,
+            """
+            INSERT INTO kv_store (user_id, namespace, key, value, created_at, updated_at)
+            VALUES (?, ?, ?, '1', ?, ?)
+            ON CONFLICT(user_id, namespace, key)
+            DO UPDATE SET value = CAST(CAST(value AS INTEGER) + 1 AS TEXT), updated_at = ?
+            """,
+            (*_SCHEDULE_VERSION_KEY, now, now, now),
+        )
+
     # ============ Approval Requests ============
 
     def create_approval_request(
@@ -940,6 +975,58 @@ class AgentMixin:
             error_message=None,
         )
 
+    def create_execution_if_idle(
+        self,
+        agent_id: str,
+        trigger_type: str,
+        triggered_by_agent_id: str | None = None,
+    ) -> AgentExecution | None:
+        """Atomically claim an agent: create a running execution unless one exists.
+
+        The has_running_execution() check and the INSERT are one statement,
+        so concurrent claimers (scheduler workers, manual runs, trigger_agent)
+        cannot both start the same agent. Returns None when the agent is
+        already running (same stuck-execution cutoff as has_running_execution).
+        """
+        execution_id = str(uuid.uuid4())
+        now = utcnow_naive()
+        cutoff = now - timedelta(minutes=Config.AGENT_EXECUTION_TIMEOUT_MINUTES)
+
+        with self._pool.get_connection() as conn:
+            cursor = self._execute_with_timing(
+                conn,
+                """INSERT INTO agent_executions
+                   (id, agent_id, status, trigger_type, triggered_by_agent_id, started_at)
+                   SELECT ?, ?, 'running', ?, ?, ?
+                   WHERE NOT EXISTS (
+                       SELECT 1 FROM agent_executions
+                       WHERE agent_id = ? AND status = 'running' AND started_at > ?
+                   )""",
+                (
+                    execution_id,
+                    agent_id,
+                    trigger_type,
+                    triggered_by_agent_id,
+                    now.isoformat(),
+                    agent_id,
+                    cutoff.isoformat(),
+                ),
+            )
+            conn.commit()
+
+        if cursor.rowcount == 0:
+            return None
+        return AgentExecution(
+            id=execution_id,
+            agent_id=agent_id,
+            status="running",
+            trigger_type=trigger_type,
+            triggered_by_agent_id=triggered_by_agent_id,
+            started_at=now,
+            completed_at=None,
+            error_message=None,
+        )
+
     def update_execution(
         self,
         execution_id: str,
@@ -5,13 +5,15 @@ The Database class is extended via mixins defined in other modules.
 """
 
 import sqlite3
+from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from yoyo import get_backend, read_migrations
 
 from src.config import Config
-from src.utils.connection_pool import ConnectionPool
+from src.utils.connection_pool import ConnectionPool, GroupCommitWriter
 from src.utils.db_helpers import execute_with_timing, init_query_logging
 from src.utils.logging import get_logger
 
@@ -20,6 +22,8 @@ logger = get_logger(__name__)
 # Path to migrations directory
 MIGRATIONS_DIR = Path(__file__).parent.parent.parent.parent / "migrations"
 
+T = TypeVar("T")
+
 
 class DatabaseBase:
     """Base database class with core infrastructure.
@@ -34,15 +38,61 @@ class DatabaseBase:
         self._should_log_queries, self._slow_query_threshold_ms = init_query_logging()
         # Use connection pool for efficient connection reuse
         self._pool = ConnectionPool(self.db_path)
+        self._writer: GroupCommitWriter | None = None
+        if Config.DB_WRITE_BEHIND_ENABLED:
+            self._writer = GroupCommitWriter(
+                self._pool,
+                max_batch=Config.DB_WRITE_BEHIND_MAX_BATCH,
+                max_queue=Config.DB_WRITE_BEHIND_MAX_QUEUE,
+            )
         self._init_db()
 
     def close(self) -> None:
-        """Close all connections in the pool.
+        """Commit queued writes and close all connections in the pool.
 
         Call this on application shutdown.
         """
+        if self._writer is not None:
+            self._writer.close()
         self._pool.close_all()
 
+    def _write(
+        self, fn: Callable[[sqlite3.Connection], T], *, background: bool = False
+    ) -> Future[T]:
+        """Run fn(conn) as a write transaction and commit it.
+
+        fn must not commit itself. With the group-commit writer enabled the
+        write is queued and committed together with other queued writes:
+        background=True returns at once (the writer logs failures), otherwise
+        this blocks until the commit and re-raises fn's error. Without the
+        writer fn runs and commits on this thread's pooled connection.
+
+        Returns:
+            A future resolving to fn's result once committed
+        """
+        writer = self._writer
+        if writer is not None and not writer.closed:
+            future = writer.submit(fn)
+            if not background:
+                future.result()
+            return future
+
+        with self._pool.get_connection() as conn:
+            result = fn(conn)
+            conn.commit()
+        done: Future[T] = Future()
+        done.set_result(result)
+        return done
+
+    def flush_writes(self, timeout: float | None = None) -> None:
+        """Block until queued background writes are committed (no-op without the writer)."""
+        if self._writer is not None:
+            self._writer.flush(timeout)
+
+    def write_queue_stats(self) -> dict[str, Any] | None:
+        """Group-commit writer metrics (queue depth, commit latency), None when disabled."""
+        return self._writer.stats() if self._writer is not None else None
+
     def _execute_with_timing(
         self,
         conn: sqlite3.Connection,
@@ -0,0 +1,247 @@
+"""Google Calendar mirror database operations mixin.
+
+Contains methods for the per-(user, calendar) local copy of event instances
+that src/utils/calendar_sync.py keeps current through syncToken incremental
+sync. Events are stored as the API returns them (JSON) with normalized
+bounds for range queries (all-day dates at midnight in the calendar's time
+zone); cancelled events are removed.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from src.utils.calendar_sync import event_bounds
+from src.utils.datetime_utils import utcnow_naive
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.utils.connection_pool import ConnectionPool
+
+logger = get_logger(__name__)
+
+# synced_at written by mark_calendar_mirror_stale: older than any sync interval
+_STALE_SYNCED_AT = "1970-01-01T00:00:00"
+
+
+class CalendarMirrorMixin:
+    """Mixin providing Google Calendar mirror database operations."""
+
+    _pool: ConnectionPool
+
+    def _execute_with_timing(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: tuple[Any, ...] = (),
+    ) -> sqlite3.Cursor:
+        """Execute query with timing (defined in base class)."""
+        raise NotImplementedError
+
+    def _store_calendar_events(
+        self,
+        conn: sqlite3.Connection,
+        user_id: str,
+        calendar_id: str,
+        events: list[dict[str, Any]],
+        time_zone: str | None,
+    ) -> None:
+        """Upsert events and drop cancelled ones (no commit)."""
+        for event in events:
+            event_id = event.get("id")
+            if not event_id:
+                continue
+            bounds = event_bounds(event, time_zone)
+            if event.get("status") == "cancelled" or bounds is None:
+                self._execute_with_timing(
+                    conn,
+                    """DELETE FROM calendar_events
+                       WHERE user_id = ? AND calendar_id = ? AND event_id = ?""",
+                    (user_id, calendar_id, event_id),
+                )
+                continue
+            self._execute_with_timing(
+                conn,
+                """INSERT OR REPLACE INTO calendar_events
+                   (user_id, calendar_id, event_id, start_at, end_at, data)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (user_id, calendar_id, event_id, bounds[0], bounds[1], json.dumps(event)),
+            )
+
+    def _calendar_time_zone(
+        self, conn: sqlite3.Connection, user_id: str, calendar_id: str
+    ) -> str | None:
+        """The time zone stored by the calendar's last sync."""
+        row = self._execute_with_timing(
+            conn,
+            "SELECT time_zone FROM calendar_sync_state WHERE user_id = ? AND calendar_id = ?",
+            (user_id, calendar_id),
+        ).fetchone()
+        return row["time_zone"] if row else None
+
+    def get_calendar_sync_state(self, user_id: str, calendar_id: str) -> dict[str, Any] | None:
+        """Get a calendar's sync token, covered window, time zone and last sync time.
+
+        Returns:
+            Dict with sync_token, window_start, window_end (naive UTC ISO),
+            time_zone (IANA name or None) and synced_at (datetime), or None if
+            the calendar was never synced
+        """
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                """SELECT sync_token, window_start, window_end, time_zone, synced_at
+                   FROM calendar_sync_state WHERE user_id = ? AND calendar_id = ?""",
+                (user_id, calendar_id),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "sync_token": row["sync_token"],
+            "window_start": row["window_start"],
+            "window_end": row["window_end"],
+            "time_zone": row["time_zone"],
+            "synced_at": datetime.fromisoformat(row["synced_at"]),
+        }
+
+    def apply_calendar_sync(
+        self,
+        user_id: str,
+        calendar_id: str,
+        sync_token: str,
+        events: list[dict[str, Any]],
+        window: tuple[str, str] | None = None,
+        time_zone: str | None = None,
+    ) -> None:
+        """Apply a sync result to a calendar's mirror in one transaction.
+
+        Args:
+            user_id: The user ID
+            calendar_id: The calendar ID (as requested, e.g. "primary")
+            sync_token: The nextSyncToken to store for the next delta
+            events: Changed (or, for a full sync, all) events
+            window: For a full sync, the (start, end) it covered - the
+                calendar's events are replaced. None patches them.
+            time_zone: The calendar's time zone from the response (None keeps
+                the stored one)
+        """
+        with self._pool.get_connection() as conn:
+            if window is not None:
+                self._execute_with_timing(
+                    conn,
+                    "DELETE FROM calendar_events WHERE user_id = ? AND calendar_id = ?",
+                    (user_id, calendar_id),
+                )
+            elif time_zone is None:
+                time_zone = self._calendar_time_zone(conn, user_id, calendar_id)
+            self._store_calendar_events(conn, user_id, calendar_id, events, time_zone)
+            now = utcnow_naive().isoformat()
+            if window is not None:
+                self._execute_with_timing(
+                    conn,
+                    """INSERT OR REPLACE INTO calendar_sync_state
+                       (user_id, calendar_id, sync_token, window_start, window_end,
+                        time_zone, synced_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (user_id, calendar_id, sync_token, window[0], window[1], time_zone, now),
+                )
+            else:
+                self._execute_with_timing(
+                    conn,
+                    """UPDATE calendar_sync_state
+                       SET sync_token = ?, time_zone = ?, synced_at = ?
+                       WHERE user_id = ? AND calendar_id = ?""",
+                    (sync_token, time_zone, now, user_id, calendar_id),
+                )
+            conn.commit()
+
+        logger.debug(
+            "Calendar mirror synced",
+            extra={
+                "user_id": user_id,
+                "calendar_id": calendar_id,
+                "full_sync": window is not None,
+                "changes": len(events),
+            },
+        )
+
+    def save_calendar_events(
+        self, user_id: str, calendar_id: str, events: list[dict[str, Any]]
+    ) -> None:
+        """Patch the mirror with events returned by a write."""
+        with self._pool.get_connection() as conn:
+            time_zone = self._calendar_time_zone(conn, user_id, calendar_id)
+            self._store_calendar_events(conn, user_id, calendar_id, events, time_zone)
+            conn.commit()
+
+    def delete_calendar_event(self, user_id: str, calendar_id: str, event_id: str) -> None:
+        """Remove one event from the mirror."""
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                """DELETE FROM calendar_events
+                   WHERE user_id = ? AND calendar_id = ? AND event_id = ?""",
+                (user_id, calendar_id, event_id),
+            )
+            conn.commit()
+
+    def _clear_calendar_mirror(self, conn: sqlite3.Connection, user_id: str) -> None:
+        """Drop all of the user's mirrored calendars and sync state (no commit)."""
+        self._execute_with_timing(conn, "DELETE FROM calendar_events WHERE user_id = ?", (user_id,))
+        self._execute_with_timing(
+            conn, "DELETE FROM calendar_sync_state WHERE user_id = ?", (user_id,)
+        )
+
+    def clear_calendar_mirror(self, user_id: str) -> None:
+        """Drop all of the user's mirrored calendars (the next read does a full sync)."""
+        with self._pool.get_connection() as conn:
+            self._clear_calendar_mirror(conn, user_id)
+            conn.commit()
+
+    def mark_calendar_mirror_stale(self, user_id: str, calendar_id: str) -> None:
+        """Force the next read of a calendar to pull a delta."""
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                "UPDATE calendar_sync_state SET synced_at = ? WHERE user_id = ? AND calendar_id = ?",
+                (_STALE_SYNCED_AT, user_id, calendar_id),
+            )
+            conn.commit()
+
+    def list_calendar_events(
+        self, user_id: str, calendar_id: str, time_min: str, time_max: str
+    ) -> list[dict[str, Any]]:
+        """Mirrored events overlapping [time_min, time_max), by start time.
+
+        Bounds are naive UTC ISO strings (see calendar_sync.utc_key). Like
+        the API's timeMin/timeMax, an event matches if it ends after time_min
+        and starts before time_max.
+        """
+        with self._pool.get_connection() as conn:
+            rows = self._execute_with_timing(
+                conn,
+                """SELECT data FROM calendar_events
+                   WHERE user_id = ? AND calendar_id = ? AND end_at > ? AND start_at < ?
+                   ORDER BY start_at""",
+                (user_id, calendar_id, time_min, time_max),
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def get_calendar_event(
+        self, user_id: str, calendar_id: str, event_id: str
+    ) -> dict[str, Any] | None:
+        """Get one mirrored event by ID."""
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                """SELECT data FROM calendar_events
+                   WHERE user_id = ? AND calendar_id = ? AND event_id = ?""",
+                (user_id, calendar_id, event_id),
+            ).fetchone()
+        if not row:
+            return None
+        result: dict[str, Any] = json.loads(row["data"])
+        return result
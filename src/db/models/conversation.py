@@ -302,7 +302,8 @@ class ConversationMixin:
     ) -> tuple[list[tuple[Conversation, int, str | None]], str | None, bool, int]:
         """List conversations for a user with cursor-based pagination and message counts.
 
-        Combines pagination with message counting in a single query for efficiency.
+        Message counts and previews come from the denormalized
+        message_count / last_message_preview columns (migration 0053).
         Returns conversations ordered by updated_at DESC (most recent first).
         Excludes planning conversations (they are fetched separately).
 
@@ -331,18 +332,16 @@ class ConversationMixin:
             ).fetchone()
             total_count = int(total_row["count"]) if total_row else 0
 
-            # Build the query with JOIN for message counts (excluding planning, agent, and archived)
+            # Counts and previews are denormalized onto conversations (maintained
+            # by message triggers), so this never touches the messages table
             if cursor:
                 cursor_timestamp, cursor_id = parse_cursor(cursor)
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ?
                          AND (c.is_planning = 0 OR c.is_planning IS NULL)
                          AND (c.is_agent = 0 OR c.is_agent IS NULL)
@@ -351,7 +350,6 @@ class ConversationMixin:
                          AND (c.is_language = 0 OR c.is_language IS NULL)
                          AND (c.pinned = 0 OR c.pinned IS NULL)
                          AND (c.updated_at < ? OR (c.updated_at = ? AND c.id < ?))
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC, c.id DESC
                        LIMIT ?""",
                     (user_id, cursor_timestamp, cursor_timestamp, cursor_id, limit + 1),
@@ -360,12 +358,9 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ?
                          AND (c.is_planning = 0 OR c.is_planning IS NULL)
                          AND (c.is_agent = 0 OR c.is_agent IS NULL)
@@ -373,7 +368,6 @@ class ConversationMixin:
                          AND (c.is_sports = 0 OR c.is_sports IS NULL)
                          AND (c.is_language = 0 OR c.is_language IS NULL)
                          AND (c.pinned = 0 OR c.pinned IS NULL)
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC, c.id DESC
                        LIMIT ?""",
                     (user_id, limit + 1),
@@ -423,14 +417,10 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ?
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC""",
                     (user_id,),
                 ).fetchall()
@@ -438,19 +428,15 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ?
                          AND (c.is_planning = 0 OR c.is_planning IS NULL)
                          AND (c.is_agent = 0 OR c.is_agent IS NULL)
                          AND (c.archived = 0 OR c.archived IS NULL)
                          AND (c.is_sports = 0 OR c.is_sports IS NULL)
                          AND (c.is_language = 0 OR c.is_language IS NULL)
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC""",
                     (user_id,),
                 ).fetchall()
@@ -487,14 +473,10 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ? AND c.updated_at > ?
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC""",
                     (user_id, since.isoformat()),
                 ).fetchall()
@@ -502,19 +484,15 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ? AND c.updated_at > ?
                          AND (c.is_planning = 0 OR c.is_planning IS NULL)
                          AND (c.is_agent = 0 OR c.is_agent IS NULL)
                          AND (c.archived = 0 OR c.archived IS NULL)
                          AND (c.is_sports = 0 OR c.is_sports IS NULL)
                          AND (c.is_language = 0 OR c.is_language IS NULL)
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC""",
                     (user_id, since.isoformat()),
                 ).fetchall()
@@ -561,17 +539,12 @@ class ConversationMixin:
         with self._pool.get_connection() as conn:
             rows = self._execute_with_timing(
                 conn,
-                """SELECT c.*, COUNT(m.id) as message_count,
-                          (SELECT m2.content FROM messages m2
-                           WHERE m2.conversation_id = c.id
-                           ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                """SELECT c.*, c.last_message_preview as last_message
                    FROM conversations c
-                   LEFT JOIN messages m ON m.conversation_id = c.id
                    WHERE c.user_id = ? AND c.pinned = 1
                      AND (c.archived = 0 OR c.archived IS NULL)
                      AND (c.is_agent = 0 OR c.is_agent IS NULL)
                      AND (c.is_planning = 0 OR c.is_planning IS NULL)
-                   GROUP BY c.id
                    ORDER BY c.updated_at DESC, c.id DESC""",
                 (user_id,),
             ).fetchall()
@@ -620,15 +593,11 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ? AND c.archived = 1
                          AND (c.updated_at < ? OR (c.updated_at = ? AND c.id < ?))
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC, c.id DESC
                        LIMIT ?""",
                     (user_id, cursor_timestamp, cursor_timestamp, cursor_id, limit + 1),
@@ -637,14 +606,10 @@ class ConversationMixin:
                 rows = self._execute_with_timing(
                     conn,
                     """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                              c.is_planning, COUNT(m.id) as message_count,
-                              (SELECT m2.content FROM messages m2
-                               WHERE m2.conversation_id = c.id
-                               ORDER BY m2.created_at DESC, m2.id DESC LIMIT 1) as last_message
+                              c.is_planning, c.message_count,
+                              c.last_message_preview as last_message
                        FROM conversations c
-                       LEFT JOIN messages m ON m.conversation_id = c.id
                        WHERE c.user_id = ? AND c.archived = 1
-                       GROUP BY c.id
                        ORDER BY c.updated_at DESC, c.id DESC
                        LIMIT ?""",
                     (user_id, limit + 1),
@@ -799,11 +764,9 @@ class ConversationMixin:
             row = self._execute_with_timing(
                 conn,
                 """SELECT c.id, c.user_id, c.title, c.model, c.created_at, c.updated_at,
-                          c.is_planning, COUNT(m.id) as message_count
+                          c.is_planning, c.message_count
                    FROM conversations c
-                   LEFT JOIN messages m ON m.conversation_id = c.id
-                   WHERE c.id = ?
-                   GROUP BY c.id""",
+                   WHERE c.id = ?""",
                 (conversation_id,),
             ).fetchone()
 
@@ -12,8 +12,10 @@ from __future__ import annotations
 import json
 import sqlite3
 import uuid
+from collections.abc import Callable
+from concurrent.futures import Future
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from src.utils.logging import get_logger
 
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class CostMixin:
     """Mixin providing cost tracking database operations."""
@@ -37,6 +41,12 @@ class CostMixin:
         """Execute query with timing (defined in base class)."""
         raise NotImplementedError
 
+    def _write(
+        self, fn: Callable[[sqlite3.Connection], T], *, background: bool = False
+    ) -> Future[T]:
+        """Run a write transaction (defined in base class)."""
+        raise NotImplementedError
+
     def save_message_cost(
         self,
         message_id: str,
@@ -53,6 +63,7 @@ class CostMixin:
         duration_ms: int | None = None,
         tool_errors: int = 0,
         tools_used: list[str] | None = None,
+        spans: dict[str, Any] | None = None,
     ) -> None:
         """Save cost information for a message.
 
@@ -71,6 +82,7 @@ class CostMixin:
             duration_ms: Wall-clock of the whole agent turn (None if unmeasured)
             tool_errors: ToolMessages structurally detected as failures
             tools_used: Unique tool names executed in the turn (stored as JSON)
+            spans: Per-turn latency span summary (src/utils/spans.py, stored as JSON)
         """
         cost_id = str(uuid.uuid4())
         now = datetime.now().isoformat()
@@ -91,7 +103,7 @@ class CostMixin:
             },
         )
 
-        with self._pool.get_connection() as conn:
+        def insert(conn: sqlite3.Connection) -> None:
             self._execute_with_timing(
                 conn,
                 """INSERT INTO message_costs (
@@ -99,8 +111,8 @@ class CostMixin:
                     input_tokens, output_tokens, cached_input_tokens,
                     tool_rounds, tool_call_count,
                     cost_usd, image_generation_cost_usd, created_at,
-                    duration_ms, tool_errors, tools_used
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    duration_ms, tool_errors, tools_used, spans
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     cost_id,
                     message_id,
@@ -118,10 +130,12 @@ class CostMixin:
                     duration_ms,
                     tool_errors,
                     json.dumps(tools_used) if tools_used else None,
+                    json.dumps(spans, separators=(",", ":")) if spans else None,
                 ),
             )
-            conn.commit()
 
+        # Background write: nothing in the turn reads the cost back
+        self._write(insert, background=True)
         logger.debug("Message cost saved", extra={"cost_id": cost_id, "message_id": message_id})
 
     def get_message_cost(self, message_id: str) -> dict[str, Any] | None:
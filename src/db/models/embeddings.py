@@ -1,29 +1,38 @@
 """Embeddings storage mixin (semantic recall over memories and messages).
 
-Vectors are packed float32 blobs (src/utils/embeddings.py); similarity search
-is brute-force cosine in Python - at family scale (a few thousand vectors per
-user) that is faster and simpler than a vector-index extension.
+Vectors are packed float32 blobs (src/utils/embeddings.py). Similarity search
+goes through the per-worker NumPy index in src/utils/vector_index.py, which
+this mixin keeps in step with its own writes and reloads when the table's
+signature shows writes from other processes.
 """
 
 from __future__ import annotations
 
 import sqlite3
 import uuid
+from collections.abc import Callable, Collection
+from concurrent.futures import Future
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from src.utils import vector_index
 from src.utils.logging import get_logger
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from src.utils.connection_pool import ConnectionPool
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class EmbeddingsMixin:
     """Mixin providing embedding-vector storage operations."""
 
     _pool: ConnectionPool
+    db_path: Path
 
     def _execute_with_timing(
         self,
@@ -34,6 +43,12 @@ class EmbeddingsMixin:
         """Execute query with timing (defined in base class)."""
         raise NotImplementedError
 
+    def _write(
+        self, fn: Callable[[sqlite3.Connection], T], *, background: bool = False
+    ) -> Future[T]:
+        """Run a write transaction (defined in base class)."""
+        raise NotImplementedError
+
     def upsert_embedding(
         self,
         user_id: str,
@@ -43,8 +58,14 @@ class EmbeddingsMixin:
         dim: int,
         vector: bytes,
     ) -> None:
-        """Insert or replace the embedding for (kind, ref_id)."""
-        with self._pool.get_connection() as conn:
+        """Insert or replace the embedding for (kind, ref_id).
+
+        A background write: with the group-commit writer enabled it returns
+        before the row is committed (the in-memory index follows the commit).
+        """
+        created_at = datetime.now().isoformat()
+
+        def upsert(conn: sqlite3.Connection) -> None:
             self._execute_with_timing(
                 conn,
                 """INSERT INTO embeddings (id, user_id, kind, ref_id, model, dim, vector, created_at)
@@ -63,10 +84,33 @@ class EmbeddingsMixin:
                     model,
                     dim,
                     vector,
-                    datetime.now().isoformat(),
+                    created_at,
                 ),
             )
-            conn.commit()
+
+        def update_index(committed: Future[None]) -> None:
+            if committed.exception() is None:
+                self._index_upsert(user_id, kind, ref_id, vector, created_at)
+
+        self._write(upsert, background=True).add_done_callback(update_index)
+
+    def _index_upsert(
+        self, user_id: str, kind: str, ref_id: str, vector: bytes, created_at: str
+    ) -> None:
+        """Apply a committed upsert to the loaded per-worker index, if any."""
+        index = vector_index.peek_index(str(self.db_path), user_id, kind)
+        if index is None:
+            return
+        with index.lock:
+            if index.signature is None:
+                return
+            count, newest = index.signature
+            if ref_id not in index:
+                count += 1
+            index.upsert(ref_id, vector)
+            # Expected table signature if nothing else wrote meanwhile; if
+            # something did, the next search sees a mismatch and reloads
+            index.signature = (count, max(newest or "", created_at))
 
     def get_embeddings(self, user_id: str, kind: str) -> list[tuple[str, int, bytes]]:
         """All (ref_id, dim, vector) rows for a user and kind."""
@@ -78,6 +122,51 @@ class EmbeddingsMixin:
             )
             return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
 
+    def get_embeddings_signature(self, user_id: str, kind: str) -> vector_index.Signature:
+        """(count, newest created_at) of a user's embeddings of one kind.
+
+        Served from idx_embeddings_user_kind_created without touching the
+        vector blobs; any insert, update or delete changes it.
+        """
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT COUNT(*), MAX(created_at) FROM embeddings WHERE user_id = ? AND kind = ?",
+                (user_id, kind),
+            ).fetchone()
+            return (int(row[0]), row[1])
+
+    def search_embeddings(
+        self,
+        user_id: str,
+        kind: str,
+        query_vec: list[float],
+        k: int,
+        *,
+        ref_ids: Collection[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Top-k (ref_id, cosine similarity) for a user and kind, best first.
+
+        Args:
+            user_id: Owner of the vectors
+            kind: 'memory' or 'message'
+            query_vec: Query embedding
+            k: Maximum number of results
+            ref_ids: Optional allow-list of ref_ids to rank
+        """
+        index = vector_index.get_index(str(self.db_path), user_id, kind, len(query_vec))
+        with index.lock:
+            signature = self.get_embeddings_signature(user_id, kind)
+            if index.signature != signature:
+                # Signature read first: a write landing during the load makes
+                # the next search reload again rather than miss it
+                index.load(self.get_embeddings(user_id, kind), signature)
+                logger.debug(
+                    "Vector index loaded",
+                    extra={"user_id": user_id, "kind": kind, "vectors": len(index)},
+                )
+            return index.top_k(query_vec, k, ref_ids)
+
     def count_embeddings(self, user_id: str, kind: str) -> int:
         """How many embeddings exist for a user and kind."""
         with self._pool.get_connection() as conn:
@@ -117,10 +206,28 @@ class EmbeddingsMixin:
 
     def delete_embedding(self, kind: str, ref_id: str) -> None:
         """Remove the embedding for (kind, ref_id), if any."""
-        with self._pool.get_connection() as conn:
-            self._execute_with_timing(
+
+        def delete(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            row: sqlite3.Row | None = self._execute_with_timing(
                 conn,
-                "DELETE FROM embeddings WHERE kind = ? AND ref_id = ?",
+                "DELETE FROM embeddings WHERE kind = ? AND ref_id = ? RETURNING user_id, created_at",
                 (kind, ref_id),
-            )
-            conn.commit()
+            ).fetchone()
+            return row
+
+        # Awaited: a deleted memory must not be recalled by the next search
+        row = self._write(delete).result()
+        if row is None:
+            return
+
+        index = vector_index.peek_index(str(self.db_path), row[0], kind)
+        if index is None:
+            return
+        with index.lock:
+            index.remove(ref_id)
+            if index.signature is None:
+                return
+            count, newest = index.signature
+            # Deleting the newest row changes MAX(created_at) to an unknown
+            # value - let the next search reload instead of guessing
+            index.signature = None if row[1] == newest else (count - 1, newest)
@@ -36,9 +36,11 @@ def make_blob_key(message_id: str, file_index: int) -> str:
     return f"{message_id}/{file_index}"
 
 
-def make_thumbnail_key(message_id: str, file_index: int) -> str:
-    """Create blob key for a thumbnail."""
-    return f"{message_id}/{file_index}.thumb"
+def make_thumbnail_key(message_id: str, file_index: int, size: str = "message") -> str:
+    """Create blob key for a thumbnail ("message" size, or "sidebar"/"preview")."""
+    if size == "message":
+        return f"{message_id}/{file_index}.thumb"
+    return f"{message_id}/{file_index}.thumb.{size}"
 
 
 def save_file_to_blob_store(message_id: str, file_index: int, file_data: dict[str, Any]) -> None:
@@ -47,13 +49,35 @@ def save_file_to_blob_store(message_id: str, file_index: int, file_data: dict[st
     Args:
         message_id: Message ID
         file_index: Index of file in message's files array
-        file_data: File dict containing 'data', 'type', and optionally 'thumbnail'
+        file_data: File dict containing 'data' (or 'upload_key'), 'type', and
+            optionally 'attachment' (decoded by validate_files) and 'thumbnail'
     """
     blob_store = get_blob_store()
     mime_type = file_data.get("type", "application/octet-stream")
 
-    # Save main file data
-    if "data" in file_data:
+    # Streamed upload (src/utils/uploads.py): move the stored blob, no copy
+    if "upload_key" in file_data:
+        if not blob_store.rename(file_data["upload_key"], make_blob_key(message_id, file_index)):
+            logger.warning(
+                "Upload blob missing when saving message",
+                extra={"message_id": message_id, "file_index": file_index},
+            )
+    # Save main file data (decoded once by validate_files)
+    elif "attachment" in file_data:
+        try:
+            attachment = file_data["attachment"]
+            blob_store.save(
+                make_blob_key(message_id, file_index),
+                attachment.data,
+                mime_type,
+                sha256=attachment.sha256,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to save file to blob store",
+                extra={"message_id": message_id, "file_index": file_index},
+            )
+    elif "data" in file_data:
         try:
             data_bytes = base64.b64decode(file_data["data"])
             blob_store.save(make_blob_key(message_id, file_index), data_bytes, mime_type)
@@ -79,17 +103,22 @@ def save_file_to_blob_store(message_id: str, file_index: int, file_data: dict[st
 def extract_file_metadata(file_data: dict[str, Any]) -> dict[str, Any]:
     """Extract metadata from file dict, removing binary data.
 
-    Returns a new dict with 'data' and 'thumbnail' removed, plus 'size' added.
+    Returns a new dict with 'data', 'attachment', 'thumbnail' and upload
+    references removed, plus 'size' added.
     """
     metadata = {}
 
     # Copy over non-data fields
     for key, value in file_data.items():
-        if key not in ("data", "thumbnail"):
+        if key not in ("data", "attachment", "thumbnail", "upload_id", "upload_key"):
             metadata[key] = value
 
-    # Calculate and store size from data
-    if "data" in file_data:
+    # Calculate and store size from data (streamed uploads already carry it)
+    if "upload_key" in file_data:
+        metadata["size"] = file_data.get("size", 0)
+    elif "attachment" in file_data:
+        metadata["size"] = file_data["attachment"].size
+    elif "data" in file_data:
         try:
             data_bytes = base64.b64decode(file_data["data"])
             metadata["size"] = len(data_bytes)
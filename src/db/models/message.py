@@ -319,6 +319,82 @@ class MessageMixin:
                 for row in rows
             ]
 
+    def get_message_stats(self, conversation_id: str) -> tuple[int, int, int]:
+        """Size of a conversation without loading its messages.
+
+        Returns:
+            (message count, total content characters, content characters of
+            the newest message)
+        """
+        with self._pool.get_connection() as conn:
+            totals = self._execute_with_timing(
+                conn,
+                """SELECT COUNT(*) AS count, COALESCE(SUM(LENGTH(content)), 0) AS chars
+                   FROM messages WHERE conversation_id = ?""",
+                (conversation_id,),
+            ).fetchone()
+            newest = self._execute_with_timing(
+                conn,
+                """SELECT LENGTH(content) AS chars FROM messages
+                   WHERE conversation_id = ? ORDER BY created_at DESC LIMIT 1""",
+                (conversation_id,),
+            ).fetchone()
+            return (
+                int(totals["count"]),
+                int(totals["chars"]),
+                int(newest["chars"] or 0) if newest else 0,
+            )
+
+    def get_messages_from(self, conversation_id: str, offset: int) -> list[Message]:
+        """Messages from position `offset` onward, same order as get_messages.
+
+        Equivalent to get_messages(conversation_id)[offset:] without reading
+        the skipped rows: the boundary timestamp is found on the
+        (conversation_id, created_at) index, then a keyset range scan loads
+        only the tail.
+        """
+        if offset <= 0:
+            return self.get_messages(conversation_id)
+        with self._pool.get_connection() as conn:
+            boundary = self._execute_with_timing(
+                conn,
+                """SELECT created_at FROM messages WHERE conversation_id = ?
+                   ORDER BY created_at LIMIT 1 OFFSET ?""",
+                (conversation_id, offset),
+            ).fetchone()
+            if not boundary:
+                return []
+            before = self._execute_with_timing(
+                conn,
+                "SELECT COUNT(*) AS count FROM messages WHERE conversation_id = ? AND created_at < ?",
+                (conversation_id, boundary["created_at"]),
+            ).fetchone()
+            rows = self._execute_with_timing(
+                conn,
+                """SELECT * FROM messages WHERE conversation_id = ? AND created_at >= ?
+                   ORDER BY created_at""",
+                (conversation_id, boundary["created_at"]),
+            ).fetchall()
+            # Rows sharing the boundary timestamp but sitting before `offset`
+            rows = rows[offset - int(before["count"]) :]
+
+            return [
+                Message(
+                    id=row["id"],
+                    conversation_id=row["conversation_id"],
+                    role=MessageRole(row["role"]),
+                    content=row["content"],
+                    created_at=datetime.fromisoformat(row["created_at"]),
+                    files=json.loads(row["files"]) if row["files"] else [],
+                    sources=json.loads(row["sources"]) if row["sources"] else None,
+                    generated_images=json.loads(row["generated_images"])
+                    if row["generated_images"]
+                    else None,
+                    language=row["language"],
+                )
+                for row in rows
+            ]
+
     def get_messages_paginated(
         self,
         conversation_id: str,
@@ -739,12 +815,31 @@ class MessageMixin:
             conn.commit()
             return cursor.rowcount > 0
 
+    def update_message_language(self, message_id: str, language: str | None) -> bool:
+        """Set a message's detected response language (ISO 639-1 code).
+
+        Used by the post-commit pipeline, which detects the language after
+        the message has been saved and the done event sent.
+
+        Returns:
+            True if updated, False if the message no longer exists
+        """
+        with self._pool.get_connection() as conn:
+            cursor = self._execute_with_timing(
+                conn,
+                "UPDATE messages SET language = ? WHERE id = ?",
+                (language, message_id),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
     def update_message_file_thumbnail(
         self,
         message_id: str,
         file_index: int,
         thumbnail: str | None,
         status: ThumbnailStatus = ThumbnailStatus.READY,
+        stored: bool = False,
     ) -> bool:
         """Update thumbnail for a specific file in a message.
 
@@ -755,8 +850,11 @@ class MessageMixin:
         Args:
             message_id: ID of the message
             file_index: Index of the file in the files array
-            thumbnail: Base64-encoded thumbnail data (or None if generation failed)
+            thumbnail: Base64-encoded thumbnail data (or None if generation failed
+                or the thumbnail is already stored)
             status: ThumbnailStatus.READY or ThumbnailStatus.FAILED
+            stored: The thumbnail engine already saved the thumbnails to the
+                blob store
 
         Returns:
             True if updated successfully, False if message not found or index out of range
@@ -813,7 +911,7 @@ class MessageMixin:
                     status = ThumbnailStatus.FAILED
                     files[file_index]["has_thumbnail"] = False
             else:
-                files[file_index]["has_thumbnail"] = False
+                files[file_index]["has_thumbnail"] = stored
 
             # Atomic single-statement update of ONLY this file's fields:
             # writing back the whole files JSON lost concurrent updates when
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import sqlite3
 import time
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from src.utils.logging import get_logger
 
@@ -19,6 +21,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class StreamJournalMixin:
     """Mixin providing stream journal operations."""
@@ -34,23 +38,37 @@ class StreamJournalMixin:
         """Execute query with timing (defined in base class)."""
         raise NotImplementedError
 
-    def journal_append_events(self, message_id: str, events: list[tuple[int, str]]) -> None:
+    def _write(
+        self, fn: Callable[[sqlite3.Connection], T], *, background: bool = False
+    ) -> Future[T]:
+        """Run a write transaction (defined in base class)."""
+        raise NotImplementedError
+
+    def journal_append_events(self, message_id: str, events: list[tuple[int, str]]) -> Future[None]:
         """Append a batch of (seq, event_json) rows for a message's stream.
 
+        A background write: with the group-commit writer enabled it returns
+        before the rows are committed, so readers should be woken from the
+        returned future.
+
         Args:
             message_id: The assistant message id the stream belongs to
             events: (seq, serialized event) tuples, seq strictly increasing
+
+        Returns:
+            A future that resolves once the rows are committed
         """
-        if not events:
-            return
         now = time.time()
-        with self._pool.get_connection() as conn:
+        rows = [(message_id, seq, event, now) for seq, event in events]
+
+        def append(conn: sqlite3.Connection) -> None:
             conn.executemany(
                 """INSERT OR IGNORE INTO stream_journal (message_id, seq, event, created_at)
                    VALUES (?, ?, ?, ?)""",
-                [(message_id, seq, event, now) for seq, event in events],
+                rows,
             )
-            conn.commit()
+
+        return self._write(append, background=True)
 
     def journal_get_events(self, message_id: str, after_seq: int) -> list[tuple[int, str]]:
         """Get journaled events for a message with seq greater than after_seq."""
@@ -67,11 +85,12 @@ class StreamJournalMixin:
     def journal_cleanup(self, max_age_seconds: int) -> int:
         """Delete journal rows older than max_age_seconds. Returns rowcount."""
         cutoff = time.time() - max_age_seconds
-        with self._pool.get_connection() as conn:
-            cursor = self._execute_with_timing(
+
+        def cleanup(conn: sqlite3.Connection) -> int:
+            return self._execute_with_timing(
                 conn,
                 "DELETE FROM stream_journal WHERE created_at < ?",
                 (cutoff,),
-            )
-            conn.commit()
-            return cursor.rowcount
+            ).rowcount
+
+        return self._write(cleanup).result()
@@ -0,0 +1,194 @@
+"""Todoist mirror database operations mixin.
+
+Contains methods for the per-user local copy of Todoist tasks ("items"),
+projects and sections that src/utils/todoist_sync.py keeps current through
+Sync API deltas. Objects are stored as the API returns them (JSON); only
+active ones are kept.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from src.utils.datetime_utils import utcnow_naive
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.utils.connection_pool import ConnectionPool
+
+logger = get_logger(__name__)
+
+# synced_at written by mark_todoist_mirror_stale: older than any sync interval
+_STALE_SYNCED_AT = "1970-01-01T00:00:00"
+
+
+def _is_active(kind: str, obj: dict[str, Any]) -> bool:
+    """Whether an object belongs in the mirror (not deleted, completed or archived)."""
+    if obj.get("is_deleted"):
+        return False
+    if kind == "item":
+        return not obj.get("checked")
+    return not obj.get("is_archived")
+
+
+class TodoistMirrorMixin:
+    """Mixin providing Todoist mirror database operations."""
+
+    _pool: ConnectionPool
+
+    def _execute_with_timing(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: tuple[Any, ...] = (),
+    ) -> sqlite3.Cursor:
+        """Execute query with timing (defined in base class)."""
+        raise NotImplementedError
+
+    def _store_todoist_objects(
+        self,
+        conn: sqlite3.Connection,
+        user_id: str,
+        kind: str,
+        objects: list[dict[str, Any]],
+    ) -> None:
+        """Upsert active objects and drop inactive ones (no commit)."""
+        for obj in objects:
+            if not obj.get("id"):
+                continue
+            if _is_active(kind, obj):
+                self._execute_with_timing(
+                    conn,
+                    """INSERT OR REPLACE INTO todoist_objects (user_id, kind, id, project_id, data)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (user_id, kind, str(obj["id"]), obj.get("project_id"), json.dumps(obj)),
+                )
+            else:
+                self._execute_with_timing(
+                    conn,
+                    "DELETE FROM todoist_objects WHERE user_id = ? AND kind = ? AND id = ?",
+                    (user_id, kind, str(obj["id"])),
+                )
+
+    def get_todoist_sync_state(self, user_id: str) -> tuple[str, datetime] | None:
+        """Get the sync_token the user's mirror is current to and when it synced.
+
+        Returns:
+            (sync_token, synced_at) or None if the mirror was never synced
+        """
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT sync_token, synced_at FROM todoist_sync_state WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return row["sync_token"], datetime.fromisoformat(row["synced_at"])
+
+    def apply_todoist_sync(
+        self,
+        user_id: str,
+        sync_token: str,
+        changes: dict[str, list[dict[str, Any]]],
+        full_sync: bool = False,
+    ) -> None:
+        """Apply a Sync API response to the mirror in one transaction.
+
+        Args:
+            user_id: The user ID
+            sync_token: The response's sync_token (stored for the next delta)
+            changes: Changed objects per kind ("item", "project", "section")
+            full_sync: Replace the mirror instead of patching it
+        """
+        with self._pool.get_connection() as conn:
+            if full_sync:
+                self._execute_with_timing(
+                    conn, "DELETE FROM todoist_objects WHERE user_id = ?", (user_id,)
+                )
+            for kind, objects in changes.items():
+                self._store_todoist_objects(conn, user_id, kind, objects)
+            self._execute_with_timing(
+                conn,
+                """INSERT OR REPLACE INTO todoist_sync_state (user_id, sync_token, synced_at)
+                   VALUES (?, ?, ?)""",
+                (user_id, sync_token, utcnow_naive().isoformat()),
+            )
+            conn.commit()
+
+        logger.debug(
+            "Todoist mirror synced",
+            extra={
+                "user_id": user_id,
+                "full_sync": full_sync,
+                "changes": sum(len(objects) for objects in changes.values()),
+            },
+        )
+
+    def save_todoist_objects(self, user_id: str, kind: str, objects: list[dict[str, Any]]) -> None:
+        """Patch the mirror with objects returned by a write (inactive ones are removed)."""
+        with self._pool.get_connection() as conn:
+            self._store_todoist_objects(conn, user_id, kind, objects)
+            conn.commit()
+
+    def delete_todoist_object(self, user_id: str, kind: str, object_id: str) -> None:
+        """Remove one object from the mirror."""
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                "DELETE FROM todoist_objects WHERE user_id = ? AND kind = ? AND id = ?",
+                (user_id, kind, object_id),
+            )
+            conn.commit()
+
+    def mark_todoist_mirror_stale(self, user_id: str) -> None:
+        """Force the next read to pull a delta (e.g. after a write with side effects)."""
+        with self._pool.get_connection() as conn:
+            self._execute_with_timing(
+                conn,
+                "UPDATE todoist_sync_state SET synced_at = ? WHERE user_id = ?",
+                (_STALE_SYNCED_AT, user_id),
+            )
+            conn.commit()
+
+    def _clear_todoist_mirror(self, conn: sqlite3.Connection, user_id: str) -> None:
+        """Drop the user's mirror and sync token (no commit)."""
+        self._execute_with_timing(conn, "DELETE FROM todoist_objects WHERE user_id = ?", (user_id,))
+        self._execute_with_timing(
+            conn, "DELETE FROM todoist_sync_state WHERE user_id = ?", (user_id,)
+        )
+
+    def clear_todoist_mirror(self, user_id: str) -> None:
+        """Drop the user's mirror and sync token (the next read does a full sync)."""
+        with self._pool.get_connection() as conn:
+            self._clear_todoist_mirror(conn, user_id)
+            conn.commit()
+
+    def list_todoist_objects(
+        self, user_id: str, kind: str, project_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List mirrored objects of a kind, optionally within one project."""
+        query = "SELECT data FROM todoist_objects WHERE user_id = ? AND kind = ?"
+        params: tuple[Any, ...] = (user_id, kind)
+        if project_id:
+            query += " AND project_id = ?"
+            params += (project_id,)
+        with self._pool.get_connection() as conn:
+            rows = self._execute_with_timing(conn, query, params).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def get_todoist_object(self, user_id: str, kind: str, object_id: str) -> dict[str, Any] | None:
+        """Get one mirrored object by ID."""
+        with self._pool.get_connection() as conn:
+            row = self._execute_with_timing(
+                conn,
+                "SELECT data FROM todoist_objects WHERE user_id = ? AND kind = ? AND id = ?",
+                (user_id, kind, object_id),
+            ).fetchone()
+        if not row:
+            return None
+        result: dict[str, Any] = json.loads(row["data"])
+        return result
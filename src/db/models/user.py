@@ -39,6 +39,13 @@ class UserMixin:
         """Execute query with timing (defined in base class)."""
         raise NotImplementedError
 
+    if TYPE_CHECKING:
+        # Defined in TodoistMirrorMixin / CalendarMirrorMixin; type-only here so
+        # these stubs can't shadow them (UserMixin comes first in the MRO)
+        def _clear_todoist_mirror(self, conn: sqlite3.Connection, user_id: str) -> None: ...
+
+        def _clear_calendar_mirror(self, conn: sqlite3.Connection, user_id: str) -> None: ...
+
     def _row_to_user(self, row: sqlite3.Row) -> User:
         """Convert a database row to a User object."""
         todoist_connected_at = None
@@ -230,8 +237,12 @@ class UserMixin:
                 "UPDATE users SET todoist_access_token = ?, todoist_connected_at = ? WHERE id = ?",
                 (encrypt_token(access_token), connected_at, user_id),
             )
-            conn.commit()
             updated = cursor.rowcount > 0
+            if updated:
+                # The new token may belong to another Todoist account: drop
+                # the local mirror so the next read starts with a full sync
+                self._clear_todoist_mirror(conn, user_id)
+            conn.commit()
 
         if updated:
             action = "connected" if access_token else "disconnected"
@@ -298,8 +309,12 @@ class UserMixin:
                     user_id,
                 ),
             )
-            conn.commit()
             updated = cursor.rowcount > 0
+            if updated:
+                # Connecting may switch Google accounts: drop the local events
+                # mirror so the next read starts with a full sync
+                self._clear_calendar_mirror(conn, user_id)
+            conn.commit()
 
         if updated:
             action = "connected" if access_token else "disconnected"
@@ -1,8 +1,9 @@
 """Background thumbnail generation using ThreadPoolExecutor.
 
 This module provides non-blocking thumbnail generation for uploaded images.
-Thumbnails are generated in background threads and the database is updated
-when complete.
+Background threads hand each saved image to the thumbnail engine (which
+renders in a process pool and writes to the blob store) and update the
+database when complete.
 """
 
 import base64
@@ -12,6 +13,7 @@ from typing import Any
 
 from src.api.schemas import ThumbnailStatus
 from src.config import Config
+from src.utils.files import Attachment
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -43,7 +45,7 @@ def get_executor() -> ThreadPoolExecutor:
     return _executor
 
 
-def should_skip_thumbnail(file_data: str, file_type: str) -> bool:
+def should_skip_thumbnail(file_data: str | Attachment, file_type: str) -> bool:
     """Determine if thumbnail generation should be skipped.
 
     Returns True if:
@@ -51,7 +53,7 @@ def should_skip_thumbnail(file_data: str, file_type: str) -> bool:
     - File is small enough that original can be used as thumbnail
 
     Args:
-        file_data: Base64-encoded file data
+        file_data: Base64-encoded file data, or the Attachment decoded from it
         file_type: MIME type of the file
 
     Returns:
@@ -60,6 +62,9 @@ def should_skip_thumbnail(file_data: str, file_type: str) -> bool:
     if not file_type.startswith("image/"):
         return True
 
+    if isinstance(file_data, Attachment):
+        return file_data.size < Config.THUMBNAIL_SKIP_THRESHOLD_BYTES
+
     try:
         data_size = len(base64.b64decode(file_data))
         return data_size < Config.THUMBNAIL_SKIP_THRESHOLD_BYTES
@@ -68,59 +73,61 @@ def should_skip_thumbnail(file_data: str, file_type: str) -> bool:
         return False
 
 
-def queue_thumbnail_generation(
-    message_id: str, file_index: int, file_data: str, file_type: str
-) -> None:
+def queue_thumbnail_generation(message_id: str, file_index: int, file_type: str) -> None:
     """Queue thumbnail generation for background processing.
 
+    The image is read from the blob store, so the message must be saved first.
+
     Args:
         message_id: ID of the message containing the file
         file_index: Index of the file in the message's files array
-        file_data: Base64-encoded image data
         file_type: MIME type of the image
     """
     logger.debug(
         "Queueing thumbnail generation",
         extra={"message_id": message_id, "file_index": file_index, "file_type": file_type},
     )
-    get_executor().submit(_generate_thumbnail_task, message_id, file_index, file_data, file_type)
+    get_executor().submit(_generate_thumbnail_task, message_id, file_index, file_type)
 
 
-def generate_and_save_thumbnail(
-    message_id: str, file_index: int, file_data: str, file_type: str
-) -> str | None:
-    """Generate a thumbnail and save it to the database.
+def generate_and_save_thumbnail(message_id: str, file_index: int, file_type: str) -> bool:
+    """Render all thumbnail sizes of a saved image and record the status.
 
     This is the shared helper used by both background generation and
-    synchronous stale recovery.
+    synchronous stale recovery. The thumbnail engine writes the thumbnails to
+    the blob store; only the status is updated in the message metadata.
 
     Args:
         message_id: ID of the message containing the file
         file_index: Index of the file in the message's files array
-        file_data: Base64-encoded image data
         file_type: MIME type of the image
 
     Returns:
-        The generated thumbnail (base64 string) or None if generation failed
+        True if the thumbnails were generated
     """
     # Import here to avoid circular imports
-    from src.db.models import db
-    from src.utils.images import generate_thumbnail
+    from src.db.models import db, make_blob_key, make_thumbnail_key
+    from src.utils.thumbnail_engine import THUMBNAIL_SIZES, render_stored_thumbnails
 
     logger.debug(
         "Generating thumbnail",
         extra={"message_id": message_id, "file_index": file_index},
     )
 
-    thumbnail = generate_thumbnail(file_data, file_type)
-    status = ThumbnailStatus.READY if thumbnail else ThumbnailStatus.FAILED
+    sizes = render_stored_thumbnails(
+        make_blob_key(message_id, file_index),
+        file_type,
+        {size: make_thumbnail_key(message_id, file_index, size) for size in THUMBNAIL_SIZES},
+    )
+    status = ThumbnailStatus.READY if sizes else ThumbnailStatus.FAILED
 
-    # Update the database with the generated thumbnail
+    # Update the database with the thumbnail status
     success = db.update_message_file_thumbnail(
         message_id,
         file_index,
-        thumbnail,
+        None,
         status=status,
+        stored=bool(sizes),
     )
 
     if success:
@@ -138,25 +145,23 @@ def generate_and_save_thumbnail(
             extra={"message_id": message_id, "file_index": file_index},
         )
 
-    return thumbnail
+    return bool(sizes)
 
 
-def _generate_thumbnail_task(
-    message_id: str, file_index: int, file_data: str, file_type: str
-) -> None:
+def _generate_thumbnail_task(message_id: str, file_index: int, file_type: str) -> None:
     """Background task to generate and save a thumbnail.
 
-    This runs in a ThreadPoolExecutor worker thread. Wraps generate_and_save_thumbnail
-    with exception handling for background execution.
+    This runs in a ThreadPoolExecutor worker thread, which waits on the
+    thumbnail engine's process pool. Wraps generate_and_save_thumbnail with
+    exception handling for background execution.
 
     Args:
         message_id: ID of the message containing the file
         file_index: Index of the file in the message's files array
-        file_data: Base64-encoded image data
         file_type: MIME type of the image
     """
     try:
-        generate_and_save_thumbnail(message_id, file_index, file_data, file_type)
+        generate_and_save_thumbnail(message_id, file_index, file_type)
     except Exception as e:
         logger.error(
             "Thumbnail generation failed",
@@ -205,7 +210,13 @@ def mark_files_for_thumbnail_generation(files: list[dict[str, Any]]) -> list[dic
             # Non-image files don't need thumbnails
             continue
 
-        if should_skip_thumbnail(file_data, file_type):
+        if "upload_key" in file:
+            # Streamed upload: size unknown here, the background task reads
+            # the image from the blob store like any other
+            file["thumbnail_status"] = ThumbnailStatus.PENDING.value
+            continue
+
+        if should_skip_thumbnail(file.get("attachment") or file_data, file_type):
             # Small image - use original data as thumbnail
             file["thumbnail"] = file_data
             file["thumbnail_status"] = ThumbnailStatus.READY.value
@@ -236,4 +247,4 @@ def queue_pending_thumbnails(message_id: str, files: list[dict[str, Any]]) -> No
     """
     for idx, file in enumerate(files):
         if file.get("thumbnail_status") == ThumbnailStatus.PENDING.value:
-            queue_thumbnail_generation(message_id, idx, file.get("data", ""), file.get("type", ""))
+            queue_thumbnail_generation(message_id, idx, file.get("type", ""))
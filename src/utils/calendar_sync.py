@@ -0,0 +1,228 @@
+"""Local Google Calendar mirror kept current through syncToken incremental sync.
+
+Every planner dashboard build pulled a full 7-day event window from each
+selected calendar, and the google_calendar tool did the same per call.
+Instead, each (user, calendar)'s event instances are mirrored in the
+database (src/db/models/calendar.py) and refreshed with the Calendar API's
+incremental sync: events.list with the stored nextSyncToken returns only
+the events changed since the last sync (cancelled ones included).
+
+- A full sync lists the instances in [now - 7 days, now +
+  GOOGLE_CALENDAR_MIRROR_DAYS) and records that window. The API rejects
+  timeMin/timeMax on syncToken requests, so deltas aren't windowed: they
+  keep the covered range current, and a new full sync moves the window
+  forward once it covers less than a week ahead.
+- A 410 Gone (sync token expired or invalidated) triggers a full resync.
+- All-day events start and end at midnight in the calendar's time zone (the
+  events.list response's timeZone, stored with the sync state), like the
+  API's own timeMin/timeMax matching.
+- Reads sync at most once per GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS;
+  the dashboard's refresh and the tool's fresh=true force a sync. Reads
+  outside the covered window, and text searches (q), go to the API.
+"""
+
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import quote
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import requests
+
+from src.config import Config
+from src.utils.datetime_utils import utcnow_naive
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How far back a full sync reaches ("what did I have yesterday?")
+MIRROR_PAST = timedelta(days=7)
+# Resync the window once it covers less than this far ahead (the dashboard's range)
+MIRROR_MIN_AHEAD = timedelta(days=7)
+_PAGE_SIZE = 250
+_MAX_PAGES = 20
+
+_locks: dict[tuple[str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+class CalendarSyncError(Exception):
+    """Raised when an events.list sync request fails."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _zone(time_zone: str | None) -> ZoneInfo:
+    """The named IANA zone, or UTC when missing or unknown."""
+    try:
+        return ZoneInfo(time_zone or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning("Unknown calendar time zone, using UTC", extra={"time_zone": time_zone})
+        return ZoneInfo("UTC")
+
+
+def utc_key(value: str | None, time_zone: str | None = None) -> str | None:
+    """Normalize an RFC 3339 timestamp or YYYY-MM-DD date to naive UTC ISO seconds.
+
+    The mirror compares these strings to answer range queries. All-day dates
+    (and other values without an offset) count from midnight in time_zone
+    (default UTC).
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_zone(time_zone))
+    return parsed.astimezone(UTC).replace(tzinfo=None, microsecond=0).isoformat()
+
+
+def event_bounds(event: dict[str, Any], time_zone: str | None = None) -> tuple[str, str] | None:
+    """(start, end) of an event as utc_key strings, or None without a start.
+
+    Args:
+        event: Event resource as returned by the API
+        time_zone: The calendar's time zone, for all-day (date) bounds
+    """
+    start = event.get("start") or {}
+    end = event.get("end") or {}
+    start_key = utc_key(start.get("dateTime") or start.get("date"), time_zone)
+    if start_key is None:
+        return None
+    end_key = utc_key(end.get("dateTime") or end.get("date"), time_zone) or start_key
+    return start_key, max(start_key, end_key)
+
+
+def _lock(user_id: str, calendar_id: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault((user_id, calendar_id), threading.Lock())
+
+
+def _list_events(
+    token: str, calendar_id: str, params: dict[str, Any]
+) -> tuple[list[dict[str, Any]], str, str | None]:
+    """Page through events.list; returns (events, nextSyncToken, calendar time zone)."""
+    url = f"{Config.GOOGLE_CALENDAR_API_BASE_URL}/calendars/{quote(calendar_id, safe='')}/events"
+    headers = {"Authorization": f"Bearer {token}"}
+    events: list[dict[str, Any]] = []
+    page_params: dict[str, Any] = {**params, "singleEvents": "true", "maxResults": _PAGE_SIZE}
+
+    for _ in range(_MAX_PAGES):
+        try:
+            response = requests.get(
+                url, headers=headers, params=page_params, timeout=Config.GOOGLE_CALENDAR_API_TIMEOUT
+            )
+        except requests.RequestException as e:
+            raise CalendarSyncError(f"Failed to connect to Google Calendar: {e}") from e
+        if response.status_code >= 400:
+            raise CalendarSyncError(
+                f"Google Calendar API error ({response.status_code})", response.status_code
+            )
+        data = response.json()
+        events.extend(data.get("items", []))
+        if data.get("nextSyncToken"):
+            return events, data["nextSyncToken"], data.get("timeZone")
+        if not data.get("nextPageToken"):
+            break
+        page_params["pageToken"] = data["nextPageToken"]
+
+    raise CalendarSyncError("Google Calendar sync returned no sync token")
+
+
+class CalendarMirror:
+    """Read and patch access to one synced calendar of a user."""
+
+    def __init__(
+        self, db: Any, user_id: str, calendar_id: str, window_start: str, window_end: str
+    ) -> None:
+        self.db = db
+        self.user_id = user_id
+        self.calendar_id = calendar_id
+        self.window_start = window_start
+        self.window_end = window_end
+
+    def covers(self, time_min: str, time_max: str) -> bool:
+        """Whether [time_min, time_max) lies within the synced window."""
+        start, end = utc_key(time_min), utc_key(time_max)
+        return bool(start and end and self.window_start <= start and end <= self.window_end)
+
+    def events(self, time_min: str, time_max: str) -> list[dict[str, Any]]:
+        """Events overlapping [time_min, time_max), ordered by start time."""
+        result: list[dict[str, Any]] = self.db.list_calendar_events(
+            self.user_id, self.calendar_id, utc_key(time_min), utc_key(time_max)
+        )
+        return result
+
+    def get(self, event_id: str) -> dict[str, Any] | None:
+        result: dict[str, Any] | None = self.db.get_calendar_event(
+            self.user_id, self.calendar_id, event_id
+        )
+        return result
+
+    def save(self, event: dict[str, Any]) -> None:
+        """Patch in an event returned by a write."""
+        self.db.save_calendar_events(self.user_id, self.calendar_id, [event])
+
+    def remove(self, event_id: str) -> None:
+        self.db.delete_calendar_event(self.user_id, self.calendar_id, event_id)
+
+    def mark_stale(self) -> None:
+        self.db.mark_calendar_mirror_stale(self.user_id, self.calendar_id)
+
+
+def sync_calendar_mirror(
+    db: Any, user_id: str, token: str, calendar_id: str, force: bool = False
+) -> CalendarMirror:
+    """Bring one calendar's mirror up to date and return it.
+
+    Pulls a delta with the stored sync token unless the calendar synced
+    within GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS (and force is off).
+    Does a full sync when there is no usable token or window.
+
+    Raises:
+        CalendarSyncError: If the events.list request fails
+    """
+    with _lock(user_id, calendar_id):
+        state = db.get_calendar_sync_state(user_id, calendar_id)
+        now = utcnow_naive().replace(microsecond=0)
+
+        if state and state["window_end"] >= (now + MIRROR_MIN_AHEAD).isoformat():
+            mirror = CalendarMirror(
+                db, user_id, calendar_id, state["window_start"], state["window_end"]
+            )
+            age = now - state["synced_at"]
+            if not force and age < timedelta(
+                seconds=Config.GOOGLE_CALENDAR_SYNC_MIN_INTERVAL_SECONDS
+            ):
+                return mirror
+            try:
+                events, sync_token, time_zone = _list_events(
+                    token, calendar_id, {"syncToken": state["sync_token"]}
+                )
+                db.apply_calendar_sync(
+                    user_id, calendar_id, sync_token, events, time_zone=time_zone
+                )
+                return mirror
+            except CalendarSyncError as e:
+                if e.status_code != 410:
+                    raise
+                logger.info(
+                    "Calendar sync token expired, doing a full sync",
+                    extra={"user_id": user_id, "calendar_id": calendar_id},
+                )
+
+        window = (
+            (now - MIRROR_PAST).isoformat(),
+            (now + timedelta(days=Config.GOOGLE_CALENDAR_MIRROR_DAYS)).isoformat(),
+        )
+        events, sync_token, time_zone = _list_events(
+            token, calendar_id, {"timeMin": f"{window[0]}Z", "timeMax": f"{window[1]}Z"}
+        )
+        db.apply_calendar_sync(
+            user_id, calendar_id, sync_token, events, window=window, time_zone=time_zone
+        )
+        return CalendarMirror(db, user_id, calendar_id, *window)
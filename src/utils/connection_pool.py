@@ -13,19 +13,31 @@ Usage:
 
     # Connections are automatically returned to the pool (not closed)
     # Call pool.close_all() on shutdown to close all connections
+
+GroupCommitWriter is the optional single-writer path on top of a pool: a
+dedicated thread applies queued write transactions in group commits instead
+of every thread committing (and contending for the WAL write lock) on its own.
 """
 
+import atexit
+import queue
 import sqlite3
 import threading
+import time
 import weakref
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Group commits slower than this are logged as warnings (with writer stats)
+SLOW_GROUP_COMMIT_MS = 1000
+
 
 class ConnectionPool:
     """Thread-local SQLite connection pool.
@@ -270,3 +282,182 @@ class ConnectionPool:
         """
         with self.get_connection() as conn:
             return conn.execute(query, params)
+
+
+WriteFn = Callable[[sqlite3.Connection], Any]
+
+
+class GroupCommitWriter:
+    """Single writer thread that applies queued writes in group commits.
+
+    Each write is a function of a connection that runs inside the batch's
+    transaction and must not commit itself. The writer drains whatever is
+    queued (up to max_batch), runs every write under its own SAVEPOINT - a
+    failing write is rolled back and reported on its future without taking
+    the rest of the batch with it - and commits once. Futures resolve after
+    the commit, so `submit(fn).result()` keeps synchronous semantics while
+    fire-and-forget callers just drop the future.
+
+    Writes are applied in submission order. A full queue blocks submitters
+    (backpressure) rather than growing without bound. The thread starts on
+    first use, so a pre-fork parent never owns it.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_batch: int = 64, max_queue: int = 10000) -> None:
+        self._pool = pool
+        self.max_batch = max_batch
+        self._queue: queue.Queue[tuple[WriteFn, Future[Any]] | None] = queue.Queue(max_queue)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._atexit_registered = False
+        self.batches = 0
+        self.writes = 0
+        self.errors = 0
+        self._commit_ms_total = 0.0
+        self.last_commit_ms = 0.0
+        self.max_commit_ms = 0.0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, fn: WriteFn) -> Future[Any]:
+        """Queue a write; the future resolves to fn's result once committed."""
+        if self._closed:
+            raise RuntimeError("GroupCommitWriter is closed")
+        future: Future[Any] = Future()
+        self._ensure_started()
+        self._queue.put((fn, future))
+        return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every write queued before this call is committed."""
+        if self._thread is None or self._closed:
+            return
+        self.submit(lambda conn: None).result(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Commit what's queued, then stop the writer thread."""
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and commit latency counters for logging and monitoring."""
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "writes": self.writes,
+                "errors": self.errors,
+                "avg_batch_size": round(self.writes / self.batches, 2) if self.batches else 0.0,
+                "last_commit_ms": round(self.last_commit_ms, 2),
+                "avg_commit_ms": (
+                    round(self._commit_ms_total / self.batches, 2) if self.batches else 0.0
+                ),
+                "max_commit_ms": round(self.max_commit_ms, 2),
+            }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="sqlite-group-commit", daemon=True
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                # Daemon thread: drain the queue at interpreter exit
+                atexit.register(self.close)
+                self._atexit_registered = True
+            logger.debug(
+                "Group commit writer started",
+                extra={"db_path": str(self._pool.db_path), "max_batch": self.max_batch},
+            )
+
+    def _run(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                batch = [item]
+                stop = False
+                while len(batch) < self.max_batch:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                self._commit_batch(batch)
+                if stop:
+                    return
+        finally:
+            self._pool.close_thread_connection()
+
+    def _commit_batch(self, batch: list[tuple[WriteFn, Future[Any]]]) -> None:
+        start = time.perf_counter()
+        applied: list[tuple[Future[Any], Any]] = []
+        errors = 0
+        try:
+            with self._pool.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for fn, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    conn.execute("SAVEPOINT group_write")
+                    try:
+                        result = fn(conn)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO group_write")
+                        conn.execute("RELEASE group_write")
+                        errors += 1
+                        logger.warning("Queued write failed", exc_info=True)
+                        future.set_exception(e)
+                        continue
+                    conn.execute("RELEASE group_write")
+                    applied.append((future, result))
+                conn.commit()
+        except Exception as e:
+            logger.error(
+                "Group commit failed",
+                extra={"db_path": str(self._pool.db_path), "batch_size": len(batch)},
+                exc_info=True,
+            )
+            # Nothing in the batch was committed: fail every unresolved write
+            failed = [future for _, future in batch if not future.done()]
+            with self._stats_lock:
+                self.errors += errors + len(failed)
+            for future in failed:
+                future.set_exception(e)
+            return
+
+        commit_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            self.batches += 1
+            self.writes += len(applied)
+            self.errors += errors
+            self._commit_ms_total += commit_ms
+            self.last_commit_ms = commit_ms
+            self.max_commit_ms = max(self.max_commit_ms, commit_ms)
+        if commit_ms > SLOW_GROUP_COMMIT_MS:
+            logger.warning("Slow group commit", extra={"batch_size": len(batch), **self.stats()})
+        else:
+            logger.debug(
+                "Group commit",
+                extra={"batch_size": len(batch), "commit_ms": round(commit_ms, 2)},
+            )
+        for future, result in applied:
+            future.set_result(result)
@@ -1,9 +1,10 @@
 """Text embeddings for semantic recall (memories, past conversations).
 
 Vectors come from the Gemini embedding API and are stored as packed float32
-blobs in the embeddings table. Similarity search is brute-force cosine in
-Python - at family scale (a few thousand vectors per user) that beats the
-complexity of a vector-index extension.
+blobs in the embeddings table. Similarity search runs against the per-worker
+NumPy index (src/utils/vector_index.py, via db.search_embeddings); the
+pure-Python helpers below remain as the reference implementation that
+scripts/benchmark_vector_index.py measures it against.
 
 Every entry point degrades gracefully: embed_text returns None on any
 failure, and callers fall back to keyword-only search.
@@ -2,7 +2,8 @@
 
 Attachments are not permanent storage: videos are retained for
 VIDEO_RETENTION_DAYS, images for IMAGE_RETENTION_DAYS, and all other file
-types (PDFs, text, JSON, CSV) for FILE_RETENTION_DAYS. Expiry is derived
+types (PDFs, text, JSON, CSV) for FILE_RETENTION_DAYS; streamed uploads no
+message referenced are dropped after UPLOAD_RETENTION_HOURS. Expiry is derived
 from message age, so callers (history labeling, retrieve_file, file routes)
 stay truthful even before the physical sweep has run.
 
@@ -54,16 +55,19 @@ def retention_note(mime_type: str) -> str:
 def cleanup_expired_files() -> dict[str, int]:
     """Delete expired attachment blobs and their Gemini URI cache entries.
 
-    Thumbnails are intentionally kept so old conversations still render a
-    placeholder. Idempotent: deleting an already-deleted blob is a no-op.
+    Also deletes abandoned uploads (POST /api/uploads never referenced by a
+    chat message). Thumbnails are intentionally kept so old conversations still render a
+    placeholder - except the lightbox preview, which is nearly full-size and
+    goes with the image. Idempotent: deleting an already-deleted blob is a no-op.
     """
     # Imports at call time so tests can patch the module-level singletons
     from src.agent.gemini_files import delete_cached_file_uri
     from src.db import models
     from src.db.blob_store import get_blob_store
-    from src.db.models import make_blob_key
+    from src.db.models import make_blob_key, make_thumbnail_key
+    from src.utils.uploads import UPLOAD_KEY_PREFIX
 
-    counts = {"videos_deleted": 0, "images_deleted": 0, "files_deleted": 0}
+    counts = {"videos_deleted": 0, "images_deleted": 0, "files_deleted": 0, "uploads_deleted": 0}
     blob_store = get_blob_store()
     now = datetime.now()
     # The shortest retention window bounds the scan
@@ -86,8 +90,14 @@ def cleanup_expired_files() -> dict[str, int]:
                     counts["images_deleted"] += 1
                 else:
                     counts["files_deleted"] += 1
-            if mime_type.startswith("video/"):
-                delete_cached_file_uri(msg.id, idx)
+            if mime_type.startswith("image/"):
+                blob_store.delete(make_thumbnail_key(msg.id, idx, "preview"))
+            # Large images/PDFs have cached Files API URIs too; a no-op otherwise
+            delete_cached_file_uri(msg.id, idx)
+
+    counts["uploads_deleted"] = blob_store.delete_by_prefix_before(
+        UPLOAD_KEY_PREFIX, now - timedelta(hours=Config.UPLOAD_RETENTION_HOURS)
+    )
 
     if any(counts.values()):
         logger.info("File retention sweep completed", extra=counts)
@@ -2,6 +2,9 @@
 
 import base64
 import binascii
+import hashlib
+import io
+from dataclasses import dataclass
 from typing import Any
 
 import magic
@@ -68,16 +71,71 @@ TEXT_BASED_MIME_TYPES: set[str] = {
     "application/json",
 }
 
+# Bytes handed to libmagic: container signatures sit in the first few KB
+MAGIC_SNIFF_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Attachment:
+    """An attachment's bytes, decoded once from the request's base64.
+
+    validate_files() creates it and stores it on the file dict as
+    "attachment"; the blob save, metadata extraction, thumbnail queueing and
+    Gemini Files API upload read it instead of decoding "data" again.
+    """
+
+    data: memoryview
+    size: int
+    sha256: str
+    # libmagic's view of the content (None if detection failed)
+    mime_type: str | None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Attachment":
+        """Hash and sniff decoded file bytes (the buffer is shared, not copied)."""
+        return cls(
+            data=memoryview(data),
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            mime_type=detect_mime_type(data),
+        )
+
+    def open(self) -> io.BytesIO:
+        """Seekable file object over the bytes (BytesIO shares a bytes buffer)."""
+        buffer = self.data.obj
+        return io.BytesIO(buffer if isinstance(buffer, bytes) else self.data.tobytes())
+
+
+def detect_mime_type(file_data: bytes | memoryview, file_name: str = "unknown") -> str | None:
+    """MIME type of the content according to libmagic, or None if detection fails.
+
+    Only the first MAGIC_SNIFF_BYTES are inspected.
+    """
+    try:
+        detected: str = magic.from_buffer(bytes(file_data[:MAGIC_SNIFF_BYTES]), mime=True)
+    except Exception as e:
+        logger.warning(
+            "Failed to detect file type by magic bytes",
+            extra={"file_name": file_name, "error": str(e)},
+        )
+        return None
+    return detected
+
 
 def verify_file_type_by_magic(
-    file_data: bytes, claimed_mime_type: str, file_name: str
+    file_data: bytes | memoryview,
+    claimed_mime_type: str,
+    file_name: str,
+    detected_mime_type: str | None = None,
 ) -> tuple[bool, str]:
     """Verify that file content matches the claimed MIME type using magic bytes.
 
     Args:
-        file_data: Decoded binary file data
+        file_data: Decoded binary file data (or at least its first MAGIC_SNIFF_BYTES)
         claimed_mime_type: MIME type claimed by the client
         file_name: Name of the file (for error messages)
+        detected_mime_type: Already detected type (Attachment.mime_type), to
+            skip running libmagic again
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -92,13 +150,9 @@ def verify_file_type_by_magic(
         return True, ""
 
     # Detect actual MIME type from file content
-    try:
-        detected_mime_type = magic.from_buffer(file_data, mime=True)
-    except Exception as e:
-        logger.warning(
-            "Failed to detect file type by magic bytes",
-            extra={"file_name": file_name, "error": str(e)},
-        )
+    if detected_mime_type is None:
+        detected_mime_type = detect_mime_type(file_data, file_name)
+    if detected_mime_type is None:
         # Fail open for detection errors - the file already passed MIME whitelist check
         return True, ""
 
@@ -164,7 +218,7 @@ def verify_file_type_by_magic(
     )
 
 
-def _matches_video_signature(file_data: bytes, claimed_mime_type: str) -> bool:
+def _matches_video_signature(file_data: bytes | memoryview, claimed_mime_type: str) -> bool:
     """Check a video container's magic bytes directly.
 
     MP4/QuickTime are ISO-BMFF ("ftyp" box at offset 4); WebM is
@@ -173,7 +227,7 @@ def _matches_video_signature(file_data: bytes, claimed_mime_type: str) -> bool:
     if claimed_mime_type in ("video/mp4", "video/quicktime"):
         return len(file_data) >= 8 and file_data[4:8] == b"ftyp"
     if claimed_mime_type == "video/webm":
-        return file_data.startswith(b"\x1a\x45\xdf\xa3")
+        return file_data[:4] == b"\x1a\x45\xdf\xa3"
     return False
 
 
@@ -187,8 +241,12 @@ def max_size_for_mime(mime_type: str) -> int:
 def validate_files(files: list[dict[str, Any]]) -> tuple[bool, str]:
     """Validate uploaded files against config limits.
 
+    Decodes each base64 file once and stores the result on the dict as
+    "attachment" (see Attachment) for the rest of the write path.
+
     Args:
         files: List of file dictionaries with 'name', 'type', 'data' keys
+            (or 'upload_key', set by src.utils.uploads.resolve_uploads)
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -210,6 +268,11 @@ def validate_files(files: list[dict[str, Any]]) -> tuple[bool, str]:
             )
             return False, f"File type '{file_type}' is not allowed"
 
+        if "upload_key" in file:
+            # Streamed upload (resolve_uploads): size and magic bytes were
+            # checked when it was stored
+            continue
+
         # Decode and check file size (base64 is ~4/3 larger than binary)
         data = file.get("data", "")
         try:
@@ -233,9 +296,13 @@ def validate_files(files: list[dict[str, Any]]) -> tuple[bool, str]:
             return False, "Invalid file data encoding"
 
         # Verify file content matches claimed MIME type using magic bytes
-        is_valid, error_msg = verify_file_type_by_magic(decoded_data, file_type, file_name)
+        attachment = Attachment.from_bytes(decoded_data)
+        is_valid, error_msg = verify_file_type_by_magic(
+            attachment.data, file_type, file_name, detected_mime_type=attachment.mime_type
+        )
         if not is_valid:
             return False, error_msg
+        file["attachment"] = attachment
 
     logger.debug("File validation passed", extra={"file_count": len(files)})
     return True, ""
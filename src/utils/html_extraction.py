@@ -0,0 +1,164 @@
+"""HTML to readable text, off the request thread.
+
+trafilatura, BeautifulSoup and html2text are pure-Python parsers: a large page
+holds the GIL for tens to hundreds of milliseconds. On a gthread worker that
+stalls token streaming for every other request in the process, and research's
+parallel fetches (RESEARCH_FETCH_WORKERS) extract effectively one at a time.
+
+extract_text() therefore parses pages of HTML_EXTRACT_MIN_BYTES or more in a
+small process pool (HTML_EXTRACT_WORKERS per web process, started on first
+use). It falls back to parsing in the calling thread when:
+- the page is small (IPC would cost more than the parse),
+- the pool already has 2x its size in pending pages (a burst never queues
+  behind a slow parse).
+
+A page gets HTML_EXTRACT_TIMEOUT_SECONDS from the moment a worker picks it
+up (see process_pool.py); one that runs out of time raises
+HTMLExtractionError - re-parsing it in the calling thread would stall it even
+longer. Pages caught in a pool another page broke are resubmitted once.
+
+This module imports nothing from the app beyond Config, logging and the
+process pool, so pool processes start without loading the agent/tool stack.
+"""
+
+import threading
+
+import html2text
+import trafilatura
+from bs4 import BeautifulSoup
+
+from src.config import Config
+from src.utils.logging import get_logger
+from src.utils.process_pool import LazyProcessPool, TaskTimeoutError, WorkerCrashedError
+
+logger = get_logger(__name__)
+
+
+class HTMLExtractionError(Exception):
+    """Raised when a page's parse timed out or crashed its pool worker."""
+
+
+# Below this many chars, trafilatura almost certainly found no article body
+# (link hubs, SPAs, very short pages) - fall back to the broad html2text pass,
+# which at least returns the page's headlines/links. Validated against real
+# pages: a Wikipedia article yields ~52k chars; the BBC News homepage ~192.
+MIN_MAIN_CONTENT_CHARS = 200
+
+
+def extract_main_content(html: str) -> str:
+    """Isolate the main article body via trafilatura.
+
+    Drops menus, related-article lists, cookie banners and comment sections
+    that a tag-based strip leaves behind, so the model gets denser signal
+    within the length cap. Returns "" when no article body is recognized (so
+    the caller falls back) or on any extraction error.
+    """
+    try:
+        extracted = trafilatura.extract(
+            html,
+            output_format="markdown",
+            include_links=False,
+            favor_precision=True,
+        )
+        return extracted or ""
+    except Exception:
+        logger.debug("trafilatura extraction failed, falling back", exc_info=True)
+        return ""
+
+
+def html_to_markdown(html: str) -> str:
+    """Broad fallback: strip boilerplate tags and convert the rest to markdown."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Remove script, style, nav, footer, header elements
+    for element in soup(["script", "style", "nav", "footer", "header", "aside", "noscript"]):
+        element.decompose()
+
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = True
+    converter.ignore_emphasis = False
+    converter.body_width = 0  # No wrapping
+
+    return converter.handle(str(soup))
+
+
+def extract_text_in_thread(html: str) -> str:
+    """Extract readable text from HTML, preferring main-content extraction.
+
+    trafilatura isolates the article body for denser signal; link hubs and
+    SPAs have no recognizable article, so we fall back to the broad html2text
+    pass when it returns too little.
+    """
+    text = extract_main_content(html)
+    if len(text) < MIN_MAIN_CONTENT_CHARS:
+        text = html_to_markdown(html)
+    return text
+
+
+def truncate_text(text: str, max_length: int | None = None) -> str:
+    """Cap text at max_length (default HTML_TEXT_MAX_LENGTH) with a truncation marker."""
+    limit = max_length if max_length is not None else Config.HTML_TEXT_MAX_LENGTH
+    if len(text) > limit:
+        text = text[:limit] + "\n\n[Content truncated...]"
+    return text.strip()
+
+
+# ============ Process pool ============
+
+_pool = LazyProcessPool("html_extraction", lambda: Config.HTML_EXTRACT_WORKERS)
+_pending_lock = threading.Lock()
+_pending = 0
+
+
+def shutdown_pool() -> None:
+    _pool.shutdown()
+
+
+def _claim_slot() -> bool:
+    global _pending
+    with _pending_lock:
+        if _pending >= 2 * Config.HTML_EXTRACT_WORKERS:
+            return False
+        _pending += 1
+        return True
+
+
+def _release_slot() -> None:
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+
+
+def extract_text(html: str) -> str:
+    """Readable text of an HTML page, parsed in the pool when worthwhile.
+
+    Raises:
+        HTMLExtractionError: If the page's parse timed out, or its worker
+            crashed on both tries
+    """
+    if (
+        Config.HTML_EXTRACT_WORKERS <= 0
+        or len(html) < Config.HTML_EXTRACT_MIN_BYTES
+        or not _claim_slot()
+    ):
+        return extract_text_in_thread(html)
+
+    timeout = Config.HTML_EXTRACT_TIMEOUT_SECONDS
+    try:
+        # At most 2x the pool size pending: a page is picked up within two
+        # rounds of parses, so the third timeout only passes for a stuck worker
+        text: str = _pool.run(
+            extract_text_in_thread,
+            html,
+            timeout=timeout,
+            backstop=3 * timeout + 1,
+            log_extra={"html_bytes": len(html)},
+        )
+        return text
+    except TaskTimeoutError:
+        raise HTMLExtractionError(f"Page text extraction timed out after {timeout:g}s") from None
+    except WorkerCrashedError:
+        raise HTMLExtractionError("Page text extraction failed") from None
+    finally:
+        _release_slot()
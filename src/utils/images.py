@@ -2,7 +2,6 @@
 
 import base64
 import binascii
-import io
 import json
 from typing import Any
 
@@ -11,6 +10,7 @@ from PIL import Image, UnidentifiedImageError
 from src.api.schemas import ThumbnailStatus
 from src.config import Config
 from src.utils.logging import get_logger
+from src.utils.thumbnail_engine import THUMBNAIL_MESSAGE, render_thumbnails
 
 logger = get_logger(__name__)
 
@@ -24,12 +24,15 @@ MIME_TYPE_TO_EXT: dict[str, str] = {
 
 
 def generate_thumbnail(
-    image_data: str, mime_type: str, max_size: tuple[int, int] | None = None
+    image_data: str | bytes | memoryview, mime_type: str, max_size: tuple[int, int] | None = None
 ) -> str | None:
     """Generate a thumbnail from base64-encoded image data.
 
+    Renders in the calling thread; background generation for uploads goes
+    through thumbnail_engine.render_stored_thumbnails() instead.
+
     Args:
-        image_data: Base64-encoded image data
+        image_data: Base64-encoded image data, or the decoded bytes
         mime_type: MIME type of the image (e.g., 'image/jpeg')
         max_size: Maximum (width, height) for the thumbnail (defaults to Config.THUMBNAIL_MAX_SIZE)
 
@@ -43,48 +46,12 @@ def generate_thumbnail(
         return None
 
     try:
-        # Decode base64 image
-        image_bytes = base64.b64decode(image_data)
-        img: Image.Image = Image.open(io.BytesIO(image_bytes))
-
-        # Handle RGBA images (PNG with transparency)
-        if img.mode in ("RGBA", "LA", "P"):
-            # Convert to RGB with white background for JPEG output
-            if mime_type == "image/jpeg":
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                if img.mode == "P":
-                    img = img.convert("RGBA")
-                background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
-                img = background
-
-        # Generate thumbnail (maintains aspect ratio)
-        # Use configurable resampling algorithm (BILINEAR is faster, LANCZOS is higher quality)
-        resampling = getattr(
-            Image.Resampling, Config.THUMBNAIL_RESAMPLING, Image.Resampling.BILINEAR
-        )
-        img.thumbnail(max_size, resampling)
-
-        # Save to bytes
-        output = io.BytesIO()
-
-        # Use original format or fallback to JPEG
-        if mime_type == "image/png":
-            img.save(output, format="PNG", optimize=True)
-        elif mime_type == "image/gif":
-            img.save(output, format="GIF")
-        elif mime_type == "image/webp":
-            img.save(output, format="WEBP", quality=Config.THUMBNAIL_QUALITY)
-        else:
-            # Default to JPEG
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            img.save(output, format="JPEG", quality=Config.THUMBNAIL_QUALITY, optimize=True)
-
-        # Return base64-encoded thumbnail
-        output.seek(0)
-        return base64.b64encode(output.read()).decode("utf-8")
-
-    except (binascii.Error, UnidentifiedImageError, OSError) as e:
+        # Decode base64 image (chat uploads arrive already decoded)
+        image_bytes = base64.b64decode(image_data) if isinstance(image_data, str) else image_data
+        rendered = render_thumbnails(image_bytes, mime_type, {THUMBNAIL_MESSAGE: max_size})
+        return base64.b64encode(rendered[THUMBNAIL_MESSAGE][0]).decode("utf-8")
+
+    except (binascii.Error, UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
         logger.error(
             "Error generating thumbnail",
             extra={"mime_type": mime_type, "error": str(e)},
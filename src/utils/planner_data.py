@@ -235,13 +235,82 @@ def _format_event_for_dashboard(event: dict[str, Any]) -> PlannerEvent:
     )
 
 
+def _split_dashboard_tasks(
+    tasks: list[dict[str, Any]],
+    section_map: dict[str, str],
+    project_map: dict[str, str],
+) -> tuple[list[PlannerTask], list[PlannerTask]]:
+    """Convert raw tasks and split them into (upcoming, overdue)."""
+    tasks_7_days: list[PlannerTask] = []
+    overdue_tasks: list[PlannerTask] = []
+    today = datetime.now().date()
+
+    for task in tasks:
+        planner_task = _format_task_for_dashboard(task, section_map, project_map)
+
+        # Determine if task is overdue or upcoming
+        if planner_task.due_date:
+            task_date = _parse_date(planner_task.due_date)
+            if task_date and task_date.date() < today:
+                overdue_tasks.append(planner_task)
+            else:
+                tasks_7_days.append(planner_task)
+        else:
+            # Tasks without due dates from "7 days" filter go to upcoming
+            tasks_7_days.append(planner_task)
+
+    return tasks_7_days, overdue_tasks
+
+
+def _fetch_todoist_dashboard_from_mirror(
+    access_token: str, user_id: str, db: Any, force_sync: bool
+) -> tuple[list[PlannerTask], list[PlannerTask], str | None]:
+    """Dashboard tasks from the local mirror: the "7 days | overdue" filter, applied locally."""
+    from src.utils.todoist_sync import TodoistSyncError, sync_todoist_mirror
+
+    try:
+        mirror = sync_todoist_mirror(db, user_id, access_token, force=force_sync)
+    except TodoistSyncError as e:
+        if e.auth_expired:
+            return [], [], "Todoist access has expired. Please reconnect in Settings."
+        logger.error("Todoist sync failed", extra={"user_id": user_id, "error": str(e)})
+        return [], [], str(e)
+
+    last_day = (datetime.now().date() + timedelta(days=6)).isoformat()
+    tasks = [
+        task
+        for task in mirror.tasks()
+        if task.get("due") and task["due"].get("date", "")[:10] <= last_day
+    ]
+    tasks.sort(key=lambda t: t["due"]["date"])
+
+    tasks_7_days, overdue_tasks = _split_dashboard_tasks(
+        tasks, mirror.section_names(), mirror.project_names()
+    )
+    logger.debug(
+        "Todoist dashboard data read from mirror",
+        extra={"tasks_7_days": len(tasks_7_days), "overdue": len(overdue_tasks)},
+    )
+    return tasks_7_days, overdue_tasks, None
+
+
 def fetch_todoist_dashboard_data(
     access_token: str,
+    user_id: str | None = None,
+    db: Any = None,
+    force_sync: bool = False,
 ) -> tuple[list[PlannerTask], list[PlannerTask], str | None]:
     """Fetch Todoist tasks for the next 7 days and overdue tasks.
 
+    With a user_id and db (and TODOIST_MIRROR_ENABLED), tasks come from the
+    local mirror after an incremental sync (src/utils/todoist_sync.py);
+    otherwise they are fetched from the REST API.
+
     Args:
         access_token: The user's Todoist access token
+        user_id: The user ID whose mirror to read
+        db: Database instance holding the mirror
+        force_sync: Sync the mirror even if it synced recently
 
     Returns:
         Tuple of (tasks_by_due_date, overdue_tasks, error_message)
@@ -251,10 +320,10 @@ def fetch_todoist_dashboard_data(
     """
     import requests
 
-    logger.debug("Fetching Todoist dashboard data")
+    if user_id and db is not None and Config.TODOIST_MIRROR_ENABLED:
+        return _fetch_todoist_dashboard_from_mirror(access_token, user_id, db, force_sync)
 
-    tasks_7_days: list[PlannerTask] = []
-    overdue_tasks: list[PlannerTask] = []
+    logger.debug("Fetching Todoist dashboard data")
 
     try:
         headers = {"Authorization": f"Bearer {access_token}"}
@@ -342,22 +411,7 @@ def fetch_todoist_dashboard_data(
                     extra={"error": str(e)},
                 )
 
-        # Convert and categorize tasks
-        today = datetime.now().date()
-
-        for task in tasks:
-            planner_task = _format_task_for_dashboard(task, section_map, project_map)
-
-            # Determine if task is overdue or upcoming
-            if planner_task.due_date:
-                task_date = _parse_date(planner_task.due_date)
-                if task_date and task_date.date() < today:
-                    overdue_tasks.append(planner_task)
-                else:
-                    tasks_7_days.append(planner_task)
-            else:
-                # Tasks without due dates from "7 days" filter go to upcoming
-                tasks_7_days.append(planner_task)
+        tasks_7_days, overdue_tasks = _split_dashboard_tasks(tasks, section_map, project_map)
 
         logger.debug(
             "Todoist dashboard data fetched",
@@ -380,12 +434,22 @@ def fetch_todoist_dashboard_data(
 def fetch_calendar_dashboard_data(
     access_token: str,
     calendar_ids: list[str] | None = None,
+    user_id: str | None = None,
+    db: Any = None,
+    force_sync: bool = False,
 ) -> tuple[list[PlannerEvent], str | None]:
     """Fetch Google Calendar events from multiple calendars in parallel.
 
+    With a user_id and db (and GOOGLE_CALENDAR_MIRROR_ENABLED), each
+    calendar's events come from the local mirror after an incremental sync
+    (src/utils/calendar_sync.py); otherwise from the events.list API.
+
     Args:
         access_token: The user's Google Calendar access token
         calendar_ids: List of calendar IDs to fetch (defaults to ["primary"])
+        user_id: The user ID whose mirror to read
+        db: Database instance holding the mirror
+        force_sync: Sync the mirrors even if they synced recently
 
     Returns:
         Tuple of (events, error_message)
@@ -434,17 +498,49 @@ def fetch_calendar_dashboard_data(
     time_min = now.isoformat() + "Z"
     time_max = (now + timedelta(days=7)).isoformat() + "Z"
 
+    max_events = 30  # per calendar: whole dashboard JSON lands in the LLM prompt each turn
     params = {
         "timeMin": time_min,
         "timeMax": time_max,
         "singleEvents": True,
         "orderBy": "startTime",
-        "maxResults": 30,  # whole dashboard JSON lands in the LLM prompt each turn
+        "maxResults": max_events,
     }
 
     all_events: list[PlannerEvent] = []
     errors: list[tuple[str, str]] = []  # (calendar_id, error_message)
     seen_event_ids: set[str] = set()  # Track event IDs to prevent duplicates
+    use_mirror = bool(user_id and db is not None and Config.GOOGLE_CALENDAR_MIRROR_ENABLED)
+
+    def read_single_calendar_mirror(
+        calendar_id: str,
+    ) -> tuple[str, list[dict[str, Any]] | None, str | None, str | None, bool]:
+        """Read one calendar's window from the local mirror (syncing first)."""
+        from src.utils.calendar_sync import CalendarSyncError, sync_calendar_mirror
+
+        try:
+            mirror = sync_calendar_mirror(
+                db, str(user_id), access_token, calendar_id, force=force_sync
+            )
+            events = mirror.events(time_min, time_max)[:max_events]
+        except CalendarSyncError as e:
+            error = {401: "Access expired", 403: "Permission denied", 404: "Calendar not found"}
+            if e.status_code is None:
+                logger.error(
+                    "Calendar sync failed", extra={"calendar_id": calendar_id, "error": str(e)}
+                )
+                return calendar_id, None, None, "Connection error", False
+            logger.warning(
+                "Calendar sync API error",
+                extra={"calendar_id": calendar_id, "status": e.status_code},
+            )
+            message = error.get(e.status_code, f"API error ({e.status_code})")
+            return calendar_id, None, None, message, False
+        finally:
+            _close_thread_pool_connections(db)
+
+        calendar_name = calendar_names.get(calendar_id, calendar_id)
+        return calendar_id, events, calendar_name, None, calendar_id == "primary"
 
     def fetch_single_calendar(
         calendar_id: str,
@@ -453,6 +549,8 @@ def fetch_calendar_dashboard_data(
 
         Returns: (calendar_id, events, calendar_name, error_message, is_primary)
         """
+        if use_mirror:
+            return read_single_calendar_mirror(calendar_id)
         try:
             # URL-encode the calendar ID to handle special characters like # in holiday calendars
             encoded_calendar_id = quote(calendar_id, safe="")
@@ -715,9 +813,14 @@ def build_planner_dashboard(
 
     def fetch_todoist_if_available() -> tuple[list[Any], list[Any], str | None]:
         """Fetch Todoist data if token available."""
-        if todoist_token:
-            return fetch_todoist_dashboard_data(todoist_token)
-        return [], [], None
+        try:
+            if todoist_token:
+                return fetch_todoist_dashboard_data(
+                    todoist_token, user_id=user_id, db=db, force_sync=force_refresh
+                )
+            return [], [], None
+        finally:
+            _close_thread_pool_connections(db)
 
     def fetch_calendar_if_available() -> tuple[list[PlannerEvent], str | None]:
         """Fetch Google Calendar data if token available."""
@@ -736,7 +839,13 @@ def build_planner_dashboard(
                             extra={"user_id": user_id, "error": str(e)},
                         )
 
-                return fetch_calendar_dashboard_data(calendar_token, selected_calendar_ids)
+                return fetch_calendar_dashboard_data(
+                    calendar_token,
+                    selected_calendar_ids,
+                    user_id=user_id,
+                    db=db,
+                    force_sync=force_refresh,
+                )
             return [], None
         finally:
             _close_thread_pool_connections(db)
@@ -0,0 +1,159 @@
+"""Lazily started process pool for CPU-bound work off the web worker's GIL.
+
+Shared by html_extraction.py and thumbnail_engine.py. The pool starts on
+first use, with forkserver workers (spawn where forkserver is missing) so a
+worker is never forked from a multi-threaded web worker.
+
+run() gives each task its own deadline, enforced inside the worker from the
+moment it picks the task up (SIGALRM), so time spent queued behind another
+task doesn't count and the worker survives a task that runs out of time. The
+caller's wait is only a backstop for a task stuck in C code that never
+returns to the interpreter; then the pool is torn down. Tasks in flight on a
+pool that broke - torn down that way, or a crashed worker - are resubmitted
+once to a fresh pool: the break was usually another task's doing.
+
+This module imports nothing from the app beyond logging, so pool processes
+start without loading the agent/tool stack.
+"""
+
+import atexit
+import multiprocessing
+import signal
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from types import FrameType
+from typing import Any
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TaskTimeoutError(Exception):
+    """Raised when a task ran out of time in its worker (or got stuck there)."""
+
+
+class WorkerCrashedError(Exception):
+    """Raised when a task's pool broke on both tries."""
+
+
+class _DeadlineExceeded(BaseException):
+    """Raised in a worker by its task alarm.
+
+    A BaseException so a task's own `except Exception` fallbacks can't
+    swallow it and keep going.
+    """
+
+
+def _deadline_exceeded(signum: int, frame: FrameType | None) -> None:
+    raise _DeadlineExceeded
+
+
+def _call_with_deadline(
+    timeout: float, fn: Callable[..., Any], args: tuple[Any, ...]
+) -> tuple[bool, Any]:
+    """Run a task in a pool worker: (True, result), or (False, None) if it ran out of time."""
+    previous = signal.signal(signal.SIGALRM, _deadline_exceeded)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return True, fn(*args)
+    except _DeadlineExceeded:
+        return False, None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class LazyProcessPool:
+    """A process pool started on first use and restarted after it breaks.
+
+    Args:
+        name: Label for log messages
+        max_workers: Returns the pool size (read when a pool starts, so
+            config overrides apply to the next pool)
+    """
+
+    def __init__(self, name: str, max_workers: Callable[[], int]) -> None:
+        self.name = name
+        self._max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    def get(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                )
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers(), mp_context=context
+                )
+            return self._pool
+
+    def retire(self, pool: ProcessPoolExecutor) -> None:
+        """Kill a pool with a stuck or dead worker; the next task starts a new one."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.terminate_workers()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: float,
+        backstop: float,
+        log_extra: dict[str, Any] | None = None,
+    ) -> Any:
+        """Run fn(*args) in a worker and return its result.
+
+        Args:
+            fn: Module-level (picklable) function
+            timeout: Seconds the task may run once a worker picks it up
+            backstop: Seconds to wait for the result before declaring the
+                worker stuck - must cover the time queued behind other tasks
+            log_extra: Extra fields for the warning logs
+
+        Raises:
+            TaskTimeoutError: If the task ran out of time or got stuck
+            WorkerCrashedError: If the pool broke on both tries
+        """
+        extra = {"pool": self.name, **(log_extra or {})}
+        for attempt in range(2):
+            pool = self.get()
+            try:
+                future = pool.submit(_call_with_deadline, timeout, fn, args)
+            except RuntimeError:
+                continue  # retired by a concurrent caller: resubmit to a fresh pool
+            try:
+                finished, result = future.result(timeout=backstop)
+            except FutureTimeoutError:
+                logger.warning("Pool task stuck, restarting pool", extra=extra)
+                self.retire(pool)
+                raise TaskTimeoutError from None
+            except BrokenProcessPool:
+                # Torn down by another task's stuck worker, or a worker
+                # crashed - possibly on this task, so only one more try
+                logger.warning("Process pool broken", extra={**extra, "attempt": attempt})
+                self.retire(pool)
+                continue
+            if not finished:
+                logger.warning("Pool task timed out", extra=extra)
+                raise TaskTimeoutError
+            return result
+        raise WorkerCrashedError
@@ -9,12 +9,18 @@ exhaustion degrades gracefully instead of breaking web search.
 Usage counters are persisted in kv_store (SQLite) under a system sentinel
 user, one key per provider+month ("brave:2026-08"), incremented atomically
 so gunicorn workers can't lose updates. Metered calls are billed on success
-only — provider dashboards stay authoritative.
+only — provider dashboards stay authoritative. Batched tool calls search
+concurrently, so calls in flight hold a per-process quota slot until they are
+billed or fail: a fan-out never sends more calls than the quota has left.
+
+Paid providers share one keep-alive httpx.Client each, so a batch (and the
+next turn's searches) reuse TLS connections instead of dialing per query.
 
 Contract: search_web() returns [{title, url, snippet}] or raises
 SearchProviderError (retriable flag drives the agent's self-correction).
 """
 
+import threading
 from calendar import monthrange
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -34,6 +40,8 @@ _BRAVE_ENDPOINT = "https://api.search.brave.com/res/v1/web/search"
 _TAVILY_ENDPOINT = "https://api.tavily.com/search"
 _EXA_ENDPOINT = "https://api.exa.ai/search"
 _HTTP_TIMEOUT_SECONDS = 15
+# Idle keep-alive connections kept per provider (one per concurrent query)
+_HTTP_KEEPALIVE_CONNECTIONS = 8
 
 # Usage counters are global app state, not per-user data - stored under a
 # sentinel user id in the per-user kv_store table
@@ -95,6 +103,27 @@ def _record_use(provider: str) -> None:
     logger.debug("Search billed", extra={"provider": provider, "monthly_usage": used})
 
 
+# ============ HTTP clients ============
+
+_http_clients: dict[str, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _http_client(provider: str) -> httpx.Client:
+    """Process-wide keep-alive client for one provider's API."""
+    client = _http_clients.get(provider)
+    if client is None:
+        with _http_clients_lock:
+            client = _http_clients.get(provider)
+            if client is None:
+                client = httpx.Client(
+                    timeout=_HTTP_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(max_keepalive_connections=_HTTP_KEEPALIVE_CONNECTIONS),
+                )
+                _http_clients[provider] = client
+    return client
+
+
 # ============ Router ============
 
 
@@ -106,13 +135,42 @@ class _Provider:
     search: Callable[[str, int], list[dict[str, str]]]
 
 
-def _provider_available(provider: _Provider) -> bool:
+def _provider_available(provider: _Provider, inflight: int = 0) -> bool:
     if provider.monthly_quota() is None:
         return True  # ddgs: always available, needs no key
     if not provider.api_key():
         return False
     quota = provider.monthly_quota()
-    return quota is None or get_monthly_usage(provider.name) < quota
+    return quota is None or get_monthly_usage(provider.name) + inflight < quota
+
+
+# Metered calls started by this process but not yet billed, per provider
+_inflight: dict[str, int] = {}
+_inflight_lock = threading.Lock()
+
+
+def _reserve(provider: _Provider) -> bool:
+    """Claim quota for one call; False when the provider is unavailable.
+
+    Usage plus this process's in-flight calls must stay under the quota, so
+    concurrent queries of one batch cannot all pass the check on the last
+    remaining search. Pair every True with _release() once the call is billed
+    or has failed.
+    """
+    if provider.monthly_quota() is None:
+        return True  # ddgs: unmetered, nothing to reserve
+    with _inflight_lock:
+        if not _provider_available(provider, _inflight.get(provider.name, 0)):
+            return False
+        _inflight[provider.name] = _inflight.get(provider.name, 0) + 1
+    return True
+
+
+def _release(provider: _Provider) -> None:
+    if provider.monthly_quota() is None:
+        return
+    with _inflight_lock:
+        _inflight[provider.name] -= 1
 
 
 def active_provider() -> str:
@@ -137,7 +195,7 @@ def search_web(query: str, num_results: int) -> list[dict[str, str]]:
     last_error: SearchProviderError | None = None
 
     for provider in _PROVIDERS:
-        if not _provider_available(provider):
+        if not _reserve(provider):
             continue
         try:
             results = _search_with_quote_retry(provider, query, num_results)
@@ -148,12 +206,17 @@ def search_web(query: str, num_results: int) -> list[dict[str, str]]:
             )
             last_error = error
             continue
+        finally:
+            _release(provider)
         _notify_if_degraded(provider.name)
         return results
 
     raise last_error or SearchProviderError("No search provider available", retriable=True)
 
 
+_degraded_alert_lock = threading.Lock()
+
+
 def _notify_if_degraded(served_by: str) -> None:
     """Alert the operator (once per day) when ddgs serves despite paid
     providers being configured - otherwise quality degrades silently when
@@ -166,9 +229,11 @@ def _notify_if_degraded(served_by: str) -> None:
             return  # dev setup without keys - ddgs IS the intended provider
 
         dedupe_key = f"degraded-alert:{date.today().isoformat()}"
-        if db.kv_get(_SYSTEM_USER_ID, USAGE_NAMESPACE, dedupe_key):
-            return
-        db.kv_set(_SYSTEM_USER_ID, USAGE_NAMESPACE, dedupe_key, "1")
+        # Locked: the queries of one batch can all degrade at the same moment
+        with _degraded_alert_lock:
+            if db.kv_get(_SYSTEM_USER_ID, USAGE_NAMESPACE, dedupe_key):
+                return
+            db.kv_set(_SYSTEM_USER_ID, USAGE_NAMESPACE, dedupe_key, "1")
 
         exhausted = all(get_monthly_usage(p.name) >= (p.monthly_quota() or 0) for p in metered)
         reason = "quotas exhausted" if exhausted else "providers failing"
@@ -219,14 +284,13 @@ def _billed_search(provider: _Provider, query: str, num_results: int) -> list[di
 
 def _search_brave(query: str, num_results: int) -> list[dict[str, str]]:
     try:
-        response = httpx.get(
+        response = _http_client("brave").get(
             _BRAVE_ENDPOINT,
             params={"q": query, "count": num_results},
             headers={
                 "X-Subscription-Token": Config.BRAVE_SEARCH_API_KEY,
                 "Accept": "application/json",
             },
-            timeout=_HTTP_TIMEOUT_SECONDS,
         )
         if response.status_code == 429:
             raise SearchProviderError("Brave Search rate limited", retriable=True)
@@ -248,14 +312,13 @@ def _search_brave(query: str, num_results: int) -> list[dict[str, str]]:
 
 def _search_tavily(query: str, num_results: int) -> list[dict[str, str]]:
     try:
-        response = httpx.post(
+        response = _http_client("tavily").post(
             _TAVILY_ENDPOINT,
             json={"query": query, "max_results": num_results},
             headers={
                 "Authorization": f"Bearer {Config.TAVILY_API_KEY}",
                 "Content-Type": "application/json",
             },
-            timeout=_HTTP_TIMEOUT_SECONDS,
         )
         if response.status_code in (429, 432):  # 432 = Tavily plan limit
             raise SearchProviderError("Tavily rate/plan limited", retriable=True)
@@ -277,7 +340,7 @@ def _search_tavily(query: str, num_results: int) -> list[dict[str, str]]:
 
 def _search_exa(query: str, num_results: int) -> list[dict[str, str]]:
     try:
-        response = httpx.post(
+        response = _http_client("exa").post(
             _EXA_ENDPOINT,
             json={
                 "query": query,
@@ -289,7 +352,6 @@ def _search_exa(query: str, num_results: int) -> list[dict[str, str]]:
                 "x-api-key": Config.EXA_API_KEY,
                 "Content-Type": "application/json",
             },
-            timeout=_HTTP_TIMEOUT_SECONDS,
         )
         if response.status_code in (402, 429):  # 402 = out of credits
             raise SearchProviderError("Exa credits exhausted or rate limited", retriable=True)
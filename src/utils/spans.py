@@ -0,0 +1,109 @@
+"""Per-turn latency spans.
+
+A turn's duration_ms says how long the agent ran, not where the time went.
+A SpanRecorder collects named wall-clock spans for one chat turn (history
+load, prompt assembly, time to first token, each tool, save, title); its
+summary is stored with the turn's message_costs row and broken down by
+scripts/analyze_costs.py.
+
+The recorder travels in a contextvar, so instrumented code just wraps work in
+``with span("name"):``. Without an active recorder (TURN_SPANS_ENABLED off,
+or code running outside a chat turn) span() is one contextvar lookup.
+Threads don't inherit contextvars: the stream producer re-sets the recorder
+(stream_events), and LangChain's tool executor copies the context into each
+parallel tool call.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from src.config import Config
+
+
+class SpanRecorder:
+    """Accumulates named spans for one turn.
+
+    Repeated spans (one "llm" per tool round, two calls of the same tool) are
+    summed and counted. Thread-safe: parallel tool calls record concurrently.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._spans: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            entry = self._spans.setdefault(name, [0.0, 0])
+            entry[0] += elapsed_ms
+            entry[1] += 1
+
+    def mark(self, name: str) -> None:
+        """Record the time since the turn started; only the first mark counts."""
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        with self._lock:
+            self._spans.setdefault(name, [elapsed_ms, 1])
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started) * 1000)
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Compact form stored with the cost row: {name: {"ms": total, "n": count}}.
+
+        "turn" is the wall-clock from recorder creation until now. Spans can
+        nest or overlap (parallel tools), so they need not add up to it.
+        """
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        with self._lock:
+            spans = {name: {"ms": round(ms), "n": int(n)} for name, (ms, n) in self._spans.items()}
+        spans["turn"] = {"ms": round(elapsed_ms), "n": 1}
+        return spans
+
+
+_current_recorder: ContextVar[SpanRecorder | None] = ContextVar("span_recorder", default=None)
+
+
+def new_span_recorder() -> SpanRecorder | None:
+    """A recorder for a new chat turn, or None when span tracing is disabled."""
+    return SpanRecorder() if Config.TURN_SPANS_ENABLED else None
+
+
+def set_span_recorder(recorder: SpanRecorder | None) -> None:
+    """Make recorder the current turn's recorder (None to stop recording)."""
+    _current_recorder.set(recorder)
+
+
+def get_span_recorder() -> SpanRecorder | None:
+    return _current_recorder.get()
+
+
+@contextmanager
+def span(name: str, recorder: SpanRecorder | None = None) -> Iterator[None]:
+    """Time the block as span `name` of the current turn.
+
+    Args:
+        name: Span name (tool spans are "tool:<tool name>")
+        recorder: Record here instead of the current recorder (for code that
+            runs before the turn's context is set up)
+    """
+    active = recorder if recorder is not None else _current_recorder.get()
+    if active is None:
+        yield
+        return
+    with active.span(name):
+        yield
+
+
+def mark_span(name: str) -> None:
+    """Record the time since the turn started as span `name` (e.g. first_token)."""
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.mark(name)
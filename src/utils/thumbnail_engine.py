@@ -0,0 +1,213 @@
+"""Thumbnail rendering for stored images, off the request thread.
+
+Decoding and resizing a phone photo with Pillow holds the GIL for hundreds of
+milliseconds, which stalls token streaming for every other request in the web
+process. render_stored_thumbnails() therefore renders in a small process pool
+(THUMBNAIL_WORKER_PROCESSES per web process, started on first use):
+
+- The worker reads the image from files.db itself and writes the thumbnails
+  straight back as binary blobs - no image bytes or base64 cross the process
+  boundary.
+- One decode yields every size (THUMBNAIL_SIZES), rendered largest first so
+  each resize starts from the previous, smaller image. For JPEGs, draft()
+  lets libjpeg decode at 1/2, 1/4 or 1/8 scale when the largest size needs
+  no more pixels than that.
+
+A render gets THUMBNAIL_TIMEOUT_SECONDS from the moment a worker picks it up
+(see process_pool.py). One that runs out of time, or crashes its worker on
+both tries (e.g. a decompression bomb running out of memory), is reported as
+failed - retrying such an image in the web process would stall or crash it.
+Images caught in a pool another image broke are resubmitted once.
+THUMBNAIL_WORKER_PROCESSES=0 renders in the calling thread.
+
+This module imports nothing from the app beyond Config, logging, the blob
+store and the process pool, so pool processes start without loading the
+agent/tool stack.
+"""
+
+import io
+import math
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+from src.config import Config
+from src.db.blob_store import BlobStore, get_blob_store
+from src.utils.logging import get_logger
+from src.utils.process_pool import LazyProcessPool, TaskTimeoutError, WorkerCrashedError
+
+logger = get_logger(__name__)
+
+THUMBNAIL_SIDEBAR = "sidebar"
+THUMBNAIL_MESSAGE = "message"
+THUMBNAIL_PREVIEW = "preview"
+THUMBNAIL_SIZES = (THUMBNAIL_SIDEBAR, THUMBNAIL_MESSAGE, THUMBNAIL_PREVIEW)
+
+
+def thumbnail_boxes() -> dict[str, tuple[int, int]]:
+    """Bounding box (width, height) of each thumbnail size."""
+    return {
+        THUMBNAIL_SIDEBAR: (Config.THUMBNAIL_SIDEBAR_MAX_SIZE, Config.THUMBNAIL_SIDEBAR_MAX_SIZE),
+        THUMBNAIL_MESSAGE: Config.THUMBNAIL_MAX_SIZE,
+        THUMBNAIL_PREVIEW: (Config.THUMBNAIL_PREVIEW_MAX_SIZE, Config.THUMBNAIL_PREVIEW_MAX_SIZE),
+    }
+
+
+def _fitted_size(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    """Size of an image scaled down (never up) to fit in box, keeping aspect ratio."""
+    scale = min(box[0] / size[0], box[1] / size[1], 1.0)
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _encode(img: Image.Image, mime_type: str) -> tuple[bytes, str]:
+    """Encode a thumbnail in the source's format (JPEG for anything else)."""
+    output = io.BytesIO()
+    if mime_type == "image/png":
+        img.save(output, format="PNG", optimize=True)
+    elif mime_type == "image/gif":
+        img.save(output, format="GIF")
+    elif mime_type == "image/webp":
+        img.save(output, format="WEBP", quality=Config.THUMBNAIL_QUALITY)
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(output, format="JPEG", quality=Config.THUMBNAIL_QUALITY, optimize=True)
+        mime_type = "image/jpeg"
+    return output.getvalue(), mime_type
+
+
+def render_thumbnails(
+    image_data: bytes | memoryview, mime_type: str, boxes: dict[str, tuple[int, int]]
+) -> dict[str, tuple[bytes, str]]:
+    """Render several thumbnail sizes of an image from a single decode.
+
+    The preview size is only rendered for images larger than its box - for
+    smaller ones the original already serves as the preview.
+
+    Args:
+        image_data: Encoded image bytes
+        mime_type: MIME type of the image (also the thumbnails' format)
+        boxes: Bounding box (width, height) per size name
+
+    Returns:
+        Dict of size name -> (thumbnail bytes, MIME type)
+
+    Raises:
+        UnidentifiedImageError, OSError, Image.DecompressionBombError: If the
+            image can't be decoded
+    """
+    img: Image.Image = Image.open(io.BytesIO(image_data))
+    boxes = {
+        name: box
+        for name, box in boxes.items()
+        if name != THUMBNAIL_PREVIEW or _fitted_size(img.size, box) != img.size
+    }
+    if not boxes:
+        return {}
+
+    # Largest target first: each later resize starts from the smaller image
+    targets = sorted(
+        ((name, _fitted_size(img.size, box)) for name, box in boxes.items()),
+        key=lambda target: target[1][0] * target[1][1],
+        reverse=True,
+    )
+    # JPEG only: decode at the smallest DCT scale that still covers the
+    # largest target (a no-op for other formats)
+    img.draft(None, targets[0][1])
+
+    # Convert RGBA/palette images to RGB on white for JPEG output
+    if mime_type == "image/jpeg" and img.mode in ("RGBA", "LA", "P"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        background.paste(img, mask=img.split()[-1])
+        img = background
+
+    # Configurable resampling (BILINEAR is faster, LANCZOS is higher quality)
+    resampling = getattr(Image.Resampling, Config.THUMBNAIL_RESAMPLING, Image.Resampling.BILINEAR)
+    rendered: dict[str, tuple[bytes, str]] = {}
+    for name, _ in targets:
+        img.thumbnail(boxes[name], resampling)
+        rendered[name] = _encode(img, mime_type)
+    return rendered
+
+
+def _render_into(
+    store: BlobStore, source_key: str, mime_type: str, targets: dict[str, str]
+) -> list[str] | None:
+    """Render a stored image and save its thumbnails; returns the sizes saved."""
+    stored = store.get(source_key)
+    if stored is None:
+        logger.warning("Image for thumbnails not in blob store", extra={"key": source_key})
+        return None
+    boxes = thumbnail_boxes()
+    try:
+        rendered = render_thumbnails(stored[0], mime_type, {name: boxes[name] for name in targets})
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        logger.error(
+            "Error generating thumbnails",
+            extra={"key": source_key, "mime_type": mime_type, "error": str(e)},
+        )
+        return None
+    for name, (data, thumb_mime) in rendered.items():
+        store.save(targets[name], data, thumb_mime)
+    return list(rendered)
+
+
+# ============ Process pool ============
+
+_pool = LazyProcessPool("thumbnails", lambda: Config.THUMBNAIL_WORKER_PROCESSES)
+# Per worker process: blob store opened on the first task
+_worker_store: BlobStore | None = None
+
+
+def _render_in_worker(
+    db_path: str, source_key: str, mime_type: str, targets: dict[str, str]
+) -> list[str] | None:
+    global _worker_store
+    if _worker_store is None or str(_worker_store.db_path) != db_path:
+        _worker_store = BlobStore(Path(db_path))
+    return _render_into(_worker_store, source_key, mime_type, targets)
+
+
+def shutdown_pool() -> None:
+    _pool.shutdown()
+
+
+def render_stored_thumbnails(
+    source_key: str, mime_type: str, targets: dict[str, str]
+) -> list[str] | None:
+    """Render thumbnails of a stored image into the blob store.
+
+    Args:
+        source_key: Blob key of the image
+        mime_type: MIME type of the image
+        targets: Blob key to save each size under, by size name
+
+    Returns:
+        Names of the sizes saved (the preview is skipped for small images),
+        or None if the image is missing or couldn't be rendered
+    """
+    store = get_blob_store()
+    if Config.THUMBNAIL_WORKER_PROCESSES <= 0:
+        return _render_into(store, source_key, mime_type, targets)
+
+    timeout = Config.THUMBNAIL_TIMEOUT_SECONDS
+    # Renders come from THUMBNAIL_WORKER_THREADS threads: an image is picked
+    # up within this many rounds, plus its own
+    rounds = math.ceil(Config.THUMBNAIL_WORKER_THREADS / Config.THUMBNAIL_WORKER_PROCESSES) + 1
+    try:
+        sizes: list[str] | None = _pool.run(
+            _render_in_worker,
+            str(store.db_path),
+            source_key,
+            mime_type,
+            targets,
+            timeout=timeout,
+            backstop=rounds * timeout + 1,
+            log_extra={"key": source_key},
+        )
+        return sizes
+    except (TaskTimeoutError, WorkerCrashedError):
+        logger.warning("Thumbnail rendering failed in pool", extra={"key": source_key})
+        return None
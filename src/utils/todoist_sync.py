@@ -0,0 +1,153 @@
+"""Local Todoist mirror kept current through Sync API deltas.
+
+Every planner dashboard build and todoist tool listing used to re-download all
+tasks (plus every section and project, just to name them). Instead, each
+user's active tasks ("items"), projects and sections are mirrored in the
+database (src/db/models/todoist.py) and refreshed with the Sync API's
+incremental sync: the stored sync_token makes Todoist return only what
+changed since the last sync (the first sync is a full one).
+
+- Reads sync at most once per TODOIST_SYNC_MIN_INTERVAL_SECONDS, then query
+  the mirror. The dashboard's refresh button forces a sync.
+- Writes still go through the REST API; the caller patches the mirror with
+  the returned object. Writes with side effects Todoist applies server-side
+  (completing a recurring task, deleting a project with its tasks) mark the
+  mirror stale, so the next read pulls the delta.
+- Todoist filter queries ("today & p1", "@label") are evaluated by Todoist,
+  so filtered listings still call /tasks/filter; the mirror only supplies
+  the project and section names.
+"""
+
+import json
+import threading
+from datetime import timedelta
+from typing import Any
+
+import requests
+
+from src.config import Config
+from src.utils.datetime_utils import utcnow_naive
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Sync API resource type -> mirror kind
+_RESOURCE_KINDS = {"items": "item", "projects": "project", "sections": "section"}
+# sync_token requesting a full sync
+_FULL_SYNC = "*"
+
+_user_locks: dict[str, threading.Lock] = {}
+_user_locks_guard = threading.Lock()
+
+
+class TodoistSyncError(Exception):
+    """Raised when a Sync API request fails."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def auth_expired(self) -> bool:
+        return self.status_code in (401, 403, 410)
+
+
+def _user_lock(user_id: str) -> threading.Lock:
+    with _user_locks_guard:
+        return _user_locks.setdefault(user_id, threading.Lock())
+
+
+def _request_sync(token: str, sync_token: str) -> dict[str, Any]:
+    """POST a read-only sync request for the mirrored resource types."""
+    try:
+        response = requests.post(
+            f"{Config.TODOIST_API_BASE_URL}/sync",
+            headers={"Authorization": f"Bearer {token}"},
+            data={"sync_token": sync_token, "resource_types": json.dumps(list(_RESOURCE_KINDS))},
+            timeout=Config.TODOIST_API_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        raise TodoistSyncError(f"Failed to connect to Todoist: {e}") from e
+
+    if response.status_code >= 400:
+        logger.warning(
+            "Todoist Sync API error",
+            extra={"status_code": response.status_code, "error": response.text},
+        )
+        raise TodoistSyncError(
+            f"Todoist Sync API error ({response.status_code})", response.status_code
+        )
+    result: dict[str, Any] = response.json()
+    return result
+
+
+class TodoistMirror:
+    """Read and patch access to one user's synced mirror."""
+
+    def __init__(self, db: Any, user_id: str) -> None:
+        self.db = db
+        self.user_id = user_id
+
+    def tasks(self, project_id: str | None = None) -> list[dict[str, Any]]:
+        """Active tasks, in Todoist's order within their parent."""
+        tasks = self.db.list_todoist_objects(self.user_id, "item", project_id)
+        return sorted(tasks, key=lambda t: t.get("child_order", 0))
+
+    def projects(self) -> list[dict[str, Any]]:
+        projects = self.db.list_todoist_objects(self.user_id, "project")
+        return sorted(projects, key=lambda p: p.get("child_order", 0))
+
+    def sections(self, project_id: str | None = None) -> list[dict[str, Any]]:
+        return list(self.db.list_todoist_objects(self.user_id, "section", project_id))
+
+    def get(self, kind: str, object_id: str) -> dict[str, Any] | None:
+        result: dict[str, Any] | None = self.db.get_todoist_object(self.user_id, kind, object_id)
+        return result
+
+    def project_names(self) -> dict[str, str]:
+        return {p["id"]: p["name"] for p in self.projects() if p.get("name")}
+
+    def section_names(self) -> dict[str, str]:
+        return {s["id"]: s["name"] for s in self.sections() if s.get("name")}
+
+    def save(self, kind: str, obj: Any) -> None:
+        """Patch in an object returned by a REST write (ignored if not an object)."""
+        if isinstance(obj, dict) and obj.get("id"):
+            self.db.save_todoist_objects(self.user_id, kind, [obj])
+
+    def remove(self, kind: str, object_id: str) -> None:
+        self.db.delete_todoist_object(self.user_id, kind, object_id)
+
+    def mark_stale(self) -> None:
+        self.db.mark_todoist_mirror_stale(self.user_id)
+
+
+def sync_todoist_mirror(db: Any, user_id: str, token: str, force: bool = False) -> TodoistMirror:
+    """Bring a user's mirror up to date and return it.
+
+    Skips the request when the mirror synced within
+    TODOIST_SYNC_MIN_INTERVAL_SECONDS, unless force is set.
+
+    Raises:
+        TodoistSyncError: If the Sync API request fails
+    """
+    with _user_lock(user_id):
+        state = db.get_todoist_sync_state(user_id)
+        if state and not force:
+            age = utcnow_naive() - state[1]
+            if age < timedelta(seconds=Config.TODOIST_SYNC_MIN_INTERVAL_SECONDS):
+                return TodoistMirror(db, user_id)
+
+        sync_token = state[0] if state else _FULL_SYNC
+        response = _request_sync(token, sync_token)
+        changes = {
+            kind: response.get(resource_type) or []
+            for resource_type, kind in _RESOURCE_KINDS.items()
+        }
+        db.apply_todoist_sync(
+            user_id,
+            response["sync_token"],
+            changes,
+            full_sync=bool(response.get("full_sync", sync_token == _FULL_SYNC)),
+        )
+    return TodoistMirror(db, user_id)
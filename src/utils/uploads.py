@@ -0,0 +1,136 @@
+"""Streamed attachment uploads (POST /api/uploads).
+
+A chat request can carry attachments as base64 in its JSON body, which
+holds the body, the base64 string and the decoded bytes (validate_files'
+Attachment) in memory at once - several hundred MB for a 100 MB video.
+Instead, the client can upload a file as multipart/form-data first:
+
+1. Werkzeug spools the part to a temporary file (in memory only up to
+   500 KB), so the request body is never held whole.
+2. store_upload() sniffs the first MAGIC_SNIFF_BYTES with libmagic, then copies the
+   spool into files.db in chunks (BlobStore.save_stream) under
+   "uploads/{user_id}/{upload_id}".
+3. The chat request references the file by upload_id. resolve_uploads() checks
+   it exists for this user; add_message() renames the blob to the message's
+   file key (no copy), and load_uploaded_files() inlines only what is sent
+   to the LLM inline anyway. Videos and large images/PDFs go to the Gemini
+   Files API straight from the blob (attach_gemini_file_uris).
+
+Uploads no message referenced are deleted by the retention sweep after
+UPLOAD_RETENTION_HOURS.
+"""
+
+import base64
+import uuid
+from typing import IO, Any
+
+from src.agent.gemini_files import uses_files_api
+from src.config import Config
+from src.db.blob_store import get_blob_store
+from src.db.models import make_blob_key
+from src.utils.files import MAGIC_SNIFF_BYTES, max_size_for_mime, verify_file_type_by_magic
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+UPLOAD_KEY_PREFIX = "uploads/"
+
+
+class UploadError(Exception):
+    """Raised when an uploaded file is rejected."""
+
+
+def make_upload_key(user_id: str, upload_id: str) -> str:
+    """Create blob key for a pending upload."""
+    return f"{UPLOAD_KEY_PREFIX}{user_id}/{upload_id}"
+
+
+def store_upload(user_id: str, stream: IO[bytes], name: str, mime_type: str) -> dict[str, Any]:
+    """Validate a spooled upload and copy it into the blob store.
+
+    Args:
+        user_id: Owner of the upload (part of the blob key)
+        stream: Seekable binary file object holding the upload
+        name: Client file name
+        mime_type: Client-claimed MIME type
+
+    Returns:
+        Dict with upload_id, name, type and size
+
+    Raises:
+        UploadError: If the type, size or content is not acceptable
+    """
+    if mime_type not in Config.ALLOWED_FILE_TYPES:
+        raise UploadError(f"File type '{mime_type}' is not allowed")
+
+    size = stream.seek(0, 2)
+    max_size = max_size_for_mime(mime_type)
+    if size > max_size:
+        raise UploadError(f"File '{name}' exceeds {max_size / (1024 * 1024):.0f}MB limit")
+
+    stream.seek(0)
+    is_valid, error = verify_file_type_by_magic(stream.read(MAGIC_SNIFF_BYTES), mime_type, name)
+    if not is_valid:
+        raise UploadError(error)
+
+    upload_id = str(uuid.uuid4())
+    stream.seek(0)
+    get_blob_store().save_stream(make_upload_key(user_id, upload_id), stream, size, mime_type)
+    logger.info(
+        "Upload stored",
+        extra={"user_id": user_id, "upload_id": upload_id, "mime_type": mime_type, "size": size},
+    )
+    return {"upload_id": upload_id, "name": name, "type": mime_type, "size": size}
+
+
+def resolve_uploads(user_id: str, files: list[dict[str, Any]]) -> tuple[bool, str]:
+    """Point upload_id attachments at their stored blobs.
+
+    Sets "upload_key" and "size" on each file that has an upload_id (the type
+    is taken from the stored upload, which was sniffed). Other files are left
+    for validate_files().
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    blob_store = get_blob_store()
+    for file in files:
+        upload_id = file.get("upload_id")
+        if not upload_id:
+            continue
+        key = make_upload_key(user_id, upload_id)
+        info = blob_store.get_info(key)
+        if info is None:
+            logger.warning(
+                "Referenced upload not found",
+                extra={"user_id": user_id, "upload_id": upload_id},
+            )
+            return False, f"Upload for '{file.get('name', 'file')}' not found or expired"
+        file["upload_key"] = key
+        file["size"], file["type"] = info
+    return True, ""
+
+
+def load_uploaded_files(message_id: str, files: list[dict[str, Any]]) -> None:
+    """Prepare saved upload attachments for the agent, in place.
+
+    Call after add_message() has moved the blobs to the message's keys.
+    Files the LLM receives inline (text, small images/PDFs) get base64 "data"
+    like a JSON upload; Files API candidates stay as references and are
+    streamed from the blob store by attach_gemini_file_uris().
+    """
+    blob_store = get_blob_store()
+    for idx, file in enumerate(files):
+        if file.pop("upload_key", None) is None:
+            continue
+        file.pop("upload_id", None)
+        if uses_files_api(file.get("type", ""), file.get("size", 0)):
+            continue
+        stored = blob_store.get(make_blob_key(message_id, idx))
+        if stored is None:
+            logger.warning(
+                "Saved upload missing from blob store",
+                extra={"message_id": message_id, "file_index": idx},
+            )
+            continue
+        file["data"] = base64.b64encode(stored[0]).decode("utf-8")
@@ -0,0 +1,177 @@
+"""Per-worker in-memory vector index for semantic recall.
+
+Each (database, user_id, kind) gets one contiguous float32 matrix of
+pre-normalized vectors, so a query is a single matrix-vector product plus
+argpartition instead of unpacking and scoring every stored blob in Python.
+
+Indexes are built from the embeddings table on first use and patched in
+place by the embeddings mixin's own writes. Writes from other processes
+(other gunicorn workers, the agent scheduler, the backfill script) are
+detected by a (count, newest created_at) signature the mixin checks before
+every query - a mismatch reloads the index from the table.
+
+Memory cost is dim * 4 bytes per vector per worker (3 KB at 768 dims).
+"""
+
+import threading
+from collections.abc import Collection, Iterable
+
+import numpy as np
+
+# (row count, newest created_at) of a user's embeddings of one kind
+Signature = tuple[int, str | None]
+
+_MIN_CAPACITY = 64
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; zero rows stay zero (cosine 0.0)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized: np.ndarray = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return normalized
+
+
+class VectorIndex:
+    """Pre-normalized float32 vectors of one dimension, keyed by ref_id.
+
+    Not thread-safe on its own: callers hold ``lock`` around every call.
+    """
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+        self.lock = threading.Lock()
+        # None until loaded (or after a write whose effect on the table is unknown)
+        self.signature: Signature | None = None
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        # Rows stored with another dimension (model change mid re-embed). They
+        # are never returned - cosine across dimensions is 0.0 - but they count
+        # toward the table signature.
+        self._other_dim: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, ref_id: object) -> bool:
+        return ref_id in self._positions or ref_id in self._other_dim
+
+    def load(self, rows: Iterable[tuple[str, int, bytes]], signature: Signature) -> None:
+        """Replace the contents with (ref_id, dim, vector) rows from the table."""
+        ids: list[str] = []
+        blobs: list[bytes] = []
+        other_dim: set[str] = set()
+        row_bytes = self.dim * 4
+        for ref_id, _dim, blob in rows:
+            if len(blob) == row_bytes:
+                ids.append(ref_id)
+                blobs.append(blob)
+            else:
+                other_dim.add(ref_id)
+
+        matrix = np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(ids), self.dim)
+        self._matrix = _normalized(matrix)
+        self._ids = ids
+        self._positions = {ref_id: i for i, ref_id in enumerate(ids)}
+        self._other_dim = other_dim
+        self.signature = signature
+
+    def upsert(self, ref_id: str, blob: bytes) -> None:
+        """Insert or replace one packed float32 vector."""
+        if len(blob) != self.dim * 4:
+            self.remove(ref_id)
+            self._other_dim.add(ref_id)
+            return
+        self._other_dim.discard(ref_id)
+
+        row = _normalized(np.frombuffer(blob, dtype="<f4").reshape(1, self.dim))
+        position = self._positions.get(ref_id)
+        if position is None:
+            position = len(self._ids)
+            if position == self._matrix.shape[0]:
+                grown = np.zeros((max(_MIN_CAPACITY, 2 * position), self.dim), dtype=np.float32)
+                grown[:position] = self._matrix
+                self._matrix = grown
+            self._ids.append(ref_id)
+            self._positions[ref_id] = position
+        self._matrix[position] = row[0]
+
+    def remove(self, ref_id: str) -> None:
+        """Drop one vector (no-op if absent); the last row fills the gap."""
+        self._other_dim.discard(ref_id)
+        position = self._positions.pop(ref_id, None)
+        if position is None:
+            return
+        last = len(self._ids) - 1
+        if position != last:
+            moved = self._ids[last]
+            self._matrix[position] = self._matrix[last]
+            self._ids[position] = moved
+            self._positions[moved] = position
+        self._ids.pop()
+
+    def top_k(
+        self,
+        query_vec: list[float],
+        k: int,
+        ref_ids: Collection[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Best k (ref_id, cosine similarity) pairs, best first.
+
+        Args:
+            query_vec: Query embedding; a different dimension matches nothing
+            k: Maximum number of results
+            ref_ids: Optional allow-list; other vectors are not ranked
+        """
+        if k <= 0 or not self._ids or len(query_vec) != self.dim:
+            return []
+        query = np.asarray(query_vec, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+
+        if ref_ids is None:
+            rows = np.arange(len(self._ids))
+            scores = self._matrix[: len(self._ids)] @ (query / norm)
+        else:
+            rows = np.array(
+                sorted(self._positions[r] for r in ref_ids if r in self._positions),
+                dtype=np.intp,
+            )
+            if not len(rows):
+                return []
+            scores = self._matrix[rows] @ (query / norm)
+
+        if k < len(scores):
+            # argpartition leaves the winners unordered; sorting them by position
+            # first keeps ties in table order, like a stable sort over all rows
+            best = np.sort(np.argpartition(-scores, k - 1)[:k])
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self._ids[rows[i]], float(scores[i])) for i in best]
+
+
+_indexes: dict[tuple[str, str, str], VectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(scope: str, user_id: str, kind: str, dim: int) -> VectorIndex:
+    """The index for (scope, user_id, kind), created (unloaded) on first use.
+
+    ``scope`` identifies the database (its path), so test databases and the
+    global one never share vectors. A different ``dim`` replaces the index.
+    """
+    key = (scope, user_id, kind)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None or index.dim != dim:
+            index = VectorIndex(dim)
+            _indexes[key] = index
+        return index
+
+
+def peek_index(scope: str, user_id: str, kind: str) -> VectorIndex | None:
+    """The index for (scope, user_id, kind) if one was ever queried."""
+    with _indexes_lock:
+        return _indexes.get((scope, user_id, kind))
@@ -24,6 +24,14 @@ os.environ["ALLOWED_EMAILS"] = "test@example.com,allowed@example.com"
 # The db.add_message embedding hook must never call the live embedding API
 # from tests; hook tests opt back in via monkeypatch on Config.
 os.environ["EMBEDDINGS_ENABLED"] = "false"
+# fetch_url tests mock httpx per test; a persistent HTTP cache would serve
+# one test's response to the next. Cache tests build their own HTTPCache.
+os.environ["HTTP_CACHE_ENABLED"] = "false"
+# Keep HTML extraction in-thread (no process pool per test session); pool
+# tests opt back in via Config.
+os.environ["HTML_EXTRACT_WORKERS"] = "0"
+# Same for thumbnail rendering
+os.environ["THUMBNAIL_WORKER_PROCESSES"] = "0"
 
 
 # -----------------------------------------------------------------------------
@@ -54,6 +62,24 @@ def cleanup_global_connections() -> Generator[None]:
         blob_store_module._blob_store = None
 
 
+@pytest.fixture(autouse=True)
+def clear_compiled_graphs() -> Generator[None]:
+    """Drop cached compiled chat graphs and tool results around each test.
+
+    Tests patch the chat model class, tool list or config per test; a graph
+    compiled (or a tool result produced) under one test's mocks must never be
+    served to the next.
+    """
+    from src.agent.graph import clear_graph_cache
+    from src.agent.tool_cache import get_tool_cache
+
+    clear_graph_cache()
+    get_tool_cache().clear()
+    yield
+    clear_graph_cache()
+    get_tool_cache().clear()
+
+
 # -----------------------------------------------------------------------------
 # Database fixtures
 # -----------------------------------------------------------------------------
@@ -417,7 +417,7 @@ def create_mock_stream_chat_events() -> Any:
         # Optionally yield a thinking event (based on mock config or message content)
         if "think" in message.lower() or MOCK_CONFIG.get("emit_thinking"):
             time.sleep(delay_s)
-            yield {"type": "thinking", "text": "Let me think about this..."}
+            yield {"type": "thinking", "text": "Let me think about this...", "offset": 0}
 
         # Optionally yield tool events (if force_tools specified)
         if force_tools:
@@ -0,0 +1,153 @@
+"""Integration tests for the chat stream routes served by the ASGI front."""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from src.api.schemas import MessageRole
+from src.asgi import StreamFront
+from src.config import Config
+
+if TYPE_CHECKING:
+    from src.db.models import Conversation, Database
+
+
+def _request(
+    app: Flask,
+    method: str,
+    path: str,
+    headers: dict[str, str],
+    body: bytes = b"",
+    query: bytes = b"",
+) -> tuple[int, list[dict[str, Any]]]:
+    """Run one request through the front; returns status and SSE events."""
+    sent: list[dict[str, Any]] = []
+    delivered = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}  # pragma: no cover
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 5000),
+    }
+    asyncio.run(StreamFront(app)(scope, receive, send))
+
+    text = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in text.decode().split("\n\n")
+        if line.startswith("data: ")
+    ]
+    return sent[0]["status"], events
+
+
+class TestAsgiChatStream:
+    def test_streams_and_saves_turn(
+        self,
+        app: Flask,
+        auth_headers: dict[str, str],
+        test_conversation: "Conversation",
+        test_database: "Database",
+    ) -> None:
+        # First exchange: the title is generated after the done event
+        test_database.update_conversation(
+            test_conversation.id, test_conversation.user_id, title=Config.DEFAULT_CONVERSATION_TITLE
+        )
+        with (
+            patch("src.api.helpers.chat_streaming.ChatAgent") as mock_agent_class,
+            patch("src.api.helpers.chat_save.generate_title", return_value="👋 Greeting"),
+        ):
+            mock_agent = MagicMock()
+
+            def mock_stream_events(*args: Any, **kwargs: Any) -> Any:
+                yield {"type": "token", "text": "Hello"}
+                yield {"type": "token", "text": " world"}
+                yield {
+                    "type": "final",
+                    "content": "Hello world",
+                    "result_messages": [],
+                    "tool_results": [],
+                    "usage_info": {"input_tokens": 50, "output_tokens": 10},
+                }
+
+            mock_agent.stream_chat_events = mock_stream_events
+            mock_agent_class.return_value = mock_agent
+
+            status, events = _request(
+                app,
+                "POST",
+                f"/api/conversations/{test_conversation.id}/chat/stream",
+                {**auth_headers, "Content-Type": "application/json"},
+                json.dumps({"message": "Hello"}).encode(),
+            )
+
+        assert status == 200
+        types = [e["type"] for e in events]
+        # The title follows done, from the post-commit pipeline
+        assert types == ["user_message_saved", "token", "token", "done", "title_updated"]
+        assistant_id = events[0]["expected_assistant_message_id"]
+        assert events[3]["id"] == assistant_id
+        assert "title" not in events[3]
+        assert events[4]["title"] == "👋 Greeting"
+        assert events[4]["message_id"] == assistant_id
+        saved = test_database.get_message_by_id(assistant_id)
+        assert saved is not None
+        assert saved.content == "Hello world"
+
+    def test_auth_still_enforced(self, app: Flask, test_conversation: "Conversation") -> None:
+        status, _ = _request(
+            app,
+            "POST",
+            f"/api/conversations/{test_conversation.id}/chat/stream",
+            {"Content-Type": "application/json"},
+            b'{"message": "Hello"}',
+        )
+        assert status == 401
+
+
+class TestAsgiChatStreamResume:
+    def test_replays_journal_and_finishes(
+        self,
+        app: Flask,
+        auth_headers: dict[str, str],
+        test_conversation: "Conversation",
+        test_database: "Database",
+    ) -> None:
+        msg = test_database.add_message(test_conversation.id, MessageRole.ASSISTANT, "done text")
+        test_database.journal_append_events(
+            msg.id,
+            [
+                (1, json.dumps({"type": "token", "text": "done ", "seq": 1})),
+                (2, json.dumps({"type": "token", "text": "text", "seq": 2})),
+                (3, json.dumps({"type": "stream_end", "seq": 3})),
+            ],
+        )
+
+        status, events = _request(
+            app,
+            "GET",
+            f"/api/conversations/{test_conversation.id}/chat/stream/{msg.id}/resume",
+            auth_headers,
+            query=b"after_seq=1",
+        )
+
+        assert status == 200
+        assert [e["type"] for e in events] == ["token", "done"]
+        assert events[-1]["content"] == "done text"
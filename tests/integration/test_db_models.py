@@ -889,6 +889,23 @@ class TestTurnMetricsColumns:
             ).fetchone()
         assert (row[0], row[1], row[2]) == (None, 0, None)
 
+    def test_spans_stored_as_json(self, test_database, test_user) -> None:
+        conv = test_database.create_conversation(test_user.id, "t3", model="gemini-3.7-flash")
+        msg = test_database.add_message(conv.id, "assistant", "hello")
+        spans = {"llm": {"ms": 900, "n": 2}, "tool:web_search": {"ms": 300, "n": 1}}
+
+        test_database.save_message_cost(
+            msg.id, conv.id, test_user.id, "gemini-3.7-flash", 100, 50, 0.001, spans=spans
+        )
+
+        with test_database._pool.get_connection() as conn:
+            row = conn.execute(
+                """SELECT json_extract(spans, '$."tool:web_search".ms')
+                   FROM message_costs WHERE message_id = ?""",
+                (msg.id,),
+            ).fetchone()
+        assert row[0] == 300
+
 
 class TestGetUserByEmail:
     def test_returns_existing_user(self, test_database, test_user) -> None:
@@ -945,3 +962,94 @@ class TestDeleteMessagesAfter:
         )
         assert deleted == 0
         assert len(test_database.get_messages(test_conversation.id)) == 4
+
+
+class TestConversationMessageStats:
+    """message_count / last_message_preview kept on conversations (migration 0053)."""
+
+    def _stats(self, test_database, conv_id: str) -> tuple[int, str | None]:
+        result = test_database.get_conversation_with_message_count(conv_id)
+        assert result is not None
+        listed = test_database.list_conversations_with_message_count(result[0].user_id)
+        _, _, preview = next(r for r in listed if r[0].id == conv_id)
+        return result[1], preview
+
+    def test_add_and_update_message(self, test_database, test_conversation) -> None:
+        test_database.add_message(test_conversation.id, "user", "**Plan** the trip")
+        placeholder = test_database.add_message(test_conversation.id, "assistant", "")
+
+        assert self._stats(test_database, test_conversation.id) == (2, None)
+
+        test_database.update_message_content(placeholder.id, "Here is the plan")
+
+        assert self._stats(test_database, test_conversation.id) == (2, "Here is the plan")
+
+    def test_deletes_and_truncation(self, test_database, test_conversation, test_user) -> None:
+        first = test_database.add_message(test_conversation.id, "user", "q1")
+        second = test_database.add_message(test_conversation.id, "assistant", "a1")
+        test_database.add_message(test_conversation.id, "user", "q2")
+        test_database.add_message(test_conversation.id, "assistant", "a2")
+
+        test_database.delete_messages_after(
+            test_conversation.id, test_user.id, second.id, inclusive=False
+        )
+        assert self._stats(test_database, test_conversation.id) == (2, "a1")
+
+        test_database.delete_message_by_id(second.id)
+        assert self._stats(test_database, test_conversation.id) == (1, "q1")
+
+        test_database.delete_message(first.id, test_user.id)
+        assert self._stats(test_database, test_conversation.id) == (0, None)
+
+    def test_listings_match_message_table(self, test_database, test_user) -> None:
+        conv = test_database.create_conversation(test_user.id, "Chat")
+        for i in range(3):
+            test_database.add_message(conv.id, "user", f"message {i}")
+
+        page, _, _, _ = test_database.list_conversations_paginated_with_counts(test_user.id)
+
+        assert [(c.id, count, preview) for c, count, preview in page] == [(conv.id, 3, "message 2")]
+        assert test_database.count_messages(conv.id) == 3
+
+
+class TestGroupCommitWrites:
+    """Background writes through the optional group-commit writer."""
+
+    @pytest.fixture
+    def queued_database(self, test_db_path):
+        from unittest.mock import patch
+
+        from src.db.models import Database
+
+        with patch("src.db.models.base.Config.DB_WRITE_BEHIND_ENABLED", True):
+            database = Database(db_path=test_db_path)
+        yield database
+        database.close()
+
+    def test_background_writes_land_after_flush(self, queued_database, test_user) -> None:
+        conv = queued_database.create_conversation(test_user.id, "t", model="gemini-3.7-flash")
+        msg = queued_database.add_message(conv.id, "assistant", "hello")
+
+        queued_database.save_message_cost(
+            msg.id, conv.id, test_user.id, "gemini-3.7-flash", 100, 50, 0.001
+        )
+        committed = queued_database.journal_append_events(msg.id, [(1, "a"), (2, "b")])
+        queued_database.flush_writes(timeout=5)
+
+        assert committed.done()
+        assert queued_database.get_message_cost(msg.id) is not None
+        assert queued_database.journal_get_events(msg.id, 0) == [(1, "a"), (2, "b")]
+        stats = queued_database.write_queue_stats()
+        assert stats is not None
+        assert stats["writes"] >= 2
+        assert stats["queue_depth"] == 0
+
+    def test_awaited_writes_return_their_result(self, queued_database) -> None:
+        queued_database.journal_append_events("msg-old", [(1, "a")])
+        queued_database.flush_writes(timeout=5)
+
+        assert queued_database.journal_cleanup(max_age_seconds=-1) == 1
+
+    def test_writer_disabled_by_default(self, test_database) -> None:
+        assert test_database.write_queue_stats() is None
+        assert test_database.journal_append_events("msg-1", [(1, "a")]).done()
@@ -1,11 +1,18 @@
 """Integration tests for file/thumbnail serving routes (T2 leftovers)."""
 
 import base64
+import io
+import uuid
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 from flask.testing import FlaskClient
 
 from src.api.schemas import MessageRole
-from src.db.models import Database, User
+from src.db.blob_store import BlobStore
+from src.db.models import Conversation, Database, User
+from src.utils.uploads import make_upload_key
 
 # 1x1 transparent PNG
 _PNG_BYTES = base64.b64decode(
@@ -83,6 +90,106 @@ class TestGetMessageFile:
     def test_requires_auth(self, client: FlaskClient) -> None:
         assert client.get("/api/messages/msg-1/files/0").status_code == 401
 
+    def test_full_response_advertises_ranges_and_etag(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+
+        response = client.get(f"/api/messages/{message_id}/files/0", headers=auth_headers)
+
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.headers["ETag"].strip('"').endswith(f":{len(_PNG_BYTES)}")
+        assert response.content_length == len(_PNG_BYTES)
+
+    def test_range_returns_partial_content(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+
+        response = client.get(
+            f"/api/messages/{message_id}/files/0",
+            headers={**auth_headers, "Range": "bytes=8-15"},
+        )
+
+        assert response.status_code == 206
+        assert response.data == _PNG_BYTES[8:16]
+        assert response.headers["Content-Range"] == f"bytes 8-15/{len(_PNG_BYTES)}"
+
+    def test_suffix_range(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+
+        response = client.get(
+            f"/api/messages/{message_id}/files/0",
+            headers={**auth_headers, "Range": "bytes=-12"},
+        )
+
+        assert response.status_code == 206
+        assert response.data == _PNG_BYTES[-12:]
+
+    def test_unsatisfiable_range_is_416(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+
+        response = client.get(
+            f"/api/messages/{message_id}/files/0",
+            headers={**auth_headers, "Range": "bytes=10000-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == f"bytes */{len(_PNG_BYTES)}"
+
+    def test_matching_etag_is_304(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+        url = f"/api/messages/{message_id}/files/0"
+        etag = client.get(url, headers=auth_headers).headers["ETag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_stale_if_range_returns_full_file(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_database: Database,
+    ) -> None:
+        message_id = _message_with_image(test_database, test_user)
+
+        response = client.get(
+            f"/api/messages/{message_id}/files/0",
+            headers={**auth_headers, "Range": "bytes=0-3", "If-Range": '"stale"'},
+        )
+
+        assert response.status_code == 200
+        assert response.data == _PNG_BYTES
+
 
 class TestGetMessageThumbnail:
     def test_ready_image_returns_binary(
@@ -254,3 +361,94 @@ class TestExpiredMediaGone:
         )
         resp = client.get(f"/api/messages/{message.id}/files/0", headers=auth_headers)
         assert resp.status_code == 200
+
+
+class TestUploads:
+    """POST /api/uploads streams a file into the blob store for a chat request."""
+
+    _MP4_BYTES = (Path(__file__).parent.parent / "fixtures" / "tiny.mp4").read_bytes()
+
+    def _upload(
+        self, client: FlaskClient, auth_headers: dict[str, str], data: bytes, name: str, mime: str
+    ) -> Any:
+        return client.post(
+            "/api/uploads",
+            headers=auth_headers,
+            data={"file": (io.BytesIO(data), name, mime)},
+            content_type="multipart/form-data",
+        )
+
+    def test_upload_is_referenced_by_chat(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_user: User,
+        test_conversation: Conversation,
+        test_blob_store: BlobStore,
+    ) -> None:
+        response = self._upload(client, auth_headers, self._MP4_BYTES, "clip.mp4", "video/mp4")
+        assert response.status_code == 201
+        upload = response.get_json()
+        assert upload["size"] == len(self._MP4_BYTES)
+        upload_key = make_upload_key(test_user.id, upload["upload_id"])
+        assert test_blob_store.exists(upload_key)
+
+        attached: dict[str, Any] = {}
+        with (
+            patch("src.api.routes.chat.ChatAgent") as mock_agent_class,
+            patch(
+                "src.api.routes.chat.attach_gemini_file_uris",
+                side_effect=lambda message_id, files: attached.update(files=files),
+            ),
+        ):
+            mock_agent = MagicMock()
+            mock_agent.chat_batch.return_value = ("A test pattern.", [], {}, [])
+            mock_agent_class.return_value = mock_agent
+
+            response = client.post(
+                f"/api/conversations/{test_conversation.id}/chat/batch",
+                headers=auth_headers,
+                json={
+                    "message": "what is in this video?",
+                    "files": [
+                        {"name": "clip.mp4", "type": "video/mp4", "upload_id": upload["upload_id"]}
+                    ],
+                },
+            )
+
+        assert response.status_code == 200
+        # The video reaches the Gemini step as a reference, never as base64
+        assert "data" not in attached["files"][0]
+        assert not test_blob_store.exists(upload_key)
+        message_id = response.get_json()["user_message_id"]
+        file_response = client.get(f"/api/messages/{message_id}/files/0", headers=auth_headers)
+        assert file_response.data == self._MP4_BYTES
+
+    def test_spoofed_content_is_rejected(
+        self, client: FlaskClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = self._upload(client, auth_headers, b"MZ\x90\x00 not a png", "a.png", "image/png")
+        assert response.status_code == 400
+
+    def test_missing_file_part_is_rejected(
+        self, client: FlaskClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = client.post(
+            "/api/uploads", headers=auth_headers, data={}, content_type="multipart/form-data"
+        )
+        assert response.status_code == 400
+
+    def test_unknown_upload_id_is_rejected(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_conversation: Conversation,
+    ) -> None:
+        response = client.post(
+            f"/api/conversations/{test_conversation.id}/chat/batch",
+            headers=auth_headers,
+            json={
+                "files": [{"name": "a.png", "type": "image/png", "upload_id": str(uuid.uuid4())}]
+            },
+        )
+        assert response.status_code == 400
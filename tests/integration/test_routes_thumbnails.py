@@ -8,6 +8,7 @@ from unittest.mock import patch
 from flask.testing import FlaskClient
 
 from src.api.schemas import ThumbnailStatus
+from src.utils.thumbnail_engine import render_thumbnails
 
 if TYPE_CHECKING:
     from src.db.models import Conversation, Database, User
@@ -150,18 +151,19 @@ class TestGetMessageThumbnail:
             )
             conn.commit()
 
-        # Mock generate_thumbnail to verify it's called (via generate_and_save_thumbnail)
+        # Spy on the engine to verify it renders (via generate_and_save_thumbnail)
         with patch(
-            "src.utils.images.generate_thumbnail", return_value=sample_png_base64
-        ) as mock_gen:
+            "src.utils.thumbnail_engine.render_thumbnails", wraps=render_thumbnails
+        ) as mock_render:
             response = client.get(
                 f"/api/messages/{message.id}/files/0/thumbnail",
                 headers=auth_headers,
             )
 
-            # Should regenerate and return 200
+            # Should regenerate and return the stored thumbnail
             assert response.status_code == 200
-            mock_gen.assert_called_once()
+            assert response.content_type == "image/png"
+            mock_render.assert_called_once()
 
         # Verify the database was updated
         updated_message = test_database.get_message_by_id(message.id)
@@ -245,6 +247,41 @@ class TestGetMessageThumbnail:
 
         assert response.status_code == 404
 
+    def test_serves_requested_size(
+        self,
+        client: FlaskClient,
+        auth_headers: dict[str, str],
+        test_conversation: Conversation,
+        test_database: Database,
+        test_blob_store,
+        sample_png_base64: str,
+    ) -> None:
+        """Should serve the sidebar size, and the full image when there is no preview."""
+        from src.db.models import make_thumbnail_key
+
+        files = [{"name": "test.png", "type": "image/png", "data": sample_png_base64}]
+        message = test_database.add_message(
+            test_conversation.id, "user", "Test message", files=files
+        )
+        test_database.update_message_file_thumbnail(
+            message.id, 0, None, status=ThumbnailStatus.READY, stored=True
+        )
+        test_blob_store.save(make_thumbnail_key(message.id, 0), b"message", "image/png")
+        test_blob_store.save(make_thumbnail_key(message.id, 0, "sidebar"), b"sidebar", "image/png")
+
+        url = f"/api/messages/{message.id}/files/0/thumbnail"
+        assert client.get(f"{url}?size=sidebar", headers=auth_headers).data == b"sidebar"
+        assert client.get(url, headers=auth_headers).data == b"message"
+        preview = client.get(f"{url}?size=preview", headers=auth_headers)
+        assert preview.status_code == 200
+        assert preview.data not in (b"message", b"sidebar")
+
+    def test_rejects_unknown_size(self, client: FlaskClient, auth_headers: dict[str, str]) -> None:
+        response = client.get(
+            "/api/messages/some-id/files/0/thumbnail?size=huge", headers=auth_headers
+        )
+        assert response.status_code == 400
+
     def test_requires_auth(self, client: FlaskClient) -> None:
         """Should return 401 without authentication."""
         response = client.get("/api/messages/some-id/files/0/thumbnail")
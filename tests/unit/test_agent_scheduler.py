@@ -0,0 +1,184 @@
+"""Unit tests for concurrent scheduled agent execution."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agent.scheduler import run_scheduled_agents
+from src.agent.scheduler_daemon import OVERDUE_RETRY_SECONDS, AgentScheduleDaemon
+from src.db.models import Database
+
+_marker: contextvars.ContextVar[str | None] = contextvars.ContextVar("_marker", default=None)
+
+
+def _agent(agent_id: str, user_id: str) -> Any:
+    return SimpleNamespace(
+        id=agent_id, user_id=user_id, name=agent_id, schedule=None, timezone="UTC"
+    )
+
+
+@pytest.fixture
+def scheduler_db() -> Generator[MagicMock]:
+    with patch("src.agent.scheduler.db") as mock_db:
+        mock_db.cleanup_zombie_executions.return_value = 0
+        mock_db.has_pending_approval.return_value = False
+        mock_db.create_execution_if_idle.side_effect = lambda agent_id, trigger_type: (
+            SimpleNamespace(id=f"exec-{agent_id}")
+        )
+        yield mock_db
+
+
+def _run(agents: list[Any], execute: Any, workers: int = 4, per_user: int = 2) -> Any:
+    with (
+        patch("src.agent.scheduler.Config.AGENT_SCHEDULER_WORKERS", workers),
+        patch("src.agent.scheduler.Config.AGENT_SCHEDULER_MAX_PER_USER", per_user),
+        patch("src.agent.executor.execute_agent", side_effect=execute),
+    ):
+        return run_scheduled_agents()
+
+
+class TestConcurrentScheduler:
+    def test_due_agents_run_concurrently(self, scheduler_db: MagicMock) -> None:
+        scheduler_db.get_due_agents.return_value = [_agent(f"a{i}", f"u{i}") for i in range(3)]
+        all_started = threading.Barrier(3, timeout=5)
+
+        def execute(agent: Any, user: Any, trigger: str, execution_id: str) -> Any:
+            all_started.wait()  # breaks (and fails the run) unless all three overlap
+            return True, None
+
+        result = _run(scheduler_db.get_due_agents.return_value, execute)
+
+        assert result.executed == 3
+        assert result.failed == 0
+
+    def test_per_user_cap_and_round_robin(self, scheduler_db: MagicMock) -> None:
+        agents = [_agent("a1", "alice"), _agent("a2", "alice"), _agent("a3", "alice")]
+        agents.append(_agent("b1", "bob"))
+        scheduler_db.get_due_agents.return_value = agents
+        order: list[str] = []
+
+        def execute(agent: Any, user: Any, trigger: str, execution_id: str) -> Any:
+            order.append(agent.id)
+            return True, None
+
+        result = _run(agents, execute, workers=1, per_user=1)
+
+        assert order == ["a1", "b1", "a2", "a3"]
+        assert result.executed == 4
+
+    def test_runs_do_not_share_contextvars(self, scheduler_db: MagicMock) -> None:
+        agents = [_agent("a1", "u1"), _agent("a2", "u2")]
+        scheduler_db.get_due_agents.return_value = agents
+        seen: list[str | None] = []
+
+        def execute(agent: Any, user: Any, trigger: str, execution_id: str) -> Any:
+            seen.append(_marker.get())
+            _marker.set(agent.id)
+            return True, None
+
+        _run(agents, execute, workers=1)
+
+        assert seen == [None, None]
+
+    def test_already_running_agent_is_skipped(self, scheduler_db: MagicMock) -> None:
+        scheduler_db.get_due_agents.return_value = [_agent("a1", "u1")]
+        scheduler_db.create_execution_if_idle.side_effect = None
+        scheduler_db.create_execution_if_idle.return_value = None
+        execute = MagicMock()
+
+        result = _run(scheduler_db.get_due_agents.return_value, execute)
+
+        assert result.skipped == 1
+        execute.assert_not_called()
+
+    def test_crash_before_claim_counts_as_failed(self, scheduler_db: MagicMock) -> None:
+        scheduler_db.get_due_agents.return_value = [_agent("a1", "u1"), _agent("a2", "u2")]
+        scheduler_db.get_user_by_id.side_effect = [RuntimeError("db locked"), MagicMock()]
+
+        result = _run(scheduler_db.get_due_agents.return_value, lambda *a: (True, None), workers=1)
+
+        assert (result.executed, result.failed) == (1, 1)
+
+
+class TestCreateExecutionIfIdle:
+    def test_second_claim_fails_until_the_first_finishes(
+        self, test_database: Database, test_agent: Any
+    ) -> None:
+        first = test_database.create_execution_if_idle(test_agent.id, "scheduled")
+        assert first is not None
+        assert test_database.create_execution_if_idle(test_agent.id, "manual") is None
+
+        test_database.update_execution(first.id, status="completed")
+
+        assert test_database.create_execution_if_idle(test_agent.id, "manual") is not None
+
+
+NOW = datetime(2026, 10, 16, 9, 0, 0)
+
+
+@pytest.fixture
+def daemon_db() -> Generator[MagicMock]:
+    with (
+        patch("src.agent.scheduler_daemon.db") as mock_db,
+        patch("src.agent.scheduler_daemon.utcnow_naive", return_value=NOW),
+    ):
+        mock_db.get_schedule_version.return_value = 1
+        mock_db.list_all_scheduled_agents.return_value = []
+        yield mock_db
+
+
+def _scheduled(agent_id: str, next_run_at: datetime) -> Any:
+    return SimpleNamespace(id=agent_id, next_run_at=next_run_at)
+
+
+class TestAgentScheduleDaemon:
+    def test_sleeps_until_next_due_agent(self, daemon_db: MagicMock) -> None:
+        daemon_db.list_all_scheduled_agents.return_value = [
+            _scheduled("later", NOW + timedelta(hours=1)),
+            _scheduled("soon", NOW + timedelta(seconds=2.5)),
+        ]
+
+        with patch("src.agent.scheduler_daemon.run_scheduled_agents") as run:
+            assert AgentScheduleDaemon(poll_seconds=5).tick(NOW) == 2.5
+            run.assert_not_called()
+
+    def test_runs_when_due_and_defers_agents_left_due(self, daemon_db: MagicMock) -> None:
+        daemon_db.list_all_scheduled_agents.return_value = [_scheduled("a1", NOW)]
+        daemon = AgentScheduleDaemon(poll_seconds=120)
+
+        with patch("src.agent.scheduler_daemon.run_scheduled_agents") as run:
+            # a1 stays due (e.g. pending approval): retried later, not spun on
+            assert daemon.tick(NOW) == OVERDUE_RETRY_SECONDS
+            run.assert_called_once()
+
+    def test_schedule_change_reloads_heap(self, daemon_db: MagicMock) -> None:
+        daemon = AgentScheduleDaemon(poll_seconds=5)
+        assert daemon.tick(NOW) == 5
+        assert daemon.next_due_at() is None
+
+        daemon_db.get_schedule_version.return_value = 2
+        daemon_db.list_all_scheduled_agents.return_value = [
+            _scheduled("new", NOW + timedelta(seconds=1))
+        ]
+
+        assert daemon.tick(NOW) == 1
+        assert daemon_db.list_all_scheduled_agents.call_count == 2
+
+
+class TestScheduleVersion:
+    def test_agent_changes_bump_the_version(self, test_database: Database, test_user: Any) -> None:
+        start = test_database.get_schedule_version()
+
+        agent = test_database.create_agent(test_user.id, "Version", schedule="0 9 * * *")
+        test_database.update_agent(agent.id, test_user.id, enabled=False)
+        test_database.delete_agent(agent.id, test_user.id)
+
+        assert test_database.get_schedule_version() == start + 3
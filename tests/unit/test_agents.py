@@ -958,7 +958,7 @@ class TestExecutorRun:
             patch("src.agent.executor.db") as db_mock,
             patch("src.agent.executor.execute_agent") as exec_mock,
         ):
-            db_mock.create_execution.return_value = mock_execution
+            db_mock.create_execution_if_idle.return_value = mock_execution
             exec_mock.return_value = ("waiting_approval", "Approval needed")
 
             from src.agent.executor import AgentBlockedError, AgentExecutor
@@ -1005,7 +1005,7 @@ class TestExecutorRun:
             patch("src.agent.executor.execute_agent") as exec_mock,
             patch("src.agent.executor.get_trigger_chain") as chain_mock,
         ):
-            db_mock.create_execution.return_value = mock_execution
+            db_mock.create_execution_if_idle.return_value = mock_execution
             exec_mock.return_value = (True, None)
             chain_mock.return_value = ["agent-123"]  # Parent agent in chain
 
@@ -1051,7 +1051,7 @@ class TestExecutorRun:
             patch("src.agent.executor.db") as db_mock,
             patch("src.agent.executor.execute_agent") as exec_mock,
         ):
-            db_mock.create_execution.return_value = mock_execution
+            db_mock.create_execution_if_idle.return_value = mock_execution
             db_mock.update_execution = MagicMock()
             exec_mock.return_value = (True, None)
 
@@ -1097,7 +1097,7 @@ class TestExecutorRun:
             patch("src.agent.executor.db") as db_mock,
             patch("src.agent.executor.execute_agent") as exec_mock,
         ):
-            db_mock.create_execution.return_value = mock_execution
+            db_mock.create_execution_if_idle.return_value = mock_execution
             db_mock.update_execution = MagicMock()
             exec_mock.return_value = (False, "LLM API error")
 
@@ -0,0 +1,132 @@
+"""Unit tests for the ASGI stream front (src/asgi.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from flask import Flask, request
+
+from src.api.helpers.stream_handoff import sse_response
+from src.asgi import StreamFront, _build_environ
+from src.config import Config
+
+
+def _scope(method: str = "GET", path: str = "/", query: bytes = b"") -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [(b"content-type", b"application/json"), (b"x-request-id", b"req-1")],
+        "server": ("testserver", 80),
+        "client": ("10.0.0.1", 5000),
+    }
+
+
+async def _run(
+    front: StreamFront,
+    scope: dict[str, Any],
+    body: bytes = b"",
+    disconnect_after: float | None = None,
+) -> list[dict[str, Any]]:
+    """Drive one request; returns the sent ASGI messages."""
+    sent: list[dict[str, Any]] = []
+    delivered = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        if disconnect_after is None:
+            await asyncio.Event().wait()
+        await asyncio.sleep(disconnect_after or 0)
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    await front(scope, receive, send)
+    return sent
+
+
+def _body(sent: list[dict[str, Any]]) -> bytes:
+    return b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+
+
+def _make_app(async_stream: Any = None) -> Flask:
+    app = Flask(__name__)
+
+    @app.post("/echo")
+    def echo() -> dict[str, Any]:
+        return {"json": request.get_json(), "args": request.args.to_dict()}
+
+    @app.get("/stream")
+    def stream() -> Any:
+        return sse_response(lambda: iter(["data: sync\n\n"]), async_stream)
+
+    return app
+
+
+class TestPassthrough:
+    def test_wsgi_response_is_forwarded(self) -> None:
+        front = StreamFront(_make_app())
+        sent = asyncio.run(_run(front, _scope("POST", "/echo", b"a=1"), b'{"x": 1}'))
+
+        assert sent[0]["status"] == 200
+        assert json.loads(_body(sent)) == {"json": {"x": 1}, "args": {"a": "1"}}
+
+    def test_oversized_body_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Config, "MAX_REQUEST_SIZE", 4)
+        front = StreamFront(_make_app())
+        sent = asyncio.run(_run(front, _scope("POST", "/echo"), b'{"x": 1}'))
+
+        assert sent[0]["status"] == 413
+
+    def test_environ_from_scope(self) -> None:
+        environ = _build_environ(_scope("GET", "/a b", b"q=1"), b"")
+        assert environ["PATH_INFO"] == "/a b"
+        assert environ["QUERY_STRING"] == "q=1"
+        assert environ["CONTENT_TYPE"] == "application/json"
+        assert environ["HTTP_X_REQUEST_ID"] == "req-1"
+        assert environ["REMOTE_ADDR"] == "10.0.0.1"
+
+
+class TestHandoff:
+    def test_handed_off_stream_is_sent_by_the_front(self) -> None:
+        async def stream() -> AsyncIterator[str]:
+            yield "data: one\n\n"
+            yield "data: two\n\n"
+
+        front = StreamFront(_make_app(stream))
+        sent = asyncio.run(_run(front, _scope(path="/stream")))
+
+        headers = dict(sent[0]["headers"])
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert b"content-length" not in headers
+        assert _body(sent) == b"data: one\n\ndata: two\n\n"
+        assert sent[-1].get("more_body", False) is False
+
+    def test_disconnect_closes_the_stream(self) -> None:
+        closed = asyncio.Event()
+
+        async def stream() -> AsyncIterator[str]:
+            try:
+                yield "data: first\n\n"
+                await asyncio.sleep(30)
+                yield "data: never\n\n"
+            finally:
+                closed.set()
+
+        async def run() -> list[dict[str, Any]]:
+            front = StreamFront(_make_app(stream))
+            sent = await _run(front, _scope(path="/stream"), disconnect_after=0.05)
+            assert closed.is_set()
+            return sent
+
+        sent = asyncio.run(run())
+        assert _body(sent) == b"data: first\n\n"
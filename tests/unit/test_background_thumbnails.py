@@ -15,6 +15,7 @@ from src.utils.background_thumbnails import (
     queue_pending_thumbnails,
     should_skip_thumbnail,
 )
+from src.utils.files import Attachment
 
 
 class TestShouldSkipThumbnail:
@@ -61,6 +62,13 @@ class TestShouldSkipThumbnail:
         # Empty string decodes to 0 bytes, which is less than threshold
         assert should_skip_thumbnail("", "image/png") is True
 
+    def test_uses_attachment_size(self) -> None:
+        """A decoded Attachment is sized without decoding base64."""
+        small = Attachment.from_bytes(b"x" * 10)
+        large = Attachment.from_bytes(b"x" * (Config.THUMBNAIL_SKIP_THRESHOLD_BYTES + 1))
+        assert should_skip_thumbnail(small, "image/png") is True
+        assert should_skip_thumbnail(large, "image/png") is False
+
 
 class TestMarkFilesForThumbnailGeneration:
     """Tests for mark_files_for_thumbnail_generation function."""
@@ -138,7 +146,7 @@ class TestQueuePendingThumbnails:
         with patch("src.utils.background_thumbnails.queue_thumbnail_generation") as mock_queue:
             queue_pending_thumbnails("msg-123", files)
 
-            mock_queue.assert_called_once_with("msg-123", 0, sample_png_base64, "image/png")
+            mock_queue.assert_called_once_with("msg-123", 0, "image/png")
 
     def test_skips_ready_files(self, sample_png_base64: str) -> None:
         """Should skip files that are already ready."""
@@ -184,8 +192,8 @@ class TestQueuePendingThumbnails:
             queue_pending_thumbnails("msg-123", files)
 
             assert mock_queue.call_count == 2
-            mock_queue.assert_any_call("msg-123", 0, sample_png_base64, "image/png")
-            mock_queue.assert_any_call("msg-123", 2, sample_png_base64, "image/png")
+            mock_queue.assert_any_call("msg-123", 0, "image/png")
+            mock_queue.assert_any_call("msg-123", 2, "image/png")
 
 
 class TestGetExecutor:
@@ -257,61 +265,62 @@ class TestGetExecutorThreadSafety:
 class TestGenerateAndSaveThumbnail:
     """Tests for generate_and_save_thumbnail function."""
 
-    def test_generates_and_saves_thumbnail(self, sample_png_base64: str) -> None:
-        """Should generate thumbnail and save to database, returning the thumbnail."""
+    def test_renders_all_sizes_and_records_status(self) -> None:
+        """Should render every size of the stored image and mark it ready."""
         mock_db = MagicMock()
         mock_db.update_message_file_thumbnail.return_value = True
 
         with patch("src.db.models.db", mock_db):
             with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value="thumbnail_data",
-            ) as mock_gen:
-                result = generate_and_save_thumbnail("msg-123", 0, sample_png_base64, "image/png")
-
-                assert result == "thumbnail_data"
-                mock_gen.assert_called_once_with(sample_png_base64, "image/png")
+                "src.utils.thumbnail_engine.render_stored_thumbnails",
+                return_value=["sidebar", "message"],
+            ) as mock_render:
+                result = generate_and_save_thumbnail("msg-123", 0, "image/png")
+
+                assert result is True
+                mock_render.assert_called_once_with(
+                    "msg-123/0",
+                    "image/png",
+                    {
+                        "sidebar": "msg-123/0.thumb.sidebar",
+                        "message": "msg-123/0.thumb",
+                        "preview": "msg-123/0.thumb.preview",
+                    },
+                )
                 mock_db.update_message_file_thumbnail.assert_called_once_with(
-                    "msg-123", 0, "thumbnail_data", status="ready"
+                    "msg-123", 0, None, status="ready", stored=True
                 )
 
-    def test_returns_none_on_generation_failure(self) -> None:
-        """Should return None when thumbnail generation fails."""
+    def test_returns_false_on_generation_failure(self) -> None:
+        """Should return False and mark failed when rendering fails."""
         mock_db = MagicMock()
         mock_db.update_message_file_thumbnail.return_value = True
 
         with patch("src.db.models.db", mock_db):
-            with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value=None,
-            ):
-                result = generate_and_save_thumbnail("msg-123", 0, "data", "image/png")
+            with patch("src.utils.thumbnail_engine.render_stored_thumbnails", return_value=None):
+                result = generate_and_save_thumbnail("msg-123", 0, "image/png")
 
-                assert result is None
+                assert result is False
                 mock_db.update_message_file_thumbnail.assert_called_once_with(
-                    "msg-123", 0, None, status="failed"
+                    "msg-123", 0, None, status="failed", stored=False
                 )
 
-    def test_returns_thumbnail_even_if_db_update_fails(self, sample_png_base64: str) -> None:
-        """Should return thumbnail even if database update fails."""
+    def test_returns_true_even_if_db_update_fails(self) -> None:
+        """Should report the stored thumbnails even if the database update fails."""
         mock_db = MagicMock()
         mock_db.update_message_file_thumbnail.return_value = False  # DB update fails
 
         with patch("src.db.models.db", mock_db):
             with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value="thumbnail_data",
+                "src.utils.thumbnail_engine.render_stored_thumbnails", return_value=["message"]
             ):
-                result = generate_and_save_thumbnail("msg-123", 0, sample_png_base64, "image/png")
-
-                # Still returns the thumbnail even though DB update failed
-                assert result == "thumbnail_data"
+                assert generate_and_save_thumbnail("msg-123", 0, "image/png") is True
 
 
 class TestGenerateThumbnailTask:
     """Tests for _generate_thumbnail_task function."""
 
-    def test_generates_and_saves_thumbnail(self, sample_png_base64: str) -> None:
+    def test_generates_and_saves_thumbnail(self) -> None:
         """Should generate thumbnail and save to database via shared helper."""
         mock_db = MagicMock()
         mock_db.update_message_file_thumbnail.return_value = True
@@ -319,29 +328,26 @@ class TestGenerateThumbnailTask:
         # db is imported inside the function, so we need to patch it in src.db.models
         with patch("src.db.models.db", mock_db):
             with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value="thumbnail_data",
-            ) as mock_gen:
-                _generate_thumbnail_task("msg-123", 0, sample_png_base64, "image/png")
+                "src.utils.thumbnail_engine.render_stored_thumbnails",
+                return_value=["message"],
+            ) as mock_render:
+                _generate_thumbnail_task("msg-123", 0, "image/png")
 
-                mock_gen.assert_called_once_with(sample_png_base64, "image/png")
+                mock_render.assert_called_once()
                 mock_db.update_message_file_thumbnail.assert_called_once_with(
-                    "msg-123", 0, "thumbnail_data", status="ready"
+                    "msg-123", 0, None, status="ready", stored=True
                 )
 
     def test_marks_failed_on_generation_error(self) -> None:
-        """Should mark as failed when thumbnail generation returns None."""
+        """Should mark as failed when rendering returns None."""
         mock_db = MagicMock()
 
         with patch("src.db.models.db", mock_db):
-            with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value=None,
-            ):
-                _generate_thumbnail_task("msg-123", 0, "invalid", "image/png")
+            with patch("src.utils.thumbnail_engine.render_stored_thumbnails", return_value=None):
+                _generate_thumbnail_task("msg-123", 0, "image/png")
 
                 mock_db.update_message_file_thumbnail.assert_called_once_with(
-                    "msg-123", 0, None, status="failed"
+                    "msg-123", 0, None, status="failed", stored=False
                 )
 
     def test_handles_exception_gracefully(self) -> None:
@@ -350,11 +356,11 @@ class TestGenerateThumbnailTask:
 
         with patch("src.db.models.db", mock_db):
             with patch(
-                "src.utils.images.generate_thumbnail",
+                "src.utils.thumbnail_engine.render_stored_thumbnails",
                 side_effect=Exception("Test error"),
             ):
                 # Should not raise
-                _generate_thumbnail_task("msg-123", 0, "data", "image/png")
+                _generate_thumbnail_task("msg-123", 0, "image/png")
 
                 # Should attempt to mark as failed
                 mock_db.update_message_file_thumbnail.assert_called_once_with(
@@ -368,8 +374,8 @@ class TestGenerateThumbnailTask:
 
         with patch("src.db.models.db", mock_db):
             with patch(
-                "src.utils.images.generate_thumbnail",
-                return_value="thumbnail",
+                "src.utils.thumbnail_engine.render_stored_thumbnails",
+                return_value=["message"],
             ):
                 # Should not raise even if DB update fails
-                _generate_thumbnail_task("msg-deleted", 0, "data", "image/png")
+                _generate_thumbnail_task("msg-deleted", 0, "image/png")
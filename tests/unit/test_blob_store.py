@@ -1,5 +1,7 @@
 """Unit tests for blob store."""
 
+import io
+import sqlite3
 import tempfile
 import threading
 import time
@@ -9,7 +11,7 @@ from unittest.mock import patch
 import pytest
 
 import src.db.blob_store as blob_store_module
-from src.db.blob_store import BlobStore, get_blob_store, reset_blob_store
+from src.db.blob_store import BlobStore, ensure_schema, get_blob_store, reset_blob_store
 
 
 class TestBlobStore:
@@ -201,6 +203,185 @@ class TestBlobStore:
         retrieved_data, _ = result
         assert retrieved_data == data
 
+    def test_open_reader_streams_in_chunks(self, blob_store):
+        """Reader yields the requested byte range chunk by chunk."""
+        data = bytes(range(256)) * 40
+        blob_store.save("msg-1/0", data, "video/mp4")
+
+        reader = blob_store.open_reader("msg-1/0")
+        assert reader is not None
+        assert reader.size == len(data)
+        assert reader.mime_type == "video/mp4"
+
+        chunks = list(reader.iter_range(100, 5000, chunk_size=1024))
+        assert b"".join(chunks) == data[100:5000]
+        assert max(len(c) for c in chunks) == 1024
+
+    def test_open_reader_nonexistent(self, blob_store):
+        """Missing keys return None."""
+        assert blob_store.open_reader("nonexistent/0") is None
+
+    def test_open_reader_close_is_idempotent(self, blob_store):
+        """Closing before, during and after iteration is safe."""
+        blob_store.save("msg-1/0", b"abcdef", "text/plain")
+
+        reader = blob_store.open_reader("msg-1/0")
+        stream = reader.iter_range(chunk_size=2)
+        assert next(stream) == b"ab"
+        stream.close()
+        reader.close()
+
+    def test_open_reader_survives_concurrent_replace(self, blob_store):
+        """An open reader keeps serving the bytes it started with."""
+        blob_store.save("msg-1/0", b"original", "text/plain")
+        reader = blob_store.open_reader("msg-1/0")
+        stream = reader.iter_range(chunk_size=4)
+        assert next(stream) == b"orig"
+
+        blob_store.save("msg-1/0", b"replaced", "text/plain")
+
+        assert next(stream) == b"inal"
+        assert blob_store.get("msg-1/0") == (b"replaced", "text/plain")
+
+    def test_save_stream_copies_in_chunks(self, blob_store):
+        """A streamed save stores the same bytes as save()."""
+        data = bytes(range(256)) * 2000  # spans several STREAM_CHUNK_SIZE reads
+        blob_store.save_stream("uploads/u/1", io.BytesIO(data), len(data), "video/mp4")
+
+        assert blob_store.get("uploads/u/1") == (data, "video/mp4")
+        assert blob_store.get_info("uploads/u/1") == (len(data), "video/mp4")
+
+    def test_save_stream_short_stream_stores_nothing(self, blob_store):
+        """A stream that ends early raises and leaves no partial row."""
+        with pytest.raises(ValueError):
+            blob_store.save_stream("uploads/u/1", io.BytesIO(b"abc"), 10, "text/plain")
+
+        assert not blob_store.exists("uploads/u/1")
+
+    def test_rename_moves_blob(self, blob_store):
+        """rename() re-keys a blob, replacing any blob at the target."""
+        blob_store.save("uploads/u/1", b"upload", "image/png")
+        blob_store.save("msg-1/0", b"old", "image/png")
+
+        assert blob_store.rename("uploads/u/1", "msg-1/0")
+        assert blob_store.get("msg-1/0") == (b"upload", "image/png")
+        assert not blob_store.exists("uploads/u/1")
+        assert not blob_store.rename("uploads/u/1", "msg-1/0")
+
+    def test_reader_fileobj_reads_and_seeks(self, blob_store):
+        """fileobj() is a seekable binary file over the blob."""
+        blob_store.save("msg-1/0", b"0123456789", "text/plain")
+        reader = blob_store.open_reader("msg-1/0")
+
+        with reader.fileobj() as f:
+            assert f.seek(0, io.SEEK_END) == 10
+            f.seek(4)
+            assert f.read(3) == b"456"
+            assert f.read() == b"789"
+
+
+class TestContentAddressing:
+    """Identical data is stored once and freed with its last key."""
+
+    @pytest.fixture
+    def blob_store(self, tmp_path: Path):
+        store = BlobStore(tmp_path / "blobs.db")
+        yield store
+        store.close()
+
+    @staticmethod
+    def _contents(store: BlobStore) -> list[tuple[int, int]]:
+        with store._pool.get_connection() as conn:
+            rows = conn.execute("SELECT size, refcount FROM blob_contents ORDER BY size").fetchall()
+        return [(row["size"], row["refcount"]) for row in rows]
+
+    def test_same_data_is_stored_once(self, blob_store):
+        for key in ("msg-a/0", "msg-b/0", "msg-c/0.thumb"):
+            blob_store.save(key, b"screenshot", "image/png")
+
+        assert self._contents(blob_store) == [(10, 3)]
+        assert blob_store.get("msg-b/0") == (b"screenshot", "image/png")
+
+    def test_delete_by_prefixes_frees_content_with_last_key(self, blob_store):
+        blob_store.save("msg-a/0", b"shared", "image/png")
+        blob_store.save("msg-b/0", b"shared", "image/png")
+        blob_store.save("msg-b/1", b"only b", "text/plain")
+
+        assert blob_store.delete_by_prefixes(["msg-b/"]) == 2
+        assert self._contents(blob_store) == [(6, 1)]
+        assert blob_store.get("msg-a/0") == (b"shared", "image/png")
+
+        blob_store.delete("msg-a/0")
+        assert self._contents(blob_store) == []
+
+    def test_overwrite_releases_previous_content(self, blob_store):
+        blob_store.save("msg-a/0", b"first", "text/plain")
+        blob_store.save("msg-a/0", b"second", "text/plain")
+        blob_store.save("msg-a/0", b"second", "text/plain")
+
+        assert self._contents(blob_store) == [(6, 1)]
+
+    def test_rename_over_existing_key_keeps_refcounts(self, blob_store):
+        blob_store.save("uploads/u/1", b"upload", "image/png")
+        blob_store.save("msg-1/0", b"old", "image/png")
+
+        assert blob_store.rename("uploads/u/1", "msg-1/0")
+
+        assert self._contents(blob_store) == [(6, 1)]
+        assert blob_store.rename("msg-1/0", "msg-1/0")
+        assert self._contents(blob_store) == [(6, 1)]
+
+    def test_save_stream_reuses_stored_content(self, blob_store):
+        data = bytes(range(256)) * 2000
+        blob_store.save("msg-a/0", data, "video/mp4")
+
+        blob_store.save_stream("uploads/u/1", io.BytesIO(data), len(data), "video/mp4")
+
+        assert self._contents(blob_store) == [(len(data), 2)]
+        assert blob_store.get("uploads/u/1") == (data, "video/mp4")
+
+    def test_open_reader_reads_shared_content(self, blob_store):
+        blob_store.save("msg-a/0", b"shared", "text/plain")
+        blob_store.save("msg-b/0", b"shared", "text/plain")
+        blob_store.delete("msg-a/0")
+
+        reader = blob_store.open_reader("msg-b/0")
+        assert b"".join(reader.iter_range()) == b"shared"
+
+
+class TestLegacyConversion:
+    """ensure_schema() converts a files.db from before content addressing."""
+
+    def test_converts_and_dedupes_existing_rows(self, tmp_path: Path):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            """CREATE TABLE blobs (key TEXT PRIMARY KEY, data BLOB NOT NULL,
+               mime_type TEXT NOT NULL, size INTEGER NOT NULL, created_at TEXT NOT NULL)"""
+        )
+        conn.executemany(
+            "INSERT INTO blobs VALUES (?, ?, ?, ?, ?)",
+            [
+                ("msg-a/0", b"same", "image/png", 4, "2026-01-01T00:00:00"),
+                ("msg-b/0", b"same", "image/png", 4, "2026-01-02T00:00:00"),
+                ("msg-b/1", b"other", "text/plain", 5, "2026-01-02T00:00:00"),
+            ],
+        )
+        conn.commit()
+
+        assert ensure_schema(conn) == (3, 2)
+        assert ensure_schema(conn) is None
+        conn.close()
+
+        store = BlobStore(path)
+        try:
+            assert store.get("msg-b/0") == (b"same", "image/png")
+            assert store.get("msg-b/1") == (b"other", "text/plain")
+            store.delete_by_prefix("msg-a/")
+            assert store.get("msg-b/0") == (b"same", "image/png")
+        finally:
+            store.close()
+
 
 class TestBlobStoreKeyFormat:
     """Test key format helpers."""
@@ -316,6 +497,25 @@ class TestExtractFileMetadata:
         assert "thumbnail" not in metadata
         assert metadata["thumbnail_status"] == "ready"
 
+    def test_extract_uses_attachment_size(self):
+        """Test that a decoded attachment is dropped and sizes the file."""
+        from src.db.models import extract_file_metadata
+        from src.utils.files import Attachment
+
+        file_data = {
+            "name": "photo.jpg",
+            "type": "image/jpeg",
+            "data": "aGVsbG8gd29ybGQ=",
+            "attachment": Attachment.from_bytes(b"hello world"),
+        }
+
+        with patch("src.db.models.helpers.base64.b64decode") as mock_decode:
+            metadata = extract_file_metadata(file_data)
+
+        mock_decode.assert_not_called()
+        assert metadata["size"] == 11
+        assert "attachment" not in metadata
+
     def test_extract_preserves_other_fields(self):
         """Test that other fields are preserved."""
         from src.db.models import extract_file_metadata
@@ -332,6 +532,33 @@ class TestExtractFileMetadata:
         assert metadata["custom_field"] == "preserved"
 
 
+class TestSaveFileToBlobStore:
+    """Test saving message files to the blob store."""
+
+    def test_saves_decoded_attachment_without_decoding(self, tmp_path: Path) -> None:
+        from src.db.models import save_file_to_blob_store
+        from src.utils.files import Attachment
+
+        blob_store = BlobStore(tmp_path / "blobs.db")
+        file_data = {
+            "name": "notes.txt",
+            "type": "text/plain",
+            "data": "aGVsbG8gd29ybGQ=",
+            "attachment": Attachment.from_bytes(b"hello world"),
+        }
+        try:
+            with (
+                patch("src.db.models.helpers.get_blob_store", return_value=blob_store),
+                patch("src.db.models.helpers.base64.b64decode") as mock_decode,
+            ):
+                save_file_to_blob_store("msg-1", 0, file_data)
+
+            mock_decode.assert_not_called()
+            assert blob_store.get("msg-1/0") == (b"hello world", "text/plain")
+        finally:
+            blob_store.close()
+
+
 class TestGetBlobStoreThreadSafety:
     """Concurrency tests for the lazy singleton (gthread worker safety)."""
 
@@ -3,6 +3,7 @@
 import importlib
 import json
 import socket
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -340,3 +341,118 @@ class TestBrowserTool:
         assert "error" in parsed
         assert "timed out" in parsed["error"].lower()
         assert "hint" in parsed
+
+    @patch("src.agent.tools.browser._start_cleanup_thread")
+    @patch("src.agent.tools.browser._get_worker")
+    @patch("src.agent.tools.browser.is_browser_available", return_value=True)
+    @patch("src.agent.tools.browser.Config")
+    def test_busy_worker_fails_fast_as_retriable(
+        self,
+        mock_config: MagicMock,
+        _mock_avail: MagicMock,
+        mock_get_worker: MagicMock,
+        _mock_cleanup: MagicMock,
+    ) -> None:
+        mock_config.BROWSER_ENABLED = True
+        mock_get_worker.return_value.execute.side_effect = _browser_mod.BrowserBusyError()
+
+        from src.agent.tools.browser import browser
+
+        parsed = json.loads(browser.invoke({"action": "extract"}))
+        assert "busy" in parsed["error"]
+        assert parsed["retriable"] is True
+
+
+def _fake_worker(index: int = 0) -> MagicMock:
+    worker = MagicMock(unhealthy=False, load=0)
+    worker.index = index
+    return worker
+
+
+class TestBrowserPool:
+    """Conversation-affinity routing across browser workers."""
+
+    @patch("src.agent.tools.browser._BrowserWorker", side_effect=_fake_worker)
+    def test_conversations_stick_and_spread(self, _mock_worker: MagicMock) -> None:
+        pool = _browser_mod._BrowserPool(2)
+
+        first = pool.worker_for("conv-a")
+        first.load = 1
+        second = pool.worker_for("conv-b")
+
+        assert second is not first
+        assert pool.worker_for("conv-a") is first
+
+    @patch("src.agent.tools.browser._BrowserWorker", side_effect=_fake_worker)
+    def test_idle_running_worker_preferred_over_new_chromium(self, mock_worker: MagicMock) -> None:
+        pool = _browser_mod._BrowserPool(2)
+
+        pool.worker_for("conv-a")
+        pool.worker_for("conv-b")
+
+        assert mock_worker.call_count == 1
+
+    @patch("src.agent.tools.browser._BrowserWorker", side_effect=_fake_worker)
+    def test_unhealthy_worker_replaced_in_its_slot(self, _mock_worker: MagicMock) -> None:
+        pool = _browser_mod._BrowserPool(2)
+        stuck = pool.worker_for("conv-a")
+        stuck.unhealthy = True
+
+        replacement = pool.worker_for("conv-a")
+
+        assert replacement is not stuck
+        assert replacement.index == stuck.index
+        stuck.stop.assert_called_once()
+
+    @patch("src.agent.tools.browser._BrowserWorker", side_effect=_fake_worker)
+    def test_prune_drops_closed_sessions(self, _mock_worker: MagicMock) -> None:
+        pool = _browser_mod._BrowserPool(1)
+        pool.worker_for("conv-a")
+        pool.worker_for("conv-b")
+
+        pool.prune(0, ["conv-b"], pool.generation())
+
+        assert set(pool._affinity) == {"conv-b"}
+
+    @patch("src.agent.tools.browser._BrowserWorker", side_effect=_fake_worker)
+    def test_prune_keeps_conversations_routed_after_snapshot(self, _mock_worker: MagicMock) -> None:
+        pool = _browser_mod._BrowserPool(2)
+        pool.worker_for("conv-a")
+        generation = pool.generation()
+        # Routed to the same worker while cleanup_stale ran; session not open yet
+        pool.worker_for("conv-b")
+        pool.worker_for("conv-a")
+
+        pool.prune(0, [], generation)
+
+        assert set(pool._affinity) == {"conv-a", "conv-b"}
+        pool.prune(0, [], pool.generation())
+        assert pool._affinity == {}
+
+
+class TestBrowserWorkerQueue:
+    @patch.object(_browser_mod._BrowserWorker, "_run", lambda self: self._started.set())
+    def test_full_queue_fails_fast(self) -> None:
+        worker = _browser_mod._BrowserWorker()
+        release = threading.Event()
+        entered = threading.Semaphore(0)
+
+        def slow(fn_name: str, kwargs: dict[str, object]) -> None:
+            entered.release()
+            release.wait(5)
+
+        with (
+            patch.object(worker, "_execute", side_effect=slow),
+            patch("src.agent.tools.browser.Config.BROWSER_WORKER_MAX_QUEUE", 1),
+        ):
+            pending = threading.Thread(target=worker.execute, args=("extract",))
+            pending.start()
+            assert entered.acquire(timeout=5)
+
+            with pytest.raises(_browser_mod.BrowserBusyError):
+                worker.execute("extract")
+
+            release.set()
+            pending.join(5)
+
+        assert worker.load == 0
@@ -0,0 +1,234 @@
+"""Unit tests for the local Google Calendar mirror (src/utils/calendar_sync.py)."""
+
+import json
+from collections.abc import Generator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.db.models import Database, User
+from src.utils.calendar_sync import CalendarSyncError, sync_calendar_mirror, utc_key
+from src.utils.planner_data import fetch_calendar_dashboard_data
+
+
+def _at(hours: int) -> str:
+    return (datetime.now(UTC) + timedelta(hours=hours)).replace(microsecond=0).isoformat()
+
+
+def _event(event_id: str, start_hours: int, **fields: Any) -> dict[str, Any]:
+    event: dict[str, Any] = {
+        "id": event_id,
+        "status": "confirmed",
+        "summary": f"Event {event_id}",
+        "start": {"dateTime": _at(start_hours)},
+        "end": {"dateTime": _at(start_hours + 1)},
+    }
+    return {**event, **fields}
+
+
+@pytest.fixture
+def list_events() -> Generator[MagicMock]:
+    with patch("src.utils.calendar_sync._list_events") as list_events:
+        yield list_events
+
+
+class TestUtcKey:
+    def test_normalizes_offsets_and_dates(self) -> None:
+        assert utc_key("2026-03-01T10:00:00+02:00") == "2026-03-01T08:00:00"
+        assert utc_key("2026-03-01T08:00:00.123Z") == "2026-03-01T08:00:00"
+        assert utc_key("2026-03-01") == "2026-03-01T00:00:00"
+        assert utc_key("not a date") is None
+
+    def test_dates_are_midnight_in_the_given_time_zone(self) -> None:
+        assert utc_key("2026-03-01", "Europe/Prague") == "2026-02-28T23:00:00"
+        assert utc_key("2026-07-01", "America/New_York") == "2026-07-01T04:00:00"
+        # Offsets in the value win over the time zone
+        assert utc_key("2026-03-01T10:00:00Z", "Europe/Prague") == "2026-03-01T10:00:00"
+        assert utc_key("2026-03-01", "Not/AZone") == "2026-03-01T00:00:00"
+
+
+class TestSyncCalendarMirror:
+    def test_delta_sync_sends_token_and_applies_changes(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.side_effect = [
+            ([_event("e1", 2), _event("e2", 30)], "sync-1", "UTC"),
+            ([_event("e1", 2, status="cancelled"), _event("e3", 5)], "sync-2", "UTC"),
+        ]
+
+        sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+        mirror = sync_calendar_mirror(test_database, test_user.id, "tok", "primary", force=True)
+
+        full_params = list_events.call_args_list[0].args[2]
+        assert full_params["timeMin"].endswith("Z") and full_params["timeMax"].endswith("Z")
+        assert list_events.call_args_list[1].args[2] == {"syncToken": "sync-1"}
+        events = mirror.events(_at(0), _at(48))
+        assert [e["id"] for e in events] == ["e3", "e2"]
+
+    def test_recent_sync_is_not_repeated_unless_stale(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.return_value = ([_event("e1", 2)], "sync-1", "UTC")
+
+        mirror = sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+        sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+        assert list_events.call_count == 1
+
+        mirror.mark_stale()
+        sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+        assert list_events.call_count == 2
+
+    def test_expired_sync_token_triggers_full_resync(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.side_effect = [
+            ([_event("e1", 2)], "sync-1", "UTC"),
+            CalendarSyncError("Google Calendar API error (410)", 410),
+            ([_event("e2", 3)], "sync-2", "UTC"),
+        ]
+
+        sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+        mirror = sync_calendar_mirror(test_database, test_user.id, "tok", "primary", force=True)
+
+        assert "timeMin" in list_events.call_args.args[2]
+        assert [e["id"] for e in mirror.events(_at(0), _at(48))] == ["e2"]
+        state = test_database.get_calendar_sync_state(test_user.id, "primary")
+        assert state is not None and state["sync_token"] == "sync-2"
+
+    def test_all_day_events_use_the_calendar_time_zone(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        day = date.today() + timedelta(days=3)
+        all_day = _event(
+            "holiday",
+            0,
+            start={"date": day.isoformat()},
+            end={"date": (day + timedelta(days=1)).isoformat()},
+        )
+        list_events.return_value = ([all_day], "sync-1", "Asia/Tokyo")
+
+        mirror = sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+
+        # Midnight in Tokyo is 15:00 UTC the previous day
+        tokyo_start = f"{(day - timedelta(days=1)).isoformat()}T15:00:00Z"
+        tokyo_end = f"{day.isoformat()}T15:00:00Z"
+        assert [e["id"] for e in mirror.events(tokyo_start, f"{day.isoformat()}T00:00:00Z")] == [
+            "holiday"
+        ]
+        assert mirror.events(tokyo_end, f"{day.isoformat()}T23:00:00Z") == []
+        state = test_database.get_calendar_sync_state(test_user.id, "primary")
+        assert state is not None and state["time_zone"] == "Asia/Tokyo"
+
+        # A write's event is stored in the zone the last sync recorded
+        mirror.save({**all_day, "id": "holiday-2"})
+        ids = [e["id"] for e in mirror.events(tokyo_start, f"{day.isoformat()}T00:00:00Z")]
+        assert ids == ["holiday", "holiday-2"]
+
+    def test_new_tokens_clear_the_mirror(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.return_value = ([_event("e1", 2)], "sync-1", "UTC")
+        sync_calendar_mirror(test_database, test_user.id, "tok", "primary")
+
+        test_database.update_user_google_calendar_tokens(
+            test_user.id, "access", "refresh", datetime.now(), "other@example.com"
+        )
+
+        assert test_database.get_calendar_sync_state(test_user.id, "primary") is None
+
+
+class TestDashboardFromMirror:
+    def test_reads_events_from_the_mirror(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.return_value = ([_event("soon", 2), _event("later", 24 * 10)], "sync-1", "UTC")
+
+        with patch("requests.get") as get:
+            get.return_value.status_code = 200
+            get.return_value.json.return_value = {
+                "items": [{"id": "me@example.com", "summary": "Me", "primary": True}]
+            }
+            events, error = fetch_calendar_dashboard_data(
+                "tok", ["primary"], user_id=test_user.id, db=test_database
+            )
+
+        assert error is None
+        assert [e.id for e in events] == ["soon"]
+        assert events[0].calendar_summary == "Me"
+        # Only the calendarList lookup hit the API
+        assert get.call_count == 1
+
+    def test_expired_access_reports_error(
+        self, test_database: Database, test_user: User, list_events: MagicMock
+    ) -> None:
+        list_events.side_effect = CalendarSyncError("Google Calendar API error (401)", 401)
+
+        with patch("requests.get") as get:
+            get.return_value.status_code = 401
+            events, error = fetch_calendar_dashboard_data(
+                "tok", ["primary"], user_id=test_user.id, db=test_database
+            )
+
+        assert events == []
+        assert error is not None and "expired" in error
+
+
+class TestCalendarToolWithMirror:
+    @pytest.fixture(autouse=True)
+    def _context(self, test_database: Database, test_user: User) -> Generator[None]:
+        with (
+            patch("src.agent.tools.google_calendar.Config.GOOGLE_CALENDAR_CLIENT_ID", "id"),
+            patch("src.agent.tools.google_calendar.Config.GOOGLE_CALENDAR_CLIENT_SECRET", "s"),
+            patch(
+                "src.agent.tools.google_calendar._get_google_calendar_access_token",
+                return_value=("tok", "me@example.com"),
+            ),
+            patch(
+                "src.agent.tools.google_calendar.get_conversation_context",
+                return_value=("conv-1", test_user.id),
+            ),
+            patch("src.db.models.db", test_database),
+        ):
+            yield
+
+    def test_list_events_reads_the_mirror(self, list_events: MagicMock) -> None:
+        from src.agent.tools import google_calendar
+
+        list_events.return_value = ([_event("e1", 2), _event("e2", 4)], "sync-1", "UTC")
+        with patch("src.agent.tools.google_calendar._google_calendar_api_request") as api:
+            parsed = json.loads(google_calendar.invoke({"action": "list_events", "max_results": 1}))
+
+        api.assert_not_called()
+        assert parsed["count"] == 1
+        assert parsed["events"][0]["id"] == "e1"
+
+    def test_searches_and_writes_use_the_api(self, list_events: MagicMock) -> None:
+        from src.agent.tools import google_calendar
+
+        list_events.return_value = ([_event("e1", 2)], "sync-1", "UTC")
+        with patch("src.agent.tools.google_calendar._google_calendar_api_request") as api:
+            google_calendar.invoke({"action": "list_events"})
+            assert list_events.call_count == 1
+
+            api.return_value = {"items": []}
+            google_calendar.invoke({"action": "list_events", "query": "dentist", "fresh": True})
+            assert api.call_args.kwargs["params"]["q"] == "dentist"
+            # Searches don't sync the mirror they can't use
+            assert list_events.call_count == 1
+
+            api.return_value = _event("e-new", 3)
+            google_calendar.invoke(
+                {
+                    "action": "create_event",
+                    "summary": "New",
+                    "start_time": _at(3),
+                    "end_time": _at(4),
+                }
+            )
+            api.reset_mock()
+            parsed = json.loads(google_calendar.invoke({"action": "list_events"}))
+
+        api.assert_not_called()
+        assert {e["id"] for e in parsed["events"]} == {"e1", "e-new"}
@@ -2370,7 +2370,7 @@ class TestGenerateTitle:
 
 
 class TestBuildMessageContentVideo:
-    """Video attachments become Files API media blocks in message content."""
+    """Files API uploads become media blocks in message content."""
 
     @staticmethod
     def _agent():
@@ -2413,6 +2413,29 @@ class TestBuildMessageContentVideo:
         texts = [b["text"] for b in blocks if isinstance(b, dict) and b.get("type") == "text"]
         assert any("could not be attached" in t for t in texts)
 
+    def test_uploaded_pdf_becomes_media_block(self) -> None:
+        files = [
+            {
+                "name": "report.pdf",
+                "type": "application/pdf",
+                "data": "aaaa",
+                "gemini_file_uri": "https://files.example/f2",
+            }
+        ]
+        blocks = self._agent()._build_message_content("summarize", files)
+        assert isinstance(blocks, list)
+        assert blocks[1] == {
+            "type": "media",
+            "file_uri": "https://files.example/f2",
+            "mime_type": "application/pdf",
+        }
+
+    def test_image_without_uri_stays_inline(self) -> None:
+        files = [{"name": "a.png", "type": "image/png", "data": "aaaa"}]
+        blocks = self._agent()._build_message_content("what is this?", files)
+        assert isinstance(blocks, list)
+        assert blocks[1] == {"type": "image", "base64": "aaaa", "mime_type": "image/png"}
+
 
 class TestBuildMessagesConversationTitle:
     """conversation_title must reach the prompt in both cached and uncached modes."""
@@ -2536,3 +2559,59 @@ class TestToolUsageDetails:
         from src.agent.agent import _tool_usage_details
 
         assert _tool_usage_details([]) == ([], 0)
+
+
+class TestStreamChatEventsThinkingDeltas:
+    """Thinking events are deltas with offsets plus doubling full-text checkpoints."""
+
+    @staticmethod
+    def _thinking_events(monkeypatch, parts: list[str]) -> list[dict]:
+        from unittest.mock import MagicMock
+
+        from langchain_core.messages import AIMessageChunk
+
+        from src.agent.agent import ChatAgent
+        from src.agent.graph import CHAT_NODE_NAME
+        from src.config import Config
+
+        monkeypatch.setattr(Config, "THINKING_CHECKPOINT_MIN_CHARS", 10)
+        agent = ChatAgent.__new__(ChatAgent)
+        agent._build_messages = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        agent.graph = MagicMock()
+        agent.graph.stream.return_value = [
+            (
+                AIMessageChunk(content=[{"type": "thinking", "thinking": part}]),
+                {"langgraph_node": CHAT_NODE_NAME},
+            )
+            for part in parts
+        ]
+        return [e for e in agent.stream_chat_events("hi") if e["type"] == "thinking"]
+
+    def test_events_carry_only_new_text_with_offsets(self, monkeypatch) -> None:
+        events = self._thinking_events(monkeypatch, ["abc", "def"])
+
+        assert events == [
+            {"type": "thinking", "text": "abc", "offset": 0},
+            {"type": "thinking", "text": "def", "offset": 3},
+        ]
+
+    def test_checkpoints_sent_each_time_trace_doubles(self, monkeypatch) -> None:
+        events = self._thinking_events(monkeypatch, ["x" * 6, "y" * 6, "z" * 6, "w" * 6])
+
+        checkpoints = [e for e in events if e.get("checkpoint")]
+        # First at >= 10 chars (12), next only once the trace reaches 24
+        assert [len(e["text"]) for e in checkpoints] == [12, 24]
+        assert all(e["offset"] == 0 for e in checkpoints)
+        assert events[2] == {"type": "thinking", "text": "z" * 6, "offset": 12}
+
+    def test_replaying_events_rebuilds_full_trace(self, monkeypatch) -> None:
+        parts = [f"step {i}. " for i in range(40)]
+        events = self._thinking_events(monkeypatch, parts)
+
+        trace = ""
+        for event in events:
+            assert event["offset"] <= len(trace)
+            trace = trace[: event["offset"]] + event["text"]
+        assert trace == "".join(parts)
+        # Linear, not quadratic: checkpoints at most double the payload
+        assert sum(len(e["text"]) for e in events) <= 3 * len(trace)
@@ -0,0 +1,147 @@
+"""Unit tests for the post-commit pipeline of the save path.
+
+The done event must not wait for cost accounting, language detection or title
+generation: save_message_to_db persists the message and hands those to the
+post-commit executor, whose result the stream sends as title_updated.
+"""
+
+import json
+import threading
+from collections.abc import Generator
+from concurrent.futures import Future
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.helpers.chat_save import PostCommitResult, save_message_to_db
+from src.api.helpers.chat_streaming import _yield_post_commit_update
+from src.config import Config
+from src.db.models import Database, User
+
+CONTENT = "Python lists keep insertion order and can hold mixed types."
+
+
+@pytest.fixture
+def patched_db(test_database: Database) -> Generator[Database]:
+    with (
+        patch("src.api.helpers.chat_save.db", test_database),
+        patch("src.api.utils.db", test_database),
+    ):
+        yield test_database
+
+
+def _save(conv_id: str, user_id: str) -> Any:
+    return save_message_to_db(
+        CONTENT,
+        [],
+        [],
+        {"input_tokens": 100, "output_tokens": 20},
+        conv_id,
+        user_id,
+        "gemini-3.7-flash",
+        "How do lists work?",
+        "req-1",
+        client_connected=True,
+    )
+
+
+class TestSaveMessagePostCommit:
+    def test_save_returns_before_title_generation(
+        self, patched_db: Database, test_user: User
+    ) -> None:
+        conv = patched_db.create_conversation(test_user.id, model="gemini-3.7-flash")
+        release = threading.Event()
+
+        def slow_title(message_text: str, content: str) -> str:
+            release.wait(timeout=5)
+            return "🐍 Python Lists"
+
+        with patch("src.api.helpers.chat_save.generate_title", side_effect=slow_title):
+            result = _save(conv.id, test_user.id)
+
+            assert result is not None
+            assert not result.post_commit.done()
+            assert patched_db.get_message_by_id(result.message_id) is not None
+
+            release.set()
+            post_commit = result.post_commit.result(timeout=5)
+
+        assert post_commit.title == "🐍 Python Lists"
+        assert post_commit.language == "en"
+        updated = patched_db.get_conversation(conv.id, test_user.id)
+        assert updated is not None and updated.title == "🐍 Python Lists"
+        message = patched_db.get_message_by_id(result.message_id)
+        assert message is not None and message.language == "en"
+        assert patched_db.get_message_cost(result.message_id) is not None
+
+    def test_title_failure_keeps_cost_and_language(
+        self, patched_db: Database, test_user: User
+    ) -> None:
+        conv = patched_db.create_conversation(test_user.id, model="gemini-3.7-flash")
+
+        with patch("src.api.helpers.chat_save.generate_title", side_effect=RuntimeError("boom")):
+            result = _save(conv.id, test_user.id)
+            assert result is not None
+            post_commit = result.post_commit.result(timeout=5)
+
+        assert post_commit.title is None
+        assert post_commit.language == "en"
+        assert patched_db.get_message_cost(result.message_id) is not None
+
+
+class TestPostCommitUpdateEvent:
+    def _context(self, post_commit: Future[PostCommitResult] | None) -> MagicMock:
+        context = MagicMock()
+        context.post_commit = post_commit
+        context.client_connected = True
+        context.expected_assistant_msg_id = "msg-1"
+        return context
+
+    def test_yields_title_and_language(self) -> None:
+        future: Future[PostCommitResult] = Future()
+        future.set_result(PostCommitResult("🐍 Python Lists", "en"))
+
+        chunks = list(_yield_post_commit_update(self._context(future)))
+
+        assert len(chunks) == 1
+        event = json.loads(chunks[0].removeprefix("data: "))
+        assert event == {
+            "type": "title_updated",
+            "message_id": "msg-1",
+            "title": "🐍 Python Lists",
+            "language": "en",
+        }
+
+    def test_nothing_to_send(self) -> None:
+        future: Future[PostCommitResult] = Future()
+        future.set_result(PostCommitResult(None, None))
+
+        assert list(_yield_post_commit_update(self._context(future))) == []
+        assert list(_yield_post_commit_update(self._context(None))) == []
+
+    def test_closes_without_event_after_timeout(self) -> None:
+        future: Future[PostCommitResult] = Future()
+
+        with patch.object(Config, "POST_COMMIT_WAIT_TIMEOUT", 0.01):
+            assert list(_yield_post_commit_update(self._context(future))) == []
+
+    def test_sends_keepalives_while_waiting(self) -> None:
+        future: Future[PostCommitResult] = Future()
+        threading.Timer(0.1, future.set_result, [PostCommitResult("Title", None)]).start()
+
+        with patch.object(Config, "SSE_KEEPALIVE_INTERVAL", 0.02):
+            chunks = list(_yield_post_commit_update(self._context(future), timeout=5))
+
+        assert ": keepalive\n\n" in chunks
+        assert json.loads(chunks[-1].removeprefix("data: "))["title"] == "Title"
+
+    def test_stops_waiting_when_client_is_gone(self) -> None:
+        future: Future[PostCommitResult] = Future()
+        context = self._context(future)
+        chunks = _yield_post_commit_update(context, timeout=5)
+
+        with patch.object(Config, "SSE_KEEPALIVE_INTERVAL", 0.01):
+            assert next(chunks) == ": keepalive\n\n"
+            context.client_connected = False
+            assert list(chunks) == []
@@ -1,9 +1,13 @@
-"""Tests for ConnectionPool dead-thread reaping."""
+"""Tests for ConnectionPool dead-thread reaping and the group-commit writer."""
 
+import sqlite3
 import threading
+from collections.abc import Callable, Generator
 from pathlib import Path
 
-from src.utils.connection_pool import ConnectionPool
+import pytest
+
+from src.utils.connection_pool import ConnectionPool, GroupCommitWriter
 
 
 class TestConnectionPoolReaping:
@@ -165,3 +169,93 @@ class TestIdentRecyclingSafety:
         ConnectionPool._release_connection(pool._lock, pool._connections, ident, conn)
 
         assert ident not in pool._connections
+
+
+class TestGroupCommitWriter:
+    @pytest.fixture
+    def pool(self, tmp_path: Path) -> Generator[ConnectionPool]:
+        pool = ConnectionPool(tmp_path / "test.db")
+        with pool.get_connection() as conn:
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT NOT NULL)")
+            conn.commit()
+        yield pool
+        pool.close_all()
+
+    @staticmethod
+    def _insert(v: str | None) -> Callable[[sqlite3.Connection], int]:
+        def write(conn: sqlite3.Connection) -> int:
+            return conn.execute("INSERT INTO t (v) VALUES (?)", (v,)).lastrowid
+
+        return write
+
+    @staticmethod
+    def _values(pool: ConnectionPool) -> list[str]:
+        with pool.get_connection() as conn:
+            return [row["v"] for row in conn.execute("SELECT v FROM t ORDER BY id")]
+
+    def test_result_is_returned_after_commit(self, pool: ConnectionPool) -> None:
+        writer = GroupCommitWriter(pool)
+        try:
+            assert writer.submit(self._insert("a")).result(timeout=5) == 1
+            # Committed: visible from another connection
+            assert self._values(pool) == ["a"]
+        finally:
+            writer.close()
+
+    def test_queued_writes_share_commits_in_order(self, pool: ConnectionPool) -> None:
+        writer = GroupCommitWriter(pool, max_batch=50)
+        gate = threading.Event()
+        try:
+            # Hold the writer inside the first batch so the rest pile up
+            writer.submit(lambda conn: gate.wait(5))
+            futures = [writer.submit(self._insert(str(i))) for i in range(20)]
+            gate.set()
+            for future in futures:
+                future.result(timeout=5)
+
+            assert self._values(pool) == [str(i) for i in range(20)]
+            stats = writer.stats()
+            assert stats["writes"] == 21
+            assert stats["batches"] < 21
+            assert stats["queue_depth"] == 0
+        finally:
+            writer.close()
+
+    def test_failing_write_does_not_roll_back_its_batch(self, pool: ConnectionPool) -> None:
+        writer = GroupCommitWriter(pool)
+        gate = threading.Event()
+        try:
+            writer.submit(lambda conn: gate.wait(5))
+            ok = writer.submit(self._insert("ok"))
+            bad = writer.submit(self._insert(None))  # NOT NULL violation
+            after = writer.submit(self._insert("after"))
+            gate.set()
+
+            with pytest.raises(sqlite3.IntegrityError):
+                bad.result(timeout=5)
+            ok.result(timeout=5)
+            after.result(timeout=5)
+            assert self._values(pool) == ["ok", "after"]
+            assert writer.stats()["errors"] == 1
+        finally:
+            writer.close()
+
+    def test_flush_waits_for_background_writes(self, pool: ConnectionPool) -> None:
+        writer = GroupCommitWriter(pool)
+        try:
+            for i in range(5):
+                writer.submit(self._insert(str(i)))
+            writer.flush(timeout=5)
+            assert len(self._values(pool)) == 5
+        finally:
+            writer.close()
+
+    def test_close_drains_queue_then_rejects(self, pool: ConnectionPool) -> None:
+        writer = GroupCommitWriter(pool)
+        futures = [writer.submit(self._insert(str(i))) for i in range(5)]
+        writer.close()
+
+        assert all(f.done() for f in futures)
+        assert len(self._values(pool)) == 5
+        with pytest.raises(RuntimeError):
+            writer.submit(self._insert("late"))
@@ -7,7 +7,7 @@ persistence via kv_store, lazy re-summarization, and failure fallbacks.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,6 +19,9 @@ from src.agent.conversation_compaction import (
 )
 from src.config import Config
 
+if TYPE_CHECKING:
+    from src.db.models import Database, User
+
 
 def _history(n: int) -> list[dict[str, Any]]:
     """Build n enriched history messages (alternating user/assistant)."""
@@ -305,3 +308,92 @@ class TestBackgroundRefresh:
 
         mock_db.kv_set.assert_called_once()
         assert "c1" not in cc._inflight_refreshes
+
+
+class TestWindowedLoad:
+    """load_compacted_history must match the load-everything-then-compact path."""
+
+    @pytest.fixture
+    def conversation(
+        self, test_database: Database, test_user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> str:
+        """30 messages + the current turn's user message, with session gaps."""
+        from datetime import datetime, timedelta
+
+        monkeypatch.setattr(cc, "db", test_database)
+        conv = test_database.create_conversation(test_user.id, model=Config.DEFAULT_MODEL)
+        start = datetime(2024, 6, 15, 8, 0)
+        with test_database._pool.get_connection() as conn:
+            for i in range(31):
+                msg = test_database.add_message(
+                    conv.id, "user" if i % 2 == 0 else "assistant", f"message {i} " * (i + 1)
+                )
+                # A multi-hour gap before every 7th message exercises the
+                # session-gap metadata at the window boundary
+                created = start + timedelta(minutes=i) + timedelta(hours=8 * (i // 7))
+                conn.execute(
+                    "UPDATE messages SET created_at = ? WHERE id = ?",
+                    (created.isoformat(), msg.id),
+                )
+        return conv.id
+
+    def _expected(self, database: Database, user_id: str, conv_id: str) -> list[dict[str, Any]]:
+        from src.agent.history import enrich_history
+
+        history = enrich_history(database.get_messages(conv_id)[:-1])
+        return build_compacted_history(user_id, conv_id, history)
+
+    @pytest.mark.parametrize("covered_count", [0, 7, 14, 21, 26, 999])
+    @pytest.mark.parametrize("token_threshold", [0, 100])
+    def test_matches_full_path(
+        self,
+        compaction_config: None,
+        conversation: str,
+        test_database: Database,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+        covered_count: int,
+        token_threshold: int,
+    ) -> None:
+        monkeypatch.setattr(Config, "CONVERSATION_COMPACTION_TOKEN_THRESHOLD", token_threshold)
+        monkeypatch.setattr(Config, "CONVERSATION_COMPACTION_RESUMMARIZE_BATCH", 100)
+        cc._save_state(test_user.id, conversation, "OLD", covered_count)
+
+        expected = self._expected(test_database, test_user.id, conversation)
+        assert cc.load_compacted_history(test_user.id, conversation) == expected
+
+    def test_only_the_window_is_read(
+        self,
+        compaction_config: None,
+        conversation: str,
+        test_database: Database,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config, "CONVERSATION_COMPACTION_RESUMMARIZE_BATCH", 100)
+        cc._save_state(test_user.id, conversation, "OLD", 21)
+        expected = self._expected(test_database, test_user.id, conversation)
+
+        with (
+            patch.object(test_database, "get_messages") as full_load,
+            patch.object(
+                test_database, "get_messages_from", wraps=test_database.get_messages_from
+            ) as window_load,
+        ):
+            result = cc.load_compacted_history(test_user.id, conversation)
+
+        full_load.assert_not_called()
+        # Starts one message before the first uncovered one (session-gap source)
+        assert window_load.call_args.args == (conversation, 20)
+        assert result == expected
+
+    def test_without_summary_matches_full_path(
+        self,
+        compaction_config: None,
+        conversation: str,
+        test_database: Database,
+        test_user: User,
+    ) -> None:
+        with patch.object(cc, "summarize_messages", return_value=None):
+            expected = self._expected(test_database, test_user.id, conversation)
+            assert cc.load_compacted_history(test_user.id, conversation) == expected
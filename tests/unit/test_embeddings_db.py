@@ -56,6 +56,76 @@ class TestEmbeddingsMixin:
         assert test_database.get_embeddings(test_user.id, "memory") == []
 
 
+class TestSearchEmbeddings:
+    """search_embeddings keeps the per-worker vector index in step with the table."""
+
+    def _upsert(self, database: Database, user_id: str, ref_id: str, vec: list[float]) -> None:
+        from src.utils.embeddings import pack_vector
+
+        database.upsert_embedding(user_id, "memory", ref_id, "m", len(vec), pack_vector(vec))
+
+    def _ranked(self, database: Database, user_id: str) -> list[str]:
+        return [r for r, _ in database.search_embeddings(user_id, "memory", [1.0, 0.0], 10)]
+
+    def test_local_writes_update_index_without_reload(
+        self, test_database: Database, test_user: User
+    ) -> None:
+        from unittest.mock import patch
+
+        self._upsert(test_database, test_user.id, "a", [0.0, 1.0])
+        assert self._ranked(test_database, test_user.id) == ["a"]
+
+        with patch.object(
+            test_database, "get_embeddings", wraps=test_database.get_embeddings
+        ) as reload:
+            self._upsert(test_database, test_user.id, "b", [1.0, 0.0])
+            self._upsert(test_database, test_user.id, "a", [1.0, 0.5])
+            assert self._ranked(test_database, test_user.id) == ["b", "a"]
+            reload.assert_not_called()
+
+    def test_other_process_writes_trigger_reload(
+        self, test_database: Database, test_user: User
+    ) -> None:
+        from src.utils.embeddings import pack_vector
+
+        self._upsert(test_database, test_user.id, "a", [0.0, 1.0])
+        self._upsert(test_database, test_user.id, "b", [1.0, 0.0])
+        assert self._ranked(test_database, test_user.id) == ["b", "a"]
+
+        # Bypass the mixin, as another gunicorn worker's connection would
+        with test_database._pool.get_connection() as conn:
+            conn.execute("DELETE FROM embeddings WHERE ref_id = 'b'")
+            conn.execute(
+                "UPDATE embeddings SET vector = ?, created_at = '2099-01-01' WHERE ref_id = 'a'",
+                (pack_vector([-1.0, 0.0]),),
+            )
+            conn.commit()
+
+        assert test_database.search_embeddings(test_user.id, "memory", [-1.0, 0.0], 10)[0][0] == "a"
+        assert self._ranked(test_database, test_user.id) == ["a"]
+
+    def test_delete_and_allow_list(self, test_database: Database, test_user: User) -> None:
+        self._upsert(test_database, test_user.id, "a", [1.0, 0.0])
+        self._upsert(test_database, test_user.id, "b", [1.0, 0.1])
+        self._upsert(test_database, test_user.id, "c", [1.0, 0.2])
+        assert self._ranked(test_database, test_user.id) == ["a", "b", "c"]
+
+        test_database.delete_embedding("memory", "a")
+
+        assert self._ranked(test_database, test_user.id) == ["b", "c"]
+        ranked = test_database.search_embeddings(
+            test_user.id, "memory", [1.0, 0.0], 10, ref_ids={"c"}
+        )
+        assert [r for r, _ in ranked] == ["c"]
+
+    def test_scoped_by_user(self, test_database: Database, test_user: User) -> None:
+        self._upsert(test_database, test_user.id, "a", [1.0, 0.0])
+        self._upsert(test_database, "other-user", "b", [1.0, 0.0])
+
+        assert self._ranked(test_database, test_user.id) == ["a"]
+        assert self._ranked(test_database, "other-user") == ["b"]
+
+
 class TestMessageEmbeddingHook:
     """add_message / update_message_content schedule background embeddings."""
 
@@ -158,7 +158,29 @@ class TestCleanupExpiredMedia:
         _seed(db, blob_store, conv_id, "video/mp4", days_old=8)
         cleanup_expired_files()
         counts = cleanup_expired_files()
-        assert counts == {"videos_deleted": 0, "images_deleted": 0, "files_deleted": 0}
+        assert counts == {
+            "videos_deleted": 0,
+            "images_deleted": 0,
+            "files_deleted": 0,
+            "uploads_deleted": 0,
+        }
+
+    def test_deletes_abandoned_uploads(self, seeded_env) -> None:
+        _, blob_store, _ = seeded_env
+        blob_store.save("uploads/u1/old", b"abandoned", "video/mp4")
+        blob_store.save("uploads/u1/new", b"pending", "video/mp4")
+        backdated = (datetime.now() - timedelta(hours=25)).isoformat()
+        with blob_store._pool.get_connection() as conn:
+            conn.execute(
+                "UPDATE blobs SET created_at = ? WHERE key = ?", (backdated, "uploads/u1/old")
+            )
+            conn.commit()
+
+        counts = cleanup_expired_files()
+
+        assert counts["uploads_deleted"] == 1
+        assert not blob_store.exists("uploads/u1/old")
+        assert blob_store.exists("uploads/u1/new")
 
 
 class TestRunIfDue:
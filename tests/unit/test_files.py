@@ -1,6 +1,7 @@
 """Unit tests for file validation utilities."""
 
 import base64
+import hashlib
 import io
 from pathlib import Path
 from unittest.mock import patch
@@ -11,6 +12,7 @@ from src.config import Config
 from src.utils.files import (
     MIME_TYPE_ALIASES,
     TEXT_BASED_MIME_TYPES,
+    Attachment,
     validate_files,
     verify_file_type_by_magic,
 )
@@ -378,6 +380,61 @@ class TestValidateFilesWithMagicBytes:
             mock_verify.assert_not_called()
 
 
+class TestAttachment:
+    """validate_files decodes each file once into an Attachment."""
+
+    def test_validate_files_attaches_decoded_bytes(self) -> None:
+        png = create_png_bytes()
+        files = [{"name": "a.png", "type": "image/png", "data": base64.b64encode(png).decode()}]
+
+        is_valid, _ = validate_files(files)
+
+        assert is_valid is True
+        attachment = files[0]["attachment"]
+        assert isinstance(attachment, Attachment)
+        assert attachment.data == png
+        assert attachment.size == len(png)
+        assert attachment.sha256 == hashlib.sha256(png).hexdigest()
+        assert attachment.mime_type == "image/png"
+
+    def test_magic_runs_once_per_file(self) -> None:
+        files = [
+            {
+                "name": "a.png",
+                "type": "image/png",
+                "data": base64.b64encode(create_png_bytes()).decode(),
+            }
+        ]
+
+        with patch("src.utils.files.magic.from_buffer", return_value="image/png") as mock_magic:
+            is_valid, _ = validate_files(files)
+
+        assert is_valid is True
+        mock_magic.assert_called_once()
+
+    def test_rejected_file_gets_no_attachment(self) -> None:
+        files = [
+            {
+                "name": "fake.png",
+                "type": "image/png",
+                "data": base64.b64encode(MINIMAL_PDF_BYTES).decode(),
+            }
+        ]
+
+        is_valid, _ = validate_files(files)
+
+        assert is_valid is False
+        assert "attachment" not in files[0]
+
+    def test_open_reads_the_bytes(self) -> None:
+        attachment = Attachment.from_bytes(b"hello world")
+
+        with attachment.open() as fileobj:
+            assert fileobj.read(5) == b"hello"
+            fileobj.seek(0)
+            assert fileobj.read() == b"hello world"
+
+
 # =============================================================================
 # Tests for MIME_TYPE_ALIASES configuration
 # =============================================================================
@@ -15,6 +15,7 @@ from src.agent.gemini_files import (
     attach_gemini_file_uris,
     ensure_gemini_file_uri,
 )
+from src.utils.files import Attachment
 
 
 @pytest.fixture(autouse=True)
@@ -126,6 +127,75 @@ class TestAttachGeminiFileUris:
         assert "gemini_file_uri" not in files[0]
         assert "gemini_upload_error" in files[0]
 
+    def test_uploads_decoded_attachment(self) -> None:
+        client = _mock_client(("ACTIVE",))
+        files = [
+            {
+                "name": "b.mp4",
+                "type": "video/mp4",
+                "data": base64.b64encode(b"video").decode(),
+                "attachment": Attachment.from_bytes(b"video"),
+            }
+        ]
+        with (
+            patch("src.agent.gemini_files._get_client", return_value=client),
+            patch("src.agent.gemini_files.base64.b64decode") as mock_decode,
+        ):
+            attach_gemini_file_uris("msg-7b", files)
+        mock_decode.assert_not_called()
+        assert files[0]["gemini_file_uri"] == "https://files.example/f1"
+
+
+class TestUsesFilesApi:
+    def test_videos_always(self) -> None:
+        assert gemini_files.uses_files_api("video/mp4", 10)
+
+    def test_images_and_pdfs_above_threshold(self) -> None:
+        with patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 100):
+            assert gemini_files.uses_files_api("application/pdf", 101)
+            assert gemini_files.uses_files_api("image/jpeg", 101)
+            assert not gemini_files.uses_files_api("image/jpeg", 100)
+            assert not gemini_files.uses_files_api("text/plain", 10_000)
+
+    def test_zero_threshold_keeps_everything_inline(self) -> None:
+        with patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 0):
+            assert not gemini_files.uses_files_api("application/pdf", 10_000_000)
+
+
+class TestAttachLargeImagesAndPdfs:
+    def test_uploads_only_files_above_threshold(self) -> None:
+        client = _mock_client(("ACTIVE",))
+        files = [
+            {"name": "a.png", "type": "image/png", "data": base64.b64encode(b"x").decode()},
+            {
+                "name": "b.pdf",
+                "type": "application/pdf",
+                "data": base64.b64encode(b"p" * 300).decode(),
+            },
+        ]
+        with (
+            patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 100),
+            patch("src.agent.gemini_files._get_client", return_value=client),
+        ):
+            attach_gemini_file_uris("msg-11", files)
+        assert "gemini_file_uri" not in files[0]
+        assert files[1]["gemini_file_uri"] == "https://files.example/f1"
+
+    def test_failed_image_upload_stays_inline_without_error(self) -> None:
+        files = [
+            {"name": "a.png", "type": "image/png", "data": base64.b64encode(b"x" * 300).decode()}
+        ]
+        with (
+            patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 100),
+            patch(
+                "src.agent.gemini_files.ensure_gemini_file_uri",
+                side_effect=GeminiFileError("quota"),
+            ),
+        ):
+            attach_gemini_file_uris("msg-12", files)
+        assert "gemini_file_uri" not in files[0]
+        assert "gemini_upload_error" not in files[0]
+
 
 class TestDeleteCachedFileUri:
     def test_deletes_cache_entry(self, test_database) -> None:
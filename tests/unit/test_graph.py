@@ -14,7 +14,9 @@ from src.agent.graph import (
     compile_graph,
     create_chat_graph,
     create_tool_node,
+    get_compiled_graph,
     get_graph_config,
+    graph_cache_key,
     should_continue,
 )
 from src.config import Config
@@ -386,6 +388,58 @@ class TestGraphCompilation:
         assert "configurable" not in config
 
 
+class TestCompiledGraphCache:
+    """Tests for the per-worker LRU of compiled graphs."""
+
+    def test_hit_skips_build(self) -> None:
+        build = MagicMock(side_effect=lambda: object())
+        key = graph_cache_key("model", True, False, [], False, None)
+
+        first = get_compiled_graph(key, build)
+        second = get_compiled_graph(key, build)
+
+        assert first is second
+        build.assert_called_once_with()
+
+    def test_key_distinguishes_every_build_input(self) -> None:
+        @tool
+        def alpha() -> str:
+            """Alpha."""
+            return "a"
+
+        @tool
+        def beta() -> str:
+            """Beta."""
+            return "b"
+
+        base = ("model", True, False, [alpha], False, None)
+        variants = [
+            ("other-model", True, False, [alpha], False, None),
+            ("model", False, False, [alpha], False, None),
+            ("model", True, True, [alpha], False, None),
+            ("model", True, False, [alpha, beta], False, None),
+            ("model", True, False, [alpha], True, None),
+            ("model", True, False, [alpha], False, "cachedContents/abc"),
+        ]
+
+        keys = {graph_cache_key(*base)} | {graph_cache_key(*v) for v in variants}
+
+        assert len(keys) == len(variants) + 1
+        assert graph_cache_key(*base) == graph_cache_key("model", True, False, [alpha], False, None)
+
+    def test_evicts_least_recently_used(self) -> None:
+        with patch.object(Config, "AGENT_GRAPH_CACHE_SIZE", 2):
+            a = get_compiled_graph("a", object)
+            get_compiled_graph("b", object)
+            get_compiled_graph("a", object)  # touch: "b" is now the oldest
+            get_compiled_graph("c", object)
+
+            assert get_compiled_graph("a", object) is a
+            build_b = MagicMock(return_value=object())
+            get_compiled_graph("b", build_b)
+            build_b.assert_called_once_with()
+
+
 # ============ Graph Structure Tests ============
 
 
@@ -0,0 +1,77 @@
+"""Unit tests for off-thread HTML extraction (src/utils/html_extraction.py)."""
+
+import time
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import html_extraction
+from src.utils.html_extraction import HTMLExtractionError, extract_text, extract_text_in_thread
+from src.utils.process_pool import TaskTimeoutError, WorkerCrashedError
+
+PAGE = (
+    "<html><body><nav>Menu</nav><article><h1>Pool Test</h1>"
+    + "<p>A paragraph of article text that trafilatura keeps.</p>" * 40
+    + "</article></body></html>"
+)
+
+
+@pytest.fixture
+def pool_enabled() -> Generator[None]:
+    with (
+        patch.object(html_extraction.Config, "HTML_EXTRACT_WORKERS", 1),
+        patch.object(html_extraction.Config, "HTML_EXTRACT_MIN_BYTES", 0),
+    ):
+        yield
+    html_extraction.shutdown_pool()
+
+
+@pytest.mark.usefixtures("pool_enabled")
+class TestExtractionPool:
+    def test_pool_matches_in_thread_result(self) -> None:
+        assert extract_text(PAGE) == extract_text_in_thread(PAGE)
+        assert html_extraction._pool.started
+
+    def test_saturated_pool_parses_in_thread(self) -> None:
+        with (
+            patch.object(html_extraction, "_pending", 2),
+            patch.object(html_extraction._pool, "get") as get_pool,
+        ):
+            assert "Pool Test" in extract_text(PAGE)
+        get_pool.assert_not_called()
+
+    def test_timeout_fails_without_parsing_in_thread(self) -> None:
+        with (
+            patch.object(html_extraction._pool, "run", side_effect=TaskTimeoutError),
+            patch.object(html_extraction, "extract_text_in_thread") as in_thread,
+            pytest.raises(HTMLExtractionError, match="timed out"),
+        ):
+            extract_text(PAGE)
+
+        in_thread.assert_not_called()
+        assert html_extraction._pending == 0
+
+    def test_crashed_worker_fails(self) -> None:
+        with (
+            patch.object(html_extraction._pool, "run", side_effect=WorkerCrashedError),
+            pytest.raises(HTMLExtractionError, match="failed"),
+        ):
+            extract_text(PAGE)
+
+        assert html_extraction._pending == 0
+
+    def test_queued_time_does_not_count_toward_timeout(self) -> None:
+        # The pool holds one worker: the page waits for the sleep to finish
+        with patch.object(html_extraction.Config, "HTML_EXTRACT_TIMEOUT_SECONDS", 0.5):
+            slow = html_extraction._pool.get().submit(time.sleep, 1.5)
+            assert extract_text(PAGE) == extract_text_in_thread(PAGE)
+            slow.result()
+
+    def test_small_pages_stay_in_thread(self) -> None:
+        with (
+            patch.object(html_extraction.Config, "HTML_EXTRACT_MIN_BYTES", len(PAGE) + 1),
+            patch.object(html_extraction._pool, "get") as get_pool,
+        ):
+            extract_text(PAGE)
+        get_pool.assert_not_called()
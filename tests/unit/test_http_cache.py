@@ -0,0 +1,145 @@
+"""Unit tests for the persistent HTTP cache and its fetch_url integration."""
+
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.agent.tools.http_cache import HTTPCache, freshness_lifetime, normalize_url
+from src.agent.tools.web import _fetch_response, _page_text
+
+URL = "https://example.com/article"
+
+
+def _response(
+    status: int = 200, body: bytes = b"<html><p>Hi</p></html>", **headers: str
+) -> httpx.Response:
+    headers = {"content-type": "text/html", **{k.replace("_", "-"): v for k, v in headers.items()}}
+    return httpx.Response(status, headers=headers, content=body, request=httpx.Request("GET", URL))
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[HTTPCache]:
+    http_cache = HTTPCache(db_path=tmp_path / "http_cache.db", max_bytes=10_000)
+    with patch("src.agent.tools.web.get_http_cache", return_value=http_cache):
+        yield http_cache
+    http_cache.close()
+
+
+@pytest.fixture
+def client() -> Generator[MagicMock]:
+    mock_client = MagicMock()
+    mock_client.__enter__ = MagicMock(return_value=mock_client)
+    mock_client.__exit__ = MagicMock(return_value=False)
+    with (
+        patch("src.agent.tools.web.httpx.Client", return_value=mock_client),
+        patch("src.agent.tools.web.validate_public_url", return_value=None) as validate,
+    ):
+        mock_client.validate = validate
+        yield mock_client
+
+
+class TestFreshness:
+    def test_max_age_minus_age(self) -> None:
+        headers = httpx.Headers({"cache-control": "public, max-age=600", "age": "100"})
+        assert freshness_lifetime(headers, time.time()) == 500
+
+    def test_s_maxage_wins_for_a_shared_cache(self) -> None:
+        headers = httpx.Headers({"cache-control": "max-age=600, s-maxage=60"})
+        assert freshness_lifetime(headers, time.time()) == 60
+
+    @pytest.mark.parametrize("directive", ["no-store", "private", "private, max-age=60"])
+    def test_uncacheable(self, directive: str) -> None:
+        assert freshness_lifetime(httpx.Headers({"cache-control": directive}), 0) is None
+
+    def test_last_modified_heuristic(self) -> None:
+        headers = httpx.Headers(
+            {
+                "date": "Thu, 15 Oct 2026 10:00:00 GMT",
+                "last-modified": "Thu, 15 Oct 2026 00:00:00 GMT",
+            }
+        )
+        assert freshness_lifetime(headers, 0) == 3600  # 10% of 10 h
+
+    def test_normalize_url(self) -> None:
+        assert normalize_url(" HTTPS://Example.COM/A?x=1#top ") == "https://example.com/A?x=1"
+
+
+class TestHTTPCache:
+    def test_uncacheable_response_is_not_stored(self, cache: HTTPCache) -> None:
+        assert not cache.store(URL, _response(cache_control="no-store"))
+        assert not cache.store(URL, _response())  # no freshness, no validators
+        assert cache.get(URL) is None
+
+    def test_evicts_least_recently_used_past_byte_budget(self, cache: HTTPCache) -> None:
+        body = b"x" * 2000
+        for i in range(4):
+            cache.store(f"{URL}/{i}", _response(body=body, cache_control="max-age=60"))
+        cache.get(f"{URL}/0")  # touch: /1 is now the oldest
+
+        cache.store(f"{URL}/4", _response(body=body, cache_control="max-age=60"))
+        cache.store(f"{URL}/5", _response(body=body, cache_control="max-age=60"))
+
+        assert cache.get(f"{URL}/1") is None
+        assert cache.get(f"{URL}/0") is not None
+
+
+class TestFetchWithCache:
+    def test_fresh_entry_skips_the_network(self, cache: HTTPCache, client: MagicMock) -> None:
+        client.get.return_value = _response(cache_control="max-age=600")
+
+        _fetch_response(URL)
+        response, error = _fetch_response(URL + "#section")
+
+        assert error is None
+        assert response is not None and response.content == b"<html><p>Hi</p></html>"
+        assert client.get.call_count == 1
+
+    def test_stale_entry_is_revalidated(self, cache: HTTPCache, client: MagicMock) -> None:
+        client.get.side_effect = [
+            _response(etag='"v1"', cache_control="no-cache"),
+            _response(304, body=b"", etag='"v1"'),
+        ]
+
+        _fetch_response(URL)
+        response, _ = _fetch_response(URL)
+
+        assert response is not None and response.content == b"<html><p>Hi</p></html>"
+        assert client.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        # SSRF validation ran for both origin requests
+        assert client.validate.call_count == 2
+
+    def test_revalidate_bypasses_freshness(self, cache: HTTPCache, client: MagicMock) -> None:
+        client.get.return_value = _response(cache_control="max-age=600", etag='"v1"')
+
+        _fetch_response(URL)
+        _fetch_response(URL, revalidate=True)
+
+        assert client.get.call_count == 2
+
+    def test_blocked_url_is_not_served_on_revalidation(
+        self, cache: HTTPCache, client: MagicMock
+    ) -> None:
+        client.get.return_value = _response(etag='"v1"')
+        _fetch_response(URL)
+        client.validate.return_value = "Blocked: private address"
+
+        response, error = _fetch_response(URL)
+
+        assert response is None
+        assert error == "Blocked: private address"
+
+    def test_extracted_text_is_cached_per_body(self, cache: HTTPCache, client: MagicMock) -> None:
+        client.get.return_value = _response(cache_control="max-age=600")
+        response, _ = _fetch_response(URL)
+        assert response is not None
+
+        with patch("src.agent.tools.web._extract_full_text", return_value="Hi") as extract:
+            texts: list[Any] = [_page_text(URL, response), _page_text(URL, response)]
+
+        assert texts == ["Hi", "Hi"]
+        extract.assert_called_once()
@@ -0,0 +1,45 @@
+"""Unit tests for Database.get_messages_from() and get_message_stats()."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from src.db.models import Conversation, Database
+
+
+def _set_created_at(database: Database, message_id: str, created_at: str) -> None:
+    with database._pool.get_connection() as conn:
+        conn.execute("UPDATE messages SET created_at = ? WHERE id = ?", (created_at, message_id))
+
+
+class TestGetMessagesFrom:
+    @pytest.mark.parametrize("offset", [0, 1, 3, 5, 6, 9])
+    def test_matches_slice_of_get_messages(
+        self, test_database: Database, test_conversation: Conversation, offset: int
+    ) -> None:
+        ids = [
+            test_database.add_message(test_conversation.id, "user", f"m{i}").id for i in range(6)
+        ]
+        # Two messages share a timestamp right at several boundaries
+        for i, message_id in enumerate(ids):
+            _set_created_at(test_database, message_id, f"2024-06-15T10:00:0{min(i, 3)}")
+
+        expected = test_database.get_messages(test_conversation.id)[offset:]
+        result = test_database.get_messages_from(test_conversation.id, offset)
+        assert [m.id for m in result] == [m.id for m in expected]
+
+
+class TestGetMessageStats:
+    def test_counts_and_lengths(
+        self, test_database: Database, test_conversation: Conversation
+    ) -> None:
+        test_database.add_message(test_conversation.id, "user", "héllo")
+        test_database.add_message(test_conversation.id, "assistant", "hi there")
+
+        assert test_database.get_message_stats(test_conversation.id) == (2, 13, 8)
+
+    def test_empty_conversation(
+        self, test_database: Database, test_conversation: Conversation
+    ) -> None:
+        assert test_database.get_message_stats(test_conversation.id) == (0, 0, 0)
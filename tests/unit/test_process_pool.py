@@ -0,0 +1,94 @@
+"""Unit tests for the shared worker process pool (src/utils/process_pool.py)."""
+
+import signal
+import time
+from collections.abc import Generator
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils import process_pool
+from src.utils.process_pool import LazyProcessPool, TaskTimeoutError, WorkerCrashedError
+
+
+def _sleep(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+def _swallowing_sleep(seconds: float) -> str:
+    try:
+        time.sleep(seconds)
+    except Exception:
+        return "swallowed"
+    return "done"
+
+
+@pytest.fixture
+def pool() -> Generator[LazyProcessPool]:
+    pool = LazyProcessPool("test", lambda: 1)
+    yield pool
+    pool.shutdown()
+
+
+class TestCallWithDeadline:
+    def test_alarm_interrupts_task(self) -> None:
+        started = time.monotonic()
+        assert process_pool._call_with_deadline(0.05, _sleep, (5,)) == (False, None)
+        assert time.monotonic() - started < 1
+
+    def test_task_fallbacks_cannot_swallow_alarm(self) -> None:
+        assert process_pool._call_with_deadline(0.05, _swallowing_sleep, (5,)) == (False, None)
+
+    def test_fast_task_clears_alarm(self) -> None:
+        assert process_pool._call_with_deadline(5, _sleep, (0,)) == (True, "done")
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+class TestRun:
+    def test_runs_in_worker(self, pool: LazyProcessPool) -> None:
+        assert pool.run(_sleep, 0, timeout=5, backstop=10) == "done"
+        assert pool.started
+
+    def test_timeout_starts_when_worker_picks_task_up(self, pool: LazyProcessPool) -> None:
+        # One worker: the task queues behind a sleep longer than its timeout
+        blocker = pool.get().submit(_sleep, 1)
+        assert pool.run(_sleep, 0.1, timeout=0.5, backstop=5) == "done"
+        blocker.result()
+
+    def test_task_timeout_keeps_pool(self, pool: LazyProcessPool) -> None:
+        with pytest.raises(TaskTimeoutError):
+            pool.run(_sleep, 5, timeout=0.1, backstop=5)
+        worker_pool = pool.get()
+        assert pool.run(_sleep, 0, timeout=5, backstop=10) == "done"
+        assert pool.get() is worker_pool
+
+    def test_stuck_worker_retires_pool(self, pool: LazyProcessPool) -> None:
+        stuck = MagicMock()
+        stuck.submit.return_value.result.side_effect = FutureTimeoutError()
+        with (
+            patch.object(pool, "get", return_value=stuck),
+            pytest.raises(TaskTimeoutError),
+        ):
+            pool.run(_sleep, 0, timeout=1, backstop=1)
+        stuck.terminate_workers.assert_called_once()
+
+    def test_broken_pool_resubmits_once(self, pool: LazyProcessPool) -> None:
+        broken, fresh = MagicMock(), MagicMock()
+        broken.submit.return_value.result.side_effect = BrokenProcessPool()
+        fresh.submit.return_value.result.return_value = (True, "done")
+        with patch.object(pool, "get", side_effect=[broken, fresh]):
+            assert pool.run(_sleep, 0, timeout=1, backstop=1) == "done"
+        broken.terminate_workers.assert_called_once()
+
+    def test_broken_twice_fails(self, pool: LazyProcessPool) -> None:
+        broken = MagicMock()
+        broken.submit.return_value.result.side_effect = BrokenProcessPool()
+        with (
+            patch.object(pool, "get", return_value=broken),
+            pytest.raises(WorkerCrashedError),
+        ):
+            pool.run(_sleep, 0, timeout=1, backstop=1)
+        assert broken.submit.call_count == 2
@@ -14,10 +14,11 @@ def _result(url: str, title: str = "T") -> dict[str, str]:
 class TestRankedUniqueUrls:
     @patch("src.agent.tools.research.search_web")
     def test_interleaves_by_rank_and_dedupes(self, mock_search: MagicMock) -> None:
-        mock_search.side_effect = [
-            [_result("https://a"), _result("https://b")],
-            [_result("https://a"), _result("https://c")],
-        ]
+        by_query = {
+            "q1": [_result("https://a"), _result("https://b")],
+            "q2": [_result("https://a"), _result("https://c")],
+        }
+        mock_search.side_effect = lambda query, _n: by_query[query]
 
         ordered = _ranked_unique_urls(["q1", "q2"], per_query=2)
 
@@ -28,10 +29,12 @@ class TestRankedUniqueUrls:
     def test_failed_query_skipped(self, mock_search: MagicMock) -> None:
         from src.utils.search_provider import SearchProviderError
 
-        mock_search.side_effect = [
-            SearchProviderError("rate limited"),
-            [_result("https://a")],
-        ]
+        def search(query: str, _n: int) -> list[dict[str, str]]:
+            if query == "q1":
+                raise SearchProviderError("rate limited")
+            return [_result("https://a")]
+
+        mock_search.side_effect = search
 
         ordered = _ranked_unique_urls(["q1", "q2"], per_query=2)
 
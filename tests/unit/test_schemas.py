@@ -87,6 +87,20 @@ class TestFileAttachment:
         errors = exc_info.value.errors()
         assert errors[0]["loc"] == ("data",)
 
+    def test_upload_id_instead_of_data(self) -> None:
+        """Should accept an upload_id in place of data, but not both or neither."""
+        upload_id = "123e4567-e89b-12d3-a456-426614174000"
+        data = FileAttachment(name="clip.mp4", type="video/mp4", upload_id=upload_id)
+        assert data.upload_id == upload_id
+        assert data.data is None
+
+        with pytest.raises(ValidationError):
+            FileAttachment(name="a.png", type="image/png", data="base64data", upload_id=upload_id)
+        with pytest.raises(ValidationError):
+            FileAttachment(name="a.png", type="image/png")
+        with pytest.raises(ValidationError):
+            FileAttachment(name="a.png", type="image/png", upload_id="../other-user/x")
+
 
 class TestCreateConversationRequest:
     """Tests for CreateConversationRequest schema."""
@@ -262,6 +276,6 @@ class TestChatRequest:
         data = ChatRequest(
             message="Test", files=[{"name": "test.png", "type": "image/png", "data": "base64data"}]
         )
-        # Convert to dicts for validate_files()
-        files_as_dicts = [f.model_dump() for f in data.files]
+        # Convert to dicts for validate_files() (as the chat routes do)
+        files_as_dicts = [f.model_dump(exclude_none=True) for f in data.files]
         assert files_as_dicts == [{"name": "test.png", "type": "image/png", "data": "base64data"}]
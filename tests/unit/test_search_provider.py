@@ -135,6 +135,50 @@ class TestRouting:
         assert exc_info.value.retriable is True
 
 
+class TestConcurrentQuota:
+    """Batched queries run in parallel; in-flight calls count against quota."""
+
+    @patch("src.utils.search_provider._search_ddgs")
+    @patch("src.utils.search_provider._search_brave")
+    def test_parallel_batch_does_not_overspend_last_slots(
+        self, mock_brave: MagicMock, mock_ddgs: MagicMock
+    ) -> None:
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Two searches left; every query is started before any is billed
+        usage = {usage_key("brave"): Config.SEARCH_QUOTA_BRAVE_MONTHLY - 2}
+        db = _fake_db(usage)
+        started = threading.Barrier(5, timeout=5)
+
+        def ddgs(_q: str, _n: int) -> list[dict[str, str]]:
+            started.wait()
+            return [{"title": "D", "url": "https://d", "snippet": "S"}]
+
+        def brave(_q: str, _n: int) -> list[dict[str, str]]:
+            started.wait()
+            return [{"title": "B", "url": "https://b", "snippet": "S"}]
+
+        mock_brave.side_effect = brave
+        mock_ddgs.side_effect = ddgs
+        with (
+            patch.multiple(Config, BRAVE_SEARCH_API_KEY="bk", TAVILY_API_KEY="", EXA_API_KEY=""),
+            patch("src.utils.search_provider.db", db),
+            ThreadPoolExecutor(max_workers=5) as pool,
+        ):
+            results = list(pool.map(lambda q: search_web(q, 3), [f"q{i}" for i in range(5)]))
+
+        assert mock_brave.call_count == 2
+        assert mock_ddgs.call_count == 3
+        assert sorted(r[0]["url"] for r in results) == ["https://b"] * 2 + ["https://d"] * 3
+
+    def test_provider_clients_are_reused(self) -> None:
+        from src.utils.search_provider import _http_client
+
+        assert _http_client("brave") is _http_client("brave")
+        assert _http_client("brave") is not _http_client("exa")
+
+
 class TestMonthlyUsage:
     def test_usage_key_includes_current_month(self) -> None:
         key = usage_key("brave")
@@ -154,7 +198,7 @@ class TestMonthlyUsage:
 
 class TestBraveSearch:
     @patch.object(Config, "BRAVE_SEARCH_API_KEY", "test-key")
-    @patch("src.utils.search_provider.httpx.get")
+    @patch("src.utils.search_provider.httpx.Client.get")
     def test_maps_brave_results_to_contract(self, mock_get: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -178,7 +222,7 @@ class TestBraveSearch:
         assert mock_get.call_args.kwargs["headers"]["X-Subscription-Token"] == "test-key"
 
     @patch.object(Config, "BRAVE_SEARCH_API_KEY", "test-key")
-    @patch("src.utils.search_provider.httpx.get")
+    @patch("src.utils.search_provider.httpx.Client.get")
     def test_brave_caps_results(self, mock_get: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -194,7 +238,7 @@ class TestBraveSearch:
 
 
 class TestTavilySearch:
-    @patch("src.utils.search_provider.httpx.post")
+    @patch("src.utils.search_provider.httpx.Client.post")
     def test_maps_tavily_results_to_contract(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -216,7 +260,7 @@ class TestTavilySearch:
         assert results == [{"title": "T1", "url": "https://a.example", "snippet": "C1"}]
         assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer tvly-key"
 
-    @patch("src.utils.search_provider.httpx.post")
+    @patch("src.utils.search_provider.httpx.Client.post")
     def test_tavily_rate_limit_is_retriable(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 429
@@ -236,7 +280,7 @@ class TestTavilySearch:
 
 
 class TestExaSearch:
-    @patch("src.utils.search_provider.httpx.post")
+    @patch("src.utils.search_provider.httpx.Client.post")
     def test_maps_exa_results_to_contract(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -258,7 +302,7 @@ class TestExaSearch:
         assert results == [{"title": "T1", "url": "https://a.example", "snippet": "body text"}]
         assert mock_post.call_args.kwargs["headers"]["x-api-key"] == "exa-key"
 
-    @patch("src.utils.search_provider.httpx.post")
+    @patch("src.utils.search_provider.httpx.Client.post")
     def test_exa_out_of_credits_falls_through(self, mock_post: MagicMock) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 402
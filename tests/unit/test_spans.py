@@ -0,0 +1,111 @@
+"""Unit tests for per-turn latency spans and their tool-node integration."""
+
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, StateGraph
+
+from src.agent.graph import AgentState, create_tool_node
+from src.utils.spans import (
+    SpanRecorder,
+    get_span_recorder,
+    mark_span,
+    new_span_recorder,
+    set_span_recorder,
+    span,
+)
+
+
+@pytest.fixture
+def recorder() -> Generator[SpanRecorder]:
+    recorder = SpanRecorder()
+    set_span_recorder(recorder)
+    yield recorder
+    set_span_recorder(None)
+
+
+class TestSpanRecorder:
+    def test_repeated_spans_are_summed_and_counted(self) -> None:
+        recorder = SpanRecorder()
+        recorder.add("llm", 100.4)
+        recorder.add("llm", 200.4)
+
+        assert recorder.summary()["llm"] == {"ms": 301, "n": 2}
+
+    def test_only_the_first_mark_counts(self) -> None:
+        recorder = SpanRecorder()
+        with patch("src.utils.spans.time.perf_counter", side_effect=[1.5, 2.5, 3.0]):
+            recorder.started = 1.0
+            recorder.mark("first_token")
+            recorder.mark("first_token")
+            summary = recorder.summary()
+
+        assert summary["first_token"] == {"ms": 500, "n": 1}
+        assert summary["turn"] == {"ms": 2000, "n": 1}
+
+    def test_span_records_even_when_the_block_raises(self, recorder: SpanRecorder) -> None:
+        with pytest.raises(ValueError), span("save_message"):
+            raise ValueError("boom")
+
+        assert recorder.summary()["save_message"]["n"] == 1
+
+
+class TestCurrentRecorder:
+    def test_span_without_recorder_is_a_no_op(self) -> None:
+        assert get_span_recorder() is None
+        with span("history"):
+            pass
+        mark_span("first_token")
+
+    def test_explicit_recorder_wins(self, recorder: SpanRecorder) -> None:
+        other = SpanRecorder()
+        with span("save_user_message", other):
+            pass
+
+        assert "save_user_message" in other.summary()
+        assert "save_user_message" not in recorder.summary()
+
+    def test_disabled_tracing_creates_no_recorder(self) -> None:
+        with patch("src.utils.spans.Config.TURN_SPANS_ENABLED", False):
+            assert new_span_recorder() is None
+        assert isinstance(new_span_recorder(), SpanRecorder)
+
+
+def _run_tools(tools: list[Any], tool_calls: list[dict[str, Any]]) -> None:
+    graph: StateGraph[AgentState] = StateGraph(AgentState)
+    graph.add_node("tools", create_tool_node(tools))
+    graph.set_entry_point("tools")
+    graph.add_edge("tools", END)
+    graph.compile().invoke(
+        {"messages": [AIMessage(content="", tool_calls=tool_calls)], "tool_retries": 0}
+    )
+
+
+class TestToolSpans:
+    def test_each_tool_call_is_timed(self, recorder: SpanRecorder) -> None:
+        @tool
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        @tool
+        def broken(key: str) -> str:
+            """Always fails."""
+            raise RuntimeError("down")
+
+        _run_tools(
+            [lookup, broken],
+            [
+                {"name": "lookup", "args": {"key": "a"}, "id": "c1"},
+                {"name": "lookup", "args": {"key": "b"}, "id": "c2"},
+                {"name": "broken", "args": {"key": "c"}, "id": "c3"},
+            ],
+        )
+
+        summary = recorder.summary()
+        assert summary["tool:lookup"]["n"] == 2
+        assert summary["tool:broken"]["n"] == 1
@@ -0,0 +1,143 @@
+"""Unit tests for resume-tail wakeups (in-process condition + cross-worker sockets)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.api.helpers import stream_notify
+from src.api.helpers.stream_notify import (
+    StreamSubscription,
+    _CrossWorkerChannel,
+    notify_stream_update,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestStreamSubscription:
+    def test_wait_wakes_on_notify_from_other_thread(self) -> None:
+        sub = StreamSubscription("msg-wake")
+        try:
+            timer = threading.Timer(0.05, notify_stream_update, args=("msg-wake",))
+            timer.start()
+            started = time.monotonic()
+            assert sub.wait(5) is True
+            assert time.monotonic() - started < 2
+        finally:
+            sub.close()
+
+    def test_wait_times_out_without_notify(self) -> None:
+        sub = StreamSubscription("msg-quiet")
+        try:
+            assert sub.wait(0.01) is False
+        finally:
+            sub.close()
+
+    def test_change_between_waits_is_not_lost(self) -> None:
+        sub = StreamSubscription("msg-race")
+        try:
+            notify_stream_update("msg-race")  # e.g. while the tail read the journal
+            assert sub.wait(0) is True
+            assert sub.wait(0) is False
+        finally:
+            sub.close()
+
+    def test_notify_for_other_message_does_not_wake(self) -> None:
+        sub = StreamSubscription("msg-a")
+        try:
+            notify_stream_update("msg-b")
+            assert sub.wait(0) is False
+        finally:
+            sub.close()
+
+    def test_wait_async_wakes_on_notify_from_other_thread(self) -> None:
+        sub = StreamSubscription("msg-async")
+
+        async def wait() -> bool:
+            threading.Timer(0.05, notify_stream_update, args=("msg-async",)).start()
+            return await sub.wait_async(5)
+
+        try:
+            started = time.monotonic()
+            assert asyncio.run(wait()) is True
+            assert time.monotonic() - started < 2
+            assert stream_notify._subscriptions["msg-async"].async_waiters == []
+        finally:
+            sub.close()
+
+    def test_wait_async_times_out_without_notify(self) -> None:
+        sub = StreamSubscription("msg-async-quiet")
+        try:
+            assert asyncio.run(sub.wait_async(0.01)) is False
+        finally:
+            sub.close()
+
+    def test_unsubscribed_ids_are_not_tracked(self) -> None:
+        sub = StreamSubscription("msg-gone")
+        sub.close()
+        notify_stream_update("msg-gone")
+        assert "msg-gone" not in stream_notify._subscriptions
+
+
+class TestCrossWorkerChannel:
+    def test_broadcast_reaches_other_worker(self, tmp_path: Path) -> None:
+        received: list[str] = []
+        got = threading.Event()
+
+        def on_message(message_id: str) -> None:
+            received.append(message_id)
+            got.set()
+
+        listener = _CrossWorkerChannel(tmp_path, "worker-a", on_message)
+        sender = _CrossWorkerChannel(tmp_path, "worker-b")
+        listener.start()
+        try:
+            sender.broadcast("msg-123")
+            assert got.wait(5)
+            assert received == ["msg-123"]
+        finally:
+            listener.close()
+            sender.close()
+
+    def test_broadcast_skips_own_socket(self, tmp_path: Path) -> None:
+        received: list[str] = []
+        channel = _CrossWorkerChannel(tmp_path, "worker-a", received.append)
+        channel.start()
+        try:
+            channel.broadcast("msg-self")
+            time.sleep(0.1)
+            assert received == []
+        finally:
+            channel.close()
+
+    def test_stale_socket_of_dead_worker_is_swept(self, tmp_path: Path) -> None:
+        dead = _CrossWorkerChannel(tmp_path, "worker-dead", lambda _mid: None)
+        dead.start()
+        # Simulate a killed process: socket file stays, nobody reads it
+        assert dead._listener is not None
+        dead._listener.close()
+        dead._listener = None
+        assert dead.path.exists()
+
+        sender = _CrossWorkerChannel(tmp_path, "worker-b")
+        try:
+            sender.broadcast("msg-1")
+            assert not dead.path.exists()
+        finally:
+            sender.close()
+
+    def test_disabled_channel_does_nothing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Patch the module's Config: test_config reloads src.config
+        monkeypatch.setattr(stream_notify.Config, "STREAM_NOTIFY_CROSS_WORKER", False)
+        channel = _CrossWorkerChannel(tmp_path / "notify", "worker-a")
+        channel.start()
+        channel.broadcast("msg-1")
+        assert not (tmp_path / "notify").exists()
@@ -175,6 +175,48 @@ class TestStreamResumeEvents:
         assert events[0]["code"] == "RESUME_FAILED"
 
 
+class TestResumePushWakeups:
+    @pytest.fixture(autouse=True)
+    def _patch_db(self, test_database: Database, monkeypatch: pytest.MonkeyPatch):
+        from src.api.helpers import stream_resume
+
+        monkeypatch.setattr(stream_resume, "db", test_database)
+        yield
+
+    def test_tail_wakes_on_journal_flush_not_poll(
+        self, test_database: Database, test_user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A live tail is woken by the producer's flush, well before the slow
+        fallback poll would have re-read the journal."""
+        import threading
+        import time
+
+        from src.api.helpers.stream_resume import _StreamJournal, stream_resume_events
+
+        monkeypatch.setattr(Config, "STREAM_RESUME_FALLBACK_POLL_SECONDS", 30)
+        monkeypatch.setattr(Config, "SSE_KEEPALIVE_INTERVAL", 30)
+        conv = test_database.create_conversation(test_user.id, model=Config.DEFAULT_MODEL)
+        msg = test_database.add_message(conv.id, MessageRole.ASSISTANT, "")
+
+        def produce() -> None:
+            time.sleep(0.2)
+            journal = _StreamJournal(msg.id)
+            journal.record({"type": "token", "text": "hi"})
+            journal.flush()
+            time.sleep(0.2)
+            test_database.update_message_content(msg.id, "hi")
+            journal.finish()
+
+        producer = threading.Thread(target=produce)
+        started = time.monotonic()
+        producer.start()
+        events = _drain_sse(stream_resume_events(msg.id, after_seq=0))
+        producer.join()
+
+        assert [e["type"] for e in events] == ["token", "done"]
+        assert time.monotonic() - started < 10
+
+
 class TestResumeStallBound:
     @pytest.fixture(autouse=True)
     def _patch_db(self, test_database: Database, monkeypatch: pytest.MonkeyPatch):
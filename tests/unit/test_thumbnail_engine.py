@@ -0,0 +1,122 @@
+"""Unit tests for the thumbnail engine (src/utils/thumbnail_engine.py)."""
+
+import base64
+import io
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from src.db.blob_store import BlobStore
+from src.utils import thumbnail_engine
+from src.utils.process_pool import TaskTimeoutError, WorkerCrashedError
+from src.utils.thumbnail_engine import render_stored_thumbnails, render_thumbnails
+from tests.fixtures.images import create_test_jpeg, create_test_png
+
+BOXES = {"sidebar": (128, 128), "message": (400, 400), "preview": (1600, 1600)}
+TARGETS = {"sidebar": "m/0.thumb.sidebar", "message": "m/0.thumb", "preview": "m/0.thumb.preview"}
+
+
+def _size(data: bytes) -> tuple[int, int]:
+    return Image.open(io.BytesIO(data)).size
+
+
+@pytest.fixture
+def store(test_blob_store: BlobStore) -> Generator[BlobStore]:
+    with patch.object(thumbnail_engine, "get_blob_store", return_value=test_blob_store):
+        yield test_blob_store
+
+
+class TestRenderThumbnails:
+    def test_renders_every_size_from_one_decode(self) -> None:
+        jpeg = base64.b64decode(create_test_jpeg(4000, 3000))
+
+        with patch.object(Image, "open", wraps=Image.open) as mock_open:
+            rendered = render_thumbnails(jpeg, "image/jpeg", BOXES)
+
+        mock_open.assert_called_once()
+        assert _size(rendered["preview"][0]) == (1600, 1200)
+        assert _size(rendered["message"][0]) == (400, 300)
+        assert _size(rendered["sidebar"][0]) == (128, 96)
+        assert all(mime == "image/jpeg" for _, mime in rendered.values())
+
+    def test_jpeg_drafts_to_largest_target(self) -> None:
+        jpeg = base64.b64decode(create_test_jpeg(4000, 3000))
+
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as mock_draft:
+            render_thumbnails(jpeg, "image/jpeg", BOXES)
+
+        # 4000x3000 -> decoded at 1/2 scale, the smallest covering 1600x1200
+        assert mock_draft.call_args_list[0].args[1:] == (None, (1600, 1200))
+
+    def test_skips_preview_for_small_images(self) -> None:
+        png = base64.b64decode(create_test_png(800, 600))
+
+        rendered = render_thumbnails(png, "image/png", BOXES)
+
+        assert set(rendered) == {"sidebar", "message"}
+        assert rendered["message"][1] == "image/png"
+
+    def test_flattens_transparency_for_jpeg(self) -> None:
+        img = Image.new("RGBA", (600, 600), (255, 0, 0, 0))
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+
+        rendered = render_thumbnails(buffer.getvalue(), "image/jpeg", {"message": (400, 400)})
+
+        thumb = Image.open(io.BytesIO(rendered["message"][0]))
+        assert thumb.format == "JPEG"
+        assert thumb.getpixel((0, 0)) == (255, 255, 255)
+
+
+class TestRenderStoredThumbnails:
+    def test_saves_binary_thumbnails(self, store: BlobStore) -> None:
+        store.save("m/0", base64.b64decode(create_test_jpeg(2400, 1800)), "image/jpeg")
+
+        sizes = render_stored_thumbnails("m/0", "image/jpeg", TARGETS)
+
+        assert sizes == ["preview", "message", "sidebar"]
+        message = store.get("m/0.thumb")
+        assert message is not None
+        assert message[1] == "image/jpeg"
+        assert _size(message[0]) == (400, 300)
+        assert store.exists("m/0.thumb.preview")
+        assert store.exists("m/0.thumb.sidebar")
+
+    def test_missing_image(self, store: BlobStore) -> None:
+        assert render_stored_thumbnails("m/0", "image/jpeg", TARGETS) is None
+
+    def test_undecodable_image(self, store: BlobStore) -> None:
+        store.save("m/0", b"not an image", "image/png")
+
+        assert render_stored_thumbnails("m/0", "image/png", TARGETS) is None
+        assert not store.exists("m/0.thumb")
+
+
+@pytest.fixture
+def pool_enabled() -> Generator[None]:
+    with patch.object(thumbnail_engine.Config, "THUMBNAIL_WORKER_PROCESSES", 1):
+        yield
+    thumbnail_engine.shutdown_pool()
+
+
+@pytest.mark.usefixtures("pool_enabled")
+class TestThumbnailPool:
+    def test_worker_writes_to_blob_store(self, store: BlobStore) -> None:
+        store.save("m/0", base64.b64decode(create_test_png(1000, 500)), "image/png")
+
+        assert render_stored_thumbnails("m/0", "image/png", TARGETS) == ["message", "sidebar"]
+        assert thumbnail_engine._pool.started
+        message = store.get("m/0.thumb")
+        assert message is not None
+        assert message[1] == "image/png"
+        assert _size(message[0]) == (400, 200)
+
+    def test_timeout_or_crash_fails(self, store: BlobStore) -> None:
+        for error in (TaskTimeoutError, WorkerCrashedError):
+            with patch.object(thumbnail_engine._pool, "run", side_effect=error):
+                assert render_stored_thumbnails("m/0", "image/png", TARGETS) is None
@@ -0,0 +1,178 @@
+"""Unit tests for the local Todoist mirror (src/utils/todoist_sync.py)."""
+
+import json
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.db.models import Database, User
+from src.utils.planner_data import fetch_todoist_dashboard_data
+from src.utils.todoist_sync import TodoistSyncError, sync_todoist_mirror
+
+
+def _day(offset: int) -> str:
+    return (datetime.now().date() + timedelta(days=offset)).isoformat()
+
+
+def _task(task_id: str, due_offset: int | None = None, **fields: Any) -> dict[str, Any]:
+    task: dict[str, Any] = {
+        "id": task_id,
+        "content": f"Task {task_id}",
+        "project_id": "p1",
+        "child_order": 1,
+        "checked": False,
+        "is_deleted": False,
+        "due": {"date": _day(due_offset)} if due_offset is not None else None,
+    }
+    return {**task, **fields}
+
+
+FULL_SYNC = {
+    "sync_token": "token-1",
+    "full_sync": True,
+    "items": [
+        _task("t-overdue", -2, section_id="s1"),
+        _task("t-today", 0),
+        _task("t-later", 10),
+        _task("t-undated"),
+    ],
+    "projects": [{"id": "p1", "name": "Home", "child_order": 1}],
+    "sections": [{"id": "s1", "name": "Chores", "project_id": "p1"}],
+}
+
+
+@pytest.fixture
+def sync_api() -> Generator[MagicMock]:
+    with patch("src.utils.todoist_sync._request_sync") as request_sync:
+        yield request_sync
+
+
+class TestSyncTodoistMirror:
+    def test_incremental_sync_sends_token_and_applies_deltas(
+        self, test_database: Database, test_user: User, sync_api: MagicMock
+    ) -> None:
+        sync_api.side_effect = [
+            FULL_SYNC,
+            {
+                "sync_token": "token-2",
+                "full_sync": False,
+                "items": [
+                    _task("t-today", 0, checked=True),
+                    _task("t-later", 10, is_deleted=True),
+                    _task("t-new", 1),
+                ],
+            },
+        ]
+
+        sync_todoist_mirror(test_database, test_user.id, "tok")
+        mirror = sync_todoist_mirror(test_database, test_user.id, "tok", force=True)
+
+        assert [call.args[1] for call in sync_api.call_args_list] == ["*", "token-1"]
+        assert {t["id"] for t in mirror.tasks()} == {"t-overdue", "t-undated", "t-new"}
+        assert mirror.project_names() == {"p1": "Home"}
+        state = test_database.get_todoist_sync_state(test_user.id)
+        assert state is not None and state[0] == "token-2"
+
+    def test_recent_sync_is_not_repeated_unless_stale(
+        self, test_database: Database, test_user: User, sync_api: MagicMock
+    ) -> None:
+        sync_api.return_value = FULL_SYNC
+
+        mirror = sync_todoist_mirror(test_database, test_user.id, "tok")
+        sync_todoist_mirror(test_database, test_user.id, "tok")
+        assert sync_api.call_count == 1
+
+        mirror.mark_stale()
+        sync_todoist_mirror(test_database, test_user.id, "tok")
+        assert sync_api.call_count == 2
+
+    def test_new_token_clears_the_mirror(
+        self, test_database: Database, test_user: User, sync_api: MagicMock
+    ) -> None:
+        sync_api.return_value = FULL_SYNC
+        sync_todoist_mirror(test_database, test_user.id, "tok")
+
+        test_database.update_user_todoist_token(test_user.id, "other-account")
+
+        assert test_database.get_todoist_sync_state(test_user.id) is None
+        assert test_database.list_todoist_objects(test_user.id, "item") == []
+
+
+class TestDashboardFromMirror:
+    def test_splits_overdue_and_upcoming_within_seven_days(
+        self, test_database: Database, test_user: User, sync_api: MagicMock
+    ) -> None:
+        sync_api.return_value = FULL_SYNC
+
+        upcoming, overdue, error = fetch_todoist_dashboard_data(
+            "tok", user_id=test_user.id, db=test_database
+        )
+
+        assert error is None
+        assert [t.id for t in overdue] == ["t-overdue"]
+        assert overdue[0].project_name == "Home"
+        assert overdue[0].section_name == "Chores"
+        assert [t.id for t in upcoming] == ["t-today"]
+
+    def test_expired_token_reports_reconnect(
+        self, test_database: Database, test_user: User, sync_api: MagicMock
+    ) -> None:
+        sync_api.side_effect = TodoistSyncError("Todoist Sync API error (401)", 401)
+
+        upcoming, overdue, error = fetch_todoist_dashboard_data(
+            "tok", user_id=test_user.id, db=test_database
+        )
+
+        assert (upcoming, overdue) == ([], [])
+        assert error is not None and "reconnect" in error
+
+
+class TestTodoistToolWithMirror:
+    @pytest.fixture(autouse=True)
+    def _context(self, test_database: Database, test_user: User) -> Generator[None]:
+        with (
+            patch("src.agent.tools.todoist._get_todoist_token", return_value="tok"),
+            patch(
+                "src.agent.tools.todoist.get_conversation_context",
+                return_value=("conv-1", test_user.id),
+            ),
+            patch("src.db.models.db", test_database),
+        ):
+            yield
+
+    def test_list_tasks_reads_the_mirror(self, sync_api: MagicMock) -> None:
+        from src.agent.tools import todoist
+
+        sync_api.return_value = FULL_SYNC
+        with patch("src.agent.tools.todoist._todoist_api_request") as api:
+            parsed = json.loads(todoist.invoke({"action": "list_tasks"}))
+
+        api.assert_not_called()
+        assert parsed["count"] == 4
+        overdue = next(t for t in parsed["tasks"] if t["id"] == "t-overdue")
+        assert overdue["project_name"] == "Home"
+        assert overdue["section_name"] == "Chores"
+
+    def test_writes_patch_the_mirror(self, test_user: User, sync_api: MagicMock) -> None:
+        from src.agent.tools import todoist
+
+        sync_api.return_value = FULL_SYNC
+        todoist.invoke({"action": "list_tasks"})
+
+        with patch("src.agent.tools.todoist._todoist_api_request") as api:
+            api.return_value = _task("t-added", 3)
+            todoist.invoke({"action": "add_task", "content": "Task t-added"})
+            api.return_value = None
+            todoist.invoke({"action": "complete_task", "task_id": "t-today"})
+
+        sync_api.return_value = {"sync_token": "token-2", "full_sync": False}
+        parsed = json.loads(todoist.invoke({"action": "list_tasks"}))
+
+        # complete_task marked the mirror stale: the read pulled a delta
+        assert sync_api.call_args.args[1] == "token-1"
+        ids = {t["id"] for t in parsed["tasks"]}
+        assert "t-added" in ids
+        assert "t-today" not in ids
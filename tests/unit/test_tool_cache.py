@@ -0,0 +1,268 @@
+"""Unit tests for the tool result cache and its tool-node integration."""
+
+import json
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, StateGraph
+
+from src.agent.graph import AgentState, create_tool_node
+from src.agent.tool_cache import (
+    ToolCachePolicy,
+    ToolResultCache,
+    cache_key,
+    get_tool_cache,
+    label_cached_result,
+)
+from src.agent.tools import TOOL_CACHE_POLICIES
+from src.agent.tools.context import set_conversation_context, set_location_context
+
+
+@pytest.fixture
+def user_context() -> Generator[None]:
+    set_conversation_context("conv-1", "user-1")
+    yield
+    set_conversation_context(None, None)
+    set_location_context(None)
+
+
+class TestToolResultCache:
+    def test_expired_entries_miss(self) -> None:
+        cache = ToolResultCache(1024)
+        with patch("src.agent.tool_cache.time.monotonic", side_effect=[0.0, 5.0, 11.0]):
+            cache.put(("t", None, "{}", None), "result", ttl_seconds=10)
+            assert cache.get(("t", None, "{}", None)) == ("result", 5.0)
+            assert cache.get(("t", None, "{}", None)) is None
+
+        assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_evicts_least_recently_used_past_byte_budget(self) -> None:
+        cache = ToolResultCache(10)
+        cache.put(("a",), "aaaa", 60)
+        cache.put(("b",), "bbbb", 60)
+        cache.get(("a",))  # touch: "b" is now the oldest
+        cache.put(("c",), "cccc", 60)
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 8
+
+    def test_oversized_result_is_not_stored(self) -> None:
+        cache = ToolResultCache(4)
+        cache.put(("a",), "ěěě", 60)  # 6 bytes in UTF-8
+
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidate_is_per_tool_and_user(self) -> None:
+        cache = ToolResultCache(1024)
+        cache.put(("google_calendar", "u1", "x", None), "1", 60)
+        cache.put(("google_calendar", "u2", "x", None), "2", 60)
+        cache.put(("garmin_connect", "u1", "x", None), "3", 60)
+
+        assert cache.invalidate("google_calendar", "u1") == 1
+        assert cache.stats()["entries"] == 2
+
+
+class TestCacheKey:
+    def test_web_search_queries_are_canonicalized(self) -> None:
+        policy = TOOL_CACHE_POLICIES["web_search"]
+
+        a = cache_key(policy, "web_search", {"query": "  Prague   weather "}, "u1")
+        b = cache_key(
+            policy, "web_search", {"queries": ["prague weather"], "num_results": None}, "u2"
+        )
+
+        assert a == b
+
+    def test_fetch_url_ignores_fragment_and_host_case(self) -> None:
+        policy = TOOL_CACHE_POLICIES["fetch_url"]
+
+        a = cache_key(policy, "fetch_url", {"url": "https://Example.com/a?x=1#top"}, None)
+        b = cache_key(policy, "fetch_url", {"url": "https://example.com/a?x=1"}, None)
+
+        assert a == b
+
+    def test_user_scoped_results_are_keyed_per_user(self) -> None:
+        policy = TOOL_CACHE_POLICIES["garmin_connect"]
+        args = {"action": "get_stats", "date_str": "2026-10-01"}
+
+        assert cache_key(policy, "garmin_connect", args, "u1") != cache_key(
+            policy, "garmin_connect", args, "u2"
+        )
+        assert cache_key(policy, "garmin_connect", args, None) is None
+
+    def test_writes_get_no_key(self) -> None:
+        policy = TOOL_CACHE_POLICIES["google_calendar"]
+
+        assert cache_key(policy, "google_calendar", {"action": "create_event"}, "u1") is None
+        assert cache_key(policy, "google_calendar", {"action": "list_events"}, "u1") is not None
+
+    def test_current_location_is_part_of_the_key(self, user_context: None) -> None:
+        policy = TOOL_CACHE_POLICIES["search_places"]
+        args = {"query": "pharmacy", "near": "current"}
+
+        set_location_context({"lat": 49.19, "lon": 16.61})
+        brno = cache_key(policy, "search_places", args, "user-1")
+        set_location_context({"lat": 50.08, "lon": 14.43})
+        prague = cache_key(policy, "search_places", args, "user-1")
+
+        assert brno != prague
+
+    def test_fresh_does_not_change_the_key(self) -> None:
+        policy = ToolCachePolicy(ttl_seconds=60)
+
+        assert cache_key(policy, "t", {"q": "x", "fresh": True}, "u1") == cache_key(
+            policy, "t", {"q": "x"}, "u1"
+        )
+
+
+class TestLabel:
+    def test_json_objects_stay_parseable(self) -> None:
+        labelled = json.loads(label_cached_result('{"results": []}', "web_search", 42.4))
+
+        assert labelled["results"] == []
+        assert "42s ago" in labelled["_cached"]
+        assert "fresh=true" in labelled["_cached"]
+
+    def test_text_gets_a_leading_note(self) -> None:
+        labelled = label_cached_result("# Page", "fetch_url", 3)
+
+        assert labelled.startswith("[Cached result from 3s ago.")
+        assert labelled.endswith("\n# Page")
+
+
+def _compile_tool_graph(tools: list[Any]) -> Any:
+    graph: StateGraph[AgentState] = StateGraph(AgentState)
+    graph.add_node("tools", create_tool_node(tools))
+    graph.set_entry_point("tools")
+    graph.add_edge("tools", END)
+    return graph.compile()
+
+
+def _run(compiled: Any, tool_calls: list[dict[str, Any]]) -> list[ToolMessage]:
+    result = compiled.invoke(
+        {"messages": [AIMessage(content="", tool_calls=tool_calls)], "tool_retries": 0}
+    )
+    return [m for m in result["messages"] if isinstance(m, ToolMessage)]
+
+
+@pytest.mark.usefixtures("user_context")
+class TestToolNodeCaching:
+    def test_repeated_call_is_served_from_cache(self) -> None:
+        calls: list[str] = []
+
+        @tool
+        def web_search(query: str = "", fresh: bool = False) -> str:
+            """Search."""
+            calls.append(query)
+            return json.dumps({"query": query, "results": [len(calls)]})
+
+        compiled = _compile_tool_graph([web_search])
+        _run(compiled, [{"name": "web_search", "args": {"query": "x"}, "id": "c1"}])
+        messages = _run(compiled, [{"name": "web_search", "args": {"query": "X "}, "id": "c2"}])
+
+        assert calls == ["x"]
+        assert messages[0].tool_call_id == "c2"
+        data = json.loads(messages[0].content)
+        assert data["results"] == [1]
+        assert "_cached" in data
+
+    def test_fresh_bypasses_and_refreshes(self) -> None:
+        calls: list[str] = []
+
+        @tool
+        def web_search(query: str = "", fresh: bool = False) -> str:
+            """Search."""
+            calls.append(query)
+            return json.dumps({"results": [len(calls)]})
+
+        compiled = _compile_tool_graph([web_search])
+        _run(compiled, [{"name": "web_search", "args": {"query": "x"}, "id": "c1"}])
+        fresh = _run(
+            compiled, [{"name": "web_search", "args": {"query": "x", "fresh": True}, "id": "c2"}]
+        )
+        cached = _run(compiled, [{"name": "web_search", "args": {"query": "x"}, "id": "c3"}])
+
+        assert len(calls) == 2
+        assert json.loads(fresh[0].content) == {"results": [2]}
+        assert json.loads(cached[0].content)["results"] == [2]
+
+    def test_errors_are_not_cached(self) -> None:
+        calls: list[str] = []
+
+        @tool
+        def web_search(query: str = "", fresh: bool = False) -> str:
+            """Search."""
+            calls.append(query)
+            return json.dumps({"error": "rate limited"})
+
+        compiled = _compile_tool_graph([web_search])
+        for call_id in ("c1", "c2"):
+            _run(compiled, [{"name": "web_search", "args": {"query": "x"}, "id": call_id}])
+
+        assert len(calls) == 2
+
+    def test_write_invalidates_cached_reads(self) -> None:
+        reads: list[str] = []
+
+        @tool
+        def google_calendar(action: str, fresh: bool = False) -> str:
+            """Calendar."""
+            if action == "list_events":
+                reads.append(action)
+            return json.dumps({"action": action, "n": len(reads)})
+
+        compiled = _compile_tool_graph([google_calendar])
+        list_call = {"name": "google_calendar", "args": {"action": "list_events"}}
+        _run(compiled, [{**list_call, "id": "c1"}])
+        _run(compiled, [{**list_call, "id": "c2"}])
+        _run(
+            compiled, [{"name": "google_calendar", "args": {"action": "create_event"}, "id": "c3"}]
+        )
+        _run(compiled, [{**list_call, "id": "c4"}])
+
+        assert len(reads) == 2
+
+    def test_mixed_batch_answers_every_call(self) -> None:
+        calls: list[str] = []
+
+        @tool
+        def web_search(query: str = "", fresh: bool = False) -> str:
+            """Search."""
+            calls.append(query)
+            return json.dumps({"query": query})
+
+        compiled = _compile_tool_graph([web_search])
+        _run(compiled, [{"name": "web_search", "args": {"query": "a"}, "id": "c1"}])
+        messages = _run(
+            compiled,
+            [
+                {"name": "web_search", "args": {"query": "a"}, "id": "c2"},
+                {"name": "web_search", "args": {"query": "b"}, "id": "c3"},
+            ],
+        )
+
+        assert calls == ["a", "b"]
+        assert {m.tool_call_id for m in messages} == {"c2", "c3"}
+
+    def test_disabled_cache_always_runs(self) -> None:
+        calls: list[str] = []
+
+        @tool
+        def web_search(query: str = "", fresh: bool = False) -> str:
+            """Search."""
+            calls.append(query)
+            return json.dumps({"query": query})
+
+        compiled = _compile_tool_graph([web_search])
+        with patch("src.agent.tool_cache.Config.TOOL_CACHE_ENABLED", False):
+            for call_id in ("c1", "c2"):
+                _run(compiled, [{"name": "web_search", "args": {"query": "x"}, "id": call_id}])
+
+        assert len(calls) == 2
+        assert get_tool_cache().stats()["entries"] == 0
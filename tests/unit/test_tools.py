@@ -34,11 +34,11 @@ from src.agent.tools.code_execution import (
 )
 from src.agent.tools.image_generation import VALID_ASPECT_RATIOS
 from src.agent.tools.web import (
-    _extract_main_content,
     _extract_text_from_html,
     _get_content_type_category,
 )
 from src.config import Config
+from src.utils.html_extraction import extract_main_content
 
 
 class TestFetchUrl:
@@ -328,7 +328,7 @@ class TestHtmlExtraction:
 
     def test_falls_back_when_main_content_too_short(self) -> None:
         """A link hub with no article body falls back to html2text."""
-        with patch("src.agent.tools.web._extract_main_content", return_value="") as mock_main:
+        with patch("src.utils.html_extraction.extract_main_content", return_value="") as mock_main:
             text = _extract_text_from_html(
                 "<html><body><ul><li>Headline A</li><li>Headline B</li></ul></body></html>"
             )
@@ -337,30 +337,32 @@ class TestHtmlExtraction:
 
     def test_main_content_used_when_sufficient(self) -> None:
         """A sufficiently long main-content extract is used verbatim (no fallback)."""
-        long_text = "Real article body. " * 30  # > _MIN_MAIN_CONTENT_CHARS
-        with patch("src.agent.tools.web._extract_main_content", return_value=long_text):
+        long_text = "Real article body. " * 30  # > MIN_MAIN_CONTENT_CHARS
+        with patch("src.utils.html_extraction.extract_main_content", return_value=long_text):
             text = _extract_text_from_html("<html><body><nav>NAVNOISE</nav></body></html>")
         assert "Real article body." in text
         assert "NAVNOISE" not in text  # fallback (which would keep nav) not used
 
     def test_trafilatura_failure_falls_back(self) -> None:
         """An exception inside trafilatura degrades to html2text, not a crash."""
-        with patch("src.agent.tools.web.trafilatura.extract", side_effect=RuntimeError("boom")):
+        with patch(
+            "src.utils.html_extraction.trafilatura.extract", side_effect=RuntimeError("boom")
+        ):
             text = _extract_text_from_html("<html><body><p>Fallback content here</p></body></html>")
         assert "Fallback content here" in text
 
     def test_truncates_at_limit(self) -> None:
         """Extracted text is capped at max_length with a truncation marker."""
         big = "word " * 500
-        with patch("src.agent.tools.web._extract_main_content", return_value=big):
+        with patch("src.utils.html_extraction.extract_main_content", return_value=big):
             text = _extract_text_from_html("<html></html>", max_length=100)
         assert len(text) <= 100 + len("\n\n[Content truncated...]")
         assert "[Content truncated...]" in text
 
     def test_extract_main_content_returns_empty_on_error(self) -> None:
-        """_extract_main_content swallows errors and returns ''."""
-        with patch("src.agent.tools.web.trafilatura.extract", side_effect=ValueError("x")):
-            assert _extract_main_content("<html></html>") == ""
+        """extract_main_content swallows errors and returns ''."""
+        with patch("src.utils.html_extraction.trafilatura.extract", side_effect=ValueError("x")):
+            assert extract_main_content("<html></html>") == ""
 
 
 class TestUntrustedContentFraming:
@@ -519,6 +521,28 @@ class TestFetchPageText:
         assert error is not None
         assert "fetch_url" in error  # points the model at the right tool
 
+    @patch("src.agent.tools.web.httpx.Client")
+    def test_returns_error_when_extraction_fails(self, mock_client_class: MagicMock) -> None:
+        from src.agent.tools.web import fetch_page_text
+        from src.utils.html_extraction import HTMLExtractionError
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.is_redirect = False
+        mock_response.text = "<html><body><p>Slow page</p></body></html>"
+        mock_response.headers = {"content-type": "text/html"}
+        mock_response.raise_for_status = MagicMock()
+        self._client_returning(mock_client_class, mock_response)
+
+        with patch(
+            "src.agent.tools.web.extract_text",
+            side_effect=HTMLExtractionError("Page text extraction timed out after 20s"),
+        ):
+            text, error = fetch_page_text("https://example.com")
+
+        assert text is None
+        assert error == "Page text extraction timed out after 20s for https://example.com"
+
 
 class TestWebSearch:
     """Tests for web_search tool (provider mocked at the search_web seam)."""
@@ -644,10 +668,12 @@ class TestWebSearchBatching:
         """A rate-limited query reports its error; the rest still succeed."""
         from src.utils.search_provider import SearchProviderError
 
-        mock_search.side_effect = [
-            self._ONE_RESULT,
-            SearchProviderError("slow down", retriable=True),
-        ]
+        def search(query: str, _num_results: int) -> list[dict[str, str]]:
+            if query == "limited":
+                raise SearchProviderError("slow down", retriable=True)
+            return self._ONE_RESULT
+
+        mock_search.side_effect = search  # keyed by query: the batch runs concurrently
 
         result = web_search.invoke({"queries": ["good", "limited"]})
         parsed = json.loads(result)
@@ -655,6 +681,25 @@ class TestWebSearchBatching:
         assert parsed["searches"][0]["results"]
         assert "error" in parsed["searches"][1]
 
+    @patch("src.agent.tools.web.search_web")
+    def test_batch_runs_concurrently(self, mock_search: MagicMock) -> None:
+        """A batch takes about as long as its slowest query, not the sum."""
+        import threading
+
+        # Every query blocks until all of them are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(_query: str, _num_results: int) -> list[dict[str, str]]:
+            barrier.wait()
+            return self._ONE_RESULT
+
+        mock_search.side_effect = search
+
+        parsed = json.loads(web_search.invoke({"queries": ["a", "b", "c"]}))
+
+        assert [s["query"] for s in parsed["searches"]] == ["a", "b", "c"]
+        assert all(s["results"] for s in parsed["searches"])
+
     def test_no_query_at_all_returns_error(self) -> None:
         """Calling with neither query nor queries is an error, not a crash."""
         parsed = json.loads(web_search.invoke({"query": ""}))
@@ -2604,3 +2649,64 @@ class TestRetrieveFileVideo:
         assert "quota exceeded" in parsed["error"]
 
         set_conversation_context(None, None)
+
+    @patch("src.agent.gemini_files.ensure_gemini_file_uri")
+    @patch("src.db.blob_store.get_blob_store")
+    @patch("src.db.models.db")
+    def test_large_pdf_returns_media_block(
+        self,
+        mock_db: MagicMock,
+        mock_get_blob_store: MagicMock,
+        mock_ensure: MagicMock,
+    ) -> None:
+        """PDFs above the upload threshold are referenced, not inlined."""
+        set_conversation_context("conv-123", "user-456")
+        mock_db.get_conversation.return_value = MagicMock()
+        mock_db.get_message_by_id.return_value = self._video_message(
+            mime="application/pdf", name="report.pdf"
+        )
+        mock_blob_store = MagicMock()
+        mock_blob_store.get.return_value = (b"%PDF" + b"x" * 2000, "application/pdf")
+        mock_get_blob_store.return_value = mock_blob_store
+        mock_ensure.return_value = "https://files.example/f2"
+
+        with patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 1024):
+            result = retrieve_file.invoke({"message_id": "msg-1", "file_index": 0})
+
+        assert result[1] == {
+            "type": "media",
+            "file_uri": "https://files.example/f2",
+            "mime_type": "application/pdf",
+        }
+
+        set_conversation_context(None, None)
+
+    @patch("src.agent.gemini_files.ensure_gemini_file_uri")
+    @patch("src.db.blob_store.get_blob_store")
+    @patch("src.db.models.db")
+    def test_large_image_upload_failure_falls_back_to_inline(
+        self,
+        mock_db: MagicMock,
+        mock_get_blob_store: MagicMock,
+        mock_ensure: MagicMock,
+    ) -> None:
+        """Images still fit inline, so a failed upload isn't an error."""
+        from src.agent.gemini_files import GeminiFileError
+
+        set_conversation_context("conv-123", "user-456")
+        mock_db.get_conversation.return_value = MagicMock()
+        mock_db.get_message_by_id.return_value = self._video_message(
+            mime="image/png", name="big.png"
+        )
+        mock_blob_store = MagicMock()
+        mock_blob_store.get.return_value = (b"p" * 2000, "image/png")
+        mock_get_blob_store.return_value = mock_blob_store
+        mock_ensure.side_effect = GeminiFileError("quota exceeded")
+
+        with patch("src.agent.gemini_files.Config.GEMINI_FILES_UPLOAD_THRESHOLD", 1024):
+            result = retrieve_file.invoke({"message_id": "msg-1", "file_index": 0})
+
+        assert result[1]["type"] == "image"
+        assert "base64" in result[1]
+
+        set_conversation_context(None, None)
@@ -0,0 +1,96 @@
+"""Tests for the in-memory NumPy vector index."""
+
+import math
+
+import pytest
+
+from src.utils.embeddings import pack_vector, top_k_similar
+from src.utils.vector_index import VectorIndex, get_index, peek_index
+
+
+def _loaded(vectors: dict[str, list[float]], dim: int = 2) -> VectorIndex:
+    index = VectorIndex(dim)
+    index.load([(ref_id, len(v), pack_vector(v)) for ref_id, v in vectors.items()], (0, None))
+    return index
+
+
+_VECTORS = {
+    "far": [0.0, 1.0],
+    "near": [1.0, 0.1],
+    "mid": [1.0, 1.0],
+    "opposite": [-1.0, 0.0],
+    "zero": [0.0, 0.0],
+}
+
+
+class TestTopK:
+    @pytest.mark.parametrize("k", [1, 2, 3, 5, 10])
+    def test_matches_reference(self, k: int) -> None:
+        query = [1.0, 0.2]
+        index = _loaded(_VECTORS)
+        expected = top_k_similar(
+            query, [(ref_id, pack_vector(v)) for ref_id, v in _VECTORS.items()], k
+        )
+
+        result = index.top_k(query, k)
+
+        assert [ref_id for ref_id, _ in result] == [ref_id for ref_id, _ in expected]
+        for (_, score), (_, ref_score) in zip(result, expected, strict=True):
+            assert math.isclose(score, ref_score, abs_tol=1e-6)
+
+    def test_ties_keep_table_order(self) -> None:
+        index = _loaded({"a": [1.0, 0.0], "b": [2.0, 0.0], "c": [3.0, 0.0]})
+
+        assert [ref_id for ref_id, _ in index.top_k([1.0, 0.0], 2)] == ["a", "b"]
+
+    def test_allow_list(self) -> None:
+        index = _loaded(_VECTORS)
+
+        result = index.top_k([1.0, 0.0], 5, ref_ids={"far", "mid", "unknown"})
+
+        assert [ref_id for ref_id, _ in result] == ["mid", "far"]
+
+    def test_dimension_mismatch_and_zero_query(self) -> None:
+        index = _loaded(_VECTORS)
+
+        assert index.top_k([1.0, 0.0, 0.0], 3) == []
+        assert index.top_k([0.0, 0.0], 3) == []
+
+
+class TestIncrementalUpdates:
+    def test_upsert_appends_and_replaces(self) -> None:
+        index = VectorIndex(2)
+        for i in range(100):  # grows past the initial capacity
+            index.upsert(f"v{i}", pack_vector([0.0, 1.0]))
+        index.upsert("v50", pack_vector([1.0, 0.0]))
+
+        assert len(index) == 100
+        assert index.top_k([1.0, 0.0], 1)[0][0] == "v50"
+
+    def test_remove_moves_last_row_into_gap(self) -> None:
+        index = _loaded({"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [-1.0, 0.0]})
+
+        index.remove("a")
+        index.remove("missing")
+
+        assert len(index) == 2
+        assert "a" not in index
+        assert [ref_id for ref_id, _ in index.top_k([-1.0, 0.0], 2)] == ["c", "b"]
+
+    def test_other_dimension_is_tracked_but_not_ranked(self) -> None:
+        index = _loaded({"a": [1.0, 0.0]})
+
+        index.upsert("a", pack_vector([1.0, 0.0, 0.0]))
+
+        assert "a" in index
+        assert len(index) == 0
+        assert index.top_k([1.0, 0.0], 1) == []
+
+
+class TestRegistry:
+    def test_scoped_by_database_and_dimension(self) -> None:
+        index = get_index("db-a", "user-1", "memory", 2)
+
+        assert get_index("db-a", "user-1", "memory", 2) is index
+        assert peek_index("db-b", "user-1", "memory") is None
+        assert get_index("db-a", "user-1", "memory", 3) is not index
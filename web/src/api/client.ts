@@ -59,6 +59,7 @@ import {
   type SelectedCalendarsResponse,
   type UpdateAgentRequest,
   type UploadConfig,
+  type UploadResponse,
   type User,
   type UserSettings,
   type VersionResponse,
@@ -613,6 +614,20 @@ export const files = {
     return fetchWithRetry();
   },
 
+  /**
+   * Upload an attachment as multipart/form-data. The server streams it into
+   * storage; reference the returned upload_id from a chat request instead of
+   * sending the file as base64.
+   */
+  async upload(file: File, onUploadProgress?: (progress: number) => void): Promise<UploadResponse> {
+    const form = new FormData();
+    form.append('file', file, file.name);
+    return requestWithProgress<UploadResponse>('/api/uploads', form, {
+      timeout: API_CHAT_TIMEOUT_MS,
+      onUploadProgress,
+    });
+  },
+
   async fetchFile(messageId: string, fileIndex: number): Promise<Blob> {
     const token = getToken();
     // Connect timeout only - large file bodies may legitimately take longer
@@ -289,7 +289,11 @@ function requestWithProgress<T>(
   return new Promise((resolve, reject) => {
     const xhr = new XMLHttpRequest();
     xhr.open('POST', url);
-    xhr.setRequestHeader('Content-Type', 'application/json');
+    // FormData sets its own multipart Content-Type (with the boundary)
+    const isFormData = body instanceof FormData;
+    if (!isFormData) {
+      xhr.setRequestHeader('Content-Type', 'application/json');
+    }
     if (token) {
       xhr.setRequestHeader('Authorization', `Bearer ${token}`);
     }
@@ -338,7 +342,7 @@ function requestWithProgress<T>(
     };
 
     log.debug('XHR request', { url });
-    xhr.send(JSON.stringify(body));
+    xhr.send(isFormData ? body : JSON.stringify(body));
   });
 }
 
@@ -1,3 +1,4 @@
+import { files as filesApi } from '../api/client';
 import { getElementById } from '../utils/dom';
 import { useStore } from '../state/store';
 import { renderFilePreview, updateSendButtonState } from './MessageInput';
@@ -111,11 +112,14 @@ export async function addFilesToPending(files: File[]): Promise<void> {
         continue;
       }
 
-      const data = await readFileAsBase64(processed);
+      // Videos are uploaded as multipart and streamed into storage server-side;
+      // as base64 inside the chat JSON they cost several in-memory copies
       const fileUpload: FileUpload = {
         name: processed.name,
         type: processed.type,
-        data,
+        ...(processed.type.startsWith('video/')
+          ? { upload_id: (await filesApi.upload(processed)).upload_id }
+          : { data: await readFileAsBase64(processed) }),
         previewUrl:
           processed.type.startsWith('image/') || processed.type.startsWith('video/')
             ? URL.createObjectURL(processed)
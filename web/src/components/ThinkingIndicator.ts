@@ -313,6 +313,19 @@ export function createThinkingState(): ThinkingState {
   };
 }
 
+/**
+ * Rebuild the accumulated thinking text from a delta-encoded thinking event.
+ * The backend sends only new text plus the offset it starts at; checkpoints
+ * carry the full trace at offset 0. A delta past the end of what we have means
+ * events were missed - keep the current text until the next checkpoint.
+ * Events without an offset (older servers) carry the full text.
+ */
+export function applyThinkingDelta(current: string, text: string, offset?: number): string {
+  if (offset === undefined) return text;
+  if (offset > current.length) return current;
+  return current.slice(0, offset) + text;
+}
+
 /**
  * Add a thinking event to the trace
  * Thinking is a singleton - there's always exactly one thinking item at the END of the trace.
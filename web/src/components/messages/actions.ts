@@ -140,7 +140,12 @@ function attachSpeakHandler(actions: HTMLElement, messageId: string, language?:
 
     window.dispatchEvent(
       new CustomEvent('message:speak', {
-        detail: { messageId, content: messageContent.textContent || '', language },
+        // data-language is set when the language is detected after the done event
+        detail: {
+          messageId,
+          content: messageContent.textContent || '',
+          language: messageEl.dataset.language || language,
+        },
       })
     );
   });
@@ -32,6 +32,7 @@ import {
   cleanupNewerMessagesScrollListener,
 } from '../components/messages';
 import { checkScrollButtonVisibility } from '../components/ScrollToBottom';
+import { applyThinkingDelta } from '../components/ThinkingIndicator';
 import {
   getMessageInput,
   clearMessageInput,
@@ -735,6 +736,9 @@ interface StreamingState {
   activeAbortController?: AbortController;
   /** Count of token events received (for debugging) */
   tokenCount?: number;
+  /** Set once done released the request: the reader only lingers for the
+   * post-commit title_updated event, so stopping or losing it is harmless */
+  released?: boolean;
 }
 
 /**
@@ -902,6 +906,23 @@ function cleanupStreamingRequest(
   }
 }
 
+/**
+ * Release a live stream's request once its done event was handled. The server
+ * keeps the stream open for the post-commit title_updated event, but the turn
+ * is over: the send button must leave Stop mode now, not when that event (or
+ * POST_COMMIT_WAIT_TIMEOUT) ends the stream.
+ */
+function releaseStreamingRequest(
+  state: StreamingState,
+  requestId: string,
+  convId: string
+): void {
+  if (state.released) return;
+  state.released = true;
+  clearInflightStream(convId);
+  cleanupStreamingRequest(requestId, convId, state.messageSuccessful);
+}
+
 /**
  * Handle scroll-to-bottom for lazy-loaded images after message completion.
  */
@@ -995,13 +1016,20 @@ function processStreamEvent(
       }
       break;
 
-    case 'thinking':
-      updateLocalThinkingState(state.thinkingState, 'thinking', event.text as string);
+    case 'thinking': {
+      // Events are deltas; rebuild the full trace before rendering
+      const thinkingText = applyThinkingDelta(
+        state.thinkingState.thinkingText,
+        event.text as string,
+        event.offset as number | undefined
+      );
+      updateLocalThinkingState(state.thinkingState, 'thinking', thinkingText);
       if (isCurrentConversation) {
-        updateStreamingThinking(event.text as string);
+        updateStreamingThinking(thinkingText);
       }
       store.updateActiveRequestContent(convId, state.fullContent, deepCopyThinkingState(state.thinkingState));
       break;
+    }
 
     case 'tool_start':
       updateLocalThinkingState(
@@ -1080,6 +1108,24 @@ function processStreamEvent(
       });
       break;
 
+    case 'title_updated': {
+      // Sent after done, once the post-commit pipeline saved the cost row,
+      // detected the language and resolved the title
+      if (event.title) {
+        updateConversationTitle(convId, event.title as string);
+      }
+      const messageEl = event.message_id
+        ? document.querySelector<HTMLElement>(
+          `.message[data-message-id="${CSS.escape(event.message_id as string)}"]`
+        )
+        : null;
+      if (messageEl && event.language) {
+        messageEl.dataset.language = event.language as string;
+      }
+      void updateConversationCost(convId);
+      break;
+    }
+
     case 'error':
       return handleStreamError(event, state);
   }
@@ -1657,6 +1703,7 @@ async function sendStreamingMessage(
       // Handle done event specially (async)
       if (event.type === 'done') {
         await handleStreamDone(event as Parameters<typeof handleStreamDone>[0], state, convId, tempUserMessageId);
+        releaseStreamingRequest(state, requestId, convId);
         continue;
       }
 
@@ -1685,6 +1732,12 @@ async function sendStreamingMessage(
       await handleMissingDoneEvent(state, convId, tempUserMessageId);
     }
   } catch (error) {
+    if (state.released) {
+      // The reply is saved and rendered: an abort (or a dropped connection)
+      // while waiting for title_updated only closes the reader
+      log.info('Stream closed after done', { conversationId: convId });
+      return;
+    }
     if (error instanceof Error && error.name === 'AbortError' && !state.resumeViaAbort) {
       log.info('Stream aborted by user', { conversationId: convId });
       state.messageEl.remove();
@@ -1770,8 +1823,7 @@ async function sendStreamingMessage(
     // The turn finished (or its failure was surfaced) in this page - only a
     // page that died mid-stream should resume after reload. Per-conversation:
     // other concurrent streams keep their entries.
-    clearInflightStream(convId);
-    cleanupStreamingRequest(requestId, convId, state.messageSuccessful);
+    releaseStreamingRequest(state, requestId, convId);
   }
 }
 
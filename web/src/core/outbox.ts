@@ -89,12 +89,13 @@ function mutateEntries(convId: string, fn: (entries: OutboxEntry[]) => OutboxEnt
 
 /** Strip blob preview URLs (dead after reload) and drop oversized payloads. */
 function persistableFiles(files: FileUpload[]): { files: FileUpload[]; filesDropped: boolean } {
-  const totalChars = files.reduce((sum, f) => sum + f.data.length, 0);
+  // Uploaded files persist as their upload_id (a few bytes)
+  const totalChars = files.reduce((sum, f) => sum + (f.data?.length ?? 0), 0);
   if (totalChars > OUTBOX_PERSIST_MAX_FILE_CHARS) {
     return { files: [], filesDropped: true };
   }
   return {
-    files: files.map(({ name, type, data }) => ({ name, type, data })),
+    files: files.map(({ name, type, data, upload_id }) => ({ name, type, data, upload_id })),
     filesDropped: false,
   };
 }
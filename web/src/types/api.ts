@@ -105,13 +105,23 @@ export interface FileMetadata {
   previewUrl?: string; // blob URL for immediate display (local uploads only)
 }
 
+/** Pending attachment: inline base64 data, or the upload_id of a file sent to /api/uploads */
 export interface FileUpload {
   name: string;
   type: string;
-  data: string; // base64
+  data?: string; // base64
+  upload_id?: string;
   previewUrl?: string; // blob URL for local preview
 }
 
+/** Response of POST /api/uploads */
+export interface UploadResponse {
+  upload_id: string;
+  name: string;
+  type: string;
+  size: number;
+}
+
 /** Device GPS fix attached to chat requests when location sharing is enabled */
 export interface ClientLocation {
   lat: number;
@@ -155,7 +165,7 @@ export interface ToolMetadata {
 
 export type StreamEvent = (
   | { type: 'token'; text: string }
-  | { type: 'thinking'; text: string }
+  | { type: 'thinking'; text: string; offset?: number; checkpoint?: boolean } // text is a delta spliced in at offset
   | { type: 'tool_start'; tool: string; detail?: string; metadata?: ToolMetadata }
   | { type: 'tool_detail'; tool: string; detail: string }
   | { type: 'tool_end'; tool: string }
@@ -173,6 +183,7 @@ export type StreamEvent = (
       title?: string;
       user_message_id?: string; // Real ID of the user message (kept for backwards compatibility)
     }
+  | { type: 'title_updated'; message_id: string; title?: string; language?: string } // After done: post-commit title/language
   | { type: 'error'; message: string; code?: string; retryable?: boolean }
 ) & {
   /** Journal sequence number for resumable streams (resume with after_seq) */
@@ -4865,7 +4865,7 @@ export interface paths {
          * @description Send a message and stream the response via Server-Sent Events.
          *
          *     Returns text/event-stream with the following event types:
-         *     - `thinking`: LLM thinking text (if enabled) - `{"type": "thinking", "text": "..."}`
+         *     - `thinking`: LLM thinking delta (if enabled) - `{"type": "thinking", "text": "...", "offset": 0}` (`text` is spliced in at `offset`; `"checkpoint": true` events carry the full trace)
          *     - `tool_start`: Tool starting - `{"type": "tool_start", "tool": "web_search", "detail": "..."}`
          *     - `tool_end`: Tool completed - `{"type": "tool_end", "tool": "web_search"}`
          *     - `token`: Content token - `{"type": "token", "text": "..."}`
@@ -0,0 +1,276 @@
+/**
+ * Regression tests for the window between a stream's done event and the end
+ * of the SSE response.
+ *
+ * The server keeps the stream open after done (up to POST_COMMIT_WAIT_TIMEOUT)
+ * to deliver title_updated. The request used to stay active until the reader
+ * closed, so the send button stayed in Stop mode - and pressing Stop removed
+ * the saved assistant reply and flagged the user message as failed.
+ */
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { useStore } from '@/state/store';
+import type { Conversation, StreamEvent } from '@/types/api';
+
+vi.mock('@/api/client', () => ({
+  chat: {
+    stream: vi.fn(),
+    resumeStream: vi.fn(),
+  },
+  conversations: {
+    get: vi.fn(),
+    create: vi.fn(),
+    unarchive: vi.fn(),
+  },
+  messages: {},
+}));
+
+vi.mock('@/components/Toast', () => ({
+  toast: {
+    loading: vi.fn(() => ({ dismiss: vi.fn() })),
+    success: vi.fn(),
+    warning: vi.fn(),
+    error: vi.fn(),
+    info: vi.fn(),
+  },
+}));
+
+vi.mock('@/components/Sidebar', () => ({
+  renderConversationsList: vi.fn(),
+  setActiveConversation: vi.fn(),
+}));
+
+vi.mock('@/components/messages', () => ({
+  addMessageToUI: vi.fn(),
+  renderMessages: vi.fn(),
+  addStreamingMessage: vi.fn(),
+  updateStreamingMessage: vi.fn(),
+  finalizeStreamingMessage: vi.fn(() => false),
+  updateStreamingThinking: vi.fn(),
+  updateStreamingToolStart: vi.fn(),
+  updateStreamingToolDetail: vi.fn(),
+  updateStreamingToolEnd: vi.fn(),
+  cleanupStreamingContext: vi.fn(),
+  getStreamingMessageElement: vi.fn(() => null),
+  showLoadingIndicator: vi.fn(),
+  hideLoadingIndicator: vi.fn(),
+  updateUserMessageId: vi.fn(),
+  loadAllRemainingNewerMessages: vi.fn(),
+  cleanupNewerMessagesScrollListener: vi.fn(),
+  hasPendingApproval: vi.fn(() => false),
+}));
+
+vi.mock('@/components/messages/send-state', () => ({
+  setMessageSendState: vi.fn(),
+}));
+
+vi.mock('@/components/messages/edit', () => ({
+  beginInlineEdit: vi.fn(),
+}));
+
+vi.mock('@/components/ScrollToBottom', () => ({
+  checkScrollButtonVisibility: vi.fn(),
+}));
+
+vi.mock('@/components/ThinkingIndicator', () => ({
+  applyThinkingDelta: vi.fn(),
+}));
+
+vi.mock('@/components/MessageInput', () => ({
+  getMessageInput: vi.fn(() => 'Hello'),
+  clearMessageInput: vi.fn(),
+  focusMessageInput: vi.fn(),
+  setInputLoading: vi.fn(),
+  shouldAutoFocusInput: vi.fn(() => false),
+  showUploadProgress: vi.fn(),
+  hideUploadProgress: vi.fn(),
+  updateUploadProgress: vi.fn(),
+}));
+
+vi.mock('@/components/FileUpload', () => ({
+  clearPendingFiles: vi.fn(),
+  getPendingFiles: vi.fn(() => []),
+}));
+
+vi.mock('@/components/VoiceInput', () => ({
+  stopVoiceRecording: vi.fn(),
+}));
+
+vi.mock('@/utils/dom', () => ({
+  getElementById: vi.fn(() => null),
+  isScrolledToBottom: vi.fn(() => true),
+}));
+
+vi.mock('@/utils/thumbnails', () => ({
+  enableScrollOnImageLoad: vi.fn(),
+  getThumbnailObserver: vi.fn(),
+  observeThumbnail: vi.fn(),
+  programmaticScrollToBottom: vi.fn(),
+  programmaticScrollToElementTop: vi.fn(),
+}));
+
+vi.mock('@/router/deeplink', () => ({
+  setConversationHash: vi.fn(),
+}));
+
+const mockSyncManager = {
+  incrementLocalMessageCount: vi.fn(),
+  setConversationStreaming: vi.fn(),
+};
+
+vi.mock('@/sync/SyncManager', () => ({
+  getSyncManager: vi.fn(() => mockSyncManager),
+}));
+
+vi.mock('@/core/conversation', () => ({
+  isTempConversation: vi.fn(() => false),
+  createConversation: vi.fn(),
+  updateConversationTitle: vi.fn(),
+}));
+
+vi.mock('@/core/attention', () => ({
+  notifyTurnFinished: vi.fn(),
+}));
+
+vi.mock('@/core/location', () => ({
+  getClientLocation: vi.fn(async () => null),
+}));
+
+vi.mock('@/core/toolbar', () => ({
+  updateConversationCost: vi.fn(),
+  resetForceTools: vi.fn(),
+}));
+
+vi.mock('@/core/stream-recovery', () => ({
+  markStreamForRecovery: vi.fn(),
+  clearPendingRecovery: vi.fn(),
+  attemptRecovery: vi.fn(async () => false),
+}));
+
+import { sendMessage, handleStopStreaming } from '@/core/messaging';
+import { chat } from '@/api/client';
+import { toast } from '@/components/Toast';
+import { addStreamingMessage } from '@/components/messages';
+import { setMessageSendState } from '@/components/messages/send-state';
+import { updateConversationTitle } from '@/core/conversation';
+
+const conversation: Conversation = {
+  id: 'conv-1',
+  title: 'Test',
+  model: 'gemini-3-flash-preview',
+  created_at: '2024-01-01T00:00:00Z',
+  updated_at: '2024-01-01T00:00:00Z',
+};
+
+const doneEvent: StreamEvent = {
+  type: 'done',
+  id: 'assistant-1',
+  created_at: '2024-01-01T00:00:01Z',
+  content: 'Hi there',
+  seq: 1,
+};
+
+/** Stream state shared between a test and the mocked chat.stream */
+let streamController: AbortController | undefined;
+let closeStream: ((error?: Error) => void) | undefined;
+
+/**
+ * Mock chat.stream: yield done, then keep the reader open (as the server
+ * does while the post-commit pipeline runs) until closeStream is called,
+ * then yield afterDone.
+ */
+function mockStream(afterDone: StreamEvent[] = []): void {
+  vi.mocked(chat.stream).mockImplementation(async function* (
+    _convId: string,
+    _message: string,
+    _files?: unknown,
+    _forceTools?: unknown,
+    controller?: AbortController
+  ) {
+    streamController = controller;
+    yield doneEvent;
+    await new Promise<void>((resolve, reject) => {
+      closeStream = (error?: Error) => (error ? reject(error) : resolve());
+    });
+    yield* afterDone;
+  } as typeof chat.stream);
+}
+
+/** Wait until done released the request and the reader is parked after it */
+async function waitForRelease(): Promise<void> {
+  await vi.waitFor(() => {
+    expect(streamController).toBeDefined();
+    expect(closeStream).toBeDefined();
+  });
+}
+
+describe('stream after done', () => {
+  let messageEl: HTMLElement;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    localStorage.clear();
+    streamController = undefined;
+    closeStream = undefined;
+    useStore.setState({
+      conversations: [conversation],
+      currentConversation: conversation,
+      streamingEnabled: true,
+      streamingConversationId: null,
+      activeRequests: new Map(),
+      forceTools: [],
+    });
+    messageEl = document.createElement('div');
+    messageEl.className = 'message assistant streaming';
+    document.body.appendChild(messageEl);
+    vi.mocked(addStreamingMessage).mockReturnValue(messageEl);
+  });
+
+  it('releases the request as soon as done is handled', async () => {
+    mockStream();
+    const sending = sendMessage();
+
+    await waitForRelease();
+
+    // Reader still open for title_updated, but the send button is out of Stop mode
+    expect(useStore.getState().getActiveRequest('conv-1')).toBeUndefined();
+    expect(useStore.getState().streamingConversationId).toBeNull();
+    expect(mockSyncManager.setConversationStreaming).toHaveBeenLastCalledWith('conv-1', false);
+    expect(mockSyncManager.incrementLocalMessageCount).toHaveBeenCalledWith('conv-1', 2);
+
+    closeStream?.();
+    await sending;
+    expect(mockSyncManager.incrementLocalMessageCount).toHaveBeenCalledTimes(1);
+  });
+
+  it('treats a stop after done as a no-op', async () => {
+    mockStream();
+    const sending = sendMessage();
+    await waitForRelease();
+
+    handleStopStreaming();
+    expect(streamController?.signal.aborted).toBe(false);
+
+    // The reader closing with an abort only ends the stream
+    closeStream?.(new DOMException('Aborted', 'AbortError'));
+    await sending;
+
+    expect(messageEl.isConnected).toBe(true);
+    expect(setMessageSendState).not.toHaveBeenCalledWith(expect.any(String), 'failed');
+    expect(toast.info).not.toHaveBeenCalled();
+    const [userMessage] = useStore.getState().getMessages('conv-1');
+    expect(userMessage.status).toBeUndefined();
+  });
+
+  it('still applies title_updated after release', async () => {
+    mockStream([
+      { type: 'title_updated', title: 'Greetings', message_id: 'assistant-1' },
+    ]);
+    const sending = sendMessage();
+    await waitForRelease();
+
+    closeStream?.();
+    await sending;
+
+    expect(updateConversationTitle).toHaveBeenCalledWith('conv-1', 'Greetings');
+  });
+});
@@ -10,6 +10,7 @@ import {
   createThinkingState,
   addThinkingToTrace,
   addToolStartToTrace,
+  applyThinkingDelta,
   markToolCompletedInTrace,
   updateToolDetailInTrace,
 } from '../../src/components/ThinkingIndicator';
@@ -62,6 +63,24 @@ describe('ThinkingIndicator', () => {
     });
   });
 
+  describe('applyThinkingDelta', () => {
+    it('should append a delta at the end of the current text', () => {
+      expect(applyThinkingDelta('Let me ', 'think', 7)).toBe('Let me think');
+    });
+
+    it('should replace the text with a checkpoint at offset 0', () => {
+      expect(applyThinkingDelta('Let me', 'Let me think harder', 0)).toBe('Let me think harder');
+    });
+
+    it('should keep the current text when a delta arrives past its end', () => {
+      expect(applyThinkingDelta('abc', 'xyz', 10)).toBe('abc');
+    });
+
+    it('should treat events without an offset as full text', () => {
+      expect(applyThinkingDelta('old', 'new full text')).toBe('new full text');
+    });
+  });
+
   describe('trace helper functions', () => {
     let state: ThinkingState;
 